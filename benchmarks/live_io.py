@@ -0,0 +1,140 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Measures the latency and throughput of the live connections against the\
+    stand-ins for a board and SPIF on the local host::
+
+        python -m benchmarks.live_io
+"""
+
+from queue import Queue
+import tempfile
+import time
+import numpy
+from spinnman.utilities import utility_functions
+from spinn_front_end_common.utilities.connections import (
+    live_event_connection)
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import (
+    SPIFLiveSpikesConnection, SpynnakerLiveSpikesConnection)
+from unittests.connection_tests.board_stand_in import (
+    BoardStandIn, SPIFStandIn)
+
+# The number of groups of spikes echoed
+_N_ECHOES = 1000
+
+# The number of spikes in each group echoed
+_ECHO_SIZE = 100
+
+# The rate at which the SPIF stand-in sends events, per second
+_SPIF_RATE = 2000000
+
+# How long SPIF sends for, in seconds
+_SPIF_TIME = 2.0
+
+
+def _board(database_dir):
+    """ Make a board that connections send to in place of the SCAMP port.
+    """
+    board = BoardStandIn(database_dir)
+    live_event_connection.SCP_SCAMP_PORT = board.port
+    utility_functions.SCP_SCAMP_PORT = board.port
+    return board
+
+
+def echo_latency(database_dir):
+    """ Time how long groups of spikes take to be sent to the board and\
+        echoed back.
+
+    :param str database_dir: Where the board writes its database
+    :return: The time each group took, in seconds
+    :rtype: ~numpy.ndarray
+    """
+    board = _board(database_dir)
+    board.add_population("input", _ECHO_SIZE)
+    board.add_population("output", _ECHO_SIZE, live_output=True)
+    board.add_echo("input", "output")
+    connection = SpynnakerLiveSpikesConnection(
+        receive_labels=["output"], send_labels=["input"],
+        local_host="127.0.0.1", local_port=None)
+    received = Queue()
+    connection.add_receive_callback(
+        "output", lambda label, time_step, atom_ids: received.put(
+            len(atom_ids)))
+    times = numpy.empty(_N_ECHOES)
+    try:
+        board.notify_database(connection.local_port)
+        board.notify_start(connection.local_port)
+        atom_ids = numpy.arange(_ECHO_SIZE)
+        for echo in range(_N_ECHOES):
+            start = time.perf_counter()
+            connection.send_spikes("input", atom_ids, send_full_keys=True)
+            n_echoed = 0
+            while n_echoed < _ECHO_SIZE:
+                n_echoed += received.get(timeout=5)
+            times[echo] = time.perf_counter() - start
+        board.notify_stop(connection.local_port)
+    finally:
+        connection.close()
+        board.close()
+    return times
+
+
+def spif_throughput(database_dir):
+    """ Count the events received from SPIF sending as fast as it can.
+
+    :param str database_dir: Where the board writes its database
+    :return: The events sent and received each second
+    :rtype: tuple(float, float)
+    """
+    board = _board(database_dir)
+    board.add_population("pop", 1000, live_output=True)
+    spif = SPIFStandIn(board.keys("pop"), rate=_SPIF_RATE)
+    connection = SPIFLiveSpikesConnection(
+        ["pop"], "127.0.0.1", spif.port, events_per_packet=64,
+        local_host="127.0.0.1", local_port=None)
+    connection.add_receive_callback("pop", lambda label, atom_ids: None)
+    try:
+        board.notify_database(connection.local_port)
+        board.notify_start(connection.local_port)
+        start = time.perf_counter()
+        spif.wait_for_events_sent(int(_SPIF_RATE * _SPIF_TIME), 2 * _SPIF_TIME)
+        board.notify_stop(connection.local_port)
+        spif.wait_for_stop()
+        elapsed = time.perf_counter() - start
+        # Let the connection handle what it has already read
+        time.sleep(0.5)
+        return (spif.n_events_sent / elapsed,
+                connection.statistics.events_delivered / elapsed)
+    finally:
+        connection.close()
+        spif.close()
+        board.close()
+
+
+def main():
+    unittest_setup()
+    with tempfile.TemporaryDirectory() as database_dir:
+        times = echo_latency(database_dir) * 1e6
+        print(f"Echo of {_ECHO_SIZE} spikes: "
+              f"median {numpy.median(times):.0f}us, "
+              f"99th percentile {numpy.percentile(times, 99):.0f}us, "
+              f"{_ECHO_SIZE * len(times) / times.sum() * 1e6:.0f} spikes/s")
+        sent, received = spif_throughput(database_dir)
+        print(f"SPIF: {sent:.0f} events/s sent, "
+              f"{received:.0f} events/s received")
+
+
+if __name__ == "__main__":
+    main()
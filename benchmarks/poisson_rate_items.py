@@ -0,0 +1,61 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Times building the expander rate items of Poisson sources with\
+    schedules that are all different, against building them one range at\
+    a time as they used to be::
+
+        python -m benchmarks.poisson_rate_items
+
+A full table of 1M sources of 100 rates needs several GB, so fewer sources
+are timed; the time scales with the number of entries.
+"""
+
+import timeit
+import numpy
+from spynnaker.pyNN.config_setup import unittest_setup
+# pylint: disable=protected-access
+from unittests.model_tests.neuron.test_spike_source.test_poisson_rate_items \
+    import _data, _items, _reference_items
+
+# The numbers of sources timed
+_N_SOURCES = (2000, 20000)
+
+# The number of rates in the schedule of each source
+_N_RATES = 100
+
+# The number of times each build is timed
+_REPEATS = 3
+
+
+def main():
+    unittest_setup()
+    rng = numpy.random.default_rng(5)
+    for n_sources in _N_SOURCES:
+        rates = [rng.random(_N_RATES) * 100.0 for _ in range(n_sources)]
+        starts = [numpy.arange(_N_RATES) * 10.0] * n_sources
+        durations = [numpy.full(_N_RATES, 10.0)] * n_sources
+        data = _data(n_sources, rates, starts, durations)
+        ids = numpy.arange(n_sources)
+        reference = min(timeit.repeat(
+            lambda: _reference_items(data, ids), number=1, repeat=_REPEATS))
+        flat = min(timeit.repeat(
+            lambda: _items(data, ids), number=1, repeat=_REPEATS))
+        print(f"{n_sources} sources of {_N_RATES} rates: "
+              f"{reference * 1e3:.0f}ms one range at a time, "
+              f"{flat * 1e3:.0f}ms from flat arrays")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Times converting a slice of values of each field type one at a time and\
+    as an array::
+
+        python -m benchmarks.struct_convert
+"""
+
+import timeit
+import numpy
+from spinn_front_end_common.interface.ds import DataType
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to, convert_array_to)
+
+# The number of values converted
+_N_VALUES = 1000
+
+# The number of times each conversion is timed
+_REPEATS = 5
+
+
+def main():
+    rng = numpy.random.default_rng(0)
+    for data_type in DataType:
+        values = rng.uniform(
+            0, min(float(data_type.max), 100) * 0.99, _N_VALUES)
+        single = min(timeit.repeat(
+            lambda: [convert_to(value, data_type) for value in values],
+            number=1, repeat=_REPEATS))
+        array = min(timeit.repeat(
+            lambda: convert_array_to(values, data_type),
+            number=1, repeat=_REPEATS))
+        print(f"{data_type.name}: {single * 1e6:.0f}us one at a time, "
+              f"{array * 1e6:.0f}us as an array")
+
+
+if __name__ == "__main__":
+    main()
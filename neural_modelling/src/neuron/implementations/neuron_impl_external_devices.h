@@ -41,6 +41,7 @@ enum send_type {
 #include <neuron/current_sources/current_source.h>
 
 // Further includes
+#include <common/maths-util.h>
 #include <debug.h>
 
 
@@ -63,6 +64,9 @@ typedef struct packet_firing_data_t {
     uint32_t time_until_next_send;
     //! Send type
     enum send_type type;
+    //! True (1) if the mean of the values since the last send is to be sent,
+    //! False (0) if just the current value
+    uint32_t aggregate;
 } packet_firing_data_t;
 
 //! Indices for recording of words
@@ -97,6 +101,13 @@ static packet_firing_data_t *packet_firing_array;
 //! The synapse shaping parameters
 static synapse_types_t *synapse_types_array;
 
+//! \brief The sum of the (clipped) values of each neuron since it last sent,
+//!     as the bits of the accum values so that it can't overflow
+static int64_t *aggregate_sum_array;
+
+//! The number of values in the sum of each neuron
+static uint32_t *aggregate_count_array;
+
 //! The number of steps to run per timestep
 static uint n_steps_per_timestep;
 
@@ -168,6 +179,14 @@ static bool neuron_impl_initialise(uint32_t n_neurons) {
 		return false;
 	}
 
+    // Allocate DTCM for the sums of values to be aggregated
+	aggregate_sum_array = spin1_malloc(n_neurons * sizeof(int64_t));
+	aggregate_count_array = spin1_malloc(n_neurons * sizeof(uint32_t));
+	if (aggregate_sum_array == NULL || aggregate_count_array == NULL) {
+		log_error("Unable to allocate aggregate arrays - Out of DTCM");
+		return false;
+	}
+
     return true;
 }
 
@@ -221,6 +240,12 @@ static void neuron_impl_load_neuron_parameters(
 	}
 	next += n_words_needed(n_neurons * sizeof(synapse_types_params_t));
 
+	// Start aggregating again from nothing
+	for (uint32_t i = 0; i < n_neurons; i++) {
+		aggregate_sum_array[i] = 0;
+		aggregate_count_array[i] = 0;
+	}
+
     // If we are to save the initial state, copy the whole of the parameters
 	// to the initial state
 	if (save_initial_state) {
@@ -249,6 +274,36 @@ static bool _test_will_fire(packet_firing_data_t *packet_firing) {
     return false;
 }
 
+//! \brief Clips a value to the range allowed by the device
+//! \param[in] packet_firing: The parameters of the device
+//! \param[in] value: The value to clip
+//! \return The clipped value
+static inline accum _clip_value(
+        packet_firing_data_t *packet_firing, accum value) {
+    if (value > packet_firing->max_value) {
+        return packet_firing->max_value;
+    }
+    if (value < packet_firing->min_value) {
+        return packet_firing->min_value;
+    }
+    return value;
+}
+
+//! \brief Gets the mean of the values summed for a neuron, and starts a new
+//!     sum
+//! \param[in] neuron_index: The index of the neuron
+//! \return The mean value, rounded towards zero
+static inline accum _take_mean(uint32_t neuron_index) {
+    int64_t sum = aggregate_sum_array[neuron_index];
+    uint32_t count = aggregate_count_array[neuron_index];
+    aggregate_sum_array[neuron_index] = 0;
+    aggregate_count_array[neuron_index] = 0;
+    if (sum < 0) {
+        return kbits(-(int32_t) udiv64((uint64_t) -sum, count));
+    }
+    return kbits((int32_t) udiv64((uint64_t) sum, count));
+}
+
 SOMETIMES_UNUSED // Marked unused as only used sometimes
 //! \brief Do the timestep update for the particular implementation
 //! \param[in] timer_count: The timer count, used for TDMA packet spreading
@@ -314,18 +369,24 @@ static void neuron_impl_do_timestep_update(
                     NUM_INHIBITORY_RECEPTORS, inh_input_values,
                     0, current_offset, this_neuron);
 
+            // Add the value to those to be aggregated if needed
+            accum value_to_send = 0;
+            if (the_packet_firing->value_as_payload) {
+                value_to_send = _clip_value(the_packet_firing, result);
+                if (the_packet_firing->aggregate) {
+                    aggregate_sum_array[neuron_index] += bitsk(value_to_send);
+                    aggregate_count_array[neuron_index] += 1;
+                }
+            }
+
             // determine if a packet should fly
             will_fire = _test_will_fire(the_packet_firing);
 
             // If spike occurs, communicate to relevant parts of model
             if (will_fire) {
                 if (the_packet_firing->value_as_payload) {
-                    accum value_to_send = result;
-                    if (result > the_packet_firing->max_value) {
-                        value_to_send = the_packet_firing->max_value;
-                    }
-                    if (result < the_packet_firing->min_value) {
-                        value_to_send = the_packet_firing->min_value;
+                    if (the_packet_firing->aggregate) {
+                        value_to_send = _take_mean(neuron_index);
                     }
 
                     uint payload = _get_payload(
@@ -180,7 +180,7 @@ __all__ = [
     'Projection',
     'get_current_time', 'create', 'connect', 'get_time_step', 'get_min_delay',
     'get_max_delay', 'initialize', 'list_standard_models', 'name',
-    'record', "get_machine"]
+    'record', "get_machine", 'get_projection_data']
 
 # Dynamically-extracted operations from PyNN
 __pynn = {}
@@ -339,6 +339,45 @@ def Projection(
         space=space, label=label)
 
 
+def get_projection_data(
+        projections, attribute_names, format="list",  # @ReservedAssignment
+        with_address=True, multiple_synapses="last", n_threads=1):
+    """
+    Get the same attributes of several projections, reading the data from
+    the machine for all of them together.  This is equivalent to calling
+    :py:meth:`~spynnaker.pyNN.models.projection.Projection.get` on each
+    projection in turn, but the synaptic data of each core is read only
+    once for all the requested projections that target it.
+
+    :param iterable(~spynnaker.pyNN.models.projection.Projection) projections:
+        The projections to get the data of
+    :param attribute_names: list of attributes to gather
+    :type attribute_names: str or iterable(str)
+    :param str format:
+        ``"list"``, ``"array"``, ``"sparse"`` or ``"structured"``
+    :param bool with_address:
+        True if the source and target are to be included
+    :param str multiple_synapses:
+        What to do with the data if format is "array" or "sparse" and
+        multiple source-target pairs with the same values exist
+    :param int n_threads:
+        The number of post-populations to read from the machine at once
+    :return: The values selected for each projection, in the order given
+    :rtype: list
+    """
+    # pylint: disable=redefined-builtin, too-many-arguments
+    SpynnakerDataView.check_user_can_act()
+    projections = list(projections)
+    # pylint: disable=protected-access
+    SpiNNakerProjection._read_connections_from_machine(
+        projections, n_threads)
+    return [
+        projection.get(
+            attribute_names, format, with_address=with_address,
+            multiple_synapses=multiple_synapses)
+        for projection in projections]
+
+
 def _create_overloaded_functions(spinnaker_simulator):
     """
     Creates functions that the main PyNN interface supports
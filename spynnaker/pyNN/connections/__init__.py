@@ -18,9 +18,18 @@ from .spynnaker_live_spikes_connection import SpynnakerLiveSpikesConnection
 from .spynnaker_poisson_control_connection import (
     SpynnakerPoissonControlConnection)
 from .spif_live_spikes_connection import SPIFLiveSpikesConnection
+from .async_live_spikes_connection import (
+    AsyncLiveSpikesConnection, SpikeBatch)
+from .async_spif_live_spikes_connection import AsyncSPIFLiveSpikesConnection
+from .shared_memory_spikes import (
+    SharedMemorySpikeReader, SharedMemorySpikeWriter)
+from .live_connection_statistics import LiveConnectionStatistics
 
 __all__ = [
     "EthernetCommandConnection", "EthernetControlConnection",
     "SpynnakerLiveSpikesConnection", "SpynnakerPoissonControlConnection",
-    "SPIFLiveSpikesConnection"
+    "SPIFLiveSpikesConnection", "AsyncLiveSpikesConnection", "SpikeBatch",
+    "AsyncSPIFLiveSpikesConnection",
+    "SharedMemorySpikeReader", "SharedMemorySpikeWriter",
+    "LiveConnectionStatistics"
 ]
@@ -0,0 +1,689 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from collections import namedtuple
+import logging
+import struct
+import time
+import numpy
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
+from spinnman.constants import SCP_SCAMP_PORT
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.scp.impl import IPTagSet
+from spinnman.utilities.utility_functions import (
+    update_sdp_header_for_udp_send)
+from spinn_front_end_common.interface.ds import DataType
+from spinn_front_end_common.utilities.constants import NOTIFY_PORT
+from spinn_front_end_common.utilities.database import DatabaseConnection
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.utilities.latency_histogram import LatencyHistogram
+from .eieio_arrays import (
+    check_atom_ids, check_keys_fit, max_elements_per_packet, pack_packets,
+    packet_buffer, packet_prefix, unpack_packet)
+from .key_to_atom_table import KeyToAtomTable, group_by_label
+from .live_connection_statistics import LiveConnectionStatistics
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+_ONE_SHORT = struct.Struct("<H")
+
+# The size of the response to setting an IP tag
+_SCP_OK_SIZE = 18
+
+# The byte of the flags of an SCP response, and their value
+_SCP_FLAGS_BYTE = 2
+_SCP_RESPONSE_FLAGS = 7
+
+# The byte of the destination core of an SCP response, and its value
+_SCP_DEST_CPU_BYTE = 4
+_SCP_RESPONSE_DEST = 0xFF
+
+# How long to wait for the response to setting an IP tag, and how many
+# times to try
+_TAG_TIMEOUT = 1.0
+_TAG_TRIES = 3
+
+# How often the IP tags are set while running, in case the board forgets
+_TAG_REFRESH_INTERVAL = 10.0
+
+# The number of batches of spikes of each population that are kept until
+# read by default
+_QUEUE_SIZE = 1024
+
+#: A batch of spikes received from a population
+SpikeBatch = namedtuple("SpikeBatch", ["ids", "times"])
+SpikeBatch.__doc__ = """
+    A batch of spikes received from a population.
+
+    :ivar ~numpy.ndarray ids: The neuron (or key) of each spike
+    :ivar times:
+        The time step of each spike, or None if the spikes were sent
+        without times
+    :vartype times: ~numpy.ndarray or None
+    """
+
+
+class AsyncLiveSpikesConnection(asyncio.DatagramProtocol):
+    """
+    A connection for receiving and sending live spikes from and to
+    SpiNNaker, and for setting the rates of Poisson sources, from an
+    :py:mod:`asyncio` event loop.
+
+    Spikes are received and sent with a datagram transport on the event
+    loop rather than with a thread for each callback.  Only the
+    notifications from the toolchain are handled by a thread, which hands
+    them to the event loop.  For example::
+
+        async with AsyncLiveSpikesConnection(
+                receive_labels=["pop"], send_labels=["input"]) as conn:
+            await conn.wait_for_start()
+            async for batch in conn.spikes("pop"):
+                await conn.send_spikes("input", batch.ids)
+
+    Spikes that are received are queued for each population until read.
+    If they are not read quickly enough, the oldest batches are dropped, and
+    counted in :py:meth:`n_dropped`.  Sending waits while the transport's
+    buffer is full.  The time from receiving spikes until they are read,
+    and the time taken to send spikes, are recorded in
+    :py:attr:`receive_latency` and :py:attr:`send_latency`, and the spikes
+    received, read and dropped are counted in :py:attr:`statistics`.
+    """
+
+    __slots__ = [
+        "__database_connection",
+        "__dropped",
+        "__error_keys",
+        "__key_to_atom_table",
+        "__live_packet_gather_label",
+        "__local_host",
+        "__local_port",
+        "__loop",
+        "__n_neurons",
+        "__packet_buffers",
+        "__packet_locks",
+        "__poisson_controls",
+        "__queue_size",
+        "__queues",
+        "__receive_labels",
+        "__receive_latency",
+        "__receiver_details",
+        "__scp_response",
+        "__send_labels",
+        "__send_latency",
+        "__send_targets",
+        "__started",
+        "__statistics",
+        "__stopped",
+        "__tag_task",
+        "__transport",
+        "__writable"]
+
+    def __init__(
+            self, receive_labels=None, send_labels=None, poisson_labels=None,
+            local_host=None, local_port=NOTIFY_PORT,
+            live_packet_gather_label="LiveSpikeReceiver",
+            control_label_extension="_control", queue_size=_QUEUE_SIZE):
+        """
+        :param iterable(str) receive_labels:
+            Labels of population from which live spikes will be received.
+        :param iterable(str) send_labels:
+            Labels of population to which live spikes will be sent
+        :param iterable(str) poisson_labels:
+            Labels of Poisson populations whose rates will be set
+        :param str local_host:
+            Optional specification of the local hostname or IP address of the
+            interface to listen on
+        :param int local_port:
+            Optional specification of the local port to listen on. Must match
+            the port that the toolchain will send the notification on (19999
+            by default)
+        :param str live_packet_gather_label:
+            The label of the vertex to which received spikes are being sent
+        :param str control_label_extension:
+            The extra name added to the label of each Poisson source
+        :param int queue_size:
+            The number of batches of spikes of each population to keep until
+            they are read
+        """
+        # pylint: disable=too-many-arguments
+        super().__init__()
+        self.__receive_labels = list(receive_labels or [])
+        self.__send_labels = list(send_labels or [])
+        self.__poisson_controls = {
+            label: f"{label}{control_label_extension}"
+            for label in poisson_labels or []}
+        self.__local_host = local_host
+        self.__local_port = local_port
+        self.__live_packet_gather_label = live_packet_gather_label
+        self.__queue_size = queue_size
+        self.__loop = None
+        self.__transport = None
+        self.__database_connection = None
+        self.__key_to_atom_table = KeyToAtomTable()
+        self.__n_neurons = dict()
+        self.__send_targets = dict()
+        self.__receiver_details = list()
+        self.__packet_buffers = dict()
+        self.__packet_locks = dict()
+        self.__queues = dict()
+        self.__dropped = {label: 0 for label in self.__receive_labels}
+        self.__error_keys = set()
+        self.__scp_response = None
+        self.__tag_task = None
+        self.__started = None
+        self.__stopped = None
+        self.__writable = None
+        self.__receive_latency = LatencyHistogram()
+        self.__send_latency = LatencyHistogram()
+        self.__statistics = LiveConnectionStatistics()
+
+    async def open(self):
+        """
+        Start listening for spikes and for notifications from the toolchain.
+        This must be awaited in the event loop that the connection is to be
+        used in before the simulation is run.
+        """
+        self.__loop = asyncio.get_running_loop()
+        self.__started = asyncio.Event()
+        self.__stopped = asyncio.Event()
+        self.__writable = asyncio.Event()
+        self.__writable.set()
+        self.__queues = {
+            label: asyncio.Queue(self.__queue_size)
+            for label in self.__receive_labels}
+        await self._create_endpoint(self.__loop)
+        self.__database_connection = DatabaseConnection(
+            self.__notify_start_resume, self.__notify_stop_pause,
+            local_host=self.__local_host, local_port=self.__local_port)
+        self.__database_connection.add_database_callback(
+            self.__read_database)
+
+    async def _create_endpoint(self, loop):
+        """
+        Create the datagram endpoint that spikes are received and sent
+        with.
+
+        :param ~asyncio.AbstractEventLoop loop: The loop to create it in
+        """
+        await loop.create_datagram_endpoint(
+            lambda: self, local_addr=(self.__local_host or "0.0.0.0", 0))
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def local_address(self):
+        """
+        The address that spikes are received on.
+
+        :rtype: tuple(str, int)
+        """
+        return self.__transport.get_extra_info("sockname")[:2]
+
+    def __read_database(self, db_reader):
+        """
+        Read where spikes are to be sent and received from, in the thread of
+        the notifications from the toolchain, and wait while the event loop
+        takes the details and sets the IP tags.
+
+        :param ~spinn_front_end_common.utilities.database.DatabaseReader \
+                db_reader:
+        """
+        if db_reader.get_job():
+            raise ConfigurationException(
+                "Live spikes can't be sent or received with asyncio through "
+                "the proxy of a spalloc job")
+        n_neurons = dict()
+        send_targets = dict()
+        for label in self.__send_labels + list(
+                self.__poisson_controls.values()):
+            x, y, p = db_reader.get_placements(label)[0]
+            atom_id_to_key = db_reader.get_atom_id_to_key_mapping(label)
+            keys = numpy.zeros(len(atom_id_to_key), dtype="uint32")
+            keys[list(atom_id_to_key.keys())] = list(atom_id_to_key.values())
+            send_targets[label] = (
+                x, y, p, db_reader.get_ip_address(x, y), keys)
+            n_neurons[label] = len(keys)
+
+        key_to_atom_ids = list()
+        receivers = set()
+        for label in self.__receive_labels:
+            key_to_atom_id, receiver = self._read_receiver(db_reader, label)
+            if receiver is not None:
+                receivers.add(receiver)
+            key_to_atom_ids.append(key_to_atom_id)
+            n_neurons[label] = len(key_to_atom_id)
+
+        asyncio.run_coroutine_threadsafe(self.__use_database(
+            n_neurons, send_targets, KeyToAtomTable(key_to_atom_ids),
+            sorted(receivers)), self.__loop).result()
+
+    def _read_receiver(self, db_reader, label):
+        """
+        Read how the keys of the spikes of a population map to its neurons,
+        and which IP tag sends the spikes.
+
+        :param ~spinn_front_end_common.utilities.database.DatabaseReader \
+                db_reader:
+        :param str label: The label of the population
+        :return: The atom ID of each key, and the x, y, tag and board
+            address of the IP tag, or None if no tag is to be set
+        :rtype: tuple(dict(int,int), tuple(int,int,int,str) or None)
+        """
+        host, _, strip_sdp, board_address, tag, x, y = \
+            db_reader.get_live_output_details(
+                label, self.__live_packet_gather_label)
+        if host is None:
+            raise ConfigurationException(
+                f"no live output tag found for {label} in app graph")
+        if not strip_sdp:
+            raise ConfigurationException(
+                "Currently, only IP tags which strip the SDP headers are "
+                "supported")
+        return (db_reader.get_key_to_atom_id_mapping(label),
+                (x, y, tag, board_address))
+
+    async def __use_database(
+            self, n_neurons, send_targets, key_to_atom_table, receivers):
+        """
+        Take the details read from the database, and point the IP tags of
+        the spikes to be received at this connection.
+
+        :param dict(str,int) n_neurons:
+        :param dict(str,tuple) send_targets:
+        :param KeyToAtomTable key_to_atom_table:
+        :param list(tuple(int,int,int,str)) receivers:
+        """
+        self.__n_neurons = n_neurons
+        self.__send_targets = send_targets
+        self.__packet_buffers.clear()
+        self.__key_to_atom_table = key_to_atom_table
+        self.__receiver_details = receivers
+        await self.__set_tags()
+
+    async def __set_tags(self):
+        """
+        Point the IP tags of the spikes to be received at this connection.
+        """
+        for x, y, tag, board_address in self.__receiver_details:
+            request = IPTagSet(
+                x, y, [0, 0, 0, 0], 0, tag, strip=True, use_sender=True)
+            update_sdp_header_for_udp_send(request.sdp_header, x, y)
+            for _ in range(_TAG_TRIES):
+                self.__scp_response = self.__loop.create_future()
+                self.__transport.sendto(
+                    b"\0\0" + request.bytestring,
+                    (board_address, SCP_SCAMP_PORT))
+                try:
+                    await asyncio.wait_for(self.__scp_response, _TAG_TIMEOUT)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                logger.warning(
+                    "No response to setting IP tag {} of {}", tag,
+                    board_address)
+            self.__scp_response = None
+
+    async def __refresh_tags(self):
+        """
+        Set the IP tags periodically while the simulation runs.
+        """
+        while True:
+            await asyncio.sleep(_TAG_REFRESH_INTERVAL)
+            await self.__set_tags()
+
+    def __notify_start_resume(self):
+        self.__loop.call_soon_threadsafe(self.__start_resume)
+
+    def __notify_stop_pause(self):
+        self.__loop.call_soon_threadsafe(self.__stop_pause)
+
+    def __start_resume(self):
+        self._start_resume()
+        self.__stopped.clear()
+        self.__started.set()
+        if self.__tag_task is None and self.__receiver_details:
+            self.__tag_task = self.__loop.create_task(self.__refresh_tags())
+
+    def __stop_pause(self):
+        self._stop_pause()
+        self.__started.clear()
+        self.__stopped.set()
+        if self.__tag_task is not None:
+            self.__tag_task.cancel()
+            self.__tag_task = None
+
+    def _start_resume(self):
+        """
+        Called in the event loop when the simulation starts or resumes,
+        before anything waiting for the start is woken.
+        """
+
+    def _stop_pause(self):
+        """
+        Called in the event loop when the simulation pauses or stops,
+        before anything waiting for the stop is woken.
+        """
+
+    async def wait_for_start(self):
+        """
+        Wait until the simulation starts or resumes.
+        """
+        await self.__started.wait()
+
+    async def wait_for_stop(self):
+        """
+        Wait until the simulation pauses or stops.
+        """
+        await self.__stopped.wait()
+
+    def n_neurons(self, label):
+        """
+        Get the number of neurons of a population, once the simulation has
+        been set up.
+
+        :param str label: The label of the population
+        :rtype: int
+        """
+        return self.__n_neurons[self.__poisson_controls.get(label, label)]
+
+    @overrides(asyncio.DatagramProtocol.connection_made)
+    def connection_made(self, transport):
+        self.__transport = transport
+
+    @overrides(asyncio.DatagramProtocol.pause_writing)
+    def pause_writing(self):
+        self.__writable.clear()
+
+    @overrides(asyncio.DatagramProtocol.resume_writing)
+    def resume_writing(self):
+        self.__writable.set()
+
+    @overrides(asyncio.DatagramProtocol.error_received)
+    def error_received(self, exc):
+        logger.warning("Error on live spikes connection: {}", exc)
+
+    @overrides(asyncio.DatagramProtocol.datagram_received)
+    def datagram_received(self, data, addr):
+        received = time.perf_counter()
+        if self.__is_scp_response(data):
+            return
+        # Ignore commands
+        if (len(data) < _ONE_SHORT.size or
+                _ONE_SHORT.unpack_from(data)[0] & 0xC000 == 0x4000):
+            return
+        # pylint: disable=broad-except
+        try:
+            header, keys, payloads = unpack_packet(data)
+        except Exception:
+            logger.warning("problem handling received packet", exc_info=True)
+            return
+        times = payloads if header.is_time else None
+        self._receive_keys(keys, times, received)
+
+    def __is_scp_response(self, data):
+        """
+        Handle the response to setting an IP tag.
+
+        :param bytes data: The packet received
+        :return: Whether the packet was the response
+        :rtype: bool
+        """
+        if (self.__scp_response is None or self.__scp_response.done() or
+                len(data) != _SCP_OK_SIZE or
+                data[_SCP_FLAGS_BYTE] != _SCP_RESPONSE_FLAGS or
+                data[_SCP_DEST_CPU_BYTE] != _SCP_RESPONSE_DEST):
+            return False
+        self.__scp_response.set_result(data)
+        return True
+
+    def _receive_keys(self, keys, times, received):
+        """
+        Queue spikes received for the populations that sent them.
+
+        :param ~numpy.ndarray keys: The key of each spike
+        :param times: The time of each spike, or None if not known
+        :type times: ~numpy.ndarray or None
+        :param float received: When the spikes were received
+        """
+        known, atom_ids, label_ids = self.__key_to_atom_table.translate(keys)
+        self.__statistics.add_packet(len(keys), len(keys) - len(atom_ids))
+        if known is not None:
+            for key in numpy.unique(keys[~known]).tolist():
+                if key not in self.__error_keys:
+                    self.__error_keys.add(key)
+                    logger.warning("Received unexpected key {}", key)
+            keys = keys[known]
+            if times is not None:
+                times = times[known]
+            if not len(keys):
+                return
+        for label_id, label_keys, label_atom_ids, label_times in \
+                group_by_label(label_ids, keys, atom_ids, times):
+            self.__queue(self.__receive_labels[label_id], (
+                label_keys, label_atom_ids, label_times, received))
+
+    def __queue(self, label, item):
+        """
+        Queue an item for a population, dropping the oldest if the queue is
+        full.
+
+        :param str label: The label of the population
+        :param tuple item: The item to queue
+        """
+        queue = self.__queues[label]
+        if queue.full():
+            dropped = queue.get_nowait()
+            if dropped is not None:
+                self.__dropped[label] += len(dropped[0])
+                self.__statistics.add_dropped(len(dropped[0]))
+                self.__statistics.change_queue_depth(-1)
+        queue.put_nowait(item)
+        if item is not None:
+            self.__statistics.change_queue_depth(1)
+
+    async def spikes(self, label, translate_key=True):
+        """
+        Get the batches of spikes received from a population, until the
+        connection is closed.  Only one reader of each population is
+        supported.
+
+        :param str label: The label of the population
+        :param bool translate_key:
+            True if the keys are to be converted to neuron IDs, False if
+            they should stay keys
+        :rtype: ~collections.abc.AsyncIterator(SpikeBatch)
+        """
+        queue = self.__queues[label]
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            keys, atom_ids, times, received = item
+            self.__receive_latency.add(time.perf_counter() - received)
+            self.__statistics.change_queue_depth(-1)
+            self.__statistics.add_delivered(len(keys))
+            yield SpikeBatch(atom_ids if translate_key else keys, times)
+
+    def n_dropped(self, label):
+        """
+        Get the number of spikes received from a population that were
+        dropped because they were not read quickly enough.
+
+        :param str label: The label of the population
+        :rtype: int
+        """
+        return self.__dropped[label]
+
+    async def __send(self, label, eieio_type, keys, payloads=None):
+        """
+        Send keys and payloads to the core of a population, waiting while
+        the transport's buffer is full.
+
+        :param str label: The label of the population
+        :param ~spinnman.messages.eieio.EIEIOType eieio_type:
+            The type of the packets
+        :param ~numpy.ndarray keys: The keys to send
+        :param payloads: The payloads of the keys
+        :type payloads: ~numpy.ndarray or None
+        """
+        start = time.perf_counter()
+        x, y, p, ip_address, _ = self.__send_targets[label]
+        buffer_key = (label, eieio_type)
+        lock = self.__packet_locks.get(buffer_key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.__packet_locks[buffer_key] = lock
+
+        # The buffer is reused by every send of the same type to the same
+        # population, so another send must wait until all the packets
+        # packed into it have been given to the transport
+        async with lock:
+            if buffer_key not in self.__packet_buffers:
+                self.__packet_buffers[buffer_key] = (
+                    packet_prefix(x, y, p, eieio_type),
+                    packet_buffer(0, eieio_type))
+            prefix, buffer = self.__packet_buffers[buffer_key]
+            if len(buffer) * max_elements_per_packet(eieio_type) < len(keys):
+                buffer = packet_buffer(len(keys), eieio_type)
+                self.__packet_buffers[buffer_key] = (prefix, buffer)
+
+            # The transport copies what it can't send at once, so the buffer
+            # can be reused
+            sizes = pack_packets(buffer, prefix, eieio_type, keys, payloads)
+            for packet, size in enumerate(sizes.tolist()):
+                if not self.__writable.is_set():
+                    await self.__writable.wait()
+                self.__transport.sendto(
+                    memoryview(buffer[packet, :size]),
+                    (ip_address, SCP_SCAMP_PORT))
+        self.__send_latency.add(time.perf_counter() - start)
+
+    async def send_spikes(self, label, neuron_ids, send_full_keys=False):
+        """
+        Send a number of spikes.
+
+        :param str label:
+            The label of the population from which the spikes will originate
+        :param ~numpy.ndarray neuron_ids: The IDs of the neurons sending
+            spikes
+        :param bool send_full_keys: Determines whether to send full 32-bit
+            keys, getting the key for each neuron from the database, or
+            whether to send 16-bit neuron IDs directly
+        :raises SpinnmanInvalidParameterException:
+            If 16-bit neuron IDs are to be sent and an ID doesn't fit, or
+            full keys are to be sent and an ID is not that of a neuron of
+            the population
+        """
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64")
+        if not len(neuron_ids):
+            return
+        if send_full_keys:
+            await self.__send(
+                label, EIEIOType.KEY_32_BIT, self.__keys(label, neuron_ids))
+        else:
+            check_keys_fit(neuron_ids, EIEIOType.KEY_16_BIT, "neuron_ids")
+            await self.__send(label, EIEIOType.KEY_16_BIT, neuron_ids)
+
+    async def set_rates(self, label, neuron_ids, rates):
+        """
+        Set the rates of a number of neurons of a Poisson source.
+
+        :param str label: The label of the Poisson population
+        :param ~numpy.ndarray neuron_ids: The neuron IDs to set the rates of
+        :param ~numpy.ndarray rates: The rate of each neuron in Hz
+        :raises SpinnmanInvalidParameterException:
+            If a neuron ID is not that of a neuron of the source, or there
+            is not a rate for each neuron ID
+        """
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64")
+        rates = numpy.asarray(rates, dtype="float64")
+        if len(rates) != len(neuron_ids):
+            raise SpinnmanInvalidParameterException(
+                "rates", len(rates), "Not the same as the number of "
+                f"neuron_ids ({len(neuron_ids)})")
+        if not len(neuron_ids):
+            return
+        control = self.__poisson_controls[label]
+        await self.__send(
+            control, EIEIOType.KEY_PAYLOAD_32_BIT,
+            self.__keys(control, neuron_ids),
+            DataType.S1615.encode_as_numpy_int_array(rates))
+
+    def __keys(self, label, neuron_ids):
+        """
+        Get the keys of neurons of a population that is sent to.
+
+        :param str label: The label of the population
+        :param ~numpy.ndarray neuron_ids: The IDs of the neurons
+        :rtype: ~numpy.ndarray
+        :raises SpinnmanInvalidParameterException:
+            If an ID is not that of a neuron of the population
+        """
+        keys = self.__send_targets[label][4]
+        check_atom_ids(neuron_ids, len(keys), "neuron_ids")
+        return keys[neuron_ids]
+
+    @property
+    def receive_latency(self):
+        """
+        The time from receiving each batch of spikes until it is read.
+
+        :rtype: ~spynnaker.pyNN.utilities.latency_histogram.LatencyHistogram
+        """
+        return self.__receive_latency
+
+    @property
+    def statistics(self):
+        """
+        The counts of the spikes received and read.  The queue depth is the
+        number of batches of spikes waiting to be read.
+
+        :rtype: LiveConnectionStatistics
+        """
+        return self.__statistics
+
+    @property
+    def send_latency(self):
+        """
+        The time taken to send each group of spikes or rates, including
+        waiting for the transport's buffer.
+
+        :rtype: ~spynnaker.pyNN.utilities.latency_histogram.LatencyHistogram
+        """
+        return self.__send_latency
+
+    def close(self):
+        """
+        Close the connection, ending the iteration of received spikes.
+        """
+        if self.__tag_task is not None:
+            self.__tag_task.cancel()
+            self.__tag_task = None
+        if self.__database_connection is not None:
+            self.__database_connection.close()
+            self.__database_connection = None
+        if self.__transport is not None:
+            self.__transport.close()
+            self.__transport = None
+        for label in self.__queues:
+            self.__queue(label, None)
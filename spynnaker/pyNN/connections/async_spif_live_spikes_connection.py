@@ -0,0 +1,130 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import numpy
+from spinn_utilities.overrides import overrides
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from .async_live_spikes_connection import (
+    AsyncLiveSpikesConnection, _QUEUE_SIZE)
+from spynnaker.pyNN.external_devices_models.spif_devices import (
+    SPIF_OUTPUT_START, SPIF_OUTPUT_STOP, SPIF_OUTPUT_SET_TICK,
+    SPIF_OUTPUT_SET_LEN)
+from .spif_live_spikes_connection import (
+    _DEFAULT_SPIF_PORT, _EVENTS_PER_PACKET, _ONE_INT, _THREE_INTS,
+    _US_PER_PACKET)
+
+
+class AsyncSPIFLiveSpikesConnection(AsyncLiveSpikesConnection):
+    """
+    A connection for receiving live spikes from SPIF from an
+    :py:mod:`asyncio` event loop.
+
+    SPIF sends each packet of spikes as a UDP datagram of 32-bit keys, which
+    are received with a datagram transport on the event loop and queued
+    for each population in the same way as by
+    :py:class:`AsyncLiveSpikesConnection`.  For example::
+
+        async with AsyncSPIFLiveSpikesConnection(
+                ["pop"], "spif.example.com") as conn:
+            await conn.wait_for_start()
+            async for batch in conn.spikes("pop"):
+                ...
+
+    SPIF doesn't send the times of spikes, so the times of each batch are
+    always None.
+    """
+
+    __slots__ = [
+        "__spif_host",
+        "__spif_packet_size",
+        "__spif_packet_time_us",
+        "__spif_port",
+        "__transport"]
+
+    def __init__(
+            self, receive_labels, spif_host, spif_port=_DEFAULT_SPIF_PORT,
+            events_per_packet=_EVENTS_PER_PACKET,
+            time_per_packet=_US_PER_PACKET, local_host=None,
+            local_port=None, queue_size=_QUEUE_SIZE):
+        """
+        :param iterable(str) receive_labels:
+            Labels of populations from which live spikes will be received.
+        :param str spif_host: The location of the SPIF board receiving packets
+        :param int spif_port: The port of the SPIF board (default 3332)
+        :param int events_per_packet:
+            The maximum number of events in each packet.  SPIF will be
+            configured to send a packet as soon as it reaches this size if not
+            before (default is 32)
+        :param int time_per_packet:
+            The maximum time between sending non-empty packets.  SPIF will be
+            configured to send a packet that isn't empty after this many
+            microseconds (default is 500)
+        :param str local_host:
+            Optional specification of the local hostname or IP address of the
+            interface to listen on for notifications from the toolchain
+        :param int local_port:
+            Optional specification of the local port to listen on. Must match
+            the port that the toolchain will send the notification on (19999
+            by default)
+        :param int queue_size:
+            The number of batches of spikes of each population to keep until
+            they are read
+        """
+        # pylint: disable=too-many-arguments
+        super().__init__(
+            receive_labels=receive_labels, local_host=local_host,
+            local_port=local_port, queue_size=queue_size)
+        self.__spif_host = spif_host
+        self.__spif_port = spif_port
+        self.__spif_packet_size = events_per_packet * BYTES_PER_WORD
+        self.__spif_packet_time_us = time_per_packet
+        self.__transport = None
+
+    @overrides(AsyncLiveSpikesConnection._create_endpoint)
+    async def _create_endpoint(self, loop):
+        await loop.create_datagram_endpoint(
+            lambda: self, remote_addr=(self.__spif_host, self.__spif_port))
+
+    @overrides(AsyncLiveSpikesConnection.connection_made)
+    def connection_made(self, transport):
+        super().connection_made(transport)
+        self.__transport = transport
+
+    @overrides(AsyncLiveSpikesConnection._read_receiver)
+    def _read_receiver(self, db_reader, label):
+        # SPIF sends to wherever it was last told to, so there is no tag
+        return db_reader.get_key_to_atom_id_mapping(label), None
+
+    @overrides(AsyncLiveSpikesConnection._start_resume)
+    def _start_resume(self):
+        if self.__transport.is_closing():
+            return
+        self.__transport.sendto(_THREE_INTS.pack(
+            SPIF_OUTPUT_SET_LEN + self.__spif_packet_size,
+            SPIF_OUTPUT_SET_TICK + self.__spif_packet_time_us,
+            SPIF_OUTPUT_START))
+
+    @overrides(AsyncLiveSpikesConnection._stop_pause)
+    def _stop_pause(self):
+        if self.__transport.is_closing():
+            return
+        self.__transport.sendto(_ONE_INT.pack(SPIF_OUTPUT_STOP))
+
+    @overrides(AsyncLiveSpikesConnection.datagram_received)
+    def datagram_received(self, data, addr):
+        received = time.perf_counter()
+        keys = numpy.frombuffer(
+            data, dtype="<u4", count=len(data) // BYTES_PER_WORD)
+        self._receive_keys(keys, None, received)
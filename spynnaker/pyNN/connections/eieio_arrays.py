@@ -0,0 +1,259 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.eieio import AbstractEIEIOMessage, EIEIOPrefix
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
+from spinnman.messages.sdp import SDPFlag, SDPHeader
+
+# The most data in an SDP message
+_MAX_SDP_DATA_BYTES = 256
+
+# The size of an EIEIO data header without prefixes, which starts with the
+# count of elements
+_EIEIO_HEADER_BYTES = 2
+
+# Two bytes of padding, the SDP header and the EIEIO header
+_PACKET_HEADER_BYTES = 2 + 8 + _EIEIO_HEADER_BYTES
+
+# The offset of the count of elements in a packet
+_COUNT_OFFSET = _PACKET_HEADER_BYTES - _EIEIO_HEADER_BYTES
+
+
+def max_elements_per_packet(eieio_type):
+    """
+    Get the most elements of a type that fit in a packet with a header
+    without prefixes.
+
+    :param ~spinnman.messages.eieio.EIEIOType eieio_type:
+    :rtype: int
+    """
+    return ((_MAX_SDP_DATA_BYTES - _EIEIO_HEADER_BYTES) //
+            (eieio_type.key_bytes + eieio_type.payload_bytes))
+
+
+def _max_packet_bytes(eieio_type):
+    """
+    Get the size of a packet with the most elements of a type in it.
+
+    :param ~spinnman.messages.eieio.EIEIOType eieio_type:
+    :rtype: int
+    """
+    return _PACKET_HEADER_BYTES + max_elements_per_packet(eieio_type) * (
+        eieio_type.key_bytes + eieio_type.payload_bytes)
+
+
+def check_keys_fit(keys, eieio_type, parameter="keys"):
+    """
+    Check that keys fit in the keys of a type of packet, as adding each
+    key to a message of that type would.
+
+    :param ~numpy.ndarray keys: The keys to be sent
+    :param ~spinnman.messages.eieio.EIEIOType eieio_type:
+        The type of the packets
+    :param str parameter: The name of the keys in the error raised
+    :raises SpinnmanInvalidParameterException: If any key doesn't fit
+    """
+    if len(keys) and int(keys.max()) > eieio_type.max_value:
+        raise SpinnmanInvalidParameterException(
+            parameter, int(keys.max()),
+            f"Larger than the maximum allowed of {eieio_type.max_value}")
+
+
+def check_atom_ids(atom_ids, n_atoms, parameter="atom_ids"):
+    """
+    Check that atom IDs are those of a population, as looking each up in
+    the keys of the population would.
+
+    :param ~numpy.ndarray atom_ids: The atom IDs to be sent
+    :param int n_atoms: The number of atoms in the population
+    :param str parameter: The name of the atom IDs in the error raised
+    :raises SpinnmanInvalidParameterException: If any ID is out of range
+    """
+    bad = (atom_ids < 0) | (atom_ids >= n_atoms)
+    if numpy.any(bad):
+        raise SpinnmanInvalidParameterException(
+            parameter, int(atom_ids[bad][0]),
+            f"Not the ID of an atom of a population of {n_atoms}")
+
+
+def message_prefix(eieio_type):
+    """
+    Get the bytes that start each packet of a type that is only to be sent
+    as a message from :py:func:`packed_messages`, which leaves out the SDP
+    header, so that the header is left empty.
+
+    :param ~spinnman.messages.eieio.EIEIOType eieio_type:
+        The type of the packets
+    :rtype: ~numpy.ndarray
+    """
+    return numpy.frombuffer(
+        bytes(_COUNT_OFFSET) + EIEIODataHeader(eieio_type).bytestring,
+        dtype="uint8")
+
+
+def packet_prefix(x, y, p, eieio_type):
+    """
+    Get the bytes that start each packet of a type sent to a core, up to
+    and including the header of the packet, with a count of zero.
+
+    :param int x: The x-coordinate of the chip of the core
+    :param int y: The y-coordinate of the chip of the core
+    :param int p: The core
+    :param ~spinnman.messages.eieio.EIEIOType eieio_type:
+        The type of the packets
+    :rtype: ~numpy.ndarray
+    """
+    header = SDPHeader(
+        flags=SDPFlag.REPLY_NOT_EXPECTED, tag=0,
+        destination_port=1, destination_cpu=p,
+        destination_chip_x=x, destination_chip_y=y,
+        source_port=0, source_cpu=0, source_chip_x=0, source_chip_y=0)
+    return numpy.frombuffer(
+        b"\0\0" + header.bytestring +
+        EIEIODataHeader(eieio_type).bytestring, dtype="uint8")
+
+
+def packet_buffer(n_elements, eieio_type):
+    """
+    Make a buffer in which to pack elements of a type into packets.
+
+    :param int n_elements: The number of elements to be packed
+    :param ~spinnman.messages.eieio.EIEIOType eieio_type:
+        The type of the packets
+    :return: A buffer with a row for each packet
+    :rtype: ~numpy.ndarray
+    """
+    n_packets = -(-n_elements // max_elements_per_packet(eieio_type))
+    return numpy.zeros((n_packets, _max_packet_bytes(eieio_type)),
+                       dtype="uint8")
+
+
+def pack_packets(buffer, prefix, eieio_type, keys, payloads=None):
+    """
+    Pack keys, and payloads if the type has them, into packets, each of
+    which is written into a row of a buffer.
+
+    :param ~numpy.ndarray buffer:
+        The buffer, with a row for each packet; see :py:func:`packet_buffer`
+    :param ~numpy.ndarray prefix:
+        The bytes that start each packet; see :py:func:`packet_prefix`
+    :param ~spinnman.messages.eieio.EIEIOType eieio_type:
+        The type of the packets
+    :param ~numpy.ndarray keys: The keys to send
+    :param payloads: The payloads of the keys
+    :type payloads: ~numpy.ndarray or None
+    :return: The number of bytes in each packet
+    :rtype: ~numpy.ndarray
+    """
+    n_elements = len(keys)
+    max_elements = max_elements_per_packet(eieio_type)
+    n_packets = -(-n_elements // max_elements)
+    n_fields = 2 if eieio_type.payload_bytes else 1
+    element_bytes = eieio_type.key_bytes * n_fields
+    packets = buffer[:n_packets]
+    packets[:, :_PACKET_HEADER_BYTES] = prefix
+    counts = numpy.full(n_packets, max_elements)
+    counts[-1] = n_elements - (n_packets - 1) * max_elements
+    packets[:, _COUNT_OFFSET] = counts
+
+    # Write the keys and payloads in turn straight into the packets; the
+    # last packet may not be full
+    elements = packets[:, _PACKET_HEADER_BYTES:].view(
+        f"<u{eieio_type.key_bytes}").reshape(n_packets, max_elements, n_fields)
+    n_full = n_elements // max_elements
+    n_in_full = n_full * max_elements
+    fields = [keys] if payloads is None else [keys, payloads]
+    for field, values in enumerate(fields):
+        elements[:n_full, :, field] = values[:n_in_full].reshape(
+            n_full, max_elements)
+        if n_full < n_packets:
+            elements[n_full, :counts[-1], field] = values[n_in_full:]
+    return _PACKET_HEADER_BYTES + counts * element_bytes
+
+
+class PackedEIEIOMessage(AbstractEIEIOMessage):
+    """
+    An EIEIO data message that has already been packed into bytes, such as
+    a packet packed by :py:func:`pack_packets`, so that it can be sent in
+    the same way as any other message.
+    """
+
+    __slots__ = ["__data"]
+
+    def __init__(self, data):
+        """
+        :param bytes data: The bytes of the message, starting at its header
+        """
+        self.__data = bytes(data)
+
+    @property
+    @overrides(AbstractEIEIOMessage.eieio_header)
+    def eieio_header(self):
+        return EIEIODataHeader.from_bytestring(self.__data, 0)
+
+    @property
+    @overrides(AbstractEIEIOMessage.bytestring)
+    def bytestring(self):
+        return self.__data
+
+
+def packed_messages(buffer, sizes):
+    """
+    Get the messages in the packets packed by :py:func:`pack_packets`,
+    without the padding and SDP header that start each packet.
+
+    :param ~numpy.ndarray buffer: The buffer that the packets were packed in
+    :param ~numpy.ndarray sizes:
+        The number of bytes in each packet, as returned by
+        :py:func:`pack_packets`
+    :rtype: iterable(PackedEIEIOMessage)
+    """
+    for packet, size in enumerate(sizes.tolist()):
+        yield PackedEIEIOMessage(buffer[packet, _COUNT_OFFSET:size])
+
+
+def unpack_packet(data):
+    """
+    Read the keys, and payloads if there are any, of an EIEIO data packet.
+
+    :param bytes data: The packet
+    :return: The header, the keys and the payloads, or None if there are no
+        payloads
+    :rtype: tuple(~spinnman.messages.eieio.data_messages.EIEIODataHeader,
+        ~numpy.ndarray, ~numpy.ndarray or None)
+    """
+    header = EIEIODataHeader.from_bytestring(data, 0)
+    eieio_type = header.eieio_type
+    n_fields = 2 if eieio_type.payload_bytes else 1
+    elements = numpy.frombuffer(
+        data, dtype=f"<u{eieio_type.key_bytes}",
+        count=header.count * n_fields, offset=header.size).reshape(
+            header.count, n_fields).astype("uint32")
+    keys = elements[:, 0]
+    if header.prefix is not None:
+        if header.prefix_type == EIEIOPrefix.UPPER_HALF_WORD:
+            keys |= header.prefix << 16
+        else:
+            keys |= header.prefix
+    payloads = elements[:, 1] if n_fields == 2 else None
+    if header.payload_base is not None:
+        if payloads is None:
+            payloads = numpy.full(
+                header.count, header.payload_base, dtype="uint32")
+        else:
+            payloads |= header.payload_base
+    return header, keys, payloads
@@ -0,0 +1,126 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+
+
+class KeyToAtomTable(object):
+    """
+    Translates arrays of received keys into the atoms and labels that sent
+    them.  Each range of consecutive keys of consecutive atoms of a label
+    is described by its base key, end key, the offset from key to atom and
+    its label, sorted by base key.  The first range is empty, so that every
+    key is in the range of a base key.
+    """
+
+    __slots__ = [
+        # The first key of each range
+        "__bases",
+
+        # The key after the last of each range
+        "__ends",
+
+        # What to add to a key of each range to get its atom
+        "__atom_offsets",
+
+        # The label of each range
+        "__label_ids",
+
+        # The label of all the keys, if they all have the same label
+        "__only_label_id"]
+
+    def __init__(self, key_to_atom_ids=()):
+        """
+        :param list(dict(int,int)) key_to_atom_ids:
+            The atom of each key of each label, in order of label
+        """
+        keys = numpy.fromiter(
+            (key for mapping in key_to_atom_ids for key in mapping),
+            dtype="int64")
+        atom_ids = numpy.fromiter(
+            (atom for mapping in key_to_atom_ids for atom in mapping.values()),
+            dtype="int64", count=len(keys))
+        label_ids = numpy.repeat(
+            numpy.arange(len(key_to_atom_ids)),
+            [len(mapping) for mapping in key_to_atom_ids]).astype("int64")
+        order = numpy.argsort(keys, kind="stable")
+        keys = keys[order]
+        atom_ids = atom_ids[order]
+        label_ids = label_ids[order]
+        starts = numpy.flatnonzero(numpy.concatenate(([True], (
+            (numpy.diff(keys) != 1) | (numpy.diff(atom_ids) != 1) |
+            (numpy.diff(label_ids) != 0)))))[:len(keys)]
+        ends = numpy.concatenate((starts[1:], [len(keys)]))[:len(starts)]
+        self.__bases = numpy.concatenate(([0], keys[starts])).astype("uint32")
+        self.__ends = numpy.concatenate(([0], keys[ends - 1] + 1))
+        self.__atom_offsets = numpy.concatenate(
+            ([0], atom_ids[starts] - keys[starts]))
+        self.__label_ids = numpy.concatenate(([0], label_ids[starts]))
+        self.__only_label_id = None
+        if len(keys) and numpy.all(label_ids == label_ids[0]):
+            self.__only_label_id = int(label_ids[0])
+
+    def translate(self, keys):
+        """
+        Find the atoms and labels of keys.
+
+        :param ~numpy.ndarray keys: The keys to translate
+        :return:
+            Which keys are known (or None if they all are), and the atom and
+            label of each known key; the labels are a single label if all the
+            known keys are of that label
+        :rtype: tuple(~numpy.ndarray or None, ~numpy.ndarray,
+            ~numpy.ndarray or int)
+        """
+        ranges = numpy.searchsorted(self.__bases, keys, side="right") - 1
+        known = keys < self.__ends[ranges]
+        if known.all():
+            known = None
+        else:
+            keys = keys[known]
+            ranges = ranges[known]
+        atom_ids = keys + self.__atom_offsets[ranges]
+        if self.__only_label_id is not None:
+            return known, atom_ids, self.__only_label_id
+        label_ids = self.__label_ids[ranges]
+        if len(label_ids) and (label_ids == label_ids[0]).all():
+            return known, atom_ids, int(label_ids[0])
+        return known, atom_ids, label_ids
+
+
+def group_by_label(label_ids, *arrays):
+    """
+    Group arrays of values by their label, keeping the order within each
+    label.
+
+    :param label_ids: The label of each value, or the label of all of them
+    :type label_ids: ~numpy.ndarray or int
+    :param ~numpy.ndarray arrays: The values, or None where there are none
+    :return: Each label with its values from each of the arrays
+    :rtype: iterable(tuple(int, ~numpy.ndarray, ...))
+    """
+    if isinstance(label_ids, int):
+        yield (label_ids, *arrays)
+        return
+    if not len(label_ids):
+        return
+    order = numpy.argsort(label_ids, kind="stable")
+    label_ids = label_ids[order]
+    arrays = [None if values is None else values[order] for values in arrays]
+    starts = numpy.flatnonzero(numpy.diff(label_ids)) + 1
+    for start, end in zip([0] + starts.tolist(),
+                          starts.tolist() + [len(label_ids)]):
+        yield (int(label_ids[start]), *(
+            None if values is None else values[start:end]
+            for values in arrays))
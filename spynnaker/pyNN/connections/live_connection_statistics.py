@@ -0,0 +1,273 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from threading import Condition
+import time
+from spynnaker.pyNN.utilities.latency_histogram import LatencyHistogram
+
+
+class LiveConnectionStatistics(object):
+    """
+    Counts what a live connection receives and what it does with it, so
+    that spikes lost at high rates can be noticed.  The counts can be
+    polled while the connection is in use, or taken together as a
+    snapshot that can be written as JSON.
+
+    The number of events received can be compared with the number that
+    the live packet gatherer reports having sent; any difference was lost
+    before it reached the connection.
+
+    What the queue depth counts depends on the connection: events read
+    from the socket but not yet handled, or batches of events waiting to
+    be read.
+    """
+
+    __slots__ = [
+        # Stops updates from different threads mixing, and wakes those
+        # waiting for the queue to empty
+        "__condition",
+
+        # When counting started
+        "__start_time",
+
+        # The number of packets of events received
+        "__packets_received",
+
+        # The number of events in the packets received
+        "__events_received",
+
+        # The number of events with keys that are not known
+        "__unknown_keys",
+
+        # The number of events passed on to callbacks or readers
+        "__events_delivered",
+
+        # The number of events dropped because they were not read in time
+        "__events_dropped",
+
+        # The time taken by each callback of each group of events
+        "__callback_time",
+
+        # The number of events or batches waiting to be handled
+        "__queue_depth",
+
+        # The most events or batches that have been waiting
+        "__max_queue_depth"]
+
+    def __init__(self):
+        self.__condition = Condition()
+        self.__callback_time = LatencyHistogram()
+        self.__queue_depth = 0
+        self.reset()
+
+    def reset(self):
+        """
+        Set all the counts back to zero, apart from the current queue
+        depth.
+        """
+        with self.__condition:
+            self.__start_time = time.monotonic()
+            self.__packets_received = 0
+            self.__events_received = 0
+            self.__unknown_keys = 0
+            self.__events_delivered = 0
+            self.__events_dropped = 0
+            self.__callback_time.reset()
+            self.__max_queue_depth = self.__queue_depth
+
+    def add_packet(self, n_events, n_unknown=0):
+        """
+        Count a packet that has been received and decoded.
+
+        :param int n_events: The number of events in the packet
+        :param int n_unknown: The number of the events with unknown keys
+        """
+        with self.__condition:
+            self.__packets_received += 1
+            self.__events_received += n_events
+            self.__unknown_keys += n_unknown
+
+    def add_delivered(self, n_events):
+        """
+        Count events that have been passed on, once however many callbacks
+        they are passed to.
+
+        :param int n_events: The number of events
+        """
+        with self.__condition:
+            self.__events_delivered += n_events
+
+    def add_callback_time(self, callback_time):
+        """
+        Record the time taken by a callback that events were passed to.
+
+        :param float callback_time: The time in seconds
+        """
+        with self.__condition:
+            self.__callback_time.add(callback_time)
+
+    def add_dropped(self, n_events):
+        """
+        Count events that were dropped because they were not read in time.
+
+        :param int n_events: The number of events
+        """
+        with self.__condition:
+            self.__events_dropped += n_events
+
+    def change_queue_depth(self, change):
+        """
+        Change the number of events or batches waiting to be handled.
+
+        :param int change: The number added, or removed if negative
+        """
+        with self.__condition:
+            self.__queue_depth += change
+            if self.__queue_depth > self.__max_queue_depth:
+                self.__max_queue_depth = self.__queue_depth
+            if not self.__queue_depth:
+                self.__condition.notify_all()
+
+    def wait_until_queue_empty(self, timeout=None):
+        """
+        Wait until nothing is waiting to be handled.
+
+        :param timeout: The longest time to wait in seconds, or None to wait
+            for as long as it takes
+        :type timeout: float or None
+        :return: Whether the queue is empty
+        :rtype: bool
+        """
+        with self.__condition:
+            return self.__condition.wait_for(
+                lambda: not self.__queue_depth, timeout)
+
+    @property
+    def packets_received(self):
+        """
+        The number of packets of events received.
+
+        :rtype: int
+        """
+        return self.__packets_received
+
+    @property
+    def events_received(self):
+        """
+        The number of events in the packets received.
+
+        :rtype: int
+        """
+        return self.__events_received
+
+    @property
+    def unknown_keys(self):
+        """
+        The number of events received with keys that are not known.
+
+        :rtype: int
+        """
+        return self.__unknown_keys
+
+    @property
+    def events_delivered(self):
+        """
+        The number of events passed on to callbacks or readers.
+
+        :rtype: int
+        """
+        return self.__events_delivered
+
+    @property
+    def events_dropped(self):
+        """
+        The number of events dropped because they were not read in time.
+
+        :rtype: int
+        """
+        return self.__events_dropped
+
+    @property
+    def callback_time(self):
+        """
+        The time taken by each callback that events were passed to.
+
+        :rtype: ~spynnaker.pyNN.utilities.latency_histogram.LatencyHistogram
+        """
+        return self.__callback_time
+
+    @property
+    def queue_depth(self):
+        """
+        The number of events or batches waiting to be handled.
+
+        :rtype: int
+        """
+        return self.__queue_depth
+
+    @property
+    def max_queue_depth(self):
+        """
+        The most events or batches that have been waiting to be handled.
+
+        :rtype: int
+        """
+        return self.__max_queue_depth
+
+    def snapshot(self):
+        """
+        Get all the counts at once.
+
+        :return: The counts, which can be written as JSON
+        :rtype: dict(str, object)
+        """
+        with self.__condition:
+            elapsed = time.monotonic() - self.__start_time
+            callback_time = self.__callback_time
+            return {
+                "elapsed": elapsed,
+                "packets_received": self.__packets_received,
+                "events_received": self.__events_received,
+                "unknown_keys": self.__unknown_keys,
+                "events_delivered": self.__events_delivered,
+                "events_dropped": self.__events_dropped,
+                "events_per_second": (
+                    self.__events_received / elapsed if elapsed else 0.0),
+                "queue_depth": self.__queue_depth,
+                "max_queue_depth": self.__max_queue_depth,
+                "callback_time": {
+                    "n_samples": callback_time.n_samples,
+                    "mean": callback_time.mean,
+                    "p99": callback_time.percentile(99),
+                    "max": callback_time.max,
+                    "counts": callback_time.counts.tolist(),
+                    # The last bucket has no upper edge
+                    "bucket_edges": callback_time.bucket_edges[:-1].tolist()}}
+
+    def to_json(self, **kwargs):
+        """
+        Get all the counts at once as JSON.
+
+        :param kwargs: Passed to :py:func:`json.dumps`
+        :rtype: str
+        """
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def __repr__(self):
+        return (f"LiveConnectionStatistics({self.__packets_received} packets, "
+                f"{self.__events_received} events received, "
+                f"{self.__events_delivered} delivered, "
+                f"{self.__events_dropped} dropped, "
+                f"{self.__unknown_keys} unknown)")
@@ -0,0 +1,369 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import namedtuple
+import json
+from threading import Lock
+import time
+import numpy
+from spynnaker.pyNN.exceptions import SpynnakerException
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # Before Python 3.8
+    resource_tracker = shared_memory = None
+
+#: The time of spikes whose time is not known
+NO_TIME = 0xFFFFFFFF
+
+# Identifies a buffer of spikes
+_MAGIC = 0x5350494B45524E47
+
+# The words of the header: the magic number, the number of events the
+# buffer holds, the size of the labels, the number of events that have
+# been started to be written, and the number of events written
+_HEADER_WORDS = 5
+(_MAGIC_WORD, _CAPACITY_WORD, _LABELS_SIZE_WORD, _RESERVED_WORD,
+ _WRITTEN_WORD) = range(_HEADER_WORDS)
+_HEADER_BYTES = _HEADER_WORDS * 8
+
+# An event in the buffer
+_EVENT_DTYPE = numpy.dtype(
+    [("time", "<u4"), ("atom", "<u4"), ("label", "<u4")])
+
+# How long a reader sleeps between looking for events by default
+_POLL_INTERVAL = 0.00005
+
+#: Events read from a buffer of spikes
+SpikeEvents = namedtuple("SpikeEvents", ["times", "atom_ids", "label_ids"])
+SpikeEvents.__doc__ = """
+    Events read from a buffer of spikes.
+
+    :ivar ~numpy.ndarray times:
+        The time step of each spike, or :py:const:`NO_TIME` if not known
+    :ivar ~numpy.ndarray atom_ids: The neuron of each spike
+    :ivar ~numpy.ndarray label_ids:
+        The index in the labels of the buffer of the population of each spike
+    """
+
+
+def _check_shared_memory():
+    if shared_memory is None:
+        raise SpynnakerException(
+            "Sharing spikes in memory needs Python 3.8 or later")
+
+
+def _layout(shm):
+    """
+    Get the parts of a buffer of spikes.
+
+    :param ~multiprocessing.shared_memory.SharedMemory shm:
+    :return: The header, the labels, and the events
+    :rtype: tuple(~numpy.ndarray, list(str), ~numpy.ndarray)
+    """
+    header = numpy.ndarray(_HEADER_WORDS, dtype="<u8", buffer=shm.buf)
+    if header[_MAGIC_WORD] != _MAGIC:
+        raise SpynnakerException(
+            f"Shared memory {shm.name} is not a buffer of spikes")
+    labels_size = int(header[_LABELS_SIZE_WORD])
+    labels = json.loads(bytes(
+        shm.buf[_HEADER_BYTES:_HEADER_BYTES + labels_size]).decode("utf-8"))
+    events = numpy.ndarray(
+        int(header[_CAPACITY_WORD]), dtype=_EVENT_DTYPE, buffer=shm.buf,
+        offset=_HEADER_BYTES + labels_size)
+    return header, labels, events
+
+
+class SharedMemorySpikeWriter(object):
+    """
+    Writes live spikes into a ring buffer in shared memory, from which any
+    number of local processes can read them with a
+    :py:class:`SharedMemorySpikeReader`, so that the spikes are received and
+    decoded only once.
+
+    Spikes can be written directly, from the callbacks of a
+    :py:class:`~spynnaker.pyNN.connections.SpynnakerLiveSpikesConnection`
+    with :py:meth:`receive_callback`, or from an
+    :py:class:`~spynnaker.pyNN.connections.AsyncLiveSpikesConnection` with
+    :py:meth:`write_from`.
+
+    The buffer starts with two counts of events: those that have been
+    started to be written, which is updated before any slot is touched,
+    and those written, which is only updated after the events are written.
+    Readers need no lock; they read up to the events written, and then
+    discard any whose slots the writer may have started to overwrite while
+    they were being copied.  When the buffer is full the oldest events are
+    overwritten; readers that fall that far behind lose them, and count
+    them.
+    """
+
+    __slots__ = [
+        # The shared memory
+        "__shm",
+
+        # The header of the buffer
+        "__header",
+
+        # The labels of the populations, and the index of each
+        "__labels",
+        "__label_ids",
+
+        # The events in the buffer
+        "__events",
+
+        # Stops writes from different threads mixing
+        "__lock"]
+
+    def __init__(self, name, labels, capacity=1 << 20):
+        """
+        :param name:
+            The name of the shared memory to create, or None to make a
+            unique one; see :py:attr:`name`
+        :type name: str or None
+        :param list(str) labels: The labels of the populations of the spikes
+        :param int capacity: The number of events that the buffer holds
+        """
+        _check_shared_memory()
+        self.__labels = list(labels)
+        self.__label_ids = {
+            label: label_id for label_id, label in enumerate(self.__labels)}
+        label_bytes = json.dumps(self.__labels).encode("utf-8")
+        # Keep the events aligned
+        label_bytes += b" " * (-len(label_bytes) % 8)
+        self.__shm = shared_memory.SharedMemory(
+            name=name, create=True, size=(
+                _HEADER_BYTES + len(label_bytes) +
+                capacity * _EVENT_DTYPE.itemsize))
+        self.__shm.buf[_HEADER_BYTES:_HEADER_BYTES + len(label_bytes)] = \
+            label_bytes
+        header = numpy.ndarray(
+            _HEADER_WORDS, dtype="<u8", buffer=self.__shm.buf)
+        header[:] = [_MAGIC, capacity, len(label_bytes), 0, 0]
+        self.__header, _, self.__events = _layout(self.__shm)
+        self.__lock = Lock()
+
+    @property
+    def name(self):
+        """
+        The name of the shared memory, by which readers attach to it.
+
+        :rtype: str
+        """
+        return self.__shm.name
+
+    @property
+    def n_written(self):
+        """
+        The number of events written.
+
+        :rtype: int
+        """
+        return int(self.__header[_WRITTEN_WORD])
+
+    def write(self, label, times, atom_ids):
+        """
+        Write spikes of a population into the buffer.
+
+        :param str label: The label of the population
+        :param times: The time step of each spike, or of all of them
+        :type times: ~numpy.ndarray or int
+        :param ~numpy.ndarray atom_ids: The neuron of each spike
+        """
+        atom_ids = numpy.asarray(atom_ids)
+        n_events = len(atom_ids)
+        if not n_events:
+            return
+        capacity = len(self.__events)
+        label_id = self.__label_ids[label]
+        times = numpy.broadcast_to(times, atom_ids.shape)
+        with self.__lock:
+            written = int(self.__header[_WRITTEN_WORD])
+            # Only the last of more events than fit are kept; event i goes
+            # in slot (written + i) % capacity
+            first = max(n_events - capacity, 0)
+            start = (written + first) % capacity
+            middle = min(n_events, first + capacity - start)
+            # Readers discard events in slots that may be being written
+            self.__header[_RESERVED_WORD] = written + n_events
+            self.__put(start, label_id, times[first:middle],
+                       atom_ids[first:middle])
+            self.__put(0, label_id, times[middle:], atom_ids[middle:])
+            # Readers only look at events once they are counted
+            self.__header[_WRITTEN_WORD] = written + n_events
+
+    def __put(self, start, label_id, times, atom_ids):
+        """
+        Put events into consecutive slots of the buffer.
+
+        :param int start: The first slot
+        :param int label_id: The label of the events
+        :param ~numpy.ndarray times: The time of each event
+        :param ~numpy.ndarray atom_ids: The atom of each event
+        """
+        events = self.__events[start:start + len(atom_ids)]
+        events["time"] = times
+        events["atom"] = atom_ids
+        events["label"] = label_id
+
+    def receive_callback(self, label, time_step, atom_ids):
+        """
+        Write spikes received by a live spikes connection; add this as a
+        receive callback of each population to be shared.
+
+        :param str label: The label of the population
+        :param int time_step: The time step of the spikes
+        :param list(int) atom_ids: The neuron of each spike
+        """
+        self.write(label, time_step, atom_ids)
+
+    async def write_from(self, connection, label):
+        """
+        Write the spikes of a population received by an asyncio live spikes
+        connection, until the connection is closed.
+
+        :param ~spynnaker.pyNN.connections.AsyncLiveSpikesConnection \
+                connection:
+            The connection receiving the spikes
+        :param str label: The label of the population
+        """
+        async for batch in connection.spikes(label):
+            self.write(
+                label, NO_TIME if batch.times is None else batch.times,
+                batch.ids)
+
+    def close(self):
+        """
+        Stop writing to the shared memory, and remove it; readers that
+        are attached can still read what was written.
+        """
+        self.__header = self.__events = None
+        self.__shm.close()
+        # A reader in a process sharing the resource tracker of this one
+        # will have unregistered the memory, which unlinking does again
+        # pylint: disable=protected-access
+        resource_tracker.register(self.__shm._name, "shared_memory")
+        self.__shm.unlink()
+
+
+class SharedMemorySpikeReader(object):
+    """
+    Reads live spikes from a ring buffer in shared memory written by a
+    :py:class:`SharedMemorySpikeWriter`, possibly in another process.
+    Each reader reads all the events written after it attaches.
+    """
+
+    __slots__ = [
+        # The shared memory
+        "__shm",
+
+        # The header of the buffer
+        "__header",
+
+        # The labels of the populations
+        "__labels",
+
+        # The events in the buffer
+        "__events",
+
+        # The number of events written that have been read or lost
+        "__n_read",
+
+        # The number of events lost by not being read in time
+        "__n_lost"]
+
+    def __init__(self, name):
+        """
+        :param str name: The name of the shared memory of the writer
+        """
+        _check_shared_memory()
+        self.__shm = shared_memory.SharedMemory(name=name)
+        # The writer owns the memory, so it must not be removed when this
+        # process ends
+        # pylint: disable=protected-access
+        resource_tracker.unregister(self.__shm._name, "shared_memory")
+        self.__header, self.__labels, self.__events = _layout(self.__shm)
+        self.__n_read = int(self.__header[_WRITTEN_WORD])
+        self.__n_lost = 0
+
+    @property
+    def labels(self):
+        """
+        The labels of the populations, indexed by the label IDs of events.
+
+        :rtype: list(str)
+        """
+        return list(self.__labels)
+
+    @property
+    def n_lost(self):
+        """
+        The number of events that were overwritten before they were read.
+
+        :rtype: int
+        """
+        return self.__n_lost
+
+    def read(self):
+        """
+        Read the events written since the last read, without waiting.
+
+        :rtype: SpikeEvents
+        """
+        capacity = len(self.__events)
+        written = int(self.__header[_WRITTEN_WORD])
+        if written - self.__n_read > capacity:
+            self.__n_lost += written - capacity - self.__n_read
+            self.__n_read = written - capacity
+        start = self.__n_read % capacity
+        n_events = written - self.__n_read
+        events = numpy.concatenate((
+            self.__events[start:start + n_events],
+            self.__events[:max(start + n_events - capacity, 0)]))
+
+        # Events in slots that the writer started to overwrite while they
+        # were being copied are lost
+        overwritten = min(int(self.__header[_RESERVED_WORD]) - capacity - (
+            self.__n_read), n_events)
+        if overwritten > 0:
+            self.__n_lost += overwritten
+            events = events[overwritten:]
+        self.__n_read = written
+        return SpikeEvents(events["time"], events["atom"], events["label"])
+
+    def wait(self, timeout=None, poll_interval=_POLL_INTERVAL):
+        """
+        Read the events written since the last read, waiting until there
+        are some.
+
+        :param timeout:
+            How long to wait in seconds, or None to wait until there are
+            events
+        :type timeout: float or None
+        :param float poll_interval: How long to sleep between looks
+        :return: The events, which are empty if the wait timed out
+        :rtype: SpikeEvents
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        while int(self.__header[_WRITTEN_WORD]) == self.__n_read:
+            if end is not None and time.monotonic() >= end:
+                break
+            time.sleep(poll_interval)
+        return self.read()
+
+    def close(self):
+        """
+        Detach from the shared memory.
+        """
+        self.__header = self.__events = None
+        self.__shm.close()
@@ -14,12 +14,20 @@
 
 import logging
 import struct
+import time
+import numpy
 from threading import Thread
 from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
 from spinnman.connections import ConnectionListener
 from spinnman.connections.udp_packet_connections import UDPConnection
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.database import DatabaseConnection
+from spynnaker.pyNN.external_devices_models.spif_devices import (
+    SPIF_OUTPUT_START, SPIF_OUTPUT_STOP, SPIF_OUTPUT_SET_TICK,
+    SPIF_OUTPUT_SET_LEN)
+from .key_to_atom_table import KeyToAtomTable, group_by_label
+from .live_connection_statistics import LiveConnectionStatistics
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -38,29 +46,50 @@ _EVENTS_PER_PACKET = 32
 # The maximum time between packets in microseconds by default
 _US_PER_PACKET = 500
 
-# SPIF message to start sending
-_SPIF_OUTPUT_START = 0x5ec00000
 
-# SPIF message to stop sending
-_SPIF_OUTPUT_STOP = 0x5ec10000
+class _CountingUDPConnection(UDPConnection):
+    """
+    A UDP connection that adds the events in each packet read to the queue
+    depth of some statistics, so that the events waiting for a handler are
+    counted as well as those being handled.
+    """
+    __slots__ = ["__statistics"]
+
+    def __init__(self, statistics, remote_host, remote_port):
+        """
+        :param LiveConnectionStatistics statistics:
+        :param str remote_host:
+        :param int remote_port:
+        """
+        super().__init__(remote_host=remote_host, remote_port=remote_port)
+        self.__statistics = statistics
 
-# SPIF message to set packet send time (time is added to this in microseconds)
-_SPIF_OUTPUT_SET_TICK = 0x5ec20000
+    @overrides(UDPConnection.get_receive_method)
+    def get_receive_method(self):
+        return self.__receive_counted
 
-# SPIF message to set packet size (size is added to this in bytes)
-_SPIF_OUTPUT_SET_LEN = 0x5ec40000
+    def __receive_counted(self):
+        data = self.receive()
+        self.__statistics.change_queue_depth(len(data) // BYTES_PER_WORD)
+        return data
 
 
 class SPIFLiveSpikesConnection(DatabaseConnection):
     """
     A connection for receiving live spikes from SPIF.
+
+    .. note::
+        Receive callbacks are given the atom IDs (or keys) of each packet as
+        a :py:class:`~numpy.ndarray`, not as a list of ints as they were
+        before; the keys may be read-only, so code that changes or extends
+        what it is given should convert it with ``.tolist()`` first.
     """
     # TODO: define SPIF
     __slots__ = [
         "_atom_id_to_key",
         "__error_keys",
         "__init_callbacks",
-        "__key_to_atom_id_and_label",
+        "__key_to_atom_table",
         "__live_event_callbacks",
         "__pause_stop_callbacks",
         "__receive_labels",
@@ -70,7 +99,8 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         "__spif_host",
         "__spif_port",
         "__spif_packet_size",
-        "__spif_packet_time_us"]
+        "__spif_packet_time_us",
+        "__statistics"]
 
     def __init__(self, receive_labels, spif_host, spif_port=_DEFAULT_SPIF_PORT,
                  events_per_packet=_EVENTS_PER_PACKET,
@@ -112,7 +142,7 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         self.__spif_packet_size = events_per_packet * BYTES_PER_WORD
         self.__spif_packet_time_us = time_per_packet
         self._atom_id_to_key = dict()
-        self.__key_to_atom_id_and_label = dict()
+        self.__key_to_atom_table = KeyToAtomTable()
         self.__live_event_callbacks = list()
         self.__start_resume_callbacks = dict()
         self.__pause_stop_callbacks = dict()
@@ -126,6 +156,18 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         self.__receiver_listener = None
         self.__receiver_connection = None
         self.__error_keys = set()
+        self.__statistics = LiveConnectionStatistics()
+
+    @property
+    def statistics(self):
+        """
+        The counts of the spikes received and passed to callbacks.  The
+        queue depth is the number of events that have been read from the
+        socket but not yet handled.
+
+        :rtype: LiveConnectionStatistics
+        """
+        return self.__statistics
 
     def add_receive_label(self, label):
         """
@@ -166,8 +208,9 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
             Must be one of the vertices listed in the constructor
         :param live_event_callback: A function to be called when events are
             received. This should take as parameters the label of the vertex,
-            and an array-like of atom IDs.
-        :type live_event_callback: callable(str, list(int)) -> None
+            and the atom IDs (or keys) as a :py:class:`~numpy.ndarray`, not
+            as a list
+        :type live_event_callback: callable(str, ~numpy.ndarray) -> None
         :param bool translate_key:
             True if the key is to be converted to an atom ID, False if the
             key should stay a key
@@ -236,14 +279,14 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         """
         # Set up a single connection for receive
         if self.__receiver_connection is None:
-            self.__receiver_connection = UDPConnection(
-                remote_host=self.__spif_host, remote_port=self.__spif_port)
-        for label_id, label in enumerate(self.__receive_labels):
-
+            self.__receiver_connection = _CountingUDPConnection(
+                self.__statistics, self.__spif_host, self.__spif_port)
+        key_to_atom_ids = list()
+        for label in self.__receive_labels:
             key_to_atom_id = db.get_key_to_atom_id_mapping(label)
-            for key, atom_id in key_to_atom_id.items():
-                self.__key_to_atom_id_and_label[key] = (atom_id, label_id)
+            key_to_atom_ids.append(key_to_atom_id)
             vertex_sizes[label] = len(key_to_atom_id)
+        self.__key_to_atom_table = KeyToAtomTable(key_to_atom_ids)
 
         # Last of all, set up the listener for packets
         # NOTE: Has to be done last as otherwise will receive SCP messages
@@ -272,16 +315,16 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
     def __do_start_resume(self):
         # Send SPIF configuration
         self.__receiver_connection.send(_THREE_INTS.pack(
-            _SPIF_OUTPUT_SET_LEN + self.__spif_packet_size,
-            _SPIF_OUTPUT_SET_TICK + self.__spif_packet_time_us,
-            _SPIF_OUTPUT_START))
+            SPIF_OUTPUT_SET_LEN + self.__spif_packet_size,
+            SPIF_OUTPUT_SET_TICK + self.__spif_packet_time_us,
+            SPIF_OUTPUT_START))
         for label, callbacks in self.__start_resume_callbacks.items():
             for callback in callbacks:
                 self.__launch_thread("start_resume", label, callback)
 
     def __do_stop_pause(self):
         # Stop SPIF output
-        self.__receiver_connection.send(_ONE_INT.pack(_SPIF_OUTPUT_STOP))
+        self.__receiver_connection.send(_ONE_INT.pack(SPIF_OUTPUT_STOP))
         for label, callbacks in self.__pause_stop_callbacks.items():
             for callback in callbacks:
                 self.__launch_thread("pause_stop", label, callback)
@@ -293,32 +336,50 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
             self.__handle_packet(packet)
         except Exception:
             logger.warning("problem handling received packet", exc_info=True)
+        finally:
+            # The events were counted when the packet was read
+            self.__statistics.change_queue_depth(
+                -(len(packet) // BYTES_PER_WORD))
 
     def __handle_packet(self, packet):
-        key_labels = dict()
-        atoms_labels = dict()
-        n_events = len(packet) // BYTES_PER_WORD
-        events = struct.unpack(f"<{n_events}I", packet)
-        for key in events:
-            if key in self.__key_to_atom_id_and_label:
-                atom_id, label_id = self.__key_to_atom_id_and_label[key]
-                if label_id not in key_labels:
-                    key_labels[label_id] = list()
-                    atoms_labels[label_id] = list()
-                key_labels[label_id].append(key)
-                atoms_labels[label_id].append(atom_id)
-            else:
-                self.__handle_unknown_key(key)
+        keys = numpy.frombuffer(
+            packet, dtype="<u4", count=len(packet) // BYTES_PER_WORD)
 
-        for label_id in key_labels:
-            label = self.__receive_labels[label_id]
-            for c_back, use_atom in self.__live_event_callbacks[label_id]:
-                if use_atom:
-                    c_back(label, atoms_labels[label_id])
-                else:
-                    c_back(label, key_labels[label_id])
+        known, atom_ids, label_ids = self.__key_to_atom_table.translate(keys)
+        self.__statistics.add_packet(len(keys), len(keys) - len(atom_ids))
+        if known is not None:
+            for key in numpy.unique(keys[~known]).tolist():
+                self.__handle_unknown_key(key)
+            keys = keys[known]
+            if not len(keys):
+                return
+        for label_id, label_keys, label_atom_ids in group_by_label(
+                label_ids, keys, atom_ids):
+            self.__call_receive_callbacks(label_id, label_keys, label_atom_ids)
+
+    def __call_receive_callbacks(self, label_id, keys, atom_ids):
+        """
+        :param int label_id: The index of the label the events are from
+        :param ~numpy.ndarray keys: The keys of the events
+        :param ~numpy.ndarray atom_ids: The atom of each of the events
+        """
+        label = self.__receive_labels[label_id]
+        for c_back, use_atom in self.__live_event_callbacks[label_id]:
+            start_time = time.perf_counter()
+            if use_atom:
+                c_back(label, atom_ids)
+            else:
+                c_back(label, keys)
+            self.__statistics.add_callback_time(
+                time.perf_counter() - start_time)
+        self.__statistics.add_delivered(len(keys))
 
     def __handle_unknown_key(self, key):
         if key not in self.__error_keys:
             self.__error_keys.add(key)
             logger.warning("Received unexpected key {}", key)
+
+    @overrides(DatabaseConnection.close)
+    def close(self):
+        self.__handle_possible_rerun_state()
+        super().close()
@@ -12,13 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import time
+import numpy
+from spinn_utilities.overrides import overrides
+from spinnman.messages.eieio import EIEIOType
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
+from .eieio_arrays import (
+    check_atom_ids, check_keys_fit, max_elements_per_packet, message_prefix,
+    pack_packets, packed_messages, packet_buffer)
+from .live_connection_statistics import LiveConnectionStatistics
 
-# The maximum number of 32-bit keys that will fit in a packet
-_MAX_FULL_KEYS_PER_PACKET = 63
-# The maximum number of 16-bit keys that will fit in a packet
-_MAX_HALF_KEYS_PER_PACKET = 127
+# The types of packets of spikes, by whether they hold full keys
+_SPIKE_PACKET_TYPES = {
+    False: EIEIOType.KEY_16_BIT,
+    True: EIEIOType.KEY_32_BIT}
+
+# The bytes that start each packet of spikes, by type
+_SPIKE_PACKET_PREFIXES = {
+    eieio_type: message_prefix(eieio_type)
+    for eieio_type in _SPIKE_PACKET_TYPES.values()}
 
 
 class SpynnakerLiveSpikesConnection(LiveEventConnection):
@@ -26,7 +40,15 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
     A connection for receiving and sending live spikes from and to
     SpiNNaker.
     """
-    __slots__ = []
+    __slots__ = [
+        "__keys",
+        "__packet_buffers",
+        "__receive_callbacks",
+        "__n_spikes_sent",
+        "__n_spike_packets_sent",
+        "__n_spike_bytes_sent",
+        "__spike_send_time",
+        "__statistics"]
 
     def __init__(self, receive_labels=None, send_labels=None, local_host=None,
                  local_port=NOTIFY_PORT,
@@ -45,10 +67,73 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             by default)
         """
         # pylint: disable=too-many-arguments
+        self.__keys = dict()
+        self.__packet_buffers = {
+            eieio_type: packet_buffer(0, eieio_type)
+            for eieio_type in _SPIKE_PACKET_TYPES.values()}
+        self.__receive_callbacks = dict()
+        self.__n_spikes_sent = 0
+        self.__n_spike_packets_sent = 0
+        self.__n_spike_bytes_sent = 0
+        self.__spike_send_time = 0.0
+        self.__statistics = LiveConnectionStatistics()
         super().__init__(
             live_packet_gather_label, receive_labels, send_labels,
             local_host, local_port)
 
+    @overrides(LiveEventConnection.add_receive_callback)
+    def add_receive_callback(self, label, live_event_callback,
+                             translate_key=True):
+        callbacks = self.__receive_callbacks.get((label, translate_key))
+        if callbacks is None:
+            # The events of a population are counted only by the first of
+            # its dispatchers, so that each is counted once
+            counts = not any(
+                callback_label == label
+                for callback_label, _ in self.__receive_callbacks)
+            callbacks = list()
+            self.__receive_callbacks[label, translate_key] = callbacks
+            super().add_receive_callback(
+                label, functools.partial(
+                    self.__dispatch_events, callbacks, counts),
+                translate_key)
+        callbacks.append(live_event_callback)
+
+    def __dispatch_events(self, callbacks, counts, label, *args):
+        """
+        Pass events received to the callbacks registered for them, timing
+        each callback.
+
+        :param list(callable) callbacks: The callbacks to call
+        :param bool counts: Whether to count the events as delivered
+        :param str label: The label of the population the events are from
+        :param args:
+            The time and atom IDs or keys of the events, or the atom ID or
+            key and any payload of a single event
+        """
+        for callback in callbacks:
+            start_time = time.perf_counter()
+            callback(label, *args)
+            self.__statistics.add_callback_time(
+                time.perf_counter() - start_time)
+        if counts:
+            self.__statistics.add_delivered(
+                len(args[-1]) if isinstance(args[-1], list) else 1)
+
+    @property
+    def statistics(self):
+        """
+        The counts of the spikes that were passed on to the receive
+        callbacks, and the time that each callback took.  The packets are
+        received by the live event connection, which does not say how many
+        there were or which keys were unknown, so the packets and events
+        received, the unknown keys and the queue depth are not counted by
+        this connection.
+
+        :rtype: LiveConnectionStatistics
+        """
+        return self.__statistics
+
     def send_spike(self, label, neuron_id, send_full_keys=False):
         """
         Send a spike from a single neuron.
@@ -62,15 +147,113 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
         """
         self.send_spikes(label, [neuron_id], send_full_keys)
 
-    def send_spikes(self, label, neuron_ids, send_full_keys=False):
+    def send_spikes(self, label, neuron_ids, send_full_keys=False,
+                    spread_over=None):
         """
-        Send a number of spikes.
+        Send a number of spikes, packing as many into each packet as will
+        fit.
 
         :param str label:
             The label of the population from which the spikes will originate
-        :param list(int) neuron_ids: array-like of neuron IDs sending spikes
+        :param neuron_ids: array-like of neuron IDs sending spikes
+        :type neuron_ids: list(int) or ~numpy.ndarray
         :param bool send_full_keys: Determines whether to send full 32-bit
             keys, getting the key for each neuron from the database, or
             whether to send 16-bit neuron IDs directly
+        :param spread_over:
+            The time in seconds, such as a simulation time step, over which
+            to spread the packets evenly, or None to send them all at once
+        :type spread_over: float or None
+        :raises SpinnmanInvalidParameterException:
+            If 16-bit neuron IDs are to be sent and an ID doesn't fit, or
+            full keys are to be sent and an ID is not that of a neuron of
+            the population
+        """
+        start_time = time.perf_counter()
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64")
+        if not len(neuron_ids):
+            return
+        eieio_type = _SPIKE_PACKET_TYPES[bool(send_full_keys)]
+        if send_full_keys:
+            keys = self.__get_keys(label, neuron_ids)
+        else:
+            check_keys_fit(neuron_ids, eieio_type, "neuron_ids")
+            keys = neuron_ids
+
+        buffer = self.__packet_buffers[eieio_type]
+        if len(buffer) * max_elements_per_packet(eieio_type) < len(keys):
+            buffer = packet_buffer(len(keys), eieio_type)
+            self.__packet_buffers[eieio_type] = buffer
+        sizes = pack_packets(
+            buffer, _SPIKE_PACKET_PREFIXES[eieio_type], eieio_type, keys)
+        interval = 0.0
+        if spread_over is not None:
+            interval = spread_over / len(sizes)
+        for packet, message in enumerate(packed_messages(buffer, sizes)):
+            if interval:
+                delay = start_time + packet * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            self.send_eieio_message(message, label)
+
+        self.__n_spikes_sent += len(keys)
+        self.__n_spike_packets_sent += len(sizes)
+        self.__n_spike_bytes_sent += int(numpy.sum(sizes))
+        self.__spike_send_time += time.perf_counter() - start_time
+
+    def __get_keys(self, label, neuron_ids):
+        """
+        Get the keys of neurons of a population.
+
+        :param str label: The label of the population
+        :param ~numpy.ndarray neuron_ids: The IDs of the neurons
+        :rtype: ~numpy.ndarray
+        :raises SpinnmanInvalidParameterException:
+            If an ID is not that of a neuron of the population
+        """
+        atom_id_to_key = self._atom_id_to_key[label]
+        if label not in self.__keys or (
+                self.__keys[label][0] is not atom_id_to_key):
+            keys = numpy.zeros(len(atom_id_to_key), dtype="uint32")
+            keys[list(atom_id_to_key.keys())] = list(atom_id_to_key.values())
+            self.__keys[label] = (atom_id_to_key, keys)
+        keys = self.__keys[label][1]
+        check_atom_ids(neuron_ids, len(keys), "neuron_ids")
+        return keys[neuron_ids]
+
+    @property
+    def n_spikes_sent(self):
+        """
+        The number of spikes sent.
+
+        :rtype: int
+        """
+        return self.__n_spikes_sent
+
+    @property
+    def n_spike_packets_sent(self):
+        """
+        The number of packets of spikes sent.
+
+        :rtype: int
+        """
+        return self.__n_spike_packets_sent
+
+    @property
+    def n_spike_bytes_sent(self):
+        """
+        The number of bytes of packets of spikes sent.
+
+        :rtype: int
+        """
+        return self.__n_spike_bytes_sent
+
+    @property
+    def spike_send_time(self):
+        """
+        The time spent sending spikes, in seconds, including any time spent
+        spreading them out.
+
+        :rtype: float
         """
-        self.send_events(label, neuron_ids, send_full_keys)
+        return self.__spike_send_time
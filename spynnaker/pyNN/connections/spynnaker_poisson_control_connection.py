@@ -12,12 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import time
+import numpy
 from spinn_utilities.overrides import overrides
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.eieio import EIEIOType
 from spinn_front_end_common.interface.ds import DataType
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
-import functools
+from .eieio_arrays import (
+    check_atom_ids, max_elements_per_packet, message_prefix, pack_packets,
+    packed_messages, packet_buffer)
+
+# The type of the packets of rates
+_RATE_PACKET_TYPE = EIEIOType.KEY_PAYLOAD_32_BIT
+
+# The bytes that start each packet of rates
+_RATE_PACKET_PREFIX = message_prefix(_RATE_PACKET_TYPE)
 
 
 class SpynnakerPoissonControlConnection(LiveEventConnection):
@@ -28,7 +41,13 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
     __slots__ = [
         "__control_label_extension",
         "__control_label_to_label",
-        "__label_to_control_label"]
+        "__label_to_control_label",
+        "__keys",
+        "__packet_buffer",
+        "__n_rates_sent",
+        "__n_rate_packets_sent",
+        "__n_rate_bytes_sent",
+        "__rate_send_time"]
 
     def __init__(
             self, poisson_labels=None, local_host=None, local_port=NOTIFY_PORT,
@@ -62,6 +81,13 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
                 {label: control
                  for label, control in zip(poisson_labels, control_labels)})
 
+        self.__keys = dict()
+        self.__packet_buffer = packet_buffer(0, _RATE_PACKET_TYPE)
+        self.__n_rates_sent = 0
+        self.__n_rate_packets_sent = 0
+        self.__n_rate_bytes_sent = 0
+        self.__rate_send_time = 0.0
+
         super().__init__(
             live_packet_gather_label=None, send_labels=control_labels,
             local_host=local_host, local_port=local_port)
@@ -145,8 +171,112 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
         :param list(tuple(int,float)) neuron_id_rates:
             A list of tuples of (neuron ID, rate) to be set
         """
+        values = numpy.asarray(neuron_id_rates, dtype="float64").reshape(
+            -1, 2)
+        self.set_rate_arrays(label, values[:, 0].astype("int64"), values[:, 1])
+
+    def __get_keys(self, control, neuron_ids):
+        """
+        Get the keys of atoms of a Poisson source.
+
+        :param str control: The control label of the Poisson source
+        :param ~numpy.ndarray neuron_ids: The IDs of the atoms
+        :rtype: ~numpy.ndarray
+        :raises SpinnmanInvalidParameterException:
+            If an ID is not that of an atom of the source
+        """
+        atom_id_to_key = self._atom_id_to_key[control]
+        if control not in self.__keys or (
+                self.__keys[control][0] is not atom_id_to_key):
+            keys = numpy.zeros(len(atom_id_to_key), dtype="uint32")
+            keys[list(atom_id_to_key.keys())] = list(atom_id_to_key.values())
+            self.__keys[control] = (atom_id_to_key, keys)
+        keys = self.__keys[control][1]
+        check_atom_ids(neuron_ids, len(keys), "neuron_ids")
+        return keys[neuron_ids]
+
+    def set_rate_arrays(self, label, neuron_ids, rates):
+        """
+        Set the rates of many Poisson neurons within a Poisson source,
+        sending as many rates in each packet as will fit.
+
+        :param str label: The label of the Population to set the rates of
+        :param ~numpy.ndarray neuron_ids: The neuron IDs to set the rates of
+        :param ~numpy.ndarray rates: The rate of each neuron in Hz
+        :raises SpinnmanInvalidParameterException:
+            If a neuron ID is not that of a neuron of the source, or there
+            is not a rate for each neuron ID
+        """
+        start_time = time.perf_counter()
         control = self.__control_label(label)
-        datatype = DataType.S1615
-        atom_ids_and_payloads = [(nid, datatype.encode_as_int(rate))
-                                 for nid, rate in neuron_id_rates]
-        self.send_events_with_payloads(control, atom_ids_and_payloads)
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64")
+        rates = numpy.asarray(rates, dtype="float64")
+        if len(rates) != len(neuron_ids):
+            raise SpinnmanInvalidParameterException(
+                "rates", len(rates), "Not the same as the number of "
+                f"neuron_ids ({len(neuron_ids)})")
+        if not len(neuron_ids):
+            return
+        keys = self.__get_keys(control, neuron_ids)
+        payloads = DataType.S1615.encode_as_numpy_int_array(rates)
+
+        if len(self.__packet_buffer) * max_elements_per_packet(
+                _RATE_PACKET_TYPE) < len(keys):
+            self.__packet_buffer = packet_buffer(len(keys), _RATE_PACKET_TYPE)
+        sizes = pack_packets(
+            self.__packet_buffer, _RATE_PACKET_PREFIX, _RATE_PACKET_TYPE,
+            keys, payloads)
+        for message in packed_messages(self.__packet_buffer, sizes):
+            self.send_eieio_message(message, control)
+
+        self.__n_rates_sent += len(keys)
+        self.__n_rate_packets_sent += len(sizes)
+        self.__n_rate_bytes_sent += int(numpy.sum(sizes))
+        self.__rate_send_time += time.perf_counter() - start_time
+
+    @property
+    def n_rates_sent(self):
+        """
+        The number of rates sent.
+
+        :rtype: int
+        """
+        return self.__n_rates_sent
+
+    @property
+    def n_rate_packets_sent(self):
+        """
+        The number of packets of rates sent.
+
+        :rtype: int
+        """
+        return self.__n_rate_packets_sent
+
+    @property
+    def n_rate_bytes_sent(self):
+        """
+        The number of bytes of packets of rates sent.
+
+        :rtype: int
+        """
+        return self.__n_rate_bytes_sent
+
+    @property
+    def rate_send_time(self):
+        """
+        The time spent setting rates, in seconds.
+
+        :rtype: float
+        """
+        return self.__rate_send_time
+
+    @property
+    def rates_per_second(self):
+        """
+        The number of rates sent per second of the time spent setting rates.
+
+        :rtype: float
+        """
+        if not self.__rate_send_time:
+            return 0.0
+        return self.__n_rates_sent / self.__rate_send_time
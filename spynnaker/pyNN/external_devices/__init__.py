@@ -36,7 +36,8 @@ from spynnaker.pyNN import model_binaries
 from spynnaker.pyNN.connections import (
     EthernetCommandConnection, EthernetControlConnection,
     SpynnakerLiveSpikesConnection, SpynnakerPoissonControlConnection,
-    SPIFLiveSpikesConnection)
+    SPIFLiveSpikesConnection, AsyncLiveSpikesConnection,
+    AsyncSPIFLiveSpikesConnection)
 from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.external_devices_models.push_bot.control import (
     PushBotLifEthernet, PushBotLifSpinnakerLink)
@@ -99,6 +100,8 @@ __all__ = [
     "SpynnakerLiveSpikesConnection",
     "SpynnakerPoissonControlConnection",
     "SPIFLiveSpikesConnection",
+    "AsyncLiveSpikesConnection",
+    "AsyncSPIFLiveSpikesConnection",
 
     # Provided functions
     "activate_live_output_for",
@@ -46,7 +46,7 @@ class ExternalDeviceLifControl(AbstractPyNNNeuronModelStandard):
             # default params for the neuron model type
             tau_m=20.0, cm=1.0, v_rest=0.0, v_reset=0.0, tau_syn_E=5.0,
             tau_syn_I=5.0, tau_refrac=0.1, i_offset=0.0, v=0.0,
-            isyn_exc=0.0, isyn_inh=0.0):
+            isyn_exc=0.0, isyn_inh=0.0, aggregate_timesteps=None):
         """
         :param list(AbstractMulticastControllableDevice) devices:
             The AbstractMulticastControllableDevice instances to be controlled
@@ -71,6 +71,14 @@ class ExternalDeviceLifControl(AbstractPyNNNeuronModelStandard):
             (defaulted LIF neuron state variable initial value)
         :param float isyn_inh:
             (defaulted LIF neuron state variable initial value)
+        :param aggregate_timesteps:
+            If given, every device is sent the mean of the values over this
+            many time steps, once every this many time steps, instead of the
+            value at the time of sending at the rate of the device.  This
+            sends fewer packets to devices that are controlled often; devices
+            that are controlled less often than this are still sent values
+            at their own rate, as the mean since the last one.
+        :type aggregate_timesteps: int or None
         """
         # pylint: disable=too-many-arguments
 
@@ -82,7 +90,8 @@ class ExternalDeviceLifControl(AbstractPyNNNeuronModelStandard):
         synapse_type = SynapseTypeExponential(
             tau_syn_E, tau_syn_I, isyn_exc, isyn_inh)
         input_type = InputTypeCurrent()
-        threshold_type = ThresholdTypeMulticastDeviceControl(devices)
+        threshold_type = ThresholdTypeMulticastDeviceControl(
+            devices, aggregate_timesteps)
 
         self._devices = devices
         self._translator = translator
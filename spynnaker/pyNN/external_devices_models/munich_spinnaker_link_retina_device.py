@@ -20,6 +20,7 @@ from spinn_front_end_common.abstract_models import (
 from spinn_front_end_common.utility_models import MultiCastCommand
 from spynnaker.pyNN.exceptions import SpynnakerException
 from spynnaker.pyNN.models.common import PopulationApplicationVertex
+from spynnaker.pyNN.protocols import CommandTable
 
 # robot with 7 7 1
 
@@ -120,6 +121,11 @@ class MunichRetinaDevice(
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.start_resume_commands)
     def start_resume_commands(self):
+        return CommandTable.get(
+            ("munich retina start", self.__is_right, self.__fixed_key),
+            self.__start_commands).commands
+
+    def __start_commands(self):
         commands = list()
         # change the retina key it transmits with
         # (based off if its right or left)
@@ -153,8 +159,10 @@ class MunichRetinaDevice(
             self._RIGHT_RETINA_DISABLE if self.__is_right
             else self._LEFT_RETINA_DISABLE)
 
-        return [MultiCastCommand(
-            disable_command, payload=0, repeat=5, delay_between_repeats=1000)]
+        return CommandTable.get(
+            ("munich retina stop", disable_command), lambda: [
+                MultiCastCommand(disable_command, payload=0, repeat=5,
+                                 delay_between_repeats=1000)]).commands
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.timed_commands)
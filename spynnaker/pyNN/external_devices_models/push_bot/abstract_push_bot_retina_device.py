@@ -43,19 +43,24 @@ class AbstractPushBotRetinaDevice(
             commands.append(self._protocol.set_mode())
 
         # device specific commands
-        commands.append(self._protocol.disable_retina())
         retina_key = None
         if self._resolution is not None:
             retina_key = self._resolution.value
-        commands.append(self._protocol.set_retina_transmission(
-            retina_key=retina_key))
+        protocol = self._protocol
+        commands.extend(protocol.command_table(
+            "retina start", lambda: [
+                protocol.disable_retina(),
+                protocol.set_retina_transmission(retina_key=retina_key)],
+            retina_key).commands)
 
         return commands
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.pause_stop_commands)
     def pause_stop_commands(self):
-        return [self._protocol.disable_retina()]
+        protocol = self._protocol
+        return protocol.command_table(
+            "retina stop", lambda: [protocol.disable_retina()]).commands
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.timed_commands)
@@ -42,6 +42,11 @@ class PushBotLifEthernet(ExternalDeviceLifControl):
     :param float v: LIF neuron parameter (defaulted)
     :param float isyn_exc: LIF neuron parameter (defaulted)
     :param float isyn_inh: LIF neuron parameter (defaulted)
+    :param aggregate_timesteps:
+        The number of time steps over which to send the mean of the values
+        to the devices, or `None` to send the values at the rate of each
+        device
+    :type aggregate_timesteps: int or None
     """
     __slots__ = []
 
@@ -53,7 +58,7 @@ class PushBotLifEthernet(ExternalDeviceLifControl):
             # default params for the neuron model type
             tau_m=20.0, cm=1.0, v_rest=0.0, v_reset=0.0, tau_syn_E=5.0,
             tau_syn_I=5.0, tau_refrac=0.1, i_offset=0.0, v=0.0,
-            isyn_exc=0.0, isyn_inh=0.0):
+            isyn_exc=0.0, isyn_inh=0.0, aggregate_timesteps=None):
         # pylint: disable=too-many-arguments
 
         translator = PushBotTranslator(
@@ -62,4 +67,5 @@ class PushBotLifEthernet(ExternalDeviceLifControl):
 
         super().__init__(
             devices, False, translator, tau_m, cm, v_rest, v_reset,
-            tau_syn_E, tau_syn_I, tau_refrac, i_offset, v, isyn_exc, isyn_inh)
+            tau_syn_E, tau_syn_I, tau_refrac, i_offset, v, isyn_exc, isyn_inh,
+            aggregate_timesteps)
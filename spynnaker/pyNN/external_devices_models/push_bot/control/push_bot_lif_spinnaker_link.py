@@ -36,6 +36,11 @@ class PushBotLifSpinnakerLink(ExternalDeviceLifControl):
     :param float v: LIF neuron parameter (defaulted)
     :param float isyn_exc: LIF neuron parameter (defaulted)
     :param float isyn_inh: LIF neuron parameter (defaulted)
+    :param aggregate_timesteps:
+        The number of time steps over which to send the mean of the values
+        to the devices, or `None` to send the values at the rate of each
+        device
+    :type aggregate_timesteps: int or None
     """
     __slots__ = []
 
@@ -46,7 +51,7 @@ class PushBotLifSpinnakerLink(ExternalDeviceLifControl):
             # default params for the neuron model type
             tau_m=20.0, cm=1.0, v_rest=0.0, v_reset=0.0, tau_syn_E=5.0,
             tau_syn_I=5.0, tau_refrac=0.1, i_offset=0.0, v=0.0,
-            isyn_exc=0.0, isyn_inh=0.0):
+            isyn_exc=0.0, isyn_inh=0.0, aggregate_timesteps=None):
         # pylint: disable=too-many-arguments
 
         command_protocol = MunichIoSpiNNakerLinkProtocol(
@@ -57,4 +62,5 @@ class PushBotLifSpinnakerLink(ExternalDeviceLifControl):
         # Initialise the abstract LIF class
         super().__init__(
             devices, True, None, tau_m, cm, v_rest, v_reset,
-            tau_syn_E, tau_syn_I, tau_refrac, i_offset, v, isyn_exc, isyn_inh)
+            tau_syn_E, tau_syn_I, tau_refrac, i_offset, v, isyn_exc, isyn_inh,
+            aggregate_timesteps)
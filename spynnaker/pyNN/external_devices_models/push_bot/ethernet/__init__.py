@@ -18,7 +18,8 @@ from .push_bot_led_device import PushBotEthernetLEDDevice
 from .push_bot_motor_device import PushBotEthernetMotorDevice
 from .push_bot_retina_device import PushBotEthernetRetinaDevice
 from .push_bot_speaker_device import PushBotEthernetSpeakerDevice
-from .push_bot_retina_connection import PushBotRetinaConnection
+from .push_bot_retina_connection import (
+    PushBotRetinaConnection, PushBotRetinaDecoder)
 from .push_bot_translator import PushBotTranslator
 from .push_bot_wifi_connection import (
     get_pushbot_wifi_connection, PushBotWIFIConnection)
@@ -26,5 +27,6 @@ from .push_bot_wifi_connection import (
 __all__ = ["PushBotEthernetDevice", "PushBotEthernetLaserDevice",
            "PushBotEthernetLEDDevice", "PushBotEthernetMotorDevice",
            "PushBotEthernetRetinaDevice", "PushBotEthernetSpeakerDevice",
-           "PushBotRetinaConnection", "PushBotTranslator",
+           "PushBotRetinaConnection", "PushBotRetinaDecoder",
+           "PushBotTranslator",
            "get_pushbot_wifi_connection", "PushBotWIFIConnection"]
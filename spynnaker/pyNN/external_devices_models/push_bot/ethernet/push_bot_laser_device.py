@@ -71,6 +71,13 @@ class PushBotEthernetLaserDevice(
             commands.append(self.protocol.set_mode())
 
         # device specific commands
+        commands.extend(self.__command_protocol.command_table(
+            "laser start", self.__start_commands, self.__start_total_period,
+            self.__start_active_time, self.__start_frequency).commands)
+        return commands
+
+    def __start_commands(self):
+        commands = list()
         if self.__start_total_period is not None:
             commands.append(
                 self.__command_protocol.push_bot_laser_config_total_period(
@@ -88,10 +95,11 @@ class PushBotEthernetLaserDevice(
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.pause_stop_commands)
     def pause_stop_commands(self):
-        return [
-            self.__command_protocol.push_bot_laser_config_total_period(0),
-            self.__command_protocol.push_bot_laser_config_active_time(0),
-            self.__command_protocol.push_bot_laser_set_frequency(0)]
+        protocol = self.__command_protocol
+        return protocol.command_table("laser stop", lambda: [
+            protocol.push_bot_laser_config_total_period(0),
+            protocol.push_bot_laser_config_active_time(0),
+            protocol.push_bot_laser_set_frequency(0)]).commands
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.timed_commands)
@@ -74,6 +74,14 @@ class PushBotEthernetLEDDevice(
             commands.append(self.protocol.set_mode())
 
         # device specific commands
+        commands.extend(self.__command_protocol.command_table(
+            "led start", self.__start_commands, self.__start_total_period,
+            self.__start_active_time_front, self.__start_active_time_back,
+            self.__start_frequency).commands)
+        return commands
+
+    def __start_commands(self):
+        commands = list()
         if self.__start_total_period is not None:
             commands.append(self.__command_protocol.push_bot_led_total_period(
                 self.__start_total_period))
@@ -93,11 +101,12 @@ class PushBotEthernetLEDDevice(
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.pause_stop_commands)
     def pause_stop_commands(self):
-        return [
-            self.__command_protocol.push_bot_led_front_active_time(0),
-            self.__command_protocol.push_bot_led_back_active_time(0),
-            self.__command_protocol.push_bot_led_total_period(0),
-            self.__command_protocol.push_bot_led_set_frequency(0)]
+        protocol = self.__command_protocol
+        return protocol.command_table("led stop", lambda: [
+            protocol.push_bot_led_front_active_time(0),
+            protocol.push_bot_led_back_active_time(0),
+            protocol.push_bot_led_total_period(0),
+            protocol.push_bot_led_set_frequency(0)]).commands
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.timed_commands)
@@ -57,13 +57,17 @@ class PushBotEthernetMotorDevice(
             commands.append(self.protocol.set_mode())
 
         # device specific commands
-        commands.append(self.__command_protocol.generic_motor_enable())
+        protocol = self.__command_protocol
+        commands.extend(protocol.command_table(
+            "motor start", lambda: [protocol.generic_motor_enable()]).commands)
         return commands
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.pause_stop_commands)
     def pause_stop_commands(self):
-        return [self.__command_protocol.generic_motor_disable()]
+        protocol = self.__command_protocol
+        return protocol.command_table(
+            "motor stop", lambda: [protocol.generic_motor_disable()]).commands
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.timed_commands)
@@ -12,22 +12,86 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from threading import RLock
+from threading import RLock, Timer
 import numpy
+from spinn_utilities.overrides import overrides
 from spinnman.connections import ConnectionListener
-from spinn_front_end_common.utilities.constants import BYTES_PER_SHORT
 from spynnaker.pyNN.connections import SpynnakerLiveSpikesConnection
 from spynnaker.pyNN.external_devices_models.push_bot.parameters import (
     PushBotRetinaResolution)
 
-# Each value is a 16-bit 1yyyyyyy.pxxxxxxx
-_RETINA_PACKET_SIZE = BYTES_PER_SHORT
-_MIN_PIXEL_VALUE = 32768
+# The longest time in seconds that events are kept by default
+_MAX_SEND_DELAY = 0.01
+
+# Each value is a 16-bit 1yyyyyyy.pxxxxxxx; the first byte is marked by
+# having the top bit set
+_EVENT_MARK = 0x80
+_COORDINATE_MASK = 0x7F
 _BITS_PER_PIXEL = 7
-_Y_SHIFT = 0
-_X_SHIFT = 8
 _P_SHIFT = 7
-_P_MASK = 0x1
+
+
+class PushBotRetinaDecoder(object):
+    """
+    Decodes the retina events in the stream of bytes sent by a PushBot into
+    neuron IDs.  An event whose second byte is in the next packet is kept
+    until that packet is decoded.
+    """
+    __slots__ = [
+        "__carry",
+        "__coordinate_shift",
+        "__p_shift",
+        "__y_shift"]
+
+    def __init__(self, resolution=PushBotRetinaResolution.NATIVE_128_X_128):
+        """
+        :param PushBotRetinaResolution resolution:
+        """
+        bits_per_coordinate = resolution.value.bits_per_coordinate
+        self.__coordinate_shift = _BITS_PER_PIXEL - bits_per_coordinate
+        self.__y_shift = bits_per_coordinate
+        self.__p_shift = bits_per_coordinate * 2
+        self.__carry = numpy.zeros(0, dtype="uint8")
+
+    def reset(self):
+        """
+        Forget any partial event kept from the last data.
+        """
+        self.__carry = numpy.zeros(0, dtype="uint8")
+
+    def decode(self, data):
+        """
+        Decode the events in data received from the PushBot.
+
+        :param bytes data: The data
+        :return: The neuron ID of each event
+        :rtype: ~numpy.ndarray
+        """
+        data = numpy.frombuffer(data, dtype="uint8")
+        if len(self.__carry):
+            data = numpy.concatenate((self.__carry, data))
+
+        # An event starts at each marked byte that is not the second byte of
+        # an event, so in each run of marked bytes every other byte starts an
+        # event
+        marked = numpy.flatnonzero(data >= _EVENT_MARK)
+        run_starts = numpy.ones(len(marked), dtype=bool)
+        run_starts[1:] = numpy.diff(marked) != 1
+        run_firsts = marked[run_starts][numpy.cumsum(run_starts) - 1]
+        starts = marked[(marked - run_firsts) % 2 == 0]
+        if len(starts) and starts[-1] == len(data) - 1:
+            self.__carry = data[-1:].copy()
+            starts = starts[:-1]
+        else:
+            self.__carry = numpy.zeros(0, dtype="uint8")
+
+        y_values = (data[starts] & _COORDINATE_MASK).astype("uint32") >> (
+            self.__coordinate_shift)
+        second = data[starts + 1].astype("uint32")
+        x_values = (second & _COORDINATE_MASK) >> self.__coordinate_shift
+        polarity = second >> _P_SHIFT
+        return (x_values | (y_values << self.__y_shift) |
+                (polarity << self.__p_shift))
 
 
 class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
@@ -39,24 +103,22 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
         This assumes a packet format of 16-bits per retina event.
     """
     __slots__ = [
+        "__decoder",
+        "__flush_timer",
         "__lock",
-        "__p_shift",
-        "__pixel_shift",
+        "__max_send_delay",
+        "__min_events_per_send",
+        "__n_pending",
+        "__pending",
         "__pushbot_listener",
         "__retina_injector_label",
-        "__x_shift",
-        "__y_shift",
-        "__orig_x_shift",
-        "__orig_y_shift",
-        "__x_mask",
-        "__y_mask",
-        "__next_data",
         "__ready"]
 
     def __init__(
             self, retina_injector_label, pushbot_wifi_connection,
             resolution=PushBotRetinaResolution.NATIVE_128_X_128,
-            local_host=None, local_port=None):
+            local_host=None, local_port=None, min_events_per_send=1,
+            max_send_delay=_MAX_SEND_DELAY):
         """
         :param str retina_injector_label:
         :param PushBotWIFIConnection pushbot_wifi_connection:
@@ -65,31 +127,33 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
         :type local_host: str or None
         :param local_port:
         :type local_port: int or None
+        :param int min_events_per_send:
+            The events from the PushBot are kept until there are at least
+            this many, so that the events of several small packets from the
+            PushBot are sent to SpiNNaker together
+        :param float max_send_delay:
+            The longest time in seconds that events are kept while waiting
+            for there to be min_events_per_send of them, so that events are
+            not held back when the PushBot sends few
         """
         # pylint: disable=too-many-arguments
         super().__init__(
             send_labels=[retina_injector_label], local_host=local_host,
             local_port=local_port)
         self.__retina_injector_label = retina_injector_label
+        self.__decoder = PushBotRetinaDecoder(resolution)
+        self.__min_events_per_send = min_events_per_send
+        self.__max_send_delay = max_send_delay
+        self.__flush_timer = None
+        self.__pending = list()
+        self.__n_pending = 0
+        self.__lock = RLock()
+        self.__ready = False
+
         self.__pushbot_listener = ConnectionListener(
             pushbot_wifi_connection, n_processes=1)
-
-        add_shift = _BITS_PER_PIXEL - resolution.value.bits_per_coordinate
-        mask = (2 ** resolution.value.bits_per_coordinate) - 1
-        self.__y_shift = resolution.value.bits_per_coordinate
-        self.__orig_x_shift = add_shift + _X_SHIFT
-        self.__x_mask = mask
-        self.__x_shift = 0
-        self.__orig_y_shift = add_shift + _Y_SHIFT
-        self.__y_mask = mask
-        self.__p_shift = resolution.value.bits_per_coordinate * 2
-
         self.__pushbot_listener.add_callback(self._receive_retina_data)
         self.__pushbot_listener.start()
-        self.__lock = RLock()
-
-        self.__next_data = None
-        self.__ready = False
 
         self.add_start_resume_callback(
             retina_injector_label, self.__push_bot_start)
@@ -105,6 +169,29 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
     def __push_bot_stop(self, label, connection):
         with self.__lock:
             self.__ready = False
+            self.__send_pending()
+            self.__decoder.reset()
+
+    def __send_pending(self):
+        """
+        Send the events that are being kept.
+        """
+        if self.__flush_timer is not None:
+            self.__flush_timer.cancel()
+            self.__flush_timer = None
+        if self.__n_pending:
+            self.send_spikes(
+                self.__retina_injector_label,
+                numpy.concatenate(self.__pending))
+        self.__pending.clear()
+        self.__n_pending = 0
+
+    def __flush(self):
+        """
+        Send the events that have been kept for the longest time allowed.
+        """
+        with self.__lock:
+            self.__send_pending()
 
     def _receive_retina_data(self, data):
         """
@@ -117,28 +204,22 @@ class PushBotRetinaConnection(SpynnakerLiveSpikesConnection):
             if not self.__ready:
                 return
 
-            if self.__next_data is not None:
-                data = data + self.__next_data
-                self.__next_data = None
-
-            # Go through the data and find pairs where the first of the pair
-            # has a 1 in the MSB
-            data_all = b''
-            for i in range(len(data)):
-                if data[i] > 128:
-                    if i + 1 < len(data):
-                        data_all += data[i:i+2]
-                        i += 1
-                    else:
-                        self.__next_data = data[i:i+1]
-
-            # Filter out the usable data
-            data_filtered = numpy.fromstring(data_all, dtype=numpy.uint16)
-            y_values = (data_filtered >> self.__orig_y_shift) & self.__y_mask
-            x_values = (data_filtered >> self.__orig_x_shift) & self.__x_mask
-            polarity = (data_filtered >> _P_SHIFT) & _P_MASK
-            neuron_ids = (
-                (x_values << self.__x_shift) |
-                (y_values << self.__y_shift) |
-                (polarity << self.__p_shift))
-            self.send_spikes(self.__retina_injector_label, neuron_ids)
+            neuron_ids = self.__decoder.decode(data)
+            self.__pending.append(neuron_ids)
+            self.__n_pending += len(neuron_ids)
+            if self.__n_pending >= self.__min_events_per_send:
+                self.__send_pending()
+            elif self.__n_pending and self.__flush_timer is None:
+                self.__flush_timer = Timer(
+                    self.__max_send_delay, self.__flush)
+                self.__flush_timer.daemon = True
+                self.__flush_timer.start()
+
+    @overrides(SpynnakerLiveSpikesConnection.close)
+    def close(self):
+        self.__pushbot_listener.close()
+        with self.__lock:
+            if self.__flush_timer is not None:
+                self.__flush_timer.cancel()
+                self.__flush_timer = None
+        super().close()
@@ -71,6 +71,14 @@ class PushBotEthernetSpeakerDevice(
             commands.append(self.protocol.set_mode())
 
         # device specific commands
+        commands.extend(self.__command_protocol.command_table(
+            "speaker start", self.__start_commands, self.__start_total_period,
+            self.__start_active_time, self.__start_frequency,
+            self.__start_melody).commands)
+        return commands
+
+    def __start_commands(self):
+        commands = list()
         commands.append(
             self.__command_protocol.push_bot_speaker_config_total_period(
                 total_period=self.__start_total_period))
@@ -89,10 +97,11 @@ class PushBotEthernetSpeakerDevice(
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.pause_stop_commands)
     def pause_stop_commands(self):
-        return [
-            self.__command_protocol.push_bot_speaker_config_total_period(0),
-            self.__command_protocol.push_bot_speaker_config_active_time(0),
-            self.__command_protocol.push_bot_speaker_set_tone(0)]
+        protocol = self.__command_protocol
+        return protocol.command_table("speaker stop", lambda: [
+            protocol.push_bot_speaker_config_total_period(0),
+            protocol.push_bot_speaker_config_active_time(0),
+            protocol.push_bot_speaker_set_tone(0)]).commands
 
     @property
     @overrides(AbstractSendMeMulticastCommandsVertex.timed_commands)
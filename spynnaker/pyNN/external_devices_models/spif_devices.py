@@ -19,6 +19,7 @@ Devices connected to the SpiNNaker peripheral interface (`SPIF`_).
 """
 
 from enum import IntEnum
+import numpy
 from spinn_front_end_common.utility_models import MultiCastCommand
 from spinn_utilities.overrides import overrides
 
@@ -56,6 +57,23 @@ SPIF_OUTPUT_FPGA_LINK = 15
 #: SPIF always gets input from odd links on FPGA 0 (1, 3, 5, 7, 9, 11, 13, 15)
 SPIF_INPUT_FPGA_LINKS = range(1, 16, 2)
 
+#: SPIF message to start sending to the host
+SPIF_OUTPUT_START = 0x5ec00000
+
+#: SPIF message to stop sending to the host
+SPIF_OUTPUT_STOP = 0x5ec10000
+
+#: SPIF message to set packet send time (time is added to this in
+#: microseconds)
+SPIF_OUTPUT_SET_TICK = 0x5ec20000
+
+#: SPIF message to set packet size (size is added to this in bytes)
+SPIF_OUTPUT_SET_LEN = 0x5ec40000
+
+#: The bits of a SPIF message to the host output that say what it is; the
+#: rest are the value added to it
+SPIF_OUTPUT_COMMAND_MASK = 0xFFFF0000
+
 
 class SPIFRegister(IntEnum):
     """
@@ -254,6 +272,58 @@ def set_input_route(pipe, index, route):
     return SPIFRegister.IR_ROUTE_BASE.cmd(route, (pipe * N_INPUTS) + index)
 
 
+def map_events(commands, pipe, events):
+    """
+    Model on the host how a SPIF pipe maps input events to the keys that
+    it sends to SpiNNaker, when configured by commands.  This can be used
+    to check a configuration without hardware.
+
+    Each field of the mapper masks and shifts each event, and the field is
+    limited to its limit; the key is the mapper key with all the fields.
+    An event is dropped if the event masked by a filter mask is equal to
+    the filter value.
+
+    :param list(~spinn_front_end_common.utility_models.MultiCastCommand) \
+            commands:
+        The commands that configure SPIF; those that are not for the
+        registers of the pipe are ignored
+    :param int pipe: The SPIF pipe to model (0-1)
+    :param ~numpy.ndarray events: The 32-bit input events
+    :return: The key of each event that is not dropped
+    :rtype: ~numpy.ndarray
+    """
+    registers = dict()
+    for command in commands:
+        if _RC_KEY <= command.key < _RC_KEY + 0x100 and command.is_payload:
+            registers[command.key - _RC_KEY] = command.payload
+
+    def register(base, index):
+        return registers.get(base.value + index, 0)
+
+    events = numpy.asarray(events, dtype="uint32").astype("int64")
+    keys = numpy.full(
+        len(events), register(SPIFRegister.MP_KEY_BASE, pipe), dtype="int64")
+    for field in range(N_FIELDS):
+        index = (pipe * N_FIELDS) + field
+        values = events & register(SPIFRegister.MP_FLD_MASK_BASE, index)
+        shift = register(SPIFRegister.MP_FLD_SHIFT_BASE, index)
+        # Negative shifts are left shifts
+        if shift & 0x80000000:
+            values = (values << (0x100000000 - shift)) & 0xFFFFFFFF
+        else:
+            values = values >> shift
+        keys |= numpy.minimum(
+            values, register(SPIFRegister.MP_FLD_LIMIT_BASE, index))
+
+    dropped = numpy.zeros(len(events), dtype=bool)
+    for fltr in range(N_FILTERS):
+        index = (pipe * N_FILTERS) + fltr
+        dropped |= (
+            (events & register(SPIFRegister.FL_MASK_BASE, index)) ==
+            register(SPIFRegister.FL_VALUE_BASE, index))
+    return keys[~dropped].astype("uint32")
+
+
 class _DelayedMultiCastCommand(MultiCastCommand):
     """
     A command where the getting of the payload is delayed.
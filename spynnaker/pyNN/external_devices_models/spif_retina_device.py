@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy
 from spinn_utilities.overrides import overrides
 from pacman.model.graphs.application import (
     Application2DFPGAVertex, FPGAConnection)
@@ -26,7 +27,7 @@ from .spif_devices import (
     N_PIPES, N_FILTERS, SpiNNFPGARegister, SPIFRegister,
     set_field_mask, set_field_shift, set_field_limit,
     set_filter_mask, set_filter_value, set_mapper_key,
-    set_input_key, set_input_mask, set_input_route)
+    set_input_key, set_input_mask, set_input_route, map_events)
 
 
 class SPIFRetinaDevice(
@@ -57,11 +58,14 @@ class SPIFRetinaDevice(
         "__input_y_mask",
         "__input_y_shift",
         "__input_x_mask",
-        "__input_x_shift"]
+        "__input_x_shift",
+        "__filters",
+        "__input_shifts"]
 
     def __init__(self, pipe, width, height, sub_width, sub_height,
                  base_key=None, input_x_shift=16, input_y_shift=0,
-                 board_address=None, chip_coords=None):
+                 board_address=None, chip_coords=None, pooling=1,
+                 roi_x=0, roi_y=0, input_width=None, input_height=None):
         """
         :param int pipe: Which pipe on SPIF the retina is connected to
         :param int width: The width of the retina in pixels
@@ -98,6 +102,30 @@ class SPIFRetinaDevice(
                 specified, with board_address then being used if the
                 coordinates don't connect to an FPGA.
         :type chip_coords: tuple(int, int) or None
+        :param int pooling:
+            The width and height of the square of input pixels that SPIF
+            sends to each neuron, which must be a power of 2; the width and
+            height of the device are then those of the input divided by this
+        :param int roi_x:
+            The x coordinate of the first input pixel used; other pixels are
+            dropped by SPIF.  This must be a multiple of the width times the
+            pooling, rounded up to a power of 2
+        :param int roi_y:
+            The y coordinate of the first input pixel used; other pixels are
+            dropped by SPIF.  This must be a multiple of the height times the
+            pooling, rounded up to a power of 2
+        :param input_width:
+            The width of the input in pixels, or `None` to not drop any
+            events by their x coordinate; this must be given if roi_x is not
+            0, and if it is not given the input must be no wider than the
+            region used
+        :type input_width: int or None
+        :param input_height:
+            The height of the input in pixels, or `None` to not drop any
+            events by their y coordinate; this must be given if roi_y is not
+            0, and if it is not given the input must be no higher than the
+            region used
+        :type input_height: int or None
         """
         # Do some checks
         if sub_width < self.X_MASK or sub_height < self.Y_MASK:
@@ -146,13 +174,69 @@ class SPIFRetinaDevice(
         SPIFRetinaDevice.__n_devices += 1
 
         # Generate the shifts and masks to convert the SPIF Ethernet inputs to
-        # PYX format
-        self.__input_x_mask = ((1 << x_bits) - 1) << input_x_shift
+        # PYX format, dropping the bits of the coordinates that are pooled
+        if pooling < 1 or pooling & (pooling - 1):
+            raise ConfigurationException(
+                f"The pooling ({pooling}) must be a power of 2")
+        pool_bits = pooling.bit_length() - 1
+        self.__input_shifts = (input_x_shift, input_y_shift)
+        self.__input_x_mask = (
+            ((1 << x_bits) - 1) << (input_x_shift + pool_bits))
         self.__input_x_shift = self.__unsigned(
-            input_x_shift)
-        self.__input_y_mask = ((1 << y_bits) - 1) << input_y_shift
+            input_x_shift + pool_bits)
+        self.__input_y_mask = (
+            ((1 << y_bits) - 1) << (input_y_shift + pool_bits))
         self.__input_y_shift = self.__unsigned(
-            input_y_shift - x_bits)
+            input_y_shift + pool_bits - x_bits)
+
+        # Filter out the events outside of the region of interest; the
+        # coordinates in the region are then those of the bits kept above
+        self.__filters = (
+            self.__roi_filters(
+                "x", roi_x, x_bits + pool_bits, input_width, input_x_shift) +
+            self.__roi_filters(
+                "y", roi_y, y_bits + pool_bits, input_height, input_y_shift))
+        if len(self.__filters) > N_FILTERS:
+            raise ConfigurationException(
+                f"The region of interest needs {len(self.__filters)} filters"
+                f" but SPIF only has {N_FILTERS}")
+
+    @staticmethod
+    def __roi_filters(name, start, region_bits, input_size, input_shift):
+        """
+        Get the filters that drop events outside of the region of interest
+        in one dimension; each drops the events in which one bit above those
+        of the region differs from that of the start of the region.
+
+        :param str name: The name of the dimension
+        :param int start: The first input coordinate of the region
+        :param int region_bits: The number of bits of coordinates in the region
+        :param input_size:
+            The size of the input, or None to not filter the dimension
+        :type input_size: int or None
+        :param int input_shift: The shift of the coordinate in the input
+        :return: The mask and value of each filter
+        :rtype: list(tuple(int, int))
+        """
+        region_size = 1 << region_bits
+        if start % region_size:
+            raise ConfigurationException(
+                f"The region of interest {name} ({start}) must be a multiple"
+                f" of {region_size}")
+        if input_size is None:
+            # Without the size, the bits above the region are not known, so
+            # events outside of a region that doesn't start at 0 would not
+            # be dropped
+            if start:
+                raise ConfigurationException(
+                    f"The input size in {name} must be given when the region"
+                    f" of interest starts at {start}")
+            return []
+        filters = list()
+        for bit in range(region_bits, (input_size - 1).bit_length()):
+            mask = 1 << (bit + input_shift)
+            filters.append((mask, mask & ~(start << input_shift)))
+        return filters
 
     def __unsigned(self, n):
         return n & 0xFFFFFFFF
@@ -246,12 +330,17 @@ class SPIFRetinaDevice(
             set_field_limit(self.__pipe, 3, 0)
         ])
 
-        # Don't filter
+        # Filter out events outside of the region of interest, and don't
+        # filter with the rest of the filters
+        filters = self.__filters + [(0, 1)] * (
+            N_FILTERS - len(self.__filters))
         commands.extend([
-            set_filter_mask(self.__pipe, i, 0) for i in range(N_FILTERS)
+            set_filter_mask(self.__pipe, i, mask)
+            for i, (mask, _) in enumerate(filters)
         ])
         commands.extend([
-            set_filter_value(self.__pipe, i, 1) for i in range(N_FILTERS)
+            set_filter_value(self.__pipe, i, value)
+            for i, (_, value) in enumerate(filters)
         ])
 
         # Configure the output routing key
@@ -275,6 +364,24 @@ class SPIFRetinaDevice(
 
         return commands
 
+    def map_events(self, x, y):
+        """
+        Get the keys that SPIF would send to SpiNNaker for input events,
+        using a model of SPIF on the host configured with the commands of
+        this device.  This can be used to check the region of interest and
+        pooling without hardware.
+
+        :param ~numpy.ndarray x: The input x coordinate of each event
+        :param ~numpy.ndarray y: The input y coordinate of each event
+        :return: The key of each event that is not dropped
+        :rtype: ~numpy.ndarray
+        """
+        input_x_shift, input_y_shift = self.__input_shifts
+        events = (
+            (numpy.asarray(x, dtype="uint32") << input_x_shift) |
+            (numpy.asarray(y, dtype="uint32") << input_y_shift))
+        return map_events(self.start_resume_commands, self.__pipe, events)
+
     def __spif_key(self, fpga_link_id):
         x, y = self.__fpga_indices(fpga_link_id)
         return ((self.__base_key << self._key_shift) +
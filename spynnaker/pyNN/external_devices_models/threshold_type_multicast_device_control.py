@@ -14,6 +14,7 @@
 
 from spinn_utilities.overrides import overrides
 from spinn_front_end_common.interface.ds import DataType
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.models.neuron.threshold_types import AbstractThresholdType
 from spynnaker.pyNN.utilities.struct import Struct
 
@@ -25,19 +26,37 @@ MAX = "max"
 TS_INTER_SEND = "ts_inter_send"
 TS_NEXT_SEND = "ts_next_send"
 TYPE = "type"
+AGGREGATE = "aggregate"
 
 
 class ThresholdTypeMulticastDeviceControl(AbstractThresholdType):
     """
     A threshold type that can send multicast keys with the value of
     membrane voltage as the payload.
+
+    If the values are aggregated, each device is sent the mean of the
+    (clipped) values since it was last sent one, rather than just the value
+    at the time of sending, so that values can be sent less often without
+    missing what happened between sends.
     """
-    __slots__ = ["__devices"]
+    __slots__ = ["__aggregate_timesteps", "__devices"]
 
-    def __init__(self, devices):
+    def __init__(self, devices, aggregate_timesteps=None):
         """
         :param list(AbstractMulticastControllableDevice) device:
+        :param aggregate_timesteps:
+            The number of time steps over which to aggregate the values of
+            every device into a single packet, or `None` to send the value
+            at the time of sending at the rate of each device.  A device is
+            never sent values more often than its own rate, so a device that
+            sends less often aggregates over the time between its sends
+        :type aggregate_timesteps: int or None
+        :raises ConfigurationException:
+            If the number of time steps is not positive
         """
+        if aggregate_timesteps is not None and aggregate_timesteps < 1:
+            raise ConfigurationException(
+                "aggregate_timesteps must be at least 1")
         super().__init__(
             [Struct([
                 (DataType.UINT32, KEY),
@@ -46,11 +65,23 @@ class ThresholdTypeMulticastDeviceControl(AbstractThresholdType):
                 (DataType.S1615, MAX),
                 (DataType.UINT32, TS_INTER_SEND),
                 (DataType.UINT32, TS_NEXT_SEND),
-                (DataType.UINT32, TYPE)])],
+                (DataType.UINT32, TYPE),
+                (DataType.UINT32, AGGREGATE)])],
             {KEY: "", SCALE: "", MIN: "mV", MAX: "mV",
              TS_INTER_SEND: "time steps", TS_NEXT_SEND: "time steps",
-             TYPE: ""})
+             TYPE: "", AGGREGATE: ""})
         self.__devices = devices
+        self.__aggregate_timesteps = aggregate_timesteps
+
+    @property
+    def aggregate_timesteps(self):
+        """
+        The number of time steps over which values are aggregated, or `None`
+        if they are not.
+
+        :rtype: int or None
+        """
+        return self.__aggregate_timesteps
 
     @overrides(AbstractThresholdType.add_parameters)
     def add_parameters(self, parameters):
@@ -62,8 +93,17 @@ class ThresholdTypeMulticastDeviceControl(AbstractThresholdType):
             d.device_control_min_value for d in self.__devices]
         parameters[MAX] = [
             d.device_control_max_value for d in self.__devices]
-        parameters[TS_INTER_SEND] = [
-            d.device_control_timesteps_between_sending for d in self.__devices]
+        if self.__aggregate_timesteps is None:
+            parameters[TS_INTER_SEND] = [
+                d.device_control_timesteps_between_sending
+                for d in self.__devices]
+            parameters[AGGREGATE] = 0
+        else:
+            parameters[TS_INTER_SEND] = [
+                max(d.device_control_timesteps_between_sending,
+                    self.__aggregate_timesteps)
+                for d in self.__devices]
+            parameters[AGGREGATE] = 1
         parameters[TYPE] = [
             d.device_control_send_type.value for d in self.__devices]
 
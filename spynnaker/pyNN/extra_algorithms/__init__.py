@@ -13,6 +13,7 @@
 # limitations under the License.
 from .connection_holder_finisher import finish_connection_holders
 from .redundant_packet_count_report import redundant_packet_count_report
+from .region_rewrite_report import region_rewrite_report
 from .spynnaker_connection_holder_generations import (
     SpYNNakerConnectionHolderGenerator)
 from .spynnaker_machine_bit_field_router_compressor import (
@@ -29,6 +30,7 @@ __all__ = [
     "delay_support_adder",
     "finish_connection_holders",
     "redundant_packet_count_report",
+    "region_rewrite_report",
     "SpYNNakerConnectionHolderGenerator",
     "spynnaker_machine_bitField_pair_router_compressor",
     "spynnaker_machine_bitfield_ordered_covering_compressor",
@@ -0,0 +1,78 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+from spinn_utilities.log import FormatAdapter
+from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.models.neuron.population_machine_neurons import (
+    PopulationMachineNeurons)
+from spynnaker.pyNN.models.spike_source import (
+    SpikeSourcePoissonMachineVertex)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+_FILE_NAME = "region_rewrites.rpt"
+
+
+def region_rewrite_report():
+    """
+    Write a report of the bytes rewritten to each region of each core
+    between the previous run and this one.
+    """
+    run_number = SpynnakerDataView.get_run_number()
+    rewrites = list()
+    for placement in SpynnakerDataView.iterate_placemements():
+        vertex = placement.vertex
+        if not isinstance(vertex, (
+                PopulationMachineNeurons, SpikeSourcePoissonMachineVertex)):
+            continue
+        # pylint: disable=protected-access
+        bytes_written = vertex._region_writer.get_bytes_written(run_number)
+        if bytes_written:
+            rewrites.append((placement, bytes_written))
+    if not rewrites:
+        return
+
+    file_name = os.path.join(SpynnakerDataView.get_run_dir_path(), _FILE_NAME)
+    try:
+        with open(file_name, "a", encoding="utf-8") as f:
+            _write_report(f, run_number, rewrites)
+    except IOError:
+        logger.exception(
+            "Region rewrite report: Can't open file {} for writing.",
+            file_name)
+
+
+def _write_report(output, run_number, rewrites):
+    """
+    :param ~io.TextIOBase output:
+    :param int run_number:
+    :param list(tuple(~pacman.model.placements.Placement, dict)) rewrites:
+    """
+    output.write(f"Run {run_number}\n")
+    total_written = 0
+    total_size = 0
+    for placement, bytes_written in rewrites:
+        output.write(
+            f"    core {placement.x}, {placement.y}, {placement.p} "
+            f"({placement.vertex.label})\n")
+        for region, (n_bytes, size) in sorted(bytes_written.items()):
+            output.write(
+                f"        region {region}: {n_bytes} of {size} bytes\n")
+            total_written += n_bytes
+            total_size += size
+    output.write(
+        f"    In total {total_written} of {total_size} bytes were "
+        "rewritten\n")
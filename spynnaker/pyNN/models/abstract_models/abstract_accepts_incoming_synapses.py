@@ -58,6 +58,35 @@ class AbstractAcceptsIncomingSynapses(object, metaclass=AbstractBase):
         :rtype: ~numpy.ndarray
         """
 
+    def get_connections_from_machine_for_projections(
+            self, projections, show_progress=True):
+        """
+        Get the connections from the machine post-run for several
+        projections ending at this vertex.
+
+        .. note::
+            By default this reads each projection separately; vertices that
+            can read the data of several projections together should
+            override this.
+
+        :param projections:
+            The edge and specific projection within the edge for each
+            projection to be read
+        :type projections:
+            list(tuple(ProjectionApplicationEdge, SynapseInformation))
+        :param bool show_progress:
+            Whether to show the progress of the reading; callers that show
+            their own progress, such as those reading from several threads,
+            turn this off
+        :return: The connections of each projection
+        :rtype: dict(tuple(ProjectionApplicationEdge, SynapseInformation),
+            ~numpy.ndarray)
+        """
+        return {
+            (app_edge, synapse_info): self.get_connections_from_machine(
+                app_edge, synapse_info)
+            for app_edge, synapse_info in projections}
+
     @abstractmethod
     def clear_connection_cache(self):
         """
@@ -32,3 +32,42 @@ class HasSynapses(object):
             The specific projection within the edge
         :rtype: ~numpy.ndarray
         """
+
+    @abstractmethod
+    def add_connection_reads(self, planner, placement, projections):
+        """
+        Add the reads needed to get the connections of several projections
+        from the machine for this vertex to a read planner.
+
+        :param SDRAMReadPlanner planner: The planner to add the reads to
+        :param ~pacman.model.placements.Placement placement:
+            Where the connection data is on the machine
+        :param projections:
+            The edge and specific projection within the edge for each
+            projection to be read
+        :type projections:
+            list(tuple(ProjectionApplicationEdge, SynapseInformation))
+        :return: The base address of the synaptic data, to be passed to
+            :py:meth:`get_connections_from_reads`
+        :rtype: int
+        """
+
+    @abstractmethod
+    def get_connections_from_reads(
+            self, planner, placement, synapses_address, app_edge,
+            synapse_info):
+        """
+        Get the connections of a projection for this vertex from the data
+        read by a read planner.
+
+        :param SDRAMReadPlanner planner: The planner that has read the data
+        :param ~pacman.model.placements.Placement placement:
+            Where the connection data is on the machine
+        :param int synapses_address:
+            The base address returned by :py:meth:`add_connection_reads`
+        :param ProjectionApplicationEdge app_edge:
+            The edge for which the data is being read
+        :param SynapseInformation synapse_info:
+            The specific projection within the edge
+        :rtype: list(~numpy.ndarray)
+        """
@@ -772,15 +772,23 @@ class NeuronRecorder(object):
             the vertex slice
         """
         spec.switch_write_focus(neuron_recording_region)
+        spec.write_array(self.get_neuron_recording_region_data(vertex_slice))
 
-        # Write the number of variables and bitfields (ignore per-timestep)
+    def get_neuron_recording_region_data(self, vertex_slice):
+        """
+        Get the data of the recording region.
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            the vertex slice
+        :rtype: ~numpy.ndarray
+        """
+        # The number of variables and bitfields (ignore per-timestep)
         n_vars = len(self.__sampling_rates) - len(self.__bitfield_variables)
-        spec.write_value(data=n_vars)
-        spec.write_value(data=len(self.__bitfield_variables))
+        header = numpy.array(
+            [n_vars, len(self.__bitfield_variables)], dtype="uint32")
 
-        # Write the recording data
-        recording_data = self._get_data(vertex_slice)
-        spec.write_array(recording_data)
+        # Then the recording data
+        return numpy.concatenate((header, self._get_data(vertex_slice)))
 
     def _get_buffered_sdram_per_record(self, variable, n_neurons):
         """
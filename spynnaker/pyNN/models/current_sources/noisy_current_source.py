@@ -98,8 +98,7 @@ class NoisyCurrentSource(AbstractCurrentSource):
         # Parameters have been set, so if multi-run then it will have been
         # injected already; if not then it can just be ignored
         if self.app_vertex is not None:
-            for m_vertex in self.app_vertex.machine_vertices:
-                m_vertex.set_reload_required(True)
+            self.app_vertex.set_current_sources_changed()
 
     @property
     @overrides(AbstractCurrentSource.get_parameters)
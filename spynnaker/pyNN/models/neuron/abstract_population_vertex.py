@@ -25,8 +25,7 @@ from pyNN.random import RandomDistribution
 
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.overrides import overrides
-from spinn_utilities.progress_bar import ProgressBar
-from spinn_utilities.ranged import RangeDictionary
+from spinn_utilities.progress_bar import DummyProgressBar, ProgressBar
 from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.config_holder import (
     get_config_int, get_config_float, get_config_bool)
@@ -51,7 +50,9 @@ from spynnaker.pyNN.models.abstract_models import (
     SupportsStructure)
 from spynnaker.pyNN.utilities.constants import (
     POSSION_SIGMA_SUMMATION_LIMIT)
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
 from spynnaker.pyNN.utilities.running_stats import RunningStats
+from spynnaker.pyNN.utilities.sdram_read_planner import SDRAMReadPlanner
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSDRAMSynapseDynamics, AbstractSynapseDynamicsStructural,
     AbstractSupportsSignedWeights)
@@ -84,6 +85,8 @@ _NEURON_GENERATOR_BASE_SDRAM = 12 * BYTES_PER_WORD
 _NEURON_GENERATOR_PER_STRUCT = 4 * BYTES_PER_WORD
 _NEURON_GENERATOR_PER_PARAM = 2 * BYTES_PER_WORD
 _NEURON_GENERATOR_PER_ITEM = (2 * BYTES_PER_WORD) + MAX_PARAMS_BYTES
+# The words of generator data for a range of neurons with a constant value
+_NEURON_GENERATOR_WORDS_PER_RANGE = 3
 
 # 1 for number of neurons
 # 1 for number of synapse types
@@ -119,11 +122,16 @@ def _all_gen(rd):
             if not is_param_generatable(rd[key]):
                 return False
         else:
+            # Values set per neuron are only generated if they form few
+            # enough ranges that the generator data is smaller than the values
+            max_ranges = None
             if not rd[key].range_based():
-                return False
-            for _start, _stop, val in rd[key].iter_ranges():
+                max_ranges = len(rd[key]) // _NEURON_GENERATOR_WORDS_PER_RANGE
+            for i, (_start, _stop, val) in enumerate(rd[key].iter_ranges()):
                 if not is_param_generatable(val):
                     return False
+                if max_ranges is not None and i >= max_ranges:
+                    return False
     return True
 
 
@@ -177,6 +185,8 @@ class AbstractPopulationVertex(
         "__pop_seed",
         "__core_seeds",
         "__connection_cache",
+        "__weight_stats_cache",
+        "__ring_buffer_shifts_cache",
         "__read_initial_values",
         "__have_read_initial_values",
         "__last_parameter_read_time",
@@ -262,9 +272,9 @@ class AbstractPopulationVertex(
 
         self.__neuron_impl = neuron_impl
         self.__pynn_model = pynn_model
-        self.__parameters = RangeDictionary(n_neurons)
+        self.__parameters = SpynnakerRangeDictionary(n_neurons)
         self.__neuron_impl.add_parameters(self.__parameters)
-        self.__initial_state_variables = RangeDictionary(n_neurons)
+        self.__initial_state_variables = SpynnakerRangeDictionary(n_neurons)
         self.__neuron_impl.add_state_variables(self.__initial_state_variables)
         self.__state_variables = self.__initial_state_variables.copy()
         self.__n_colour_bits = n_colour_bits
@@ -314,6 +324,12 @@ class AbstractPopulationVertex(
         # Store connections read from machine until asked to clear
         # Key is app_edge, synapse_info
         self.__connection_cache = dict()
+
+        # Store the weight statistics of each incoming projection, and the
+        # last ring buffer shifts calculated with the key they were
+        # calculated for, as these are expensive to calculate
+        self.__weight_stats_cache = dict()
+        self.__ring_buffer_shifts_cache = None
         self.__read_initial_values = False
         self.__have_read_initial_values = False
         self.__last_parameter_read_time = None
@@ -655,20 +671,29 @@ class AbstractPopulationVertex(
             return
 
         self.__last_parameter_read_time = current_time
-        for m_vertex in self.machine_vertices:
-            if isinstance(m_vertex, PopulationMachineNeurons):
-                placement = SpynnakerDataView.get_placement_of_vertex(m_vertex)
-                m_vertex.read_parameters_from_machine(placement)
+        self.__read_neuron_data_now(initial=False)
 
     def __read_initial_parameters_now(self):
         # If we already read the initial parameters, don't do it again
         if self.__have_read_initial_values:
             return
 
-        for m_vertex in self.machine_vertices:
-            if isinstance(m_vertex, PopulationMachineNeurons):
-                placement = SpynnakerDataView.get_placement_of_vertex(m_vertex)
-                m_vertex.read_initial_parameters_from_machine(placement)
+        self.__read_neuron_data_now(initial=True)
+
+    def __read_neuron_data_now(self, initial):
+        """
+        Read the neuron data of all the cores of the population.
+
+        :param bool initial:
+            Whether to read the initial values rather than the current ones
+        """
+        placements = [
+            SpynnakerDataView.get_placement_of_vertex(m_vertex)
+            for m_vertex in self.machine_vertices
+            if isinstance(m_vertex, PopulationMachineNeurons)]
+        PopulationMachineNeurons.read_parameters_from_machines(
+            placements, initial, n_threads=get_config_int(
+                "Simulation", "n_parameter_read_threads"))
 
     def __read_parameter(self, name, selector=None):
         return self.__parameters[name].get_values(selector)
@@ -930,8 +955,16 @@ class AbstractPopulationVertex(
         # set the associated vertex (for multi-run case)
         current_source.set_app_vertex(self)
         # set to reload for multi-run case
+        self.set_current_sources_changed()
+
+    def set_current_sources_changed(self):
+        """
+        Indicate that the current sources or their parameters have changed,
+        so the current source data of the cores needs to be rewritten.
+        """
         for m_vertex in self.machine_vertices:
-            m_vertex.set_reload_required(True)
+            if isinstance(m_vertex, PopulationMachineNeurons):
+                m_vertex.set_do_current_source_regeneration()
 
     @property
     def current_sources(self):
@@ -985,22 +1018,25 @@ class AbstractPopulationVertex(
         and timestep.
 
         All arguments should be assumed real values except n_synapses_in
-        which will be an integer.
+        which will be an integer.  All arguments except sigma can also be
+        arrays, in which case the bounds are evaluated for each element.
 
         :param float weight_mean: Mean of weight distribution (in either nA or
             microSiemens as required)
         :param float weight_std_dev: SD of weight distribution
         :param float spikes_per_second: Maximum expected Poisson rate in Hz
-        :param int machine_timestep: in us
         :param int n_synapses_in: No of connected synapses
         :param float sigma: How many SD above the mean to go for upper bound;
             a good starting choice is 5.0. Given length of simulation we can
             set this for approximate number of saturation events.
-        :rtype: float
+        :rtype: float or ~numpy.ndarray
         """
+        weight_mean = numpy.asarray(weight_mean, dtype="float64")
+        weight_std_dev = numpy.asarray(weight_std_dev, dtype="float64")
+
         # E[ number of spikes ] in a timestep
         average_spikes_per_timestep = (
-            float(n_synapses_in * spikes_per_second) /
+            numpy.multiply(n_synapses_in, spikes_per_second, dtype="float64") /
             SpynnakerDataView.get_simulation_time_step_per_s())
 
         # Exact variance contribution from inherent Poisson variation
@@ -1008,9 +1044,9 @@ class AbstractPopulationVertex(
 
         # Upper end of range for Poisson summation required below
         # upper_bound needs to be an integer
-        upper_bound = int(round(average_spikes_per_timestep +
-                                POSSION_SIGMA_SUMMATION_LIMIT *
-                                math.sqrt(average_spikes_per_timestep)))
+        upper_bound = numpy.round(
+            average_spikes_per_timestep + POSSION_SIGMA_SUMMATION_LIMIT *
+            numpy.sqrt(average_spikes_per_timestep))
 
         # Closed-form exact solution for summation that gives the variance
         # contributed by weight distribution variation when modulated by
@@ -1019,30 +1055,31 @@ class AbstractPopulationVertex(
         # Mathematica because (1) it's regularised and needs a further
         # multiplication and (2) it's actually the complement that is needed
         # i.e. 'gammaincc']
-
-        weight_variance = 0.0
-
-        if weight_std_dev > 0:
+        # Invalid values are produced where there is no variance to add,
+        # so are masked out below
+        with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
             # pylint: disable=no-member
             lngamma = special.gammaln(1 + upper_bound)
             gammai = special.gammaincc(
                 1 + upper_bound, average_spikes_per_timestep)
 
-            big_ratio = (math.log(average_spikes_per_timestep) * upper_bound -
-                         lngamma)
+            log_average = numpy.log(average_spikes_per_timestep)
+            big_ratio = log_average * upper_bound - lngamma
 
-            if -701.0 < big_ratio < 701.0 and big_ratio != 0.0:
-                log_weight_variance = (
-                    -average_spikes_per_timestep +
-                    math.log(average_spikes_per_timestep) +
-                    2.0 * math.log(weight_std_dev) +
-                    math.log(math.exp(average_spikes_per_timestep) * gammai -
-                             math.exp(big_ratio)))
-                weight_variance = math.exp(log_weight_variance)
+            log_weight_variance = (
+                -average_spikes_per_timestep + log_average +
+                2.0 * numpy.log(weight_std_dev) +
+                numpy.log(numpy.exp(average_spikes_per_timestep) * gammai -
+                          numpy.exp(big_ratio)))
+            weight_variance = numpy.where(
+                (weight_std_dev > 0) & (-701.0 < big_ratio) &
+                (big_ratio < 701.0) & (big_ratio != 0.0) &
+                numpy.isfinite(log_weight_variance),
+                numpy.exp(log_weight_variance), 0.0)
 
         # upper bound calculation -> mean + n * SD
         return ((average_spikes_per_timestep * weight_mean) +
-                (sigma * math.sqrt(poisson_variance + weight_variance)))
+                (sigma * numpy.sqrt(poisson_variance + weight_variance)))
 
     def get_ring_buffer_shifts(self):
         """
@@ -1058,18 +1095,30 @@ class AbstractPopulationVertex(
         stats = _Stats(self.__neuron_impl, self.__spikes_per_second,
                        self.__ring_buffer_sigma)
 
-        for proj in self.incoming_projections:
-            # pylint: disable=protected-access
-            synapse_info = proj._synapse_information
-            # Skip if this is a synapse dynamics synapse type
-            if synapse_info.synapse_type_from_dynamics:
-                continue
-            stats.add_projection(proj)
-
-        n_synapse_types = self.__neuron_impl.get_n_synapse_types()
-        max_weights = numpy.zeros(n_synapse_types)
-        for synapse_type in range(n_synapse_types):
-            max_weights[synapse_type] = stats.get_max_weight(synapse_type)
+        # Skip projections with a synapse dynamics synapse type
+        # pylint: disable=protected-access
+        projections = [
+            proj for proj in self.incoming_projections
+            if not proj._synapse_information.synapse_type_from_dynamics]
+
+        # The rates of the sources can change between runs, so these are
+        # part of the key, along with the projections and the parameters
+        spike_stats = [stats.get_spike_stats(proj) for proj in projections]
+        key = (self.__spikes_per_second, self.__ring_buffer_sigma,
+               tuple(zip(projections, spike_stats)))
+        if (self.__ring_buffer_shifts_cache is not None and
+                self.__ring_buffer_shifts_cache[0] == key):
+            return list(self.__ring_buffer_shifts_cache[1])
+
+        # The weight statistics of a projection don't change once made, so
+        # only need to be worked out for projections not seen before
+        for proj, proj_spike_stats in zip(projections, spike_stats):
+            if proj not in self.__weight_stats_cache:
+                self.__weight_stats_cache[proj] = stats.get_weight_stats(proj)
+            stats.add_weight_stats(
+                self.__weight_stats_cache[proj], proj_spike_stats)
+
+        max_weights = stats.get_max_weights()
 
         # Convert these to powers; we could use int.bit_length() for this if
         # they were integers, but they aren't...
@@ -1079,10 +1128,11 @@ class AbstractPopulationVertex(
 
         # If 2^max_weight_power equals the max weight, we have to add another
         # power, as range is 0 - (just under 2^max_weight_power)!
-        max_weight_powers = (
+        max_weight_powers = [
             w + 1 if (2 ** w) <= a else w
-            for w, a in zip(max_weight_powers, max_weights))
+            for w, a in zip(max_weight_powers, max_weights)]
 
+        self.__ring_buffer_shifts_cache = (key, max_weight_powers)
         return list(max_weight_powers)
 
     @staticmethod
@@ -1114,26 +1164,75 @@ class AbstractPopulationVertex(
     @overrides(AbstractAcceptsIncomingSynapses.get_connections_from_machine)
     def get_connections_from_machine(
             self, app_edge, synapse_info):
-        # If we already have connections cached, return them
-        if (app_edge, synapse_info) in self.__connection_cache:
-            return self.__connection_cache[app_edge, synapse_info]
-
+        return self.get_connections_from_machine_for_projections(
+            [(app_edge, synapse_info)])[app_edge, synapse_info]
+
+    @overrides(AbstractAcceptsIncomingSynapses.
+               get_connections_from_machine_for_projections)
+    def get_connections_from_machine_for_projections(
+            self, projections, show_progress=True):
+        # Only read the projections that are not already cached
+        to_read = [
+            projection for projection in dict.fromkeys(projections)
+            if projection not in self.__connection_cache]
+        if to_read:
+            self.__read_connections_from_machine(to_read, show_progress)
+        return {
+            projection: self.__connection_cache[projection]
+            for projection in projections}
+
+    def __read_connections_from_machine(self, projections, show_progress):
+        """
+        Read the connections of several projections from the machine,
+        reading the data of all the projections on each core with as few
+        reads as possible, and add them to the cache.
+
+        :param list(tuple(ProjectionApplicationEdge, SynapseInformation))
+            projections: The projections to read
+        :param bool show_progress: Whether to show the progress of the reading
+        """
         # Start with something in the list so that concatenate works
-        connections = [numpy.zeros(
+        connections = {
+            projection: [numpy.zeros(
                 0, dtype=AbstractSDRAMSynapseDynamics.NUMPY_CONNECTORS_DTYPE)]
-        progress = ProgressBar(
-            len(self.machine_vertices),
-            f"Getting synaptic data between {app_edge.pre_vertex.label} "
-            f"and {app_edge.post_vertex.label}")
-        for post_vertex in progress.over(self.machine_vertices):
+            for projection in projections}
+        if len(projections) == 1:
+            app_edge = projections[0][0]
+            label = (f"Getting synaptic data between "
+                     f"{app_edge.pre_vertex.label} and "
+                     f"{app_edge.post_vertex.label}")
+        else:
+            label = (f"Getting synaptic data of {len(projections)} "
+                     f"projections to {self.label}")
+        if show_progress:
+            progress = ProgressBar(len(self.machine_vertices) * 2, label)
+        else:
+            progress = DummyProgressBar(len(self.machine_vertices) * 2, label)
+
+        # Plan the reads of all the projections on all the cores...
+        planner = SDRAMReadPlanner()
+        synapse_addresses = list()
+        for post_vertex in progress.over(self.machine_vertices, False):
             if isinstance(post_vertex, HasSynapses):
                 placement = SpynnakerDataView.get_placement_of_vertex(
                     post_vertex)
-                connections.extend(post_vertex.get_connections_from_machine(
-                    placement, app_edge, synapse_info))
-        all_connections = numpy.concatenate(connections)
-        self.__connection_cache[app_edge, synapse_info] = all_connections
-        return all_connections
+                synapse_addresses.append((
+                    post_vertex, placement, post_vertex.add_connection_reads(
+                        planner, placement, projections)))
+
+        # ...read them in one go...
+        planner.read()
+
+        # ...and then convert each of them
+        for post_vertex, placement, synapses_address in progress.over(
+                synapse_addresses):
+            for app_edge, synapse_info in projections:
+                connections[app_edge, synapse_info].extend(
+                    post_vertex.get_connections_from_reads(
+                        planner, placement, synapses_address, app_edge,
+                        synapse_info))
+        for projection, conns in connections.items():
+            self.__connection_cache[projection] = numpy.concatenate(conns)
 
     def get_synapse_params_size(self):
         """
@@ -1616,15 +1715,24 @@ class _Stats(object):
         self.default_spikes_per_second = default_spikes_per_second
         self.ring_buffer_sigma = ring_buffer_sigma
 
-    def add_projection(self, proj):
+    def get_weight_stats(self, proj):
+        """
+        Get the weight statistics of a projection, which depend only on the
+        projection itself.
+
+        :param ~spynnaker.pyNN.models.projection.Projection proj:
+        :return: The synapse type, number of connections, weight mean,
+            weight variance, maximum weight and delay variance for each
+            synapse type the projection uses
+        :rtype: list(tuple(int, int, float, float, float, float))
+        """
         # pylint: disable=protected-access
         s_dynamics = proj._synapse_information.synapse_dynamics
         if isinstance(s_dynamics, AbstractSupportsSignedWeights):
-            self.__add_signed_projection(proj)
-        else:
-            self.__add_unsigned_projection(proj)
+            return self.__get_signed_weight_stats(proj)
+        return self.__get_unsigned_weight_stats(proj)
 
-    def __add_signed_projection(self, proj):
+    def __get_signed_weight_stats(self, proj):
         # pylint: disable=protected-access
         s_info = proj._synapse_information
         connector = s_info.connector
@@ -1637,17 +1745,16 @@ class _Stats(object):
         w_mean_pos = s_dynamics.get_mean_positive_weight(proj)
         w_var_pos = s_dynamics.get_variance_positive_weight(proj)
         w_max_pos = s_dynamics.get_maximum_positive_weight(proj)
-        self.__add_details(
-            proj, s_type_pos, n_conns, w_mean_pos, w_var_pos, w_max_pos, d_var)
 
         s_type_neg = s_dynamics.get_negative_synapse_index(proj)
         w_mean_neg = -s_dynamics.get_mean_negative_weight(proj)
         w_var_neg = -s_dynamics.get_variance_negative_weight(proj)
         w_max_neg = -s_dynamics.get_minimum_negative_weight(proj)
-        self.__add_details(
-            proj, s_type_neg, n_conns, w_mean_neg, w_var_neg, w_max_neg, d_var)
+        return [
+            (s_type_pos, n_conns, w_mean_pos, w_var_pos, w_max_pos, d_var),
+            (s_type_neg, n_conns, w_mean_neg, w_var_neg, w_max_neg, d_var)]
 
-    def __add_unsigned_projection(self, proj):
+    def __get_unsigned_weight_stats(self, proj):
         # pylint: disable=protected-access
         s_info = proj._synapse_information
         s_type = s_info.synapse_type
@@ -1660,21 +1767,36 @@ class _Stats(object):
             connector, s_info.weights, s_info)
         w_max = s_dynamics.get_weight_maximum(connector, s_info)
         d_var = s_dynamics.get_delay_variance(connector, s_info.delays, s_info)
-        self.__add_details(proj, s_type, n_conns, w_mean, w_var, w_max, d_var)
+        return [(s_type, n_conns, w_mean, w_var, w_max, d_var)]
 
-    def __add_details(
-            self, proj, s_type, n_conns, w_mean, w_var, w_max, d_var):
-        self.running_totals[s_type].add_items(
-            w_mean * self.w_scale, w_var * self.w_scale_sq, n_conns)
-        self.biggest_weight[s_type] = max(
-            self.biggest_weight[s_type], w_max * self.w_scale)
-        self.delay_running_totals[s_type].add_items(0.0, d_var, n_conns)
+    def add_weight_stats(self, weight_stats, spike_stats):
+        """
+        Add the statistics of a projection.
+
+        :param weight_stats: The result of :py:meth:`get_weight_stats`
+        :type weight_stats: list(tuple(int, int, float, float, float, float))
+        :param tuple(float, float) spike_stats:
+            The result of :py:meth:`get_spike_stats`
+        """
+        spikes_per_tick, spikes_per_second = spike_stats
+        for s_type, n_conns, w_mean, w_var, w_max, d_var in weight_stats:
+            self.running_totals[s_type].add_items(
+                w_mean * self.w_scale, w_var * self.w_scale_sq, n_conns)
+            self.biggest_weight[s_type] = max(
+                self.biggest_weight[s_type], w_max * self.w_scale)
+            self.delay_running_totals[s_type].add_items(0.0, d_var, n_conns)
+            self.rate_stats[s_type].add_items(spikes_per_second, 0, n_conns)
+            self.total_weights[s_type] += spikes_per_tick * (w_max * n_conns)
 
-        spikes_per_tick, spikes_per_second = self.__pre_spike_stats(proj)
-        self.rate_stats[s_type].add_items(spikes_per_second, 0, n_conns)
-        self.total_weights[s_type] += spikes_per_tick * (w_max * n_conns)
+    def get_spike_stats(self, proj):
+        """
+        Get the statistics of the spikes arriving from the source of a
+        projection.
 
-    def __pre_spike_stats(self, proj):
+        :param ~spynnaker.pyNN.models.projection.Projection proj:
+        :return: The spikes per tick and the spikes per second
+        :rtype: tuple(float, float)
+        """
         spikes_per_tick = max(
             1.0, self.default_spikes_per_second / self.steps_per_second)
         spikes_per_second = self.default_spikes_per_second
@@ -1687,16 +1809,30 @@ class _Stats(object):
             spikes_per_tick = pre_vertex.max_spikes_per_ts()
         return spikes_per_tick, spikes_per_second
 
-    def get_max_weight(self, s_type):
-        if self.delay_running_totals[s_type].variance == 0.0:
-            return max(self.total_weights[s_type], self.biggest_weight[s_type])
+    def get_max_weights(self):
+        """
+        Get the expected maximum weight for each synapse type.
+
+        :rtype: ~numpy.ndarray
+        """
+        # Without delay variance, the maximum is just the total weight
+        max_weights = numpy.maximum(self.total_weights, self.biggest_weight)
+        s_types = [
+            s_type for s_type, stats in enumerate(self.delay_running_totals)
+            if stats.variance != 0.0]
+        if not s_types:
+            return max_weights
 
-        stats = self.running_totals[s_type]
-        rates = self.rate_stats[s_type]
+        # Otherwise work out the expected upper bound of all the others
+        # together
         # pylint: disable=protected-access
         w_max = AbstractPopulationVertex._ring_buffer_expected_upper_bound(
-            stats.mean, stats.standard_deviation, rates.mean,
-            stats.n_items, self.ring_buffer_sigma)
-        w_max = min(w_max, self.total_weights[s_type])
-        w_max = max(w_max, self.biggest_weight[s_type])
-        return w_max
+            [self.running_totals[s].mean for s in s_types],
+            [self.running_totals[s].standard_deviation for s in s_types],
+            [self.rate_stats[s].mean for s in s_types],
+            [self.running_totals[s].n_items for s in s_types],
+            self.ring_buffer_sigma)
+        w_max = numpy.minimum(w_max, self.total_weights[s_types])
+        max_weights[s_types] = numpy.maximum(
+            w_max, self.biggest_weight[s_types])
+        return max_weights
@@ -14,6 +14,19 @@
 
 import numpy
 from numpy.lib.recfunctions import merge_arrays
+from scipy import sparse
+
+#: The formats in which the connections can be returned
+_FORMATS = ("list", "array", "sparse", "structured")
+
+#: The reductions that can be applied to multiple synapses between the
+#: same source and target
+_MULTAPSE_REDUCTIONS = {
+    "sum": numpy.add,
+    "min": numpy.minimum,
+    "max": numpy.maximum
+}
+_MULTAPSE_SELECTIONS = ("first", "last")
 
 
 class ConnectionHolder(object):
@@ -25,9 +38,14 @@ class ConnectionHolder(object):
         # A list of items of data that are to be present in each element
         "__data_items_to_return",
 
-        # True if the values should be returned as a list of tuples,
-        # False if they should be returned as a tuple of matrices
-        "__as_list",
+        # The format in which the values are returned; one of "list" (a list
+        # of tuples), "array" (a tuple of dense matrices), "sparse" (a tuple
+        # of scipy sparse matrices) or "structured" (a numpy structured array)
+        "__format",
+
+        # What to do when there are multiple synapses between the same
+        # source and target in the "array" and "sparse" formats
+        "__multiple_synapses",
 
         # The number of atoms in the pre-vertex
         "__n_pre_atoms",
@@ -52,13 +70,15 @@ class ConnectionHolder(object):
 
     def __init__(
             self, data_items_to_return, as_list, n_pre_atoms, n_post_atoms,
-            connections=None, fixed_values=None, notify=None):
+            connections=None, fixed_values=None, notify=None,
+            data_format=None, multiple_synapses="last"):
         """
         :param data_items_to_return: A list of data fields to be returned
         :type data_items_to_return: list(int) or tuple(int) or None
         :param bool as_list:
             True if the data will be returned as a list, False if it is to be
-            returned as a matrix (or series of matrices)
+            returned as a matrix (or series of matrices).
+            Ignored if `data_format` is given.
         :param int n_pre_atoms: The number of atoms in the pre-vertex
         :param int n_post_atoms: The number of atoms in the post-vertex
         :param connections:
@@ -80,10 +100,33 @@ class ConnectionHolder(object):
             This should accept a single parameter, which will contain the
             data requested
         :type notify: callable(ConnectionHolder, None) or None
+        :param data_format:
+            The format of the data returned; one of ``"list"``, ``"array"``
+            (dense matrices), ``"sparse"`` (:py:class:`scipy.sparse.csr_matrix`
+            matrices) or ``"structured"`` (the numpy structured array of the
+            requested fields, without any conversion).
+            If `None`, this is determined by `as_list`.
+        :type data_format: str or None
+        :param str multiple_synapses:
+            What to do with the data in the ``"array"`` and ``"sparse"``
+            formats when there are multiple synapses with the same source and
+            target; one of ``"last"``, ``"first"``, ``"sum"``, ``"min"`` or
+            ``"max"``
         """
         # pylint: disable=too-many-arguments
+        if data_format is None:
+            data_format = "list" if as_list else "array"
+        if data_format not in _FORMATS:
+            raise ValueError(
+                f"Unknown format {data_format}; must be one of {_FORMATS}")
+        if (multiple_synapses not in _MULTAPSE_REDUCTIONS and
+                multiple_synapses not in _MULTAPSE_SELECTIONS):
+            raise ValueError(
+                f"Unknown multiple_synapses {multiple_synapses}; must be one "
+                f"of {_MULTAPSE_SELECTIONS + tuple(_MULTAPSE_REDUCTIONS)}")
         self.__data_items_to_return = data_items_to_return
-        self.__as_list = as_list
+        self.__format = data_format
+        self.__multiple_synapses = multiple_synapses
         self.__n_pre_atoms = n_pre_atoms
         self.__n_post_atoms = n_post_atoms
         self.__connections = connections
@@ -167,7 +210,7 @@ class ConnectionHolder(object):
                 (connections, fixed_values), flatten=True)
 
         # If we are returning a list...
-        if self.__as_list:
+        if self.__format == "list":
             # ...sort by source then target
             order = numpy.lexsort(
                 (connections["target"], connections["source"]))
@@ -194,22 +237,37 @@ class ConnectionHolder(object):
                     data_item_list = list(data_item)
                 self.__data_items.append(data_item_list)
 
+        # If we are returning the structured array, just select the fields
+        elif self.__format == "structured":
+            if (self.__data_items_to_return is None or
+                    not self.__data_items_to_return):
+                self.__data_items = connections
+            else:
+                self.__data_items = connections[
+                    list(self.__data_items_to_return)]
+
         else:
             if self.__data_items_to_return is None:
                 return []
 
+            # Deal with multiple synapses between the same source and target
+            sources, targets, values = self.__merge_multapses(connections)
+
             # Keep track of the matrices
             merged_connections = list()
             for item in self.__data_items_to_return:
-                # Build an empty matrix and fill it with NAN
-                matrix = numpy.empty((self.__n_pre_atoms, self.__n_post_atoms))
-                matrix.fill(numpy.nan)
-
-                # Fill in the values that have data
-                # TODO: Change this to sum the items with the same
-                #       (source, target) pairs
-                matrix[connections["source"], connections["target"]] = \
-                    connections[item]
+                if self.__format == "sparse":
+                    matrix = sparse.csr_matrix(
+                        (values[item], (sources, targets)),
+                        shape=(self.__n_pre_atoms, self.__n_post_atoms))
+                else:
+                    # Build an empty matrix and fill it with NAN
+                    matrix = numpy.empty(
+                        (self.__n_pre_atoms, self.__n_post_atoms))
+                    matrix.fill(numpy.nan)
+
+                    # Fill in the values that have data
+                    matrix[sources, targets] = values[item]
 
                 # Store the matrix generated
                 merged_connections.append(matrix)
@@ -223,6 +281,44 @@ class ConnectionHolder(object):
 
         return self.__data_items
 
+    def __merge_multapses(self, connections):
+        """
+        Reduce the connections so that there is one value per field for each
+        distinct (source, target) pair.
+
+        :param ~numpy.ndarray connections: The connections to reduce
+        :return: The sources, the targets and the values per field name
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray,
+            dict(str, ~numpy.ndarray))
+        """
+        if not len(connections):
+            return (connections["source"], connections["target"], {
+                item: connections[item]
+                for item in self.__data_items_to_return})
+
+        # Stable sort by source then target, so that within a run of the same
+        # pair the original order (and so "first" and "last") is kept
+        order = numpy.lexsort((connections["target"], connections["source"]))
+        sources = connections["source"][order]
+        targets = connections["target"][order]
+
+        # Find the start of each run of the same (source, target) pair
+        starts = numpy.flatnonzero(numpy.concatenate((
+            [True],
+            (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1]))))
+        values = dict()
+        for item in self.__data_items_to_return:
+            item_values = connections[item][order]
+            if self.__multiple_synapses == "first":
+                values[item] = item_values[starts]
+            elif self.__multiple_synapses == "last":
+                ends = numpy.append(starts[1:], len(order)) - 1
+                values[item] = item_values[ends]
+            else:
+                values[item] = _MULTAPSE_REDUCTIONS[
+                    self.__multiple_synapses].reduceat(item_values, starts)
+        return sources[starts], targets[starts], values
+
     def __getitem__(self, s):
         data = self._get_data_items()
         return data[s]
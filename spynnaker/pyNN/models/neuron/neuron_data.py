@@ -16,6 +16,7 @@ from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement)
 from spynnaker.pyNN.utilities.struct import StructRepeat
+from spynnaker.pyNN.utilities.utility_calls import map_in_threads
 from spinn_utilities.helpful_functions import is_singleton
 from spynnaker.pyNN.data import SpynnakerDataView
 
@@ -180,6 +181,40 @@ class NeuronData(object):
                     vertex_slice.n_atoms),
             label="initial_values")
 
+    def rewrite_data(self, spec, placement, vertex_slice, neuron_regions,
+                     region_writer):
+        """
+        Rewrite the data of the neurons from the host between runs, writing
+        only the words that have changed where possible.
+
+        :param ~data_specification.DataSpecificationReloader spec:
+            The data specification to write whole regions with
+        :param ~pacman.model.placements.Placement placement:
+            Where the vertex is on the machine
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The vertex slice to write for
+        :param NeuronRegions neuron_regions: The regions to write to
+        :param RegionDeltaWriter region_writer:
+            The writer of the regions of the core
+        """
+        spec.reserve_memory_region(
+            region=neuron_regions.neuron_params,
+            size=self.__app_vertex.get_sdram_usage_for_neuron_params(
+                    vertex_slice.n_atoms),
+            label="neuron_params")
+        neuron_recorder = self.__app_vertex.neuron_recorder
+        spec.reserve_memory_region(
+            region=neuron_regions.neuron_recording,
+            size=neuron_recorder.get_metadata_sdram_usage_in_bytes(
+                vertex_slice.n_atoms),
+            label="neuron recording")
+        region_writer.write_region(
+            spec, placement, neuron_regions.neuron_params,
+            self.__get_neuron_param_data(vertex_slice), changes_on_run=True)
+        region_writer.write_region(
+            spec, placement, neuron_regions.neuron_recording,
+            neuron_recorder.get_neuron_recording_region_data(vertex_slice))
+
     def __get_neuron_param_data(self, vertex_slice):
         """
         Get neuron parameter data for a slice.
@@ -286,6 +321,75 @@ class NeuronData(object):
         self.__do_read_data(
             placement, neuron_regions.initial_values, merged_dict)
 
+    def read_all_data(self, cores, initial=False, n_threads=1):
+        """
+        Read the state of the data of several cores of the application
+        vertex from the machine into the application vertex.  The cores are
+        read concurrently, and then the data of all the cores is decoded
+        together, setting each value of the application vertex once.
+
+        :param cores: The placement and neuron regions of each core to read
+        :type cores:
+            list(tuple(~pacman.model.placements.Placement, NeuronRegions))
+        :param bool initial:
+            Whether to read the initial state rather than the current state
+        :param int n_threads:
+            The number of cores to read at the same time; this relies on the
+            transceiver being thread-safe, as spinnman documents it to be
+        :return: The data read from each core
+        :rtype: list(bytes)
+        """
+        params = self.__app_vertex.parameters
+        if initial:
+            state_vars = self.__app_vertex.initial_state_variables
+        else:
+            state_vars = self.__app_vertex.state_variables
+        results = _MergedDict(params, state_vars)
+
+        def read(core):
+            placement, neuron_regions = core
+            if initial:
+                region = neuron_regions.initial_values
+            else:
+                region = neuron_regions.neuron_params
+            return self.__read_block(placement, region)
+
+        blocks = list(map_in_threads(read, cores, n_threads))
+        if not blocks:
+            return blocks
+
+        vertex_slices = [placement.vertex.vertex_slice
+                         for placement, _regions in cores]
+        offsets = [0] * len(blocks)
+        for struct in self.__app_vertex.neuron_impl.structs:
+            if struct.repeat_type == StructRepeat.GLOBAL:
+                # The global values are the same on every core
+                struct.read_data(blocks[-1], results, offsets[-1])
+                sizes = [struct.get_size_in_whole_words()] * len(blocks)
+            else:
+                struct.read_data_of_slices(
+                    list(zip(blocks, offsets, vertex_slices)), results)
+                sizes = [struct.get_size_in_whole_words(vertex_slice.n_atoms)
+                         for vertex_slice in vertex_slices]
+            offsets = [offset + size * BYTES_PER_WORD
+                       for offset, size in zip(offsets, sizes)]
+        return blocks
+
+    def __read_block(self, placement, region):
+        """
+        Read the neuron data of a core.
+
+        :param ~pacman.model.placements.Placement placement:
+            Where the vertex is on the machine
+        :param int region: The region to read from
+        :rtype: bytes
+        """
+        address = locate_memory_region_for_placement(placement, region)
+        data_size = self.__app_vertex.get_sdram_usage_for_neuron_params(
+            placement.vertex.vertex_slice.n_atoms)
+        return SpynnakerDataView.read_memory(
+            placement.x, placement.y, address, data_size)
+
     def __do_read_data(self, placement, region, results):
         """
         Perform the reading of data.
@@ -295,12 +399,8 @@ class NeuronData(object):
         :param int region: The region to read from
         :param MergedDict results: Where to write the results to
         """
-        address = locate_memory_region_for_placement(placement, region)
         vertex_slice = placement.vertex.vertex_slice
-        data_size = self.__app_vertex.get_sdram_usage_for_neuron_params(
-            vertex_slice.n_atoms)
-        block = SpynnakerDataView.read_memory(
-            placement.x, placement.y, address, data_size)
+        block = self.__read_block(placement, region)
         offset = 0
         for struct in self.__app_vertex.neuron_impl.structs:
             if struct.repeat_type == StructRepeat.GLOBAL:
@@ -21,6 +21,7 @@ from spinn_front_end_common.abstract_models import (
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.interface.provenance import ProvenanceWriter
 from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+from spynnaker.pyNN.utilities.region_delta_writer import RegionDeltaWriter
 from .population_machine_common import CommonRegions, PopulationMachineCommon
 from .population_machine_neurons import (
     NeuronRegions, PopulationMachineNeurons, NeuronProvenance)
@@ -71,6 +72,7 @@ class PopulationMachineLocalOnlyCombinedVertex(
         "__weight_scales",
         "__slice_index",
         "__neuron_data",
+        "__region_writer",
         "__max_atoms_per_core",
         "__regenerate_data"]
 
@@ -160,6 +162,7 @@ class PopulationMachineLocalOnlyCombinedVertex(
         self.__ring_buffer_shifts = ring_buffer_shifts
         self.__weight_scales = weight_scales
         self.__neuron_data = neuron_data
+        self.__region_writer = RegionDeltaWriter()
         self.__max_atoms_per_core = max_atoms_per_core
         self.__regenerate_data = False
 
@@ -187,6 +190,11 @@ class PopulationMachineLocalOnlyCombinedVertex(
     def _neuron_data(self):
         return self.__neuron_data
 
+    @property
+    @overrides(PopulationMachineNeurons._region_writer)
+    def _region_writer(self):
+        return self.__region_writer
+
     @property
     @overrides(PopulationMachineNeurons._max_atoms_per_core)
     def _max_atoms_per_core(self):
@@ -285,7 +293,7 @@ class PopulationMachineLocalOnlyCombinedVertex(
 
     @overrides(AbstractRewritesDataSpecification.regenerate_data_specification)
     def regenerate_data_specification(self, spec, placement):
-        self._rewrite_neuron_data_spec(spec)
+        self._rewrite_neuron_data_spec(spec, placement)
 
         # close spec
         spec.end_specification()
@@ -354,3 +362,10 @@ class PopulationMachineLocalOnlyCombinedVertex(
     @overrides(PopulationMachineNeurons.set_do_neuron_regeneration)
     def set_do_neuron_regeneration(self):
         self.__regenerate_data = True
+        self.__region_writer.set_dirty(self.NEURON_REGIONS.neuron_params)
+
+    @overrides(PopulationMachineNeurons.set_do_current_source_regeneration)
+    def set_do_current_source_regeneration(self):
+        self.__regenerate_data = True
+        self.__region_writer.set_dirty(
+            self.NEURON_REGIONS.current_source_params)
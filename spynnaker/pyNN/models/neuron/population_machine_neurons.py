@@ -13,6 +13,7 @@
 # limitations under the License.
 import ctypes
 from dataclasses import dataclass
+import numpy
 
 from spinn_utilities.abstract_base import abstractproperty, abstractmethod
 from spinn_utilities.overrides import overrides
@@ -29,6 +30,53 @@ from spynnaker.pyNN.models.neuron.local_only import AbstractLocalOnly
 from spynnaker.pyNN.utilities.utility_calls import convert_to
 
 
+def _neurons_on_core(ids, lo_atom, hi_atom):
+    """
+    Get which neurons of a core are in a list of neuron IDs.
+
+    :param list(int) ids: The IDs of the neurons
+    :param int lo_atom: The first neuron on the core
+    :param int hi_atom: The last neuron on the core
+    :return: Whether each neuron of the core is in the IDs
+    :rtype: ~numpy.ndarray(bool)
+    """
+    ids = numpy.asarray(ids, dtype=numpy.int64).ravel()
+    ids = ids[(ids >= lo_atom) & (ids <= hi_atom)]
+    mask = numpy.zeros(hi_atom + 1 - lo_atom, dtype=bool)
+    mask[ids - lo_atom] = True
+    return mask
+
+
+def _neuron_current_source_table(masks, cs_ids, cs_indices):
+    """
+    Get the table of the current sources of each neuron on a core.  For
+    each neuron there is the number of current sources of the neuron,
+    followed by the ID and the index of each current source in turn.
+
+    :param ~numpy.ndarray(bool) masks:
+        For each current source, whether it is injected into each neuron
+    :param ~numpy.ndarray(uint32) cs_ids: The ID of each current source
+    :param ~numpy.ndarray(uint32) cs_indices:
+        The index of each current source within its type
+    :rtype: ~numpy.ndarray(uint32)
+    """
+    n_sources_per_neuron = numpy.count_nonzero(masks, axis=0)
+    # Sources of each neuron in order of neuron, then of current source
+    neurons, sources = numpy.nonzero(masks.T)
+
+    # Each neuron has one word for the count, then two for each source
+    n_before = numpy.cumsum(n_sources_per_neuron) - n_sources_per_neuron
+    starts = numpy.arange(len(n_sources_per_neuron)) + 2 * n_before
+    table = numpy.zeros(
+        len(n_sources_per_neuron) + 2 * len(sources), dtype="uint32")
+    table[starts] = n_sources_per_neuron
+    positions = (starts[neurons] + 1 +
+                 2 * (numpy.arange(len(sources)) - n_before[neurons]))
+    table[positions] = cs_ids[sources]
+    table[positions + 1] = cs_indices[sources]
+    return table
+
+
 class NeuronProvenance(ctypes.LittleEndianStructure):
     """
     Provenance items from neuron processing.
@@ -142,12 +190,27 @@ class PopulationMachineNeurons(
         :rtype: int
         """
 
+    @abstractproperty
+    def _region_writer(self):
+        """
+        The writer of the neuron regions when they are rewritten.
+
+        :rtype: RegionDeltaWriter
+        """
+
     @abstractmethod
     def set_do_neuron_regeneration(self):
         """
         Indicate that data re-generation of neuron parameters is required.
         """
 
+    @abstractmethod
+    def set_do_current_source_regeneration(self):
+        """
+        Indicate that data re-generation of current source parameters is
+        required.
+        """
+
     def _parse_neuron_provenance(self, x, y, p, provenance_data):
         """
         Extract and yield neuron provenance.
@@ -184,6 +247,10 @@ class PopulationMachineNeurons(
         # Write the neuron core parameters
         self._write_neuron_core_parameters(spec, ring_buffer_shifts)
 
+        # Everything is written again, so forget what was there
+        self._region_writer.forget()
+        self._region_writer.clear_dirty()
+
         # Write the current source parameters
         self._write_current_source_parameters(spec)
 
@@ -191,21 +258,33 @@ class PopulationMachineNeurons(
         self._neuron_data.write_data(
             spec, self._vertex_slice, self._neuron_regions)
 
-    def _rewrite_neuron_data_spec(self, spec):
+    def _rewrite_neuron_data_spec(self, spec, placement):
         """
-        Re-Write the data specification of the neuron data.
+        Re-Write the data specification of the neuron data, writing only
+        the regions marked as dirty, and only the parts of them that have
+        changed where possible.
 
-        :param ~data_specification.DataSpecificationGenerator spec:
+        :param ~data_specification.DataSpecificationReloader spec:
             The data specification to write to
-        :param list(int) ring_buffer_shifts:
-            The shifts to apply to convert ring buffer values to S1615 values
+        :param ~pacman.model.placements.Placement placement:
+            Where the vertex is on the machine
         """
+        region_writer = self._region_writer
+
         # Write the current source parameters
-        self._write_current_source_parameters(spec)
+        region = self._neuron_regions.current_source_params
+        if region_writer.is_dirty(region):
+            self.__reserve_current_source_region(spec)
+            region_writer.write_region(
+                spec, placement, region, self._get_current_source_data())
 
-        # Write the other parameters after forcing a regeneration
-        self._neuron_data.write_data(
-            spec, self._vertex_slice, self._neuron_regions, False)
+        # Write the other parameters from the host
+        if region_writer.is_dirty(self._neuron_regions.neuron_params):
+            self._neuron_data.rewrite_data(
+                spec, placement, self._vertex_slice, self._neuron_regions,
+                region_writer)
+
+        region_writer.clear_dirty()
 
     def _write_neuron_core_parameters(self, spec, ring_buffer_shifts):
         """
@@ -267,112 +346,129 @@ class PopulationMachineNeurons(
         # Write the keys
         spec.write_array(keys)
 
-    def _write_current_source_parameters(self, spec):
-        # pylint: disable=too-many-arguments
-        n_atoms = self._vertex_slice.n_atoms
-        lo_atom = self._vertex_slice.lo_atom
-        hi_atom = self._vertex_slice.hi_atom
-
-        spec.comment(
-            f"\nWriting Current Source Parameters for {n_atoms} Neurons:\n")
+    def __reserve_current_source_region(self, spec):
+        """
+        Reserve the current source region.
 
-        # Reserve and switch to the current source region
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification to write to
+        """
         params_size = self._app_vertex.\
             get_sdram_usage_for_current_source_params(
                 self._vertex_slice.n_atoms)
         spec.reserve_memory_region(
             region=self._neuron_regions.current_source_params,
             size=params_size, label='CurrentSourceParams')
+
+    def _write_current_source_parameters(self, spec):
+        """
+        Write the current source parameters region.
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The data specification to write to
+        """
+        n_atoms = self._vertex_slice.n_atoms
+        spec.comment(
+            f"\nWriting Current Source Parameters for {n_atoms} Neurons:\n")
+
+        # Reserve and switch to the current source region
+        self.__reserve_current_source_region(spec)
         spec.switch_write_focus(self._neuron_regions.current_source_params)
+        data = self._get_current_source_data()
+        spec.write_array(data)
+
+        # The machine only reads this region, so it stays as written
+        self._region_writer.note_data(
+            self._neuron_regions.current_source_params, data)
+
+    def _get_current_source_data(self):
+        """
+        Get the data of the current source parameters region.
+
+        :rtype: ~numpy.ndarray
+        """
+        lo_atom = self._vertex_slice.lo_atom
+        hi_atom = self._vertex_slice.hi_atom
 
         # Get the current sources from the app vertex
         app_current_sources = self._app_vertex.current_sources
         current_source_id_list = self._app_vertex.current_source_id_list
 
-        # Work out which current sources are on this core
-        current_sources = set()
+        # Work out which neurons on this core each current source is
+        # injected into, keeping those with at least one neuron on this core
+        current_sources = list()
+        masks = list()
         for app_current_source in app_current_sources:
-            for n in range(lo_atom, hi_atom + 1):
-                if (n in current_source_id_list[app_current_source]):
-                    current_sources.add(app_current_source)
+            mask = _neurons_on_core(
+                current_source_id_list[app_current_source], lo_atom, hi_atom)
+            if numpy.any(mask):
+                current_sources.append(app_current_source)
+                masks.append(mask)
 
         n_current_sources = len(current_sources)
 
-        # Write the number of sources
-        spec.write_value(n_current_sources)
-
-        # Don't write anything else if there are no current sources
-        if n_current_sources != 0:
-            # Sort the current sources into current_source_id order
-            current_sources = sorted(
-                current_sources, key=lambda x: x.current_source_id)
-
-            # Array to keep track of the number of each type of current source
-            # (there are four, but they are numbered 1 to 4, so five elements)
-            cs_index_array = [0, 0, 0, 0, 0]
-
-            # Data sent to the machine will be current sources per neuron
-            # This array will have the first entry indicating the number of
-            # sources for each neuron, then if this is non-zero, follow it with
-            # the IDs indicating the current source ID value, and then the
-            # index within that type of current source
-            neuron_current_sources = [[0] for n in range(lo_atom, hi_atom + 1)]
-            for current_source in current_sources:
-                # Get the ID of the current source
-                cs_id = current_source.current_source_id
-
-                # Only use IDs that are on this core
-                for n in range(lo_atom, hi_atom + 1):
-                    if (n in current_source_id_list[current_source]):
-                        # I think this is now right, but test it more...
-                        neuron_current_sources[n-lo_atom][0] += 1
-                        neuron_current_sources[n-lo_atom].append(cs_id)
-                        neuron_current_sources[n-lo_atom].append(
-                            cs_index_array[cs_id])
-
-                # Increase the ID value in case a (different) current source
-                # of the same type is also used
-                cs_index_array[cs_id] += 1
-
-            # Now loop over the neurons on this core and write the current
-            # source ID and index for sources attached to each neuron
-            for n in range(0, hi_atom + 1 - lo_atom):
-                n_current_sources = neuron_current_sources[n][0]
-                spec.write_value(n_current_sources)
-                if n_current_sources != 0:
-                    for csid in range(n_current_sources * 2):
-                        spec.write_value(neuron_current_sources[n][csid+1])
-
-            # Write the number of each type of current source
-            for n in range(1, len(cs_index_array)):
-                spec.write_value(cs_index_array[n])
-
-            # Now loop over the current sources and write the data required
-            # for each type of current source
-            for current_source in current_sources:
-                cs_data_types = current_source.get_parameter_types
-                cs_id = current_source.current_source_id
-                for key, value in current_source.get_parameters.items():
-                    # StepCurrentSource currently handled with arrays
-                    if (cs_id == CurrentSourceIDs.STEP_CURRENT_SOURCE.value):
-                        n_params = len(current_source.get_parameters[key])
-                        spec.write_value(n_params)
-                        for n_p in range(n_params):
-                            value_convert = convert_to(
-                                value[n_p], cs_data_types[key]).view("uint32")
-                            spec.write_value(data=value_convert)
-                    # All other sources have single-valued params
+        # Start with the number of sources
+        data = [numpy.array([n_current_sources], dtype="uint32")]
+
+        # Don't add anything else if there are no current sources
+        if n_current_sources == 0:
+            return data[0]
+
+        # Sort the current sources into current_source_id order
+        order = sorted(range(n_current_sources),
+                       key=lambda i: current_sources[i].current_source_id)
+        current_sources = [current_sources[i] for i in order]
+        masks = numpy.array([masks[i] for i in order])
+
+        # Array to keep track of the number of each type of current source
+        # (there are four, but they are numbered 1 to 4, so five elements)
+        cs_index_array = [0, 0, 0, 0, 0]
+
+        # The ID and the index within that type of each current source
+        cs_ids = numpy.zeros(n_current_sources, dtype="uint32")
+        cs_indices = numpy.zeros(n_current_sources, dtype="uint32")
+        for i, current_source in enumerate(current_sources):
+            cs_id = current_source.current_source_id
+            cs_ids[i] = cs_id
+            cs_indices[i] = cs_index_array[cs_id]
+
+            # Increase the ID value in case a (different) current source
+            # of the same type is also used
+            cs_index_array[cs_id] += 1
+
+        # The current sources per neuron: for each neuron, the number of
+        # sources, followed by the current source ID and the index within
+        # that type of current source of each source
+        data.append(_neuron_current_source_table(masks, cs_ids, cs_indices))
+
+        # The number of each type of current source
+        data.append(numpy.array(cs_index_array[1:], dtype="uint32"))
+
+        # Now loop over the current sources and add the data required
+        # for each type of current source
+        words = list()
+        for current_source in current_sources:
+            cs_data_types = current_source.get_parameter_types
+            cs_id = current_source.current_source_id
+            for key, value in current_source.get_parameters.items():
+                # StepCurrentSource currently handled with arrays
+                if (cs_id == CurrentSourceIDs.STEP_CURRENT_SOURCE.value):
+                    n_params = len(current_source.get_parameters[key])
+                    words.append(n_params)
+                    for n_p in range(n_params):
+                        words.append(convert_to(
+                            value[n_p], cs_data_types[key]).view("uint32"))
+                # All other sources have single-valued params
+                else:
+                    if hasattr(value, "__getitem__"):
+                        for m in range(len(value)):
+                            words.append(convert_to(
+                                value[m], cs_data_types[key]).view("uint32"))
                     else:
-                        if hasattr(value, "__getitem__"):
-                            for m in range(len(value)):
-                                value_convert = convert_to(
-                                    value[m],
-                                    cs_data_types[key]).view("uint32")
-                                spec.write_value(data=value_convert)
-                        else:
-                            value_convert = convert_to(
-                                value, cs_data_types[key]).view("uint32")
-                            spec.write_value(data=value_convert)
+                        words.append(convert_to(
+                            value, cs_data_types[key]).view("uint32"))
+        data.append(numpy.array(words, dtype="uint32"))
+        return numpy.concatenate(data)
 
     def read_parameters_from_machine(self, placement):
         """
@@ -384,6 +480,37 @@ class PopulationMachineNeurons(
         """
         self._neuron_data.read_data(placement, self._neuron_regions)
 
+    @staticmethod
+    def read_parameters_from_machines(
+            placements, initial=False, n_threads=1):
+        """
+        Read the parameters and state of the neurons of several machine
+        vertices of the same application vertex from the machine, reading
+        the cores concurrently.
+
+        :param list(~pacman.model.placements.Placement) placements:
+            Where the machine vertices to read are
+        :param bool initial:
+            Whether to read the state as it was at the last time 0 rather
+            than the current state
+        :param int n_threads: The number of cores to read at the same time
+        """
+        if not placements:
+            return
+        # pylint: disable=protected-access
+        neuron_data = placements[0].vertex._neuron_data
+        blocks = neuron_data.read_all_data(
+            [(placement, placement.vertex._neuron_regions)
+             for placement in placements],
+            initial, n_threads)
+
+        # What was read is what is now on the machine, until it next runs
+        if not initial:
+            for placement, block in zip(placements, blocks):
+                placement.vertex._region_writer.note_data(
+                    placement.vertex._neuron_regions.neuron_params, block,
+                    changes_on_run=True)
+
     def read_initial_parameters_from_machine(self, placement):
         """
         Read the parameters and state of the neurons from the machine
@@ -240,6 +240,22 @@ class PopulationMachineSynapses(
         return self._synaptic_matrices.get_connections_from_machine(
             placement, app_edge, synapse_info)
 
+    @overrides(HasSynapses.add_connection_reads)
+    def add_connection_reads(self, planner, placement, projections):
+        synapses_address = locate_memory_region_for_placement(
+            placement=placement, region=self._synapse_regions.synaptic_matrix)
+        for app_edge, synapse_info in projections:
+            self._synaptic_matrices.add_connection_reads(
+                planner, placement, synapses_address, app_edge, synapse_info)
+        return synapses_address
+
+    @overrides(HasSynapses.get_connections_from_reads)
+    def get_connections_from_reads(
+            self, planner, placement, synapses_address, app_edge,
+            synapse_info):
+        return self._synaptic_matrices.get_connections_from_reads(
+            planner, placement, synapses_address, app_edge, synapse_info)
+
     @property
     @overrides(AbstractSynapseExpandable.max_gen_data)
     def max_gen_data(self):
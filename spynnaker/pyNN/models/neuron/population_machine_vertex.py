@@ -19,6 +19,7 @@ from spinn_utilities.overrides import overrides
 from spinn_front_end_common.abstract_models import (
     AbstractGeneratesDataSpecification, AbstractRewritesDataSpecification)
 from spinn_front_end_common.interface.provenance import ProvenanceWriter
+from spynnaker.pyNN.utilities.region_delta_writer import RegionDeltaWriter
 from .population_machine_common import CommonRegions, PopulationMachineCommon
 from .population_machine_neurons import (
     NeuronRegions, PopulationMachineNeurons, NeuronProvenance)
@@ -74,6 +75,7 @@ class PopulationMachineVertex(
     __slots__ = [
         "__synaptic_matrices",
         "__neuron_data",
+        "__region_writer",
         "__key",
         "__ring_buffer_shifts",
         "__weight_scales",
@@ -186,6 +188,7 @@ class PopulationMachineVertex(
         self.__max_atoms_per_core = max_atoms_per_core
         self.__synaptic_matrices = synaptic_matrices
         self.__neuron_data = neuron_data
+        self.__region_writer = RegionDeltaWriter()
         self.__regenerate_neuron_data = False
         self.__regenerate_synapse_data = False
 
@@ -213,6 +216,11 @@ class PopulationMachineVertex(
     def _neuron_data(self):
         return self.__neuron_data
 
+    @property
+    @overrides(PopulationMachineNeurons._region_writer)
+    def _region_writer(self):
+        return self.__region_writer
+
     @property
     @overrides(PopulationMachineSynapses._synapse_regions)
     def _synapse_regions(self):
@@ -309,7 +317,7 @@ class PopulationMachineVertex(
         AbstractRewritesDataSpecification.regenerate_data_specification)
     def regenerate_data_specification(self, spec, placement):
         if self.__regenerate_neuron_data:
-            self._rewrite_neuron_data_spec(spec)
+            self._rewrite_neuron_data_spec(spec, placement)
             self.__regenerate_neuron_data = False
 
         if self.__regenerate_synapse_data:
@@ -393,8 +401,15 @@ class PopulationMachineVertex(
     @overrides(PopulationMachineNeurons.set_do_neuron_regeneration)
     def set_do_neuron_regeneration(self):
         self.__regenerate_neuron_data = True
+        self.__region_writer.set_dirty(self.NEURON_REGIONS.neuron_params)
         self.__neuron_data.reset_generation()
 
+    @overrides(PopulationMachineNeurons.set_do_current_source_regeneration)
+    def set_do_current_source_regeneration(self):
+        self.__regenerate_neuron_data = True
+        self.__region_writer.set_dirty(
+            self.NEURON_REGIONS.current_source_params)
+
     @overrides(PopulationMachineSynapses.set_do_synapse_regeneration)
     def set_do_synapse_regeneration(self):
         self.__regenerate_synapse_data = True
@@ -24,6 +24,7 @@ from spynnaker.pyNN.exceptions import SynapticConfigurationException
 from spynnaker.pyNN.models.abstract_models import (
     ReceivesSynapticInputsOverSDRAM, SendsSynapticInputsOverSDRAM)
 from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+from spynnaker.pyNN.utilities.region_delta_writer import RegionDeltaWriter
 from .population_machine_common import CommonRegions, PopulationMachineCommon
 from .population_machine_neurons import (
     NeuronRegions, PopulationMachineNeurons, NeuronProvenance)
@@ -64,6 +65,7 @@ class PopulationNeuronsMachineVertex(
         "__weight_scales",
         "__slice_index",
         "__neuron_data",
+        "__region_writer",
         "__max_atoms_per_core",
         "__regenerate_data"]
 
@@ -136,6 +138,7 @@ class PopulationNeuronsMachineVertex(
         self.__ring_buffer_shifts = ring_buffer_shifts
         self.__weight_scales = weight_scales
         self.__neuron_data = neuron_data
+        self.__region_writer = RegionDeltaWriter()
         self.__max_atoms_per_core = max_atoms_per_core
         self.__regenerate_data = False
 
@@ -163,6 +166,11 @@ class PopulationNeuronsMachineVertex(
     def _neuron_data(self):
         return self.__neuron_data
 
+    @property
+    @overrides(PopulationMachineNeurons._region_writer)
+    def _region_writer(self):
+        return self.__region_writer
+
     @property
     @overrides(PopulationMachineNeurons._max_atoms_per_core)
     def _max_atoms_per_core(self):
@@ -248,7 +256,7 @@ class PopulationNeuronsMachineVertex(
         AbstractRewritesDataSpecification.regenerate_data_specification)
     def regenerate_data_specification(self, spec, placement):
         # Write the other parameters
-        self._rewrite_neuron_data_spec(spec)
+        self._rewrite_neuron_data_spec(spec, placement)
 
         # close spec
         spec.end_specification()
@@ -295,8 +303,15 @@ class PopulationNeuronsMachineVertex(
     @overrides(PopulationMachineNeurons.set_do_neuron_regeneration)
     def set_do_neuron_regeneration(self):
         self.__regenerate_data = True
+        self.__region_writer.set_dirty(self.NEURON_REGIONS.neuron_params)
         self.__neuron_data.reset_generation()
 
+    @overrides(PopulationMachineNeurons.set_do_current_source_regeneration)
+    def set_do_current_source_regeneration(self):
+        self.__regenerate_data = True
+        self.__region_writer.set_dirty(
+            self.NEURON_REGIONS.current_source_params)
+
     @overrides(PopulationMachineCommon.get_n_keys_for_partition)
     def get_n_keys_for_partition(self, partition_id):
         n_colours = 2 ** self._app_vertex.n_colour_bits
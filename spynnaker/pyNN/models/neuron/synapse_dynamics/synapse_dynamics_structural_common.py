@@ -37,6 +37,55 @@ DEFAULT_INITIAL_DELAY = 1.0
 DEFAULT_S_MAX = 32
 
 
+def _get_post_to_pre_table(
+        pop_indices, subpop_indices, sources, targets, n_atoms, s_max):
+    """
+    Build the post-to-pre table from the connections of a post slice.  Each
+    target has a row of `s_max` entries, filled from the end with the
+    connections to that target in the order given, and padded at the start
+    with 0xFFFFFFFF.
+
+    :param ~numpy.ndarray pop_indices: The pre-population of each connection
+    :param ~numpy.ndarray subpop_indices:
+        The sub-population of each connection
+    :param ~numpy.ndarray sources:
+        The source of each connection, relative to its sub-population
+    :param ~numpy.ndarray targets:
+        The target of each connection, relative to the post slice
+    :param int n_atoms: The number of atoms in the post slice
+    :param int s_max: The maximum number of connections per target
+    :return: The table as words, (pop_index, subpop_index, neuron_index) in
+        8, 8 and 16 bits
+    :rtype: ~numpy.ndarray
+    """
+    # pylint: disable=too-many-arguments
+    targets = numpy.asarray(targets, dtype="int64")
+    counts = numpy.bincount(targets, minlength=n_atoms)
+    if len(counts) > n_atoms:
+        raise ValueError("Connection target out of range of the post slice")
+    if len(targets) and counts.max() > s_max:
+        raise ValueError(
+            "Too many initial connections per incoming neuron")
+
+    # Sort by target, keeping the order of connections to each target
+    order = numpy.argsort(targets, kind="stable")
+    sorted_targets = targets[order]
+
+    # Rows are filled from the end, so the first connection to a target
+    # goes in column s_max - count, the second in the next one and so on
+    row_starts = numpy.cumsum(counts) - counts
+    rank = numpy.arange(len(order)) - row_starts[sorted_targets]
+    columns = s_max - counts[sorted_targets] + rank
+
+    words = (
+        (numpy.asarray(pop_indices, dtype="uint32") & 0xFF) |
+        ((numpy.asarray(subpop_indices, dtype="uint32") & 0xFF) << 8) |
+        ((numpy.asarray(sources, dtype="uint32") & 0xFFFF) << 16))
+    table = numpy.full((n_atoms, s_max), 0xFFFFFFFF, dtype="uint32")
+    table[sorted_targets, columns] = words[order]
+    return table.reshape(-1)
+
+
 class SynapseDynamicsStructuralCommon(
         AbstractSynapseDynamicsStructural, metaclass=AbstractBase):
 
@@ -214,7 +263,15 @@ class SynapseDynamicsStructuralCommon(
             list(~pacman.model.graphs.machine.MachineEdge))
         :param dict(AbstractSynapseType,float) weight_scales:
         :param SynapticMatrices synaptic_matrices:
-        :rtype: dict(tuple(AbstractPopulationVertex,SynapseInformation),int)
+        :return: The index of each pre-population, and arrays indexed by
+            source atom of the sub-population index and of the low atom of
+            the sub-population, per pre-population
+        :rtype: tuple(
+            dict(tuple(AbstractPopulationVertex,SynapseInformation),int),
+            dict(tuple(AbstractPopulationVertex,SynapseInformation),
+            ~numpy.ndarray),
+            dict(tuple(AbstractPopulationVertex,SynapseInformation),
+            ~numpy.ndarray))
         """
         spec.comment("Writing pre-population info")
         pop_index = dict()
@@ -258,6 +315,11 @@ class SynapseDynamicsStructuralCommon(
             spec.write_value(synapse_info.synapse_type)
             # Total number of atoms in pre-vertex
             spec.write_value(app_edge.pre_vertex.n_atoms)
+            # Lookups of the sub-population index and low atom by source
+            subpop_lookup = numpy.zeros(
+                app_edge.pre_vertex.n_atoms, dtype="uint32")
+            lo_atom_lookup = numpy.zeros(
+                app_edge.pre_vertex.n_atoms, dtype="uint32")
             # Machine edge information
             for sub, m_vertex in enumerate(out_verts):
                 r_info = routing_info.get_routing_info_from_pre_vertex(
@@ -270,10 +332,11 @@ class SynapseDynamicsStructuralCommon(
                 spec.write_value(vertex_slice.lo_atom)
                 spec.write_value(synaptic_matrices.get_index(
                     app_edge, synapse_info))
-                lo = m_vertex.vertex_slice.lo_atom
-                for i in range(vertex_slice.lo_atom, vertex_slice.hi_atom + 1):
-                    subpop_index[app_edge.pre_vertex, synapse_info, i] = sub
-                    lo_atom_index[app_edge.pre_vertex, synapse_info, i] = lo
+                atoms = slice(vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
+                subpop_lookup[atoms] = sub
+                lo_atom_lookup[atoms] = vertex_slice.lo_atom
+            subpop_index[app_edge.pre_vertex, synapse_info] = subpop_lookup
+            lo_atom_index[app_edge.pre_vertex, synapse_info] = lo_atom_lookup
         return pop_index, subpop_index, lo_atom_index
 
     def __write_post_to_pre_table(
@@ -286,6 +349,14 @@ class SynapseDynamicsStructuralCommon(
         :param pop_index:
         :type pop_index:
             dict(tuple(AbstractPopulationVertex,SynapseInformation), int)
+        :param subpop_index:
+        :type subpop_index:
+            dict(tuple(AbstractPopulationVertex,SynapseInformation),
+            ~numpy.ndarray)
+        :param lo_atom_index:
+        :type lo_atom_index:
+            dict(tuple(AbstractPopulationVertex,SynapseInformation),
+            ~numpy.ndarray)
         :param ~pacman.model.graphs.application.ApplicationVertex app_vertex:
             the vertex for which data specs are being prepared
         :param ~pacman.model.graphs.common.Slice vertex_slice:
@@ -306,40 +377,20 @@ class SynapseDynamicsStructuralCommon(
             [pop_index[a_edge.pre_vertex, s_info]
              for (_, a_edge, s_info) in slice_conns], conn_lens)
         # Make a single large array of sub-population index
-        subpop_indices = numpy.array([
-            subpop_index[a_edge.pre_vertex, s_info, c["source"]]
-            for (conns, a_edge, s_info) in slice_conns for c in conns])
+        subpop_indices = numpy.concatenate([
+            subpop_index[a_edge.pre_vertex, s_info][conns["source"]]
+            for (conns, a_edge, s_info) in slice_conns])
         # Get the low atom for each source and subtract
-        lo_atoms = numpy.array([
-            lo_atom_index[a_edge.pre_vertex, s_info, c["source"]]
-            for (conns, a_edge, s_info) in slice_conns for c in conns])
-        connections["source"] = connections["source"] - lo_atoms
-        connections["target"] = connections["target"] - vertex_slice.lo_atom
-
-        # Make an array of all data required
-        conn_data = numpy.dstack(
-            (pop_indices, subpop_indices, connections["source"]))[0]
-
-        # Break data into rows based on target and strip target out
-        rows = [conn_data[connections["target"] == i]
-                for i in range(0, vertex_slice.n_atoms)]
-
-        if any(len(row) > self.s_max for row in rows):
-            raise ValueError(
-                "Too many initial connections per incoming neuron")
-
-        # Make each row the required length through padding with 0xFFFF
-        padded_rows = [numpy.pad(row, [(self.s_max - len(row), 0), (0, 0)],
-                                 "constant", constant_values=0xFFFF)
-                       for row in rows]
+        lo_atoms = numpy.concatenate([
+            lo_atom_index[a_edge.pre_vertex, s_info][conns["source"]]
+            for (conns, a_edge, s_info) in slice_conns])
+        sources = connections["source"] - lo_atoms
+        targets = connections["target"] - vertex_slice.lo_atom
 
         # Finally make the table and write it out
-        post_to_pre = numpy.core.records.fromarrays(
-            numpy.concatenate(padded_rows).T, formats="u1, u1, u2").view("u4")
-        if len(post_to_pre) != vertex_slice.n_atoms * self.s_max:
-            raise ValueError(
-                f"Wrong size of pre-to-pop tables: {len(post_to_pre)} "
-                f"Found, {vertex_slice.n_atoms * self.s_max} Expected")
+        post_to_pre = _get_post_to_pre_table(
+            pop_indices, subpop_indices, sources, targets,
+            vertex_slice.n_atoms, self.s_max)
         spec.comment(
             "Writing post-to-pre table of "
             f"{vertex_slice.n_atoms * self.s_max} words")
@@ -447,6 +447,52 @@ class SynapticMatrices(object):
         matrix = self.__matrices[app_edge, synapse_info]
         return matrix.get_connections(placement)
 
+    def add_connection_reads(
+            self, planner, placement, synapses_address, app_edge,
+            synapse_info):
+        """
+        Add the reads needed to get the synaptic connections of a projection
+        from the machine to a read planner.
+
+        :param SDRAMReadPlanner planner: The planner to add the reads to
+        :param ~pacman.model.placements.Placement placement:
+            Where the vertices are on the machine
+        :param int synapses_address:
+            The base address of the synaptic matrix region
+        :param ProjectionApplicationEdge app_edge:
+            The application edge of the projection
+        :param SynapseInformation synapse_info:
+            The synapse information of the projection
+        """
+        # pylint: disable=too-many-arguments
+        matrix = self.__matrices[app_edge, synapse_info]
+        matrix.add_connection_reads(planner, placement, synapses_address)
+
+    def get_connections_from_reads(
+            self, planner, placement, synapses_address, app_edge,
+            synapse_info):
+        """
+        Get the synaptic connections of a projection from the data read by a
+        read planner.
+
+        :param SDRAMReadPlanner planner: The planner that has read the data
+        :param ~pacman.model.placements.Placement placement:
+            Where the vertices are on the machine
+        :param int synapses_address:
+            The base address of the synaptic matrix region
+        :param ProjectionApplicationEdge app_edge:
+            The application edge of the projection
+        :param SynapseInformation synapse_info:
+            The synapse information of the projection
+        :return: A list of arrays of connections, each with dtype
+            :py:attr:`~.AbstractSDRAMSynapseDynamics.NUMPY_CONNECTORS_DTYPE`
+        :rtype: list(~numpy.ndarray)
+        """
+        # pylint: disable=too-many-arguments
+        matrix = self.__matrices[app_edge, synapse_info]
+        return matrix.get_connections_from_reads(
+            planner, placement, synapses_address)
+
     def read_generated_connection_holders(self, placement):
         """
         Fill in any pre-run connection holders for data which is generated
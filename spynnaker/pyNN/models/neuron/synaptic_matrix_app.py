@@ -16,9 +16,9 @@ import numpy
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement)
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
-from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamicsStructural)
+from spynnaker.pyNN.utilities.sdram_read_planner import SDRAMReadPlanner
 from .generator_data import GeneratorData
 from .synapse_io import read_all_synapses, convert_to_connections, get_synapses
 
@@ -353,7 +353,11 @@ class SynapticMatrixApp(object):
         """
         synapses_address = locate_memory_region_for_placement(
             placement, self.__synaptic_matrix_region)
-        return self.__read_connections(placement, synapses_address)
+        planner = SDRAMReadPlanner()
+        self.add_connection_reads(planner, placement, synapses_address)
+        planner.read()
+        return self.get_connections_from_reads(
+            planner, placement, synapses_address)
 
     def read_generated_connection_holders(self, placement):
         """
@@ -369,23 +373,48 @@ class SynapticMatrixApp(object):
                 for holder in self.__synapse_info.pre_run_connection_holders:
                     holder.add_connections(connections)
 
-    def __read_connections(self, placement, synapses_address):
+    def add_connection_reads(self, planner, placement, synapses_address):
         """
-        Read connections from an address on the machine.
+        Add the reads of the matrices needed to get the connections from
+        the machine to a read planner.
 
+        :param SDRAMReadPlanner planner: The planner to add the reads to
+        :param ~pacman.model.placements.Placement placement:
+            Where the matrix is on the machine
+        :param int synapses_address:
+            The base address of the synaptic matrix region
+        """
+        if self.__syn_mat_offset is not None:
+            planner.add_read(
+                placement.x, placement.y,
+                synapses_address + self.__syn_mat_offset, self.__matrix_size)
+        if self.__delay_syn_mat_offset is not None:
+            planner.add_read(
+                placement.x, placement.y,
+                synapses_address + self.__delay_syn_mat_offset,
+                self.__delay_matrix_size)
+
+    def get_connections_from_reads(self, planner, placement, synapses_address):
+        """
+        Get the connections from the data read by a read planner to which
+        the reads were added with :py:meth:`add_connection_reads`.
+
+        :param SDRAMReadPlanner planner: The planner that has read the data
         :param ~pacman.model.placements.Placement placement:
             Where the matrix is on the machine
         :param int synapses_address:
             The base address of the synaptic matrix region
         :return: A list of arrays of connections, each with dtype
             :py:attr:`~.AbstractSDRAMSynapseDynamics.NUMPY_CONNECTORS_DTYPE`
-        :rtype: ~numpy.ndarray
+        :rtype: list(~numpy.ndarray)
         """
         connections = list()
+        splitter = self.__app_edge.post_vertex.splitter
 
         if self.__syn_mat_offset is not None:
-            block = self.__get_block(placement, synapses_address)
-            splitter = self.__app_edge.post_vertex.splitter
+            block = planner.get_data(
+                placement.x, placement.y,
+                synapses_address + self.__syn_mat_offset, self.__matrix_size)
             connections.append(convert_to_connections(
                 self.__synapse_info, placement.vertex.vertex_slice,
                 self.__app_edge.pre_vertex.n_atoms,
@@ -395,8 +424,10 @@ class SynapticMatrixApp(object):
                 self.__max_atoms_per_core))
 
         if self.__delay_syn_mat_offset is not None:
-            block = self.__get_delayed_block(placement, synapses_address)
-            splitter = self.__app_edge.post_vertex.splitter
+            block = planner.get_data(
+                placement.x, placement.y,
+                synapses_address + self.__delay_syn_mat_offset,
+                self.__delay_matrix_size)
             connections.append(convert_to_connections(
                 self.__synapse_info, placement.vertex.vertex_slice,
                 self.__app_edge.pre_vertex.n_atoms,
@@ -406,35 +437,6 @@ class SynapticMatrixApp(object):
 
         return connections
 
-    def __get_block(self, placement, synapses_address):
-        """
-        Get a block of data for undelayed synapses.
-
-        :param Placement placement: Where the matrix is on the machine
-        :param int synapses_address:
-            The base address of the synaptic matrix region
-        :rtype: bytearray
-        """
-        address = self.__syn_mat_offset + synapses_address
-        block = SpynnakerDataView.read_memory(
-            placement.x, placement.y, address, self.__matrix_size)
-        return block
-
-    def __get_delayed_block(self, placement, synapses_address):
-        """
-        Get a block of data for delayed synapses.
-
-        :param ~pacman.model.placements.Placement placement:
-            Where the matrix is on the machine
-        :param int synapses_address:
-            The base address of the synaptic matrix region
-        :rtype: bytearray
-        """
-        address = self.__delay_syn_mat_offset + synapses_address
-        block = SpynnakerDataView.read_memory(
-            placement.x, placement.y, address, self.__delay_matrix_size)
-        return block
-
     def get_index(self):
         """
         Get the index in the master population table of the matrix.
@@ -12,17 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
 import functools
 import logging
 import numpy
 from spinn_utilities.config_holder import get_config_bool
 from spinn_utilities.log import FormatAdapter
+from spinn_utilities.progress_bar import ProgressBar
 from pyNN.recording.files import StandardTextFile
 from pyNN.space import Space as PyNNSpace
 from spinn_utilities.logger_utils import warn_once
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+from spynnaker.pyNN.utilities.utility_calls import map_in_threads
 from spynnaker.pyNN.models.abstract_models import (
     AbstractAcceptsIncomingSynapses)
 from spynnaker.pyNN.models.neural_projections import (
@@ -39,6 +42,9 @@ from spynnaker.pyNN.models.spike_source import SpikeSourcePoissonVertex
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
+#: The values of multiple_synapses supported by Projection.get
+_MULTIPLE_SYNAPSES = ("last", "first", "sum", "min", "max")
+
 
 def _we_dont_do_this_now(*args):  # pylint: disable=unused-argument
     # pragma: no cover
@@ -225,25 +231,32 @@ class Projection(object):
 
         :param attribute_names: list of attributes to gather
         :type attribute_names: str or iterable(str)
-        :param str format: ``"list"`` or ``"array"``
+        :param str format:
+            ``"list"`` or ``"array"`` as in PyNN, or one of the sPyNNaker
+            extensions ``"sparse"`` (a :py:class:`scipy.sparse.csr_matrix`
+            per attribute, avoiding a dense matrix) or ``"structured"``
+            (a numpy structured array with a field per attribute, avoiding
+            the creation of a Python object per connection)
         :param bool gather: gather over all nodes
         :param bool with_address:
             True if the source and target are to be included
         :param str multiple_synapses:
-            What to do with the data if format="array" and if the multiple
-            source-target pairs with the same values exist.  Currently only
-            "last" is supported
+            What to do with the data if format is "array" or "sparse" and
+            multiple source-target pairs with the same values exist; one of
+            "last", "first", "sum", "min" or "max"
         :return: values selected
         """
         # pylint: disable=too-many-arguments
         if not gather:
             logger.warning("sPyNNaker always gathers from every core.")
-        if multiple_synapses != 'last':
+        if multiple_synapses not in _MULTIPLE_SYNAPSES:
             raise ConfigurationException(
-                "sPyNNaker only recognises multiple_synapses == last")
+                f"sPyNNaker only recognises multiple_synapses in "
+                f"{_MULTIPLE_SYNAPSES}")
 
         return self.__get_data(
-            attribute_names, format, with_address, notify=None)
+            attribute_names, format, with_address, notify=None,
+            multiple_synapses=multiple_synapses)
 
     def save(
             self, attribute_names, file, format='list',  # @ReservedAssignment
@@ -251,6 +264,8 @@ class Projection(object):
         """
         Print synaptic attributes (weights, delays, etc.) to file. In the
         array format, zeros are printed for non-existent connections.
+        In the sparse and structured formats, only the existing connections
+        are written, one per row, as in the list format.
         Values will be expressed in the standard PyNN units (i.e.,
         millivolts, nanoamps, milliseconds, microsiemens, nanofarads,
         event per second).
@@ -271,6 +286,10 @@ class Projection(object):
             warn_once(
                 logger, "sPyNNaker only supports gather=True. We will run "
                 "as if gather was set to True.")
+        if format == "sparse":
+            # A sparse matrix is written as its coordinates and values, which
+            # is exactly what the structured format provides
+            format = "structured"  # @ReservedAssignment
         if isinstance(attribute_names, str):
             attribute_names = [attribute_names]
         if attribute_names in (['all'], ['connections']):
@@ -286,23 +305,28 @@ class Projection(object):
 
     def __get_data(
             self, attribute_names, format,  # @ReservedAssignment
-            with_address, notify):
+            with_address, notify, multiple_synapses="last"):
         """
         Internal data getter to add notify option.
 
         :param attribute_names: list of attributes to gather
         :type attribute_names: str or iterable(str)
-        :param str format: ``"list"`` or ``"array"``
+        :param str format:
+            ``"list"``, ``"array"``, ``"sparse"`` or ``"structured"``
         :param bool with_address:
         :param callable(ConnectionHolder,None) notify:
+        :param str multiple_synapses:
         :return: values selected
         """
+        # pylint: disable=too-many-arguments
         # fix issue with 1 versus many
         if isinstance(attribute_names, str):
             attribute_names = [attribute_names]
+        else:
+            attribute_names = list(attribute_names)
 
         data_items = list()
-        if format != "list":
+        if format not in ("list", "structured"):
             with_address = False
         if with_address:
             data_items.append("source")
@@ -327,7 +351,8 @@ class Projection(object):
 
         # Return the connection data
         return self._get_synaptic_data(
-            format == "list", data_items, fixed_values, notify=notify)
+            format == "list", data_items, fixed_values, notify=notify,
+            data_format=format, multiple_synapses=multiple_synapses)
 
     @staticmethod
     def __save_callback(save_file, metadata, data):
@@ -339,9 +364,9 @@ class Projection(object):
         :type data: ConnectionHolder or numpy.ndarray
         """
         # Convert structured array to normal numpy array
-        if hasattr(data, "dtype") and hasattr(data.dtype, "names"):
-            dtype = [(name, "<f8") for name in data.dtype.names]
-            data = data.astype(dtype)
+        if hasattr(data, "dtype") and data.dtype.names is not None:
+            data = numpy.column_stack([
+                data[name].astype("<f8") for name in data.dtype.names])
         data = numpy.nan_to_num(data)
         if isinstance(save_file, str):
             data_file = StandardTextFile(save_file, mode='wb')
@@ -424,12 +449,17 @@ class Projection(object):
         return None
 
     def _get_synaptic_data(
-            self, as_list, data_to_get, fixed_values=None, notify=None):
+            self, as_list, data_to_get, fixed_values=None, notify=None,
+            data_format=None, multiple_synapses="last"):
         """
         :param bool as_list:
         :param list(int) data_to_get:
         :param list(tuple(str,int)) fixed_values:
         :param callable(ConnectionHolder,None) notify:
+        :param data_format:
+            The format of the data, overriding `as_list` if not `None`
+        :type data_format: str or None
+        :param str multiple_synapses:
         :rtype: ConnectionHolder
         """
         # pylint: disable=too-many-arguments
@@ -441,7 +471,8 @@ class Projection(object):
             connection_holder = ConnectionHolder(
                 data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
                 self.__virtual_connection_list, fixed_values=fixed_values,
-                notify=notify)
+                notify=notify, data_format=data_format,
+                multiple_synapses=multiple_synapses)
             connection_holder.finish()
             return connection_holder
 
@@ -449,7 +480,8 @@ class Projection(object):
         # possible later date
         connection_holder = ConnectionHolder(
             data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
-            fixed_values=fixed_values, notify=notify)
+            fixed_values=fixed_values, notify=notify, data_format=data_format,
+            multiple_synapses=multiple_synapses)
 
         # If we haven't run, add the holder to get connections, and return it
         # and set up a callback for after run to fill in this connection holder
@@ -467,6 +499,48 @@ class Projection(object):
             connection_holder.finish()
         return connection_holder
 
+    @staticmethod
+    def _read_connections_from_machine(projections, n_threads=1):
+        """
+        Read the connections of several projections from the machine in
+        one go, so that later calls to :py:meth:`get` for them use the data
+        read without any further reading.  The projections are grouped by
+        their post-vertex so that the data of each core is read once for
+        all the projections that target it.
+
+        :param iterable(Projection) projections: The projections to read
+        :param int n_threads:
+            The number of post-vertices to read from concurrently; this
+            relies on the transceiver being thread-safe, as spinnman
+            documents it to be
+        """
+        # Nothing to read if there is no machine or nothing has run
+        if (get_config_bool("Machine", "virtual_board") or
+                not SpynnakerDataView.is_ran_ever()):
+            return
+
+        # Group the projections by the vertex that holds the synapses
+        by_post_vertex = defaultdict(list)
+        for projection in projections:
+            edge = projection.__projection_edge
+            by_post_vertex[edge.post_vertex].append(
+                (edge, projection.__synapse_information))
+
+        def read(post_vertex):
+            post_vertex.get_connections_from_machine_for_projections(
+                by_post_vertex[post_vertex], show_progress=False)
+
+        # One progress bar for all the reads, as the threads doing them
+        # each showing their own would interleave
+        progress = ProgressBar(
+            len(by_post_vertex),
+            "Getting synaptic data of "
+            f"{sum(map(len, by_post_vertex.values()))} projections")
+        # Consume the results so that any exception is raised here
+        for _ in progress.over(
+                map_in_threads(read, by_post_vertex, n_threads)):
+            pass
+
     def _clear_cache(self):
         post_vertex = self.__projection_edge.post_vertex
         if isinstance(post_vertex, AbstractAcceptsIncomingSynapses):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .columnar_spike_times import ColumnarSpikeTimes
 from .spike_source_array import SpikeSourceArray
 from .spike_source_array_vertex import SpikeSourceArrayVertex
 from .spike_source_from_file import SpikeSourceFromFile
@@ -20,8 +21,10 @@ from .spike_source_poisson_variable import SpikeSourcePoissonVariable
 from .spike_source_poisson_machine_vertex import (
     SpikeSourcePoissonMachineVertex)
 from .spike_source_poisson_vertex import SpikeSourcePoissonVertex
+from .streamed_spike_times import StreamedSpikeTimes
 
-__all__ = ["SpikeSourceArray", "SpikeSourceArrayVertex",
-           "SpikeSourceFromFile", "SpikeSourcePoisson",
-           "SpikeSourcePoissonMachineVertex", "SpikeSourcePoissonVariable",
-           "SpikeSourcePoissonVertex"]
+__all__ = ["ColumnarSpikeTimes", "SpikeSourceArray",
+           "SpikeSourceArrayVertex", "SpikeSourceFromFile",
+           "SpikeSourcePoisson", "SpikeSourcePoissonMachineVertex",
+           "SpikeSourcePoissonVariable", "SpikeSourcePoissonVertex",
+           "StreamedSpikeTimes"]
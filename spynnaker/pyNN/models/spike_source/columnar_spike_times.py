@@ -0,0 +1,194 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+
+
+class ColumnarSpikeTimes(object):
+    """
+    The spike times of a number of neurons, held as a column of times
+    sorted by neuron and then by time, along with the offset of the times
+    of each neuron in the column.  This avoids holding a Python object for
+    each neuron when there are many neurons or spikes, such as when
+    replaying recorded data.
+
+    Can be passed as the ``spike_times`` of a
+    :py:class:`~spynnaker.pyNN.models.spike_source.SpikeSourceArray`.
+    """
+
+    __slots__ = [
+        # The times, sorted by neuron and then by time
+        "__times",
+
+        # The index of the first time of each neuron, and the end
+        "__offsets"]
+
+    def __init__(self, neuron_ids, times=None):
+        """
+        :param ~numpy.ndarray neuron_ids:
+            The neuron of each spike, or a structured array with fields
+            ``id`` and ``time`` if times is not given
+        :param times: The time of each spike in milliseconds
+        :type times: ~numpy.ndarray or None
+        :raises ValueError:
+            If the IDs and times are not the same length or there is a
+            negative ID
+        """
+        if times is None:
+            times = neuron_ids["time"]
+            neuron_ids = neuron_ids["id"]
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64")
+        times = numpy.asarray(times, dtype="float64")
+        if neuron_ids.shape != times.shape or neuron_ids.ndim != 1:
+            raise ValueError(
+                "The neuron IDs and times must be 1D arrays of the same "
+                "length")
+        if len(neuron_ids) and neuron_ids.min() < 0:
+            raise ValueError("The neuron IDs must not be negative")
+        order = numpy.lexsort((times, neuron_ids))
+        neuron_ids = neuron_ids[order]
+        n_neurons = int(neuron_ids[-1]) + 1 if len(neuron_ids) else 0
+        self.__times = times[order]
+        self.__offsets = numpy.searchsorted(
+            neuron_ids, numpy.arange(n_neurons + 1))
+
+    @classmethod
+    def _from_sorted(cls, times, offsets):
+        """
+        Make spike times from times that are already in order.
+
+        :param ~numpy.ndarray times:
+        :param ~numpy.ndarray offsets:
+        :rtype: ColumnarSpikeTimes
+        """
+        spike_times = cls.__new__(cls)
+        # pylint: disable=protected-access, unused-private-member
+        spike_times.__times = times
+        spike_times.__offsets = offsets
+        return spike_times
+
+    def with_n_neurons(self, n_neurons):
+        """
+        Get the spike times covering a number of neurons, which must include
+        all those that have spikes.
+
+        :param int n_neurons: The number of neurons to cover
+        :rtype: ColumnarSpikeTimes
+        :raises ValueError: If there are spikes of neurons beyond the number
+        """
+        n_with_spikes = len(self.__offsets) - 1
+        if n_with_spikes > n_neurons:
+            raise ValueError(
+                f"There are spike times for neuron {n_with_spikes - 1} "
+                f"but only {n_neurons} neurons")
+        offsets = numpy.concatenate((self.__offsets, numpy.full(
+            n_neurons - n_with_spikes, len(self.__times))))
+        return self._from_sorted(self.__times, offsets)
+
+    def __len__(self):
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, neuron_id):
+        """
+        Get the times of a neuron, or the spike times of a collection of
+        neurons.
+
+        :param neuron_id: The neuron, or a slice or collection of neurons
+        :type neuron_id: int or slice or iterable(int)
+        :rtype: ~numpy.ndarray or ColumnarSpikeTimes
+        """
+        if isinstance(neuron_id, (int, numpy.integer)):
+            if neuron_id < 0:
+                neuron_id += len(self)
+            return self.__times[
+                self.__offsets[neuron_id]:self.__offsets[neuron_id + 1]]
+        if isinstance(neuron_id, slice):
+            return self.select(numpy.arange(len(self))[neuron_id])
+        return self.select(neuron_id)
+
+    def __iter__(self):
+        for start, end in zip(self.__offsets[:-1].tolist(),
+                              self.__offsets[1:].tolist()):
+            yield self.__times[start:end]
+
+    def __repr__(self):
+        return (f"ColumnarSpikeTimes({len(self)} neurons, "
+                f"{len(self.__times)} spikes)")
+
+    @property
+    def times(self):
+        """
+        The times of all the spikes, in order of neuron and then time.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times
+
+    @property
+    def neuron_ids(self):
+        """
+        The neuron of each of the spikes in :py:attr:`times`.
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.repeat(numpy.arange(len(self)), self.counts)
+
+    @property
+    def counts(self):
+        """
+        The number of spikes of each neuron.
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.diff(self.__offsets)
+
+    @property
+    def n_spikes(self):
+        """
+        The total number of spikes.
+
+        :rtype: int
+        """
+        return len(self.__times)
+
+    def select(self, neuron_ids):
+        """
+        Get the spike times of a collection of neurons, which become
+        neurons 0 to n - 1 of the result.
+
+        :param iterable(int) neuron_ids: The neurons to get the times of
+        :rtype: ColumnarSpikeTimes
+        """
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64")
+        starts = self.__offsets[neuron_ids]
+        counts = self.__offsets[neuron_ids + 1] - starts
+        offsets = numpy.concatenate(([0], numpy.cumsum(counts)))
+        if len(neuron_ids) and numpy.all(numpy.diff(neuron_ids) == 1):
+            times = self.__times[starts[0]:starts[0] + offsets[-1]]
+        else:
+            index = numpy.arange(offsets[-1]) + numpy.repeat(
+                starts - offsets[:-1], counts)
+            times = self.__times[index]
+        return self._from_sorted(times, offsets)
+
+    def map_times(self, convert):
+        """
+        Get spike times with each time converted, such as into time steps.
+        The conversion must not change the order of the times.
+
+        :param callable(~numpy.ndarray, ~numpy.ndarray) convert:
+            Converts an array of times
+        :rtype: ColumnarSpikeTimes
+        """
+        return self._from_sorted(convert(self.__times), self.__offsets)
@@ -11,19 +11,108 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import bisect
 import numpy
 from spinn_utilities.overrides import overrides
 from pacman.utilities.utility_calls import get_field_based_keys
+from spinn_front_end_common.interface.buffer_management.storage_objects \
+    import BufferedSendingRegion
 from spinn_front_end_common.utility_models import (
     ReverseIPTagMulticastSourceMachineVertex)
 from spynnaker.pyNN.data.spynnaker_data_view import SpynnakerDataView
+from .columnar_spike_times import ColumnarSpikeTimes
+from .streamed_spike_times import StreamedSpikeTimesSlice
+
+
+class _SortedKeysSendingRegion(BufferedSendingRegion):
+    """
+    A sending region to which keys can be added many at a time, sorted by
+    time.
+    """
+
+    __slots__ = []
+
+    def add_sorted_keys(self, timestamps, keys):
+        """
+        Add keys to be sent at given times.
+
+        :param ~numpy.ndarray timestamps:
+            The time at which each key is to be sent, in order
+        :param ~numpy.ndarray keys: The keys to send
+        """
+        if not len(timestamps):
+            return
+        starts = numpy.concatenate((
+            [0], numpy.flatnonzero(numpy.diff(timestamps)) + 1))
+        ends = numpy.append(starts[1:], len(timestamps))
+        keys = keys.tolist()
+        for timestamp, start, end in zip(
+                timestamps[starts].tolist(), starts.tolist(), ends.tolist()):
+            if timestamp not in self._buffer:
+                bisect.insort(self._timestamps, timestamp)
+                self._buffer[timestamp] = keys[start:end]
+            else:
+                self._buffer[timestamp].extend(keys[start:end])
 
 
 class SpikeSourceArrayMachineVertex(ReverseIPTagMulticastSourceMachineVertex):
     """
-    Extended to add colour.
+    Extended to add colour, and to send spike times held in columns or
+    streamed from a file.
     """
 
+    @staticmethod
+    @overrides(ReverseIPTagMulticastSourceMachineVertex.
+               _max_send_buffer_keys_per_timestep)
+    def _max_send_buffer_keys_per_timestep(send_buffer_times, n_keys):
+        if isinstance(send_buffer_times, StreamedSpikeTimesSlice):
+            return send_buffer_times.max_spikes_per_tick
+        if not isinstance(send_buffer_times, ColumnarSpikeTimes):
+            return ReverseIPTagMulticastSourceMachineVertex.\
+                _max_send_buffer_keys_per_timestep(send_buffer_times, n_keys)
+        if not send_buffer_times.n_spikes:
+            return 0
+        return int(numpy.max(numpy.bincount(send_buffer_times.times)))
+
+    @overrides(ReverseIPTagMulticastSourceMachineVertex._install_send_buffer)
+    def _install_send_buffer(self, send_buffer_times):
+        if not isinstance(send_buffer_times, StreamedSpikeTimesSlice):
+            super()._install_send_buffer(send_buffer_times)
+        if isinstance(send_buffer_times, (
+                ColumnarSpikeTimes, StreamedSpikeTimesSlice)):
+            self._send_buffer = _SortedKeysSendingRegion()
+            self._send_buffer_times = send_buffer_times
+            self._send_buffers = {
+                self._REGIONS.SEND_BUFFER: self._send_buffer
+            }
+
+    @overrides(ReverseIPTagMulticastSourceMachineVertex._fill_send_buffer)
+    def _fill_send_buffer(self):
+        if not isinstance(self._send_buffer_times, StreamedSpikeTimesSlice):
+            super()._fill_send_buffer()
+            return
+
+        # Only the spikes of the time steps to be run are read
+        first_time_step = SpynnakerDataView.get_first_machine_time_step()
+        end_time_step = SpynnakerDataView.get_current_run_timesteps()
+        if (self._first_machine_time_step == first_time_step and
+                self._run_until_timesteps == end_time_step):
+            return
+        self._first_machine_time_step = first_time_step
+        self._run_until_timesteps = end_time_step
+        self._send_buffer.clear()
+        if first_time_step == end_time_step:
+            return
+        key_base = self._virtual_key
+        if key_base is None:
+            key_base = 0
+        keys = get_field_based_keys(
+            key_base, self._vertex_slice, self.app_vertex.n_colour_bits)
+        colour_mask = (2 ** self.app_vertex.n_colour_bits) - 1
+        self.__fill_send_buffer_columns(
+            self._send_buffer_times.window(first_time_step, end_time_step),
+            keys, colour_mask, first_time_step, end_time_step)
+
     @overrides(
         ReverseIPTagMulticastSourceMachineVertex.get_n_keys_for_partition)
     def get_n_keys_for_partition(self, partition_id):
@@ -56,8 +145,38 @@ class SpikeSourceArrayMachineVertex(ReverseIPTagMulticastSourceMachineVertex):
         keys = get_field_based_keys(
             key_base, self._vertex_slice, self.app_vertex.n_colour_bits)
         colour_mask = (2 ** self.app_vertex.n_colour_bits) - 1
+        if isinstance(self._send_buffer_times, ColumnarSpikeTimes):
+            self.__fill_send_buffer_columns(
+                self._send_buffer_times, keys, colour_mask, first_time_step,
+                end_time_step)
+            return
         for atom in range(self._vertex_slice.n_atoms):
             for tick in sorted(self._send_buffer_times[atom]):
                 if self._is_in_range(tick, first_time_step, end_time_step):
                     self._send_buffer.add_key(
                         tick, keys[atom] + (tick & colour_mask))
+
+    def __fill_send_buffer_columns(
+            self, spike_times, keys, colour_mask, first_time_step,
+            end_time_step):
+        """
+        Add the keys of spike times held in columns.
+
+        :param ColumnarSpikeTimes spike_times:
+            The spike times of the atoms, as time steps
+        :param ~numpy.ndarray keys: The key of each atom
+        :param int colour_mask: The mask of the colour bits
+        :param int first_time_step: The first time step to send
+        :param end_time_step: The time step after the last to send
+        :type end_time_step: int or None
+        """
+        ticks = spike_times.times
+        atoms = spike_times.neuron_ids
+        if end_time_step is not None:
+            in_range = (ticks >= first_time_step) & (ticks < end_time_step)
+            ticks = ticks[in_range]
+            atoms = atoms[in_range]
+        order = numpy.argsort(ticks, kind="stable")
+        ticks = ticks[order]
+        self._send_buffer.add_sorted_keys(
+            ticks, numpy.asarray(keys)[atoms[order]] + (ticks & colour_mask))
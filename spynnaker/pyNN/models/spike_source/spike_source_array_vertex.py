@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from collections import Counter
+from functools import partial
 import logging
 import numpy
 from pyNN.space import Grid2D, Grid3D
@@ -27,7 +28,9 @@ from spynnaker.pyNN.models.abstract_models import SupportsStructure
 from spynnaker.pyNN.utilities.buffer_data_type import BufferDataType
 from spynnaker.pyNN.utilities.ranged import SpynnakerRangedList
 from spynnaker.pyNN.models.common import ParameterHolder
+from .columnar_spike_times import ColumnarSpikeTimes
 from .spike_source_array_machine_vertex import SpikeSourceArrayMachineVertex
+from .streamed_spike_times import StreamedSpikeTimes, StreamedSpikeTimesSlice
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -42,6 +45,9 @@ def _as_numpy_ticks(times, time_step):
 
 def _send_buffer_times(spike_times, time_step):
     # Convert to ticks
+    if isinstance(spike_times, ColumnarSpikeTimes):
+        return spike_times.map_times(
+            lambda times: _as_numpy_ticks(times, time_step))
     if len(spike_times) and hasattr(spike_times[0], "__len__"):
         data = []
         for times in spike_times:
@@ -62,6 +68,8 @@ class SpikeSourceArrayVertex(
                  "__model",
                  "__structure",
                  "_spike_times",
+                 "__spike_time_columns",
+                 "__spike_time_stream",
                  "__n_colour_bits"]
 
     SPIKE_RECORDING_REGION_ID = 0
@@ -76,19 +84,39 @@ class SpikeSourceArrayVertex(
 
         if spike_times is None:
             spike_times = []
-        use_list_as_value = (
-            not len(spike_times) or not hasattr(spike_times[0], '__iter__'))
-        self._spike_times = SpynnakerRangedList(
-            n_neurons, spike_times, use_list_as_value=use_list_as_value)
-
         time_step = SpynnakerDataView.get_simulation_time_step_us()
 
+        # Columns of spike times are only made into a list of times per
+        # neuron if the times are read or set
+        self.__spike_time_columns = None
+        self.__spike_time_stream = None
+        if isinstance(spike_times, StreamedSpikeTimes):
+            # Streamed spike times are only read when they are sent
+            self.__spike_time_stream = spike_times
+            self._spike_times = None
+            send_buffer_times = None
+        elif isinstance(spike_times, ColumnarSpikeTimes):
+            spike_times = spike_times.with_n_neurons(n_neurons)
+            self.__spike_time_columns = spike_times
+            self._spike_times = None
+            send_buffer_times = None
+        else:
+            use_list_as_value = (
+                not len(spike_times) or
+                not hasattr(spike_times[0], '__iter__'))
+            self._spike_times = SpynnakerRangedList(
+                n_neurons, spike_times, use_list_as_value=use_list_as_value)
+            send_buffer_times = _send_buffer_times(spike_times, time_step)
+
         super().__init__(
             n_keys=n_neurons, label=label,
             max_atoms_per_core=max_atoms_per_core,
-            send_buffer_times=_send_buffer_times(spike_times, time_step),
+            send_buffer_times=send_buffer_times,
             send_buffer_partition_id=constants.SPIKE_PARTITION_ID,
             splitter=splitter)
+        if self.__spike_time_columns is not None:
+            self._send_buffer_times = _send_buffer_times(
+                self.__spike_time_columns, time_step)
 
         self._check_spike_density(spike_times)
         # Do colouring
@@ -101,6 +129,10 @@ class SpikeSourceArrayVertex(
     def create_machine_vertex(
             self, vertex_slice, sdram, label=None):
         send_buffer_times = self._filtered_send_buffer_times(vertex_slice)
+        streamed_times = None
+        if isinstance(send_buffer_times, StreamedSpikeTimesSlice):
+            streamed_times = send_buffer_times
+            send_buffer_times = None
         machine_vertex = SpikeSourceArrayMachineVertex(
             vertex_slice=vertex_slice,
             label=label, app_vertex=self,
@@ -114,14 +146,63 @@ class SpikeSourceArrayVertex(
             send_buffer_partition_id=self._send_buffer_partition_id,
             reserve_reverse_ip_tag=self._reserve_reverse_ip_tag,
             injection_partition_id=self._injection_partition_id)
+        if streamed_times is not None:
+            machine_vertex.send_buffer_times = streamed_times
         machine_vertex.enable_recording(self._is_recording)
         # Known issue with ReverseIPTagMulticastSourceMachineVertex
         if sdram:
             assert sdram == machine_vertex.sdram_required
         return machine_vertex
 
+    @overrides(ReverseIpTagMultiCastSource.get_sdram_used_by_atoms)
+    def get_sdram_used_by_atoms(self, vertex_slice):
+        return SpikeSourceArrayMachineVertex.get_sdram_usage(
+            self._filtered_send_buffer_times(vertex_slice),
+            self._is_recording, self._receive_rate, vertex_slice.n_atoms)
+
+    @overrides(ReverseIpTagMultiCastSource._filtered_send_buffer_times)
+    def _filtered_send_buffer_times(self, vertex_slice):
+        if self.__spike_time_stream is not None:
+            send_buffer_times = StreamedSpikeTimesSlice(
+                self.__spike_time_stream, vertex_slice.get_raster_ids(),
+                self.n_atoms, partial(
+                    _as_numpy_ticks,
+                    time_step=SpynnakerDataView.get_simulation_time_step_us()),
+                self.get_max_atoms_per_core())
+            if not send_buffer_times.max_spikes_per_tick:
+                return None
+            return send_buffer_times
+        if not isinstance(self._send_buffer_times, ColumnarSpikeTimes):
+            return super()._filtered_send_buffer_times(vertex_slice)
+        send_buffer_times = self._send_buffer_times.select(
+            vertex_slice.get_raster_ids())
+        if not send_buffer_times.n_spikes:
+            return None
+        return send_buffer_times
+
+    @property
+    @overrides(ReverseIpTagMultiCastSource.send_buffer_times)
+    def send_buffer_times(self):
+        return self._send_buffer_times
+
+    @send_buffer_times.setter
+    def send_buffer_times(self, send_buffer_times):
+        if not isinstance(send_buffer_times, ColumnarSpikeTimes):
+            ReverseIpTagMultiCastSource.send_buffer_times.fset(
+                self, send_buffer_times)
+            return
+        self._send_buffer_times = send_buffer_times
+        for vertex in self.machine_vertices:
+            vertex.send_buffer_times = send_buffer_times.select(
+                vertex.vertex_slice.get_raster_ids())
+
     def _check_spike_density(self, spike_times):
-        if len(spike_times):
+        if isinstance(spike_times, StreamedSpikeTimes):
+            # Not checked, as that would need all the spikes to be read
+            return
+        if isinstance(spike_times, ColumnarSpikeTimes):
+            self._check_density_columns(spike_times)
+        elif len(spike_times):
             if hasattr(spike_times[0], '__iter__'):
                 self._check_density_double_list(spike_times)
             else:
@@ -160,6 +241,19 @@ class SpikeSourceArrayVertex(
                 "For example at time {}, {} spikes will be sent",
                 val, count)
 
+    def _check_density_columns(self, spike_times):
+        if not spike_times.n_spikes:
+            logger.warning("SpikeSourceArray has no spike times")
+            return
+        values, counts = numpy.unique(spike_times.times, return_counts=True)
+        top = numpy.argmax(counts)
+        if counts[top] > TOO_MANY_SPIKES:
+            logger.warning(
+                "Danger of SpikeSourceArray sending too many spikes "
+                "at the same time. "
+                "For example at time {}, {} spikes will be sent",
+                float(values[top]), int(counts[top]))
+
     @overrides(SupportsStructure.set_structure)
     def set_structure(self, structure):
         self.__structure = structure
@@ -209,13 +303,32 @@ class SpikeSourceArrayVertex(
                         self, current_time, float(id_times[i]))
                     return
 
+    def _check_spikes_columns(self, spike_times):
+        """
+        Checks if there is one or more spike_times before the current time.
+
+        Logs a warning for the first one found
+
+        :param ColumnarSpikeTimes spike_times:
+        """
+        current_time = SpynnakerDataView.get_current_run_time_ms()
+        early = numpy.flatnonzero(spike_times.times < current_time)
+        if len(early):
+            logger.warning(
+                "SpikeSourceArray {} has spike_times that are lower "
+                "than the current time {} For example {} - "
+                "these will be ignored.",
+                self, current_time, float(spike_times.times[early[0]]))
+
     def __set_spike_buffer_times(self, spike_times):
         """
         Set the spike source array's buffer spike times.
         """
         time_step = SpynnakerDataView.get_simulation_time_step_us()
         # warn the user if they are asking for a spike time out of range
-        if spike_times:  # in case of empty list do not check
+        if isinstance(spike_times, ColumnarSpikeTimes):
+            self._check_spikes_columns(spike_times)
+        elif len(spike_times):  # in case of empty list do not check
             if hasattr(spike_times[0], '__iter__'):
                 self._check_spikes_double_list(spike_times)
             else:
@@ -223,10 +336,25 @@ class SpikeSourceArrayVertex(
         self.send_buffer_times = _send_buffer_times(spike_times, time_step)
         self._check_spike_density(spike_times)
 
+    def __spike_times_list(self):
+        """
+        The spike times as a list of times per neuron, made from the
+        columns of spike times if needed.
+
+        :rtype: SpynnakerRangedList
+        """
+        if self._spike_times is None:
+            columns = self.__spike_time_columns
+            if columns is None:
+                columns = self.__spike_time_stream.to_columns(self.n_atoms)
+            self._spike_times = SpynnakerRangedList(
+                self.n_atoms, list(columns), use_list_as_value=False)
+        return self._spike_times
+
     def __read_parameter(self, name, selector):
         # pylint: disable=unused-argument
         # This can only be spike times
-        return self._spike_times.get_values(selector)
+        return self.__spike_times_list().get_values(selector)
 
     @overrides(PopulationApplicationVertex.get_parameter_values)
     def get_parameter_values(self, names, selector=None):
@@ -236,10 +364,34 @@ class SpikeSourceArrayVertex(
     @overrides(PopulationApplicationVertex.set_parameter_values)
     def set_parameter_values(self, name, value, selector=None):
         self._check_parameters(name, {"spike_times"})
+        if isinstance(value, StreamedSpikeTimes):
+            if selector is not None:
+                raise KeyError(
+                    "Streamed spike times can only be set for all neurons")
+            self.__spike_time_stream = value
+            self.__spike_time_columns = None
+            self._spike_times = None
+            self._send_buffer_times = None
+            # The space needed to send the spikes could change
+            SpynnakerDataView.set_requires_mapping()
+            return
+        if isinstance(value, ColumnarSpikeTimes):
+            if selector is not None:
+                raise KeyError(
+                    "Columns of spike times can only be set for all neurons")
+            value = value.with_n_neurons(self.n_atoms)
+            self.__set_spike_buffer_times(value)
+            self.__spike_time_columns = value
+            self.__spike_time_stream = None
+            self._spike_times = None
+            return
+        spike_times = self.__spike_times_list()
+        self.__spike_time_columns = None
+        self.__spike_time_stream = None
         self.__set_spike_buffer_times(value)
         use_list_as_value = (
             not len(value) or not hasattr(value[0], '__iter__'))
-        self._spike_times.set_value_by_selector(
+        spike_times.set_value_by_selector(
             selector, value, use_list_as_value)
 
     @overrides(PopulationApplicationVertex.get_parameters)
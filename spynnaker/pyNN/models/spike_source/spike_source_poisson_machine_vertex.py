@@ -47,6 +47,7 @@ from spynnaker.pyNN.models.abstract_models import (
 from spynnaker.pyNN.exceptions import SynapticConfigurationException
 from spynnaker.pyNN.utilities.constants import (
     LIVE_POISSON_CONTROL_PARTITION_ID)
+from spynnaker.pyNN.utilities.region_delta_writer import RegionDeltaWriter
 
 
 def _flatten(alist):
@@ -119,6 +120,80 @@ def _u3232_to_uint64(array):
         DataType.U3232.numpy_typename)
 
 
+def _values_of_ids(values, ids):
+    """
+    Get the value of each of a collection of IDs from a ranged list,
+    without comparing the values of neighbouring IDs.
+
+    :param ~spinn_utilities.ranged.AbstractList values: The values
+    :param ~numpy.ndarray ids: The IDs to get the values of, in order
+    :rtype: list
+    """
+    if not values.range_based():
+        return [values.get_value_by_id(i) for i in ids.tolist()]
+    ranges = list(values.iter_ranges())
+    stops = numpy.array([stop for _, stop, _ in ranges])
+    indices = numpy.searchsorted(stops, ids, side="right")
+    return [ranges[i][2] for i in indices.tolist()]
+
+
+def _rate_items(rates, starts, durations, ids):
+    """
+    Build the items of the rates to be expanded on the machine, where each
+    item is a run of consecutive IDs with the same rates, starts and
+    durations.  Each item is the count of IDs, the number of rates, a zero
+    word and then the rate, start and duration of each rate in U3232.
+
+    :param list(~numpy.ndarray) rates: The rates of each ID
+    :param list(~numpy.ndarray) starts: The starts of each ID
+    :param list(~numpy.ndarray) durations: The durations of each ID
+    :param ~numpy.ndarray ids: The IDs, in order
+    :return: The number of items and the words of the items
+    :rtype: tuple(int, ~numpy.ndarray)
+    """
+    n_ids = len(ids)
+    if not n_ids:
+        return 0, numpy.zeros(0, dtype="uint32")
+    n_rates = numpy.fromiter(map(len, rates), dtype="int64", count=n_ids)
+    values = [numpy.concatenate(v).astype("float64")
+              for v in (rates, starts, durations)]
+
+    # The rate entries of each ID follow those of the previous ID; an ID
+    # is part of the item of the previous ID if it follows on from it and
+    # has the same number of rates, all of which match
+    owner = numpy.repeat(numpy.arange(n_ids), n_rates)
+    same = numpy.zeros(n_ids, dtype=bool)
+    same[1:] = (numpy.diff(ids) == 1) & (n_rates[1:] == n_rates[:-1])
+    check = numpy.flatnonzero(same[owner])
+    previous = check - n_rates[owner[check]]
+    differ = numpy.zeros(len(check), dtype=bool)
+    for value in values:
+        differ |= value[check] != value[previous]
+    same &= numpy.bincount(owner[check[differ]], minlength=n_ids) == 0
+
+    # Each item takes the rates of its first ID
+    first = numpy.flatnonzero(~same)
+    counts = numpy.diff(numpy.append(first, n_ids))
+    item_n_rates = n_rates[first]
+    item_words = EXPANDER_WORDS_PER_NEURON + (
+        item_n_rates * PARAMS_WORDS_PER_RATE)
+    item_starts = numpy.concatenate(([0], numpy.cumsum(item_words)[:-1]))
+    items = numpy.zeros(int(numpy.sum(item_words)), dtype="uint32")
+    items[item_starts] = counts
+    items[item_starts + 1] = item_n_rates
+
+    # The rates of the items then fill the words after the item headers
+    # in order
+    is_rate = numpy.ones(len(items), dtype=bool)
+    for i in range(EXPANDER_WORDS_PER_NEURON):
+        is_rate[item_starts + i] = False
+    entries = numpy.flatnonzero(~same[owner])
+    items[is_rate] = numpy.stack(
+        [_u3232_to_uint64(value[entries]) for value in values],
+        axis=1).view("uint32").ravel()
+    return len(first), items
+
+
 # 1. uint32_t has_key;
 # 2. uint32_t set_rate_neuron_id_mask;
 # 3. UFRACT seconds_per_tick; 4. REAL ticks_per_second;
@@ -168,7 +243,8 @@ class SpikeSourcePoissonMachineVertex(
         "__minimum_buffer_sdram",
         "__sdram",
         "__sdram_partition",
-        "__rate_changed"]
+        "__rate_changed",
+        "__region_writer"]
 
     class POISSON_SPIKE_SOURCE_REGIONS(IntEnum):
         """
@@ -225,6 +301,7 @@ class SpikeSourcePoissonMachineVertex(
         self.__sdram = sdram
         self.__sdram_partition = None
         self.__rate_changed = True
+        self.__region_writer = RegionDeltaWriter()
 
     def set_sdram_partition(self, sdram_partition):
         self.__sdram_partition = sdram_partition
@@ -298,8 +375,10 @@ class SpikeSourcePoissonMachineVertex(
 
     @overrides(AbstractRewritesDataSpecification.regenerate_data_specification)
     def regenerate_data_specification(self, spec, placement):
-        # write rates
-        self._write_poisson_rates(spec)
+        # write rates if they have changed; otherwise what is on the machine
+        # is ignored anyway, so doesn't need to be written
+        if self.__rate_changed:
+            self._write_poisson_rates(spec, placement)
 
         # end spec
         spec.end_specification()
@@ -309,6 +388,7 @@ class SpikeSourcePoissonMachineVertex(
         spec.comment("\n*** Spec for SpikeSourcePoisson Instance ***\n\n")
         # if we are here, the rates have changed!
         self.__rate_changed = True
+        self.__region_writer.forget()
 
         # write setup data
         spec.reserve_memory_region(
@@ -390,12 +470,25 @@ class SpikeSourcePoissonMachineVertex(
         # End-of-Spec:
         spec.end_specification()
 
-    def _write_poisson_rates(self, spec):
+    @property
+    def _region_writer(self):
+        """
+        The writer of the regions when they are rewritten.
+
+        :rtype: RegionDeltaWriter
+        """
+        return self.__region_writer
+
+    def _write_poisson_rates(self, spec, placement=None):
         """
         Generate Rate data for Poisson spike sources.
 
         :param ~data_specification.DataSpecification spec:
             the data specification writer
+        :param placement:
+            Where the vertex is if the rates are being rewritten, in which
+            case only the changes are written where possible
+        :type placement: ~pacman.model.placements.Placement or None
         """
         spec.comment(
             f"\nWriting Rates for {self.vertex_slice.n_atoms} "
@@ -407,32 +500,31 @@ class SpikeSourcePoissonMachineVertex(
             region=self.POISSON_SPIKE_SOURCE_REGIONS.RATES_REGION,
             size=get_rates_bytes(n_atoms, n_rates), label='PoissonRates')
 
-        # List starts with n_items, so start with 0.  Use arrays to allow
-        # numpy concatenation to work.
-        data_items = list()
-        data_items.append([int(self.__rate_changed)])
-        data_items.append([0])
-        n_items = 0
+        # Data starts with the rate changed flag and the number of items
         data = self._app_vertex.data
-        ids = self.vertex_slice.get_raster_ids()
-        for (start, stop, item) in data.iter_ranges_by_ids(ids):
-            count = stop - start
-            items = numpy.dstack(
-                (_u3232_to_uint64(item['rates']),
-                 _u3232_to_uint64(item['starts']),
-                 _u3232_to_uint64(item['durations']))
-                )[0]
-            data_items.extend([[count], [len(items)], [0],
-                               numpy.ravel(items).view("uint32")])
-            n_items += 1
-        data_items[1] = [n_items]
-        data_to_write = numpy.concatenate(data_items)
+        ids = numpy.asarray(self.vertex_slice.get_raster_ids())
+        n_items, items = _rate_items(
+            _values_of_ids(data["rates"], ids),
+            _values_of_ids(data["starts"], ids),
+            _values_of_ids(data["durations"], ids), ids)
+        data_to_write = numpy.concatenate((
+            numpy.array([int(self.__rate_changed), n_items], dtype="uint32"),
+            items))
+        region = self.POISSON_SPIKE_SOURCE_REGIONS.EXPANDER_REGION
         spec.reserve_memory_region(
-            region=self.POISSON_SPIKE_SOURCE_REGIONS.EXPANDER_REGION,
+            region=region,
             size=get_expander_rates_bytes(n_atoms, n_rates), label='Expander')
-        spec.switch_write_focus(
-            self.POISSON_SPIKE_SOURCE_REGIONS.EXPANDER_REGION)
-        spec.write_array(data_to_write)
+        if placement is None:
+            spec.switch_write_focus(region)
+            spec.write_array(data_to_write)
+        else:
+            self.__region_writer.write_region(
+                spec, placement, region, data_to_write)
+
+        # The machine clears the rate changed flag once it has read the rates
+        on_machine = numpy.array(data_to_write, dtype="uint32")
+        on_machine[0] = 0
+        self.__region_writer.note_data(region, on_machine)
 
         self.__rate_changed = False
 
@@ -0,0 +1,246 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import os
+import numpy
+from .columnar_spike_times import ColumnarSpikeTimes
+
+#: The number of spikes read from the file at a time when scanning it
+_CHUNK_SPIKES = 1 << 22
+
+
+class StreamedSpikeTimes(object):
+    """
+    The spike times of a number of neurons, held in a file of spikes sorted
+    by time, such as recorded data to be replayed.  The file is memory
+    mapped, and only the spikes of the time steps being run are read from
+    it, so the memory used does not depend on the length of the data.
+
+    The file is a numpy ``.npy`` file of a structured array with fields
+    ``id`` (the neuron of each spike) and ``time`` (the time of each spike
+    in milliseconds), sorted by time.
+
+    Can be passed as the ``spike_times`` of a
+    :py:class:`~spynnaker.pyNN.models.spike_source.SpikeSourceArray`.
+    """
+
+    __slots__ = [
+        # The neuron of each spike
+        "__ids",
+
+        # The time of each spike, in order
+        "__times",
+
+        # The time steps of the last window of spikes read, and the spikes
+        "__window",
+
+        # The most spikes in a time step of each block of neurons, by the
+        # size of the blocks
+        "__block_maxima"]
+
+    def __init__(self, spikes):
+        """
+        :param spikes:
+            The name of the file of spikes, or a structured array of spikes
+            (which could be memory mapped) with fields ``id`` and ``time``
+        :type spikes: str or ~numpy.ndarray
+        """
+        if isinstance(spikes, (str, os.PathLike)):
+            spikes = numpy.load(spikes, mmap_mode="r")
+        self.__ids = spikes["id"]
+        self.__times = spikes["time"]
+        self.__window = None
+        self.__block_maxima = dict()
+
+    def __repr__(self):
+        return f"StreamedSpikeTimes({self.n_spikes} spikes)"
+
+    @property
+    def n_spikes(self):
+        """
+        The total number of spikes.
+
+        :rtype: int
+        """
+        return len(self.__times)
+
+    def __first_at_or_after(self, tick, convert):
+        """
+        Find the first spike at or after a time step.
+
+        :param int tick: The time step
+        :param callable convert: Converts times into time steps
+        :rtype: int
+        """
+        low, high = 0, len(self.__times)
+        while low < high:
+            middle = (low + high) // 2
+            if convert(self.__times[middle:middle + 1])[0] < tick:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def window(self, first_tick, end_tick, n_neurons, convert):
+        """
+        Get the spikes in a range of time steps, with the times as time
+        steps.  The spikes of the last range read are kept, so they are
+        only read once for all the neurons.
+
+        :param int first_tick: The first time step
+        :param end_tick: The time step after the last, or None for all
+        :type end_tick: int or None
+        :param int n_neurons: The number of neurons
+        :param callable convert:
+            Converts times into time steps; must be the same on each call
+        :rtype: ColumnarSpikeTimes
+        """
+        if self.__window is None or self.__window[0] != (
+                first_tick, end_tick):
+            start = self.__first_at_or_after(first_tick, convert)
+            end = len(self.__times)
+            if end_tick is not None:
+                end = self.__first_at_or_after(end_tick, convert)
+            spikes = ColumnarSpikeTimes(
+                numpy.array(self.__ids[start:end]),
+                numpy.array(self.__times[start:end]))
+            self.__window = ((first_tick, end_tick), spikes.with_n_neurons(
+                n_neurons).map_times(convert))
+        return self.__window[1]
+
+    def to_columns(self, n_neurons):
+        """
+        Read all the spikes.
+
+        :param int n_neurons: The number of neurons
+        :rtype: ColumnarSpikeTimes
+        """
+        return ColumnarSpikeTimes(
+            numpy.array(self.__ids), numpy.array(self.__times)
+            ).with_n_neurons(n_neurons)
+
+    def max_spikes_per_tick(self, block_size, n_neurons, convert):
+        """
+        Get the most spikes in any time step of each block of neurons,
+        reading through the file a chunk at a time.
+
+        :param int block_size: The number of neurons in each block
+        :param int n_neurons: The number of neurons
+        :param callable convert:
+            Converts times into time steps; must be the same on each call
+        :return: The most spikes in a time step of each block
+        :rtype: ~numpy.ndarray
+        :raises ValueError:
+            If the spikes are not sorted by time or there is a spike of a
+            neuron that does not exist
+        """
+        if block_size in self.__block_maxima:
+            return self.__block_maxima[block_size]
+        n_blocks = max(math.ceil(n_neurons / block_size), 1)
+        maxima = numpy.zeros(n_blocks, dtype="int64")
+        n_spikes = len(self.__times)
+        start = 0
+        last_time = -numpy.inf
+        while start < n_spikes:
+            # Read whole time steps, so no step is split between chunks
+            end = min(start + _CHUNK_SPIKES, n_spikes)
+            if end < n_spikes:
+                end = self.__first_at_or_after(
+                    convert(self.__times[end - 1:end])[0] + 1, convert)
+            times = numpy.array(self.__times[start:end])
+            ids = numpy.array(self.__ids[start:end]).astype("int64")
+            if times[0] < last_time or numpy.any(numpy.diff(times) < 0):
+                raise ValueError("The spikes must be sorted by time")
+            if ids.min() < 0 or ids.max() >= n_neurons:
+                raise ValueError(
+                    f"There are spikes of neurons that are not in the "
+                    f"{n_neurons} neurons")
+            tick_blocks, counts = numpy.unique(
+                convert(times) * n_blocks + ids // block_size,
+                return_counts=True)
+            numpy.maximum.at(maxima, tick_blocks % n_blocks, counts)
+            last_time = times[-1]
+            start = end
+        self.__block_maxima[block_size] = maxima
+        return maxima
+
+
+class StreamedSpikeTimesSlice(object):
+    """
+    The spike times of some of the neurons of a :py:class:`StreamedSpikeTimes`.
+    """
+
+    __slots__ = [
+        # The spike times of all the neurons
+        "__spike_times",
+
+        # The neurons of the slice
+        "__neuron_ids",
+
+        # The number of neurons of the spike times
+        "__n_neurons",
+
+        # Converts times into time steps
+        "__convert",
+
+        # The most spikes that can be sent in a time step
+        "__max_spikes_per_tick"]
+
+    def __init__(self, spike_times, neuron_ids, n_neurons, convert,
+                 block_size):
+        """
+        :param StreamedSpikeTimes spike_times: The spike times of all neurons
+        :param ~numpy.ndarray neuron_ids: The neurons of the slice
+        :param int n_neurons: The number of neurons of the spike times
+        :param callable convert: Converts times into time steps
+        :param int block_size:
+            The size of the blocks of neurons to count the spikes of in each
+            time step
+        """
+        self.__spike_times = spike_times
+        self.__neuron_ids = numpy.asarray(neuron_ids)
+        self.__n_neurons = n_neurons
+        self.__convert = convert
+        maxima = spike_times.max_spikes_per_tick(
+            block_size, n_neurons, convert)
+        self.__max_spikes_per_tick = int(numpy.sum(
+            maxima[numpy.unique(self.__neuron_ids // block_size)]))
+
+    def __len__(self):
+        return len(self.__neuron_ids)
+
+    @property
+    def max_spikes_per_tick(self):
+        """
+        The most spikes of the slice in a time step; this is an upper
+        bound if the slice covers part of a block of neurons.
+
+        :rtype: int
+        """
+        return self.__max_spikes_per_tick
+
+    def window(self, first_tick, end_tick):
+        """
+        Get the spikes of the slice in a range of time steps, with the times
+        as time steps.
+
+        :param int first_tick: The first time step
+        :param end_tick: The time step after the last, or None for all
+        :type end_tick: int or None
+        :rtype: ColumnarSpikeTimes
+        """
+        return self.__spike_times.window(
+            first_tick, end_tick, self.__n_neurons, self.__convert).select(
+                self.__neuron_ids)
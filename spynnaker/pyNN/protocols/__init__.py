@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .command_table import CommandTable
 from .munich_io_ethernet_protocol import MunichIoEthernetProtocol
 from .munich_io_spinnaker_link_protocol import (
     MunichIoSpiNNakerLinkProtocol, RetinaKey, RetinaPayload, MUNICH_MODES)
 
-__all__ = ["MunichIoEthernetProtocol", "MunichIoSpiNNakerLinkProtocol",
-           "MUNICH_MODES", "RetinaKey", "RetinaPayload"]
+__all__ = ["CommandTable", "MunichIoEthernetProtocol",
+           "MunichIoSpiNNakerLinkProtocol", "MUNICH_MODES", "RetinaKey",
+           "RetinaPayload"]
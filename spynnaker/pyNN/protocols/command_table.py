@@ -0,0 +1,222 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utility_models import MultiCastCommand
+
+# The value in the times of commands that are not timed
+NOT_TIMED = -1
+
+# The most tables that are kept for reuse
+_MAX_TABLES = 1024
+
+# The tables made so far, by the configuration that they were made for
+_TABLES = dict()
+
+
+class _FixedMultiCastCommand(MultiCastCommand):
+    """
+    A command of a command table, which can't be changed as it is shared
+    by all the devices that use the table.
+    """
+
+    @property
+    @overrides(MultiCastCommand.payload)
+    def payload(self):
+        return self._payload
+
+    @payload.setter
+    def payload(self, payload):
+        raise ConfigurationException(
+            "The commands of a command table can't be changed")
+
+
+class CommandTable(object):
+    """
+    A fixed list of multicast commands held as arrays of keys, payloads,
+    repeats, delays and times.  Tables are made once for each device
+    configuration with :py:meth:`get` and then reused, including across
+    runs, so that devices with many commands, or many devices, do not make
+    their commands again each time they are asked for them.  If too many
+    tables are made, those made so far are forgotten.
+    """
+
+    __slots__ = [
+        # The keys of the commands
+        "__keys",
+
+        # The payloads of the commands, or 0 where there is no payload
+        "__payloads",
+
+        # Whether each command has a payload
+        "__has_payload",
+
+        # The number of times each command is repeated
+        "__repeats",
+
+        # The microseconds between repeats of each command
+        "__delays",
+
+        # The time of each command, or NOT_TIMED
+        "__times",
+
+        # The commands made from the arrays
+        "__commands"]
+
+    def __init__(self, commands):
+        """
+        :param iterable(MultiCastCommand) commands: The commands of the table
+        """
+        commands = list(commands)
+        self.__keys = numpy.array(
+            [command.key for command in commands], dtype="uint32")
+        self.__has_payload = numpy.array(
+            [command.is_payload for command in commands], dtype="bool")
+        self.__payloads = numpy.array(
+            [command.payload if command.is_payload else 0
+             for command in commands], dtype="uint32")
+        self.__repeats = numpy.array(
+            [command.repeat for command in commands], dtype="uint16")
+        self.__delays = numpy.array(
+            [command.delay_between_repeats for command in commands],
+            dtype="uint16")
+        self.__times = numpy.array(
+            [NOT_TIMED if command.time is None else command.time
+             for command in commands], dtype="int64")
+        self.__commands = tuple(
+            _FixedMultiCastCommand(
+                key=int(key), payload=int(payload) if has_payload else None,
+                time=None if time == NOT_TIMED else int(time),
+                repeat=int(repeat), delay_between_repeats=int(delay))
+            for key, payload, has_payload, repeat, delay, time in zip(
+                self.__keys.tolist(), self.__payloads.tolist(),
+                self.__has_payload.tolist(), self.__repeats.tolist(),
+                self.__delays.tolist(), self.__times.tolist()))
+        for array in (self.__keys, self.__has_payload, self.__payloads,
+                      self.__repeats, self.__delays, self.__times):
+            array.flags.writeable = False
+
+    @staticmethod
+    def get(configuration, make_commands):
+        """
+        Get the table for a device configuration, making it only if a table
+        has not already been made for an equal configuration.
+
+        :param tuple configuration:
+            Everything that the commands depend on; this must be hashable
+        :param callable make_commands:
+            Called with no arguments to make the commands if needed
+        :rtype: CommandTable
+        """
+        table = _TABLES.get(configuration)
+        if table is None:
+            if len(_TABLES) >= _MAX_TABLES:
+                _TABLES.clear()
+            table = CommandTable(make_commands())
+            _TABLES[configuration] = table
+        return table
+
+    @staticmethod
+    def clear_cache():
+        """
+        Forget all the tables made so far.
+        """
+        _TABLES.clear()
+
+    @property
+    def keys(self):
+        """
+        The keys of the commands.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__keys
+
+    @property
+    def payloads(self):
+        """
+        The payloads of the commands, or 0 where there is no payload.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__payloads
+
+    @property
+    def has_payload(self):
+        """
+        Whether each of the commands has a payload.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__has_payload
+
+    @property
+    def repeats(self):
+        """
+        The number of times that each command is repeated after the first.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__repeats
+
+    @property
+    def delays(self):
+        """
+        The time in microseconds between the repeats of each command.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__delays
+
+    @property
+    def times(self):
+        """
+        The time of each command, or :py:data:`NOT_TIMED` where the command
+        is not timed.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times
+
+    @property
+    def commands(self):
+        """
+        The commands of the table.  The list is new each time, so it can be
+        added to, but the commands in it are shared and can't be changed.
+
+        :rtype: list(~spinn_front_end_common.utility_models.MultiCastCommand)
+        """
+        return list(self.__commands)
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __eq__(self, other):
+        if not isinstance(other, CommandTable):
+            return False
+        return (numpy.array_equal(self.__keys, other.keys) and
+                numpy.array_equal(self.__payloads, other.payloads) and
+                numpy.array_equal(self.__has_payload, other.has_payload) and
+                numpy.array_equal(self.__repeats, other.repeats) and
+                numpy.array_equal(self.__delays, other.delays) and
+                numpy.array_equal(self.__times, other.times))
+
+    def __hash__(self):
+        return hash((self.__keys.tobytes(), self.__payloads.tobytes(),
+                     self.__times.tobytes()))
+
+    def __repr__(self):
+        return f"CommandTable({len(self)} commands)"
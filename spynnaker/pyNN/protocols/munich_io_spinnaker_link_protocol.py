@@ -15,6 +15,7 @@
 from enum import Enum
 from spinn_front_end_common.utility_models import MultiCastCommand
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from .command_table import CommandTable
 
 # structure of command is KKKKKKKKKKKKKKKKKKKKK-IIIIIII-F-DDD
 # K = ignored key at the top of the command
@@ -352,6 +353,22 @@ class MunichIoSpiNNakerLinkProtocol(object):
         """
         return self.__instance_key
 
+    def command_table(self, name, make_commands, *parameters):
+        """
+        Get a table of commands made by this protocol, which is made only
+        once for each combination of the protocol's instance key, UART and
+        mode with the given name and parameters.
+
+        :param str name: What the commands are for
+        :param callable make_commands:
+            Called with no arguments to make the commands if needed
+        :param parameters: Anything else that the commands depend on
+        :rtype: CommandTable
+        """
+        return CommandTable.get(
+            (name, self.__mode, self.__instance_key, self.__uart_id) +
+            parameters, make_commands)
+
     def _get_key(self, command, offset_to_uart_id=None):
         if offset_to_uart_id is None:
             return command | self.__instance_key
@@ -40,7 +40,7 @@ from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
 from spynnaker.pyNN.extra_algorithms import (
     delay_support_adder, neuron_expander, synapse_expander,
-    redundant_packet_count_report,
+    redundant_packet_count_report, region_rewrite_report,
     spynnaker_neuron_graph_network_specification_report)
 from spynnaker.pyNN.extra_algorithms.\
     spynnaker_machine_bit_field_router_compressor import (
@@ -467,6 +467,7 @@ class SpiNNaker(AbstractSpinnakerBase, pynn_control.BaseState):
     def _do_provenance_reports(self):
         AbstractSpinnakerBase._do_provenance_reports(self)
         self._report_redundant_packet_count()
+        self._report_region_rewrites()
 
     def _report_redundant_packet_count(self):
         with FecTimer("Redundant packet count report",
@@ -476,6 +477,13 @@ class SpiNNaker(AbstractSpinnakerBase, pynn_control.BaseState):
                 return
             redundant_packet_count_report()
 
+    def _report_region_rewrites(self):
+        with FecTimer("Region rewrite report", TimerWork.REPORT) as timer:
+            if timer.skip_if_cfg_false(
+                    "Reports", "write_region_rewrite_report"):
+                return
+            region_rewrite_report()
+
     @overrides(AbstractSpinnakerBase._execute_splitter_selector)
     def _execute_splitter_selector(self):
         with FecTimer("Spynnaker splitter selector", TimerWork.OTHER):
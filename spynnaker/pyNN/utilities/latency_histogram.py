@@ -0,0 +1,134 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+
+#: The number of buckets; the last holds everything from about 18 minutes
+_N_BUCKETS = 32
+
+#: The upper edge of the first bucket, in seconds
+_FIRST_EDGE = 1e-6
+
+
+class LatencyHistogram(object):
+    """
+    A histogram of latencies, in buckets whose upper edges double from a
+    microsecond, so that it is cheap to add to and covers a wide range.
+    """
+
+    __slots__ = [
+        # The number of latencies in each bucket
+        "__counts",
+
+        # The sum of the latencies
+        "__total",
+
+        # The longest latency
+        "__max"]
+
+    def __init__(self):
+        self.__counts = [0] * _N_BUCKETS
+        self.__total = 0.0
+        self.__max = 0.0
+
+    def add(self, latency):
+        """
+        Add a latency to the histogram.
+
+        :param float latency: The latency in seconds
+        """
+        bucket = int(latency / _FIRST_EDGE).bit_length()
+        self.__counts[min(bucket, _N_BUCKETS - 1)] += 1
+        self.__total += latency
+        if latency > self.__max:
+            self.__max = latency
+
+    def reset(self):
+        """
+        Remove all the latencies from the histogram.
+        """
+        self.__counts = [0] * _N_BUCKETS
+        self.__total = 0.0
+        self.__max = 0.0
+
+    @property
+    def counts(self):
+        """
+        The number of latencies in each bucket.
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.array(self.__counts)
+
+    @property
+    def bucket_edges(self):
+        """
+        The upper edge of each bucket in seconds; the last bucket has no
+        upper edge.
+
+        :rtype: ~numpy.ndarray
+        """
+        edges = _FIRST_EDGE * 2.0 ** numpy.arange(_N_BUCKETS)
+        edges[-1] = numpy.inf
+        return edges
+
+    @property
+    def n_samples(self):
+        """
+        The number of latencies added.
+
+        :rtype: int
+        """
+        return sum(self.__counts)
+
+    @property
+    def mean(self):
+        """
+        The mean latency in seconds, or 0 if there are none.
+
+        :rtype: float
+        """
+        n_samples = self.n_samples
+        return self.__total / n_samples if n_samples else 0.0
+
+    @property
+    def max(self):
+        """
+        The longest latency in seconds.
+
+        :rtype: float
+        """
+        return self.__max
+
+    def percentile(self, percent):
+        """
+        Get an upper bound of a percentile of the latencies, which is the
+        upper edge of the bucket that the percentile is in, or the longest
+        latency if that is less.
+
+        :param float percent: The percentile, from 0 to 100
+        :return: The latency in seconds, or 0 if there are none
+        :rtype: float
+        """
+        n_samples = self.n_samples
+        if not n_samples:
+            return 0.0
+        bucket = int(numpy.searchsorted(
+            numpy.cumsum(self.__counts), n_samples * percent / 100.0))
+        return min(float(self.bucket_edges[bucket]), self.__max)
+
+    def __repr__(self):
+        return (f"LatencyHistogram({self.n_samples} samples, "
+                f"mean {self.mean * 1e6:.1f}us, "
+                f"99% under {self.percentile(99) * 1e6:.1f}us)")
@@ -12,5 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .dense_ranged_list import DenseRangedList
+from .spynnaker_range_dictionary import SpynnakerRangeDictionary
 from .spynnaker_ranged_list import SpynnakerRangedList
-__all__ = ["SpynnakerRangedList"]
+__all__ = [
+    "DenseRangedList", "SpynnakerRangeDictionary", "SpynnakerRangedList"]
@@ -0,0 +1,249 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from spinn_utilities.ranged import MultipleValuesException
+from spinn_utilities.ranged.ranged_list import RangedList
+
+# The kinds of numpy data that can be held densely
+_DENSE_KINDS = "biuf"
+
+
+def _as_dense(values):
+    """
+    Get the values as a numpy array of numbers if possible.
+
+    :param values: A single value or a list of values
+    :return: The values as an array, or `None` if they are not all numbers
+    :rtype: ~numpy.ndarray or None
+    """
+    try:
+        array = numpy.asarray(values)
+    except ValueError:
+        # Ragged lists of lists
+        return None
+    if array.ndim > 1 or array.dtype.kind not in _DENSE_KINDS:
+        return None
+    return array
+
+
+class DenseRangedList(RangedList):
+    """
+    A :py:class:`~spinn_utilities.ranged.RangedList` which switches to
+    holding its values in a numpy array once they have been set to a
+    different number for each ID, so that reading and writing many values
+    are array operations rather than a search through many ranges.
+
+    Values which are not numbers (such as random distributions) are held
+    as ranges as usual.
+    """
+
+    @property
+    def is_dense(self):
+        """
+        Whether the values are currently held in a numpy array.
+
+        :rtype: bool
+        """
+        return not self._ranged_based and isinstance(
+            self._ranges, numpy.ndarray)
+
+    def get_dense_values(self, ids):
+        """
+        Get the values of the given IDs from a dense list as an array.
+
+        :param ids: The IDs to get the values of
+        :type ids: ~numpy.ndarray or list(int) or slice
+        :rtype: ~numpy.ndarray
+        :raises ValueError: If the list is not dense
+        """
+        if not self.is_dense:
+            raise ValueError(f"The values of {self._key} are not dense")
+        return self._ranges[ids]
+
+    def __densify(self):
+        """
+        Switch to holding the values in an array if they are all numbers.
+
+        :return: Whether the values are now dense
+        :rtype: bool
+        """
+        if self.is_dense:
+            return True
+        if self._ranged_based:
+            starts, stops, values = zip(*self._ranges)
+            values = _as_dense(values)
+            if values is None:
+                return False
+            values = numpy.repeat(
+                values, numpy.subtract(stops, starts))
+        else:
+            values = _as_dense(self._ranges)
+            if values is None:
+                return False
+        self._ranges = values
+        self._ranged_based = False
+        return True
+
+    def __set_dense(self, index, values):
+        """
+        Set values in the array, switching to or from dense values as
+        needed.
+
+        :param index: The index or indices into the array to set
+        :param values: The value or values to set
+        :return: Whether the values were set
+        :rtype: bool
+        """
+        new_values = _as_dense(values)
+        if new_values is None:
+            if self.is_dense:
+                self._ranges = list(self._ranges)
+            return False
+        if not self.__densify():
+            return False
+        if not numpy.can_cast(new_values.dtype, self._ranges.dtype):
+            self._ranges = self._ranges.astype(
+                numpy.result_type(self._ranges, new_values))
+        self._ranges[index] = new_values
+        return True
+
+    def __iter_dense_ranges(self, ids, values):
+        """
+        Iterate over the ranges of consecutive IDs with the same value.
+
+        :param ~numpy.ndarray ids: The IDs of the values
+        :param ~numpy.ndarray values: The values of the IDs
+        """
+        if not len(ids):
+            return
+        ends = numpy.flatnonzero(
+            (ids[1:] != ids[:-1] + 1) | (values[1:] != values[:-1])) + 1
+        starts = numpy.concatenate(([0], ends))
+        ends = numpy.concatenate((ends, [len(ids)]))
+        for start, end in zip(starts, ends):
+            yield (int(ids[start]), int(ids[end - 1]) + 1, values[start])
+
+    @overrides(RangedList.get_single_value_by_slice)
+    def get_single_value_by_slice(self, slice_start, slice_stop):
+        if not self.is_dense:
+            return super().get_single_value_by_slice(slice_start, slice_stop)
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        values = self._ranges[slice_start:slice_stop]
+        different = values != values[0]
+        if numpy.any(different):
+            raise MultipleValuesException(
+                self._key, values[0], values[different][0])
+        return values[0]
+
+    @overrides(RangedList.iter_ranges)
+    def iter_ranges(self):
+        if not self.is_dense:
+            return super().iter_ranges()
+        return self.__iter_dense_ranges(
+            numpy.arange(self._size), self._ranges)
+
+    @overrides(RangedList.iter_ranges_by_slice)
+    def iter_ranges_by_slice(self, slice_start, slice_stop):
+        if not self.is_dense:
+            return super().iter_ranges_by_slice(slice_start, slice_stop)
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        return self.__iter_dense_ranges(
+            numpy.arange(slice_start, slice_stop),
+            self._ranges[slice_start:slice_stop])
+
+    @overrides(RangedList.iter_ranges_by_ids)
+    def iter_ranges_by_ids(self, ids):
+        if not self.is_dense:
+            return super().iter_ranges_by_ids(ids)
+        ids = numpy.asarray(ids, dtype=numpy.intp)
+        return self.__iter_dense_ranges(ids, self._ranges[ids])
+
+    @overrides(RangedList.get_values)
+    def get_values(self, selector=None):
+        if not self.is_dense:
+            return super().get_values(selector)
+        if selector is None:
+            return list(self._ranges)
+        return list(self._ranges[self.selector_to_ids(selector)])
+
+    @overrides(RangedList.set_value)
+    def set_value(self, value, use_list_as_value=False):
+        if not use_list_as_value and self.is_list(value, self._size):
+            values = self.as_list(value, self._size)
+            dense_values = _as_dense(values)
+            self._ranges = values if dense_values is None else dense_values
+            self._ranged_based = False
+        else:
+            super().set_value(value, use_list_as_value)
+
+    @overrides(RangedList.set_value_by_id)
+    def set_value_by_id(self, the_id, value):
+        if self.is_dense:
+            self._check_id_in_range(the_id)
+            if self.__set_dense(the_id, value):
+                return
+        super().set_value_by_id(the_id, value)
+
+    @overrides(RangedList.set_value_by_slice)
+    def set_value_by_slice(
+            self, slice_start, slice_stop, value, use_list_as_value=False):
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if slice_start == slice_stop:
+            return
+        index = slice(slice_start, slice_stop)
+        if not use_list_as_value and self.is_list(
+                value, size=slice_stop - slice_start):
+            # A list of values makes the list heterogeneous, so go dense
+            value = self.as_list(
+                value, slice_stop - slice_start,
+                ids=range(slice_start, slice_stop))
+            if self.__set_dense(index, value):
+                return
+        elif self.is_dense and self.__set_dense(index, value):
+            return
+        super().set_value_by_slice(
+            slice_start, slice_stop, value, use_list_as_value)
+
+    @overrides(RangedList.set_value_by_ids)
+    def set_value_by_ids(self, ids, value, use_list_as_value=False):
+        index = numpy.asarray(ids, dtype=numpy.intp)
+        if not use_list_as_value and self.is_list(value, len(ids)):
+            value = self.as_list(value, len(ids), ids=ids)
+            if self.__set_dense(index, value):
+                return
+        elif self.is_dense and self.__set_dense(index, value):
+            return
+        super().set_value_by_ids(ids, value, use_list_as_value)
+
+    @overrides(RangedList.copy_into)
+    def copy_into(self, other):
+        if isinstance(other, DenseRangedList) and other.is_dense:
+            self._ranges = numpy.array(other.get_dense_values(slice(None)))
+            self._ranged_based = False
+            return
+        if self.is_dense:
+            self._ranges = list()
+        super().copy_into(other)
+
+    @overrides(RangedList.copy)
+    def copy(self):
+        clone = DenseRangedList(self._size, None, self._key)
+        clone.set_default(self._default)
+        clone.copy_into(self)
+        return clone
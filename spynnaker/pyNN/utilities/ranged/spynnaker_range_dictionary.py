@@ -0,0 +1,35 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spinn_utilities.overrides import overrides
+from spinn_utilities.ranged import RangeDictionary
+from .dense_ranged_list import DenseRangedList
+
+
+class SpynnakerRangeDictionary(RangeDictionary):
+    """
+    A :py:class:`~spinn_utilities.ranged.RangeDictionary` whose values are
+    held in :py:class:`DenseRangedList`\\ s, so that values which are
+    different for every ID are held as numpy arrays.
+    """
+
+    @overrides(RangeDictionary.list_factory)
+    def list_factory(self, size, value, key):
+        return DenseRangedList(size, value, key)
+
+    @overrides(RangeDictionary.copy)
+    def copy(self):
+        copy = SpynnakerRangeDictionary(len(self))
+        copy.copy_into(self)
+        return copy
@@ -0,0 +1,238 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spinn_front_end_common.utilities.helpful_functions import (
+    get_region_base_address_offset)
+from spynnaker.pyNN.data import SpynnakerDataView
+
+#: Changed words separated by at most this many unchanged words are written
+#: together, rather than paying for another write to the machine
+_MAX_GAP_WORDS = 16
+
+#: If a region needs more writes than this, the whole region is written
+_MAX_DELTA_WRITES = 8
+
+
+def _changed_runs(known, data):
+    """
+    Get the runs of words which differ between two arrays of the same
+    length, merging runs with small gaps between them.
+
+    :param ~numpy.ndarray known: The words that are on the machine
+    :param ~numpy.ndarray data: The words that need to be on the machine
+    :return: The start and end word of each run
+    :rtype: list(tuple(int, int))
+    """
+    changed = numpy.flatnonzero(known != data)
+    if not len(changed):
+        return []
+    breaks = numpy.flatnonzero(numpy.diff(changed) > _MAX_GAP_WORDS + 1)
+    starts = changed[numpy.concatenate(([0], breaks + 1))]
+    ends = changed[numpy.concatenate((breaks, [len(changed) - 1]))] + 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+class RegionDeltaWriter(object):
+    """
+    Rewrites the regions of a core between runs.  The regions that need to
+    be rewritten are marked as dirty, and when they are rewritten, only the
+    words that differ from the data last known to be on the machine are
+    written, if it is known.
+    """
+
+    __slots__ = [
+        # The regions which need to be rewritten
+        "__dirty",
+
+        # The data known to be in each region, and the run number for which
+        # it is known, or None if the machine doesn't change it when run
+        "__known",
+
+        # The address of each region on the machine
+        "__addresses",
+
+        # The run number in which regions were last rewritten
+        "__rewrite_run_number",
+
+        # The bytes written to each region and the size of the data of the
+        # region when last rewritten
+        "__bytes_written"
+    ]
+
+    def __init__(self):
+        self.__dirty = set()
+        self.__known = dict()
+        self.__addresses = dict()
+        self.__rewrite_run_number = None
+        self.__bytes_written = dict()
+
+    def set_dirty(self, *regions):
+        """
+        Mark regions as needing to be rewritten.
+
+        :param int regions: The regions that need to be rewritten
+        """
+        self.__dirty.update(regions)
+
+    def is_dirty(self, region):
+        """
+        Whether a region needs to be rewritten.
+
+        :param int region: The region to check
+        :rtype: bool
+        """
+        return region in self.__dirty
+
+    def clear_dirty(self):
+        """
+        Mark all regions as not needing to be rewritten.
+        """
+        self.__dirty.clear()
+
+    def forget(self):
+        """
+        Forget what is known about the data on the machine, such as when it
+        has all been written again.
+        """
+        self.__known.clear()
+        self.__addresses.clear()
+
+    def note_data(self, region, data, changes_on_run=False):
+        """
+        Note the data that is now in a region on the machine.
+
+        :param int region: The region that the data is in
+        :param data: The data in the region
+        :type data: ~numpy.ndarray or bytes
+        :param bool changes_on_run:
+            Whether the machine changes the data in the region when it runs,
+            in which case the data is only known until the next run
+        """
+        if isinstance(data, (bytes, bytearray)):
+            data = numpy.frombuffer(
+                data, dtype="uint32", count=len(data) // BYTES_PER_WORD)
+        run_number = None
+        if changes_on_run:
+            run_number = SpynnakerDataView.get_run_number()
+        self.__known[region] = (
+            run_number, numpy.array(data, dtype="uint32"))
+
+    def __get_known(self, region, n_words):
+        """
+        Get the data known to be at the start of a region.
+
+        :param int region: The region to get the data of
+        :param int n_words: The number of words to get
+        :rtype: ~numpy.ndarray or None
+        """
+        if region not in self.__known:
+            return None
+        run_number, data = self.__known[region]
+        if (run_number is not None and
+                run_number != SpynnakerDataView.get_run_number()):
+            return None
+        if len(data) < n_words:
+            return None
+        return data[:n_words]
+
+    def __get_address(self, placement, region, transceiver):
+        """
+        Get the address of a region on the machine.
+
+        :param ~pacman.model.placements.Placement placement:
+            Where the core is
+        :param int region: The region to get the address of
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            The transceiver to read the address with
+        :rtype: int
+        """
+        if region not in self.__addresses:
+            base_address = transceiver.get_cpu_information_from_core(
+                placement.x, placement.y, placement.p).user[0]
+            self.__addresses[region] = transceiver.read_word(
+                placement.x, placement.y,
+                get_region_base_address_offset(base_address, region))
+        return self.__addresses[region]
+
+    def write_region(self, spec, placement, region, data,
+                     changes_on_run=False, transceiver=None):
+        """
+        Rewrite the data of a region.  If the data in the region on the
+        machine is known, only the changed words are written directly to
+        the machine, otherwise the whole region is written with the
+        specification.
+
+        :param ~spinn_front_end_common.interface.ds.DataSpecificationReloader\
+                spec:
+            The specification to write whole regions with
+        :param ~pacman.model.placements.Placement placement:
+            Where the core is
+        :param int region: The region to write
+        :param ~numpy.ndarray data: The words to be in the region
+        :param bool changes_on_run:
+            Whether the machine changes the data in the region when it runs
+        :param transceiver:
+            The transceiver to write with; by default that of the simulation
+        :type transceiver: ~spinnman.transceiver.Transceiver or None
+        :return: The number of bytes written
+        :rtype: int
+        """
+        data = numpy.asarray(data, dtype="uint32")
+        known = self.__get_known(region, len(data))
+        runs = None
+        if known is not None:
+            runs = _changed_runs(known, data)
+            if len(runs) > _MAX_DELTA_WRITES:
+                runs = None
+
+        if runs is None:
+            spec.switch_write_focus(region)
+            spec.write_array(data)
+            n_bytes = data.nbytes
+        else:
+            n_bytes = 0
+            if runs:
+                if transceiver is None:
+                    transceiver = SpynnakerDataView.get_transceiver()
+                address = self.__get_address(placement, region, transceiver)
+                for start, end in runs:
+                    transceiver.write_memory(
+                        placement.x, placement.y,
+                        address + start * BYTES_PER_WORD,
+                        data[start:end].tobytes())
+                    n_bytes += (end - start) * BYTES_PER_WORD
+
+        self.note_data(region, data, changes_on_run)
+        run_number = SpynnakerDataView.get_run_number()
+        if self.__rewrite_run_number != run_number:
+            self.__rewrite_run_number = run_number
+            self.__bytes_written.clear()
+        self.__bytes_written[region] = (n_bytes, data.nbytes)
+        return n_bytes
+
+    def get_bytes_written(self, run_number):
+        """
+        Get the bytes written to each region when rewritten in a run.
+
+        :param int run_number: The run to get the bytes written in
+        :return:
+            The bytes written to each region rewritten and the size of the
+            data of the region
+        :rtype: dict(int, tuple(int, int))
+        """
+        if self.__rewrite_run_number != run_number:
+            return {}
+        return dict(self.__bytes_written)
@@ -0,0 +1,129 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from bisect import bisect_right
+from collections import defaultdict
+from spynnaker.pyNN.data import SpynnakerDataView
+
+
+class SDRAMReadPlanner(object):
+    """
+    Plans reads of SDRAM so that requested ranges on the same chip which
+    are adjacent (or overlapping) are read from the machine in a single
+    transfer, and then gives access to the data of each requested range
+    as a slice of the data read.
+
+    Usage is to :py:meth:`add_read` every range needed, call
+    :py:meth:`read` once, and then :py:meth:`get_data` for each range.
+    """
+
+    __slots__ = [
+        # The requested ranges, as a dict of (x, y) to list of
+        # (address, n_bytes)
+        "__requests",
+        # The data read, as a dict of (x, y) to a tuple of a list of
+        # start addresses and a list of memoryviews of the data read
+        "__reads",
+        # The largest number of bytes between two ranges that can be read
+        # (and thrown away) to join the ranges together
+        "__max_gap",
+        # The function used to read memory
+        "__read_memory"]
+
+    def __init__(self, max_gap=0, read_memory=None):
+        """
+        :param int max_gap:
+            The largest number of unrequested bytes between two ranges on the
+            same chip that will be read anyway to avoid a separate read
+        :param read_memory:
+            The function to read memory with, taking x, y, address and
+            number of bytes; by default
+            :py:meth:`SpynnakerDataView.read_memory`
+        :type read_memory: callable(int, int, int, int, bytes) or None
+        """
+        self.__requests = defaultdict(list)
+        self.__reads = None
+        self.__max_gap = max_gap
+        if read_memory is None:
+            read_memory = SpynnakerDataView.read_memory
+        self.__read_memory = read_memory
+
+    def add_read(self, x, y, address, n_bytes):
+        """
+        Add a range of memory that needs to be read.
+
+        :param int x: The x-coordinate of the chip to read from
+        :param int y: The y-coordinate of the chip to read from
+        :param int address: The address of the start of the range
+        :param int n_bytes: The size of the range in bytes
+        """
+        if self.__reads is not None:
+            raise ValueError("Reads cannot be added after reading")
+        if n_bytes > 0:
+            self.__requests[x, y].append((address, n_bytes))
+
+    def plan(self):
+        """
+        Get the reads that will be done, with adjacent and overlapping
+        ranges on each chip merged.
+
+        :return: The (x, y, address, n_bytes) of each read
+        :rtype: list(tuple(int, int, int, int))
+        """
+        reads = list()
+        for (x, y), ranges in sorted(self.__requests.items()):
+            ranges = sorted(ranges)
+            start, end = ranges[0][0], ranges[0][0] + ranges[0][1]
+            for address, n_bytes in ranges[1:]:
+                if address > end + self.__max_gap:
+                    reads.append((x, y, start, end - start))
+                    start = address
+                end = max(end, address + n_bytes)
+            reads.append((x, y, start, end - start))
+        return reads
+
+    def read(self):
+        """
+        Read all the ranges added from the machine.
+        """
+        reads = defaultdict(lambda: ([], []))
+        for x, y, address, n_bytes in self.plan():
+            starts, data = reads[x, y]
+            starts.append(address)
+            data.append(memoryview(
+                self.__read_memory(x, y, address, n_bytes)))
+        self.__reads = reads
+
+    def get_data(self, x, y, address, n_bytes):
+        """
+        Get the data of a range that has been read.
+
+        :param int x: The x-coordinate of the chip the range is on
+        :param int y: The y-coordinate of the chip the range is on
+        :param int address: The address of the start of the range
+        :param int n_bytes: The size of the range in bytes
+        :rtype: memoryview
+        """
+        if self.__reads is None:
+            raise ValueError("The data has not been read yet")
+        if n_bytes <= 0:
+            return memoryview(b"")
+        starts, data = self.__reads.get((x, y), ((), ()))
+        index = bisect_right(starts, address) - 1
+        if index < 0 or address + n_bytes > starts[index] + len(data[index]):
+            raise KeyError(
+                f"{n_bytes} bytes at 0x{address:08x} on {x}, {y} were not "
+                "requested")
+        offset = address - starts[index]
+        return data[index][offset:offset + n_bytes]
@@ -16,14 +16,20 @@ import numpy
 from enum import Enum
 from pyNN.random import RandomDistribution
 from spinn_utilities.helpful_functions import is_singleton
+from spinn_front_end_common.interface.ds import DataType
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
-from spynnaker.pyNN.utilities.utility_calls import convert_to
+from spynnaker.pyNN.utilities.ranged import DenseRangedList
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to, convert_array_to)
 from spynnaker.pyNN.models.common.param_generator_data import (
     get_generator_type, param_generator_id, param_generator_params,
     type_has_generator)
 
 REPEAT_PER_NEURON_FLAG = 0xFFFFFFFF
 
+# The type in which the parameters of the generators are written
+_GENERATOR_PARAM_TYPE = DataType.S1615
+
 
 class StructRepeat(Enum):
     """
@@ -172,21 +178,30 @@ class Struct(object):
         """
         Get the data for a single value from a vertex slice.
         """
-        # If there is a list of values, convert it
         ids = vertex_slice.get_raster_ids()
-        data_pos = 0
+
+        # Dense values can be read directly as an array
+        if isinstance(all_vals, DenseRangedList) and all_vals.is_dense:
+            data[name] = convert_array_to(
+                all_vals.get_dense_values(ids), data_type)
+            return
+
+        # Gather the values of the whole slice, then convert them together
+        slice_values = list()
         for start, stop, value in all_vals.iter_ranges_by_ids(ids):
-            # Get the values and convert to the correct data type
             n_values = stop - start
             if isinstance(value, RandomDistribution):
-                r_vals = value.next(n_values)
-                data_value = [
-                    convert_to(v, data_type) for v in r_vals]
+                slice_values.append(numpy.atleast_1d(value.next(n_values)))
             else:
-                data_value = convert_to(value, data_type)
-
-            data[name][data_pos:data_pos + n_values] = data_value
-            data_pos += n_values
+                slice_values.append(numpy.full(n_values, value))
+        # Integers mixed with floats are kept as they are rather than made
+        # floats when a float can't hold every value of the type
+        dtype = None
+        if (data.dtype[name].kind in "iu" and data.dtype[name].itemsize == 8
+                and len({values.dtype.kind for values in slice_values}) > 1):
+            dtype = object
+        data[name] = convert_array_to(
+            numpy.concatenate(slice_values, dtype=dtype), data_type)
 
     def get_generator_data(self, values, vertex_slice=None):
         """
@@ -299,13 +314,26 @@ class Struct(object):
 
                 # Go through and get the data for each value
                 ids = vertex_slice.get_raster_ids()
-                for start, stop, value in vals.iter_ranges_by_ids(ids):
+                ranges = list(vals.iter_ranges_by_ids(ids))
+
+                # Encode the constant values of all the ranges together
+                constants = convert_array_to(
+                    [value for _start, _stop, value in ranges
+                     if numpy.isscalar(value)],
+                    _GENERATOR_PARAM_TYPE).view("uint32")
+                n_constants = 0
+                for start, stop, value in ranges:
                     n_items += 1
                     # This is the metadata
                     data.append(stop - start)
                     data.append(param_generator_id(value))
                     # This data goes after *all* the metadata
-                    gen_data.append(param_generator_params(value))
+                    if numpy.isscalar(value):
+                        gen_data.append(
+                            constants[n_constants:n_constants + 1])
+                        n_constants += 1
+                    else:
+                        gen_data.append(param_generator_params(value))
                 data[n_items_index] = n_items
         else:
             # Just a single value for all neurons from defaults
@@ -343,8 +371,6 @@ class Struct(object):
             non-repeating structure.
         :type array_size: int or None
         """
-        n_items = 1
-        ids = None
         if vertex_slice is None:
             if self.__repeat_type != StructRepeat.GLOBAL:
                 raise ValueError(
@@ -352,22 +378,56 @@ class Struct(object):
         elif self.__repeat_type == StructRepeat.GLOBAL:
             raise ValueError("Global Structures do not have a slice")
         else:
-            n_items = vertex_slice.n_atoms
-            ids = vertex_slice.get_raster_ids()
+            self.read_data_of_slices(
+                [(data, data_offset, vertex_slice)], values)
+            return
 
         if not self.__fields:
             return
 
         # Read in the data values
         numpy_data = numpy.frombuffer(
-            data, offset=data_offset, dtype=self.numpy_dtype, count=n_items)
+            data, offset=data_offset, dtype=self.numpy_dtype, count=1)
 
         for data_type, name in self.fields:
             # Ignore fields that can't be set
             if name in values:
-                # Get the data to set for this item
-                value = data_type.decode_numpy_array(numpy_data[name])
-                if self.__repeat_type == StructRepeat.GLOBAL:
-                    values[name] = value[0]
-                else:
-                    values[name].set_value_by_ids(ids, value)
+                values[name] = data_type.decode_numpy_array(
+                    numpy_data[name])[0]
+
+    def read_data_of_slices(self, blocks, values):
+        """
+        Read the data of several slices of a repeating structure and write
+        to values, setting each value once for all the slices.
+
+        :param blocks:
+            The data, the index of the byte at the start of the valid data,
+            and the vertex slice of the data, for each slice
+        :type blocks:
+            list(tuple(bytes, int, ~pacman.model.graphs.common.Slice))
+        :param ~spinn_utilities.ranged.RangeDictionary values:
+            The values to update with the read data
+        """
+        if self.__repeat_type == StructRepeat.GLOBAL:
+            raise ValueError("Global Structures do not have a slice")
+        if not self.__fields or not blocks:
+            return
+
+        # Gather the data of all the slices into one array
+        n_items = sum(vertex_slice.n_atoms for _, _, vertex_slice in blocks)
+        numpy_data = numpy.empty(n_items, dtype=self.numpy_dtype)
+        ids = numpy.empty(n_items, dtype=numpy.intp)
+        index = 0
+        for data, data_offset, vertex_slice in blocks:
+            n_atoms = vertex_slice.n_atoms
+            numpy_data[index:index + n_atoms] = numpy.frombuffer(
+                data, offset=data_offset, dtype=self.numpy_dtype,
+                count=n_atoms)
+            ids[index:index + n_atoms] = vertex_slice.get_raster_ids()
+            index += n_atoms
+
+        for data_type, name in self.fields:
+            # Ignore fields that can't be set
+            if name in values:
+                values[name].set_value_by_ids(
+                    ids, data_type.decode_numpy_array(numpy_data[name]))
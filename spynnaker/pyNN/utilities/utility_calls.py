@@ -15,6 +15,7 @@
 """
 Utility package containing simple helper functions.
 """
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 import math
@@ -123,6 +124,85 @@ def convert_to(value, data_type):
         data_type.struct_encoding)
 
 
+def convert_array_to(values, data_type):
+    """
+    Convert an array of values to a given data type in one operation.
+    This gives exactly the same result as calling :py:func:`convert_to` on
+    each value.
+
+    :param values: The values to convert
+    :type values: ~numpy.ndarray or list(int or float)
+    :param ~data_specification.enums.DataType data_type:
+        The data type to convert to
+    :return: The converted data
+    :rtype: ~numpy.ndarray
+    :raises ValueError: If a value is out of range of a fixed-point type
+    """
+    encoding = numpy.dtype(data_type.struct_encoding)
+    if data_type.scale == 1:
+        if encoding.kind == "f":
+            return numpy.round(numpy.asarray(values)).astype(encoding)
+        if encoding.itemsize == 8 and not (
+                isinstance(values, numpy.ndarray) and
+                values.dtype.kind in "iu"):
+            # A float can't hold every 64-bit integer, so anything but an
+            # array of integers is converted one at a time
+            return numpy.array(
+                [convert_to(value, data_type) for value in values],
+                dtype=encoding)
+        # Go through a 64-bit integer so that negative values wrap in the
+        # same way as they do when converting one at a time
+        return numpy.asarray(values).astype("int64").astype(encoding)
+
+    # Fixed point; the negation makes NaN values out of range too
+    values = numpy.asarray(values)
+    out_of_range = ~((values >= _float_at_least(data_type.min)) &
+                     (values <= _float_at_most(data_type.max)))
+    if numpy.any(out_of_range):
+        raise ValueError(
+            f"value {values[out_of_range].flat[0]:f} cannot be converted"
+            f" to {data_type.__doc__}: out of range")
+    # Scaling by a power of two is exact, but each value is rounded as the
+    # decimal that prints it, so those close enough to half way (or too big
+    # for a float to hold exactly) that the decimal could round the other
+    # way are converted one at a time
+    scaled = values * float(data_type.scale)
+    near_half = (numpy.abs(scaled - numpy.floor(scaled) - 0.5) <=
+                 numpy.spacing(numpy.abs(scaled)))
+    converted = numpy.round(numpy.where(near_half, 0, scaled)).astype(
+        "uint64" if encoding == numpy.uint64 else "int64")
+    if numpy.any(near_half):
+        converted[near_half] = [
+            convert_to(value, data_type) for value in values[near_half]]
+    return converted.astype(encoding)
+
+
+def _float_at_least(value):
+    """
+    Get the smallest float that is at least a decimal value.
+
+    :param ~decimal.Decimal value:
+    :rtype: float
+    """
+    as_float = float(value)
+    if as_float < value:
+        as_float = float(numpy.nextafter(as_float, numpy.inf))
+    return as_float
+
+
+def _float_at_most(value):
+    """
+    Get the largest float that is at most a decimal value.
+
+    :param ~decimal.Decimal value:
+    :rtype: float
+    """
+    as_float = float(value)
+    if as_float > value:
+        as_float = float(numpy.nextafter(as_float, -numpy.inf))
+    return as_float
+
+
 def read_in_data_from_file(
         file_path, min_atom, max_atom, min_time, max_time, extra=False):
     """
@@ -403,6 +483,33 @@ def get_time_to_write_us(n_bytes, n_cores):
     return int(math.ceil(seconds * MICRO_TO_SECOND_CONVERSION))
 
 
+def map_in_threads(function, items, n_threads=1):
+    """
+    Apply a function to each of the items, using several threads if asked
+    to, so that reads from the machine for different items can be waiting
+    for the machine at the same time.
+
+    .. note::
+        The function is called from several threads at once when
+        `n_threads` is more than 1, so anything it uses must be
+        thread-safe.  This includes the transceiver, which spinnman
+        documents as thread-safe except for access to a BMP.
+
+    :param callable function: The function to apply to each item
+    :param iterable items: The items to apply the function to
+    :param int n_threads:
+        The number of items to apply the function to at the same time;
+        1 or less applies it to each in turn in the calling thread
+    :return: The results of the function, in the order of the items
+    :rtype: iterable
+    """
+    if n_threads <= 1:
+        yield from map(function, items)
+    else:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            yield from executor.map(function, items)
+
+
 def get_neo_io(file_or_folder):
     """
     Hack for https://github.com/NeuralEnsemble/python-neo/issues/1287
@@ -0,0 +1,556 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Stand-ins for a board, SPIF and a PushBot on the local host, so that the\
+    live connections can be run end to end without hardware.
+"""
+
+import os
+import socket
+import sqlite3
+import struct
+from threading import Condition, Lock, Thread
+import time
+import numpy
+from spinnman.connections.udp_packet_connections import (
+    EIEIOConnection, UDPConnection)
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.command_messages import (
+    NotificationProtocolDatabaseLocation, NotificationProtocolPauseStop,
+    NotificationProtocolStartResume)
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
+from spinnman.messages.sdp import SDPHeader
+from spinn_front_end_common.interface.ds import DataType
+from spinn_front_end_common.utilities import database
+from spynnaker.pyNN.connections.eieio_arrays import (
+    max_elements_per_packet, unpack_packet)
+from spynnaker.pyNN.external_devices_models.spif_devices import (
+    SPIF_OUTPUT_COMMAND_MASK, SPIF_OUTPUT_SET_LEN, SPIF_OUTPUT_START,
+    SPIF_OUTPUT_STOP)
+
+_LOCAL_HOST = "127.0.0.1"
+
+# The label of the live packet gatherer
+_LPG_LABEL = "LiveSpikeReceiver"
+
+# Where the live packet gatherer is
+_LPG_PLACEMENT = (0, 0, 1)
+
+# The tag used for live output
+_TAG = 1
+
+# The offset of the EIEIO message in an SDP message sent over UDP
+_EIEIO_OFFSET = 10
+
+# The SDP port of SCP messages
+_SCP_PORT = 0
+
+# The SCP response that says that an IP tag was set
+_SCP_OK = bytes([0, 0, 7, 0, 0xFF] + [0] * 13)
+
+# The type of packets of live output
+_LIVE_OUTPUT_TYPE = EIEIOType.KEY_PAYLOAD_32_BIT
+
+# A command sent to SPIF
+_SPIF_COMMAND = struct.Struct("<I")
+
+# How long the threads of the stand-ins wait for something to do
+_POLL_TIMEOUT = 0.05
+
+# How long to wait for a stand-in to stop sending
+_STOP_TIMEOUT = 5.0
+
+
+class _Population(object):
+    """ A population on the stand-in board.
+    """
+
+    __slots__ = ["label", "n_neurons", "key_base", "placement", "live_output"]
+
+    def __init__(self, label, n_neurons, key_base, placement, live_output):
+        self.label = label
+        self.n_neurons = n_neurons
+        self.key_base = key_base
+        self.placement = placement
+        self.live_output = live_output
+
+
+class BoardStandIn(object):
+    """ Stands in for a board running a simulation, on a free port of the\
+        local host that connections must be pointed at in place of the SCAMP\
+        port.  It writes a database describing its populations, tells\
+        connections where it is as the toolchain would, and answers their\
+        IP tag messages.  Spikes injected into a population can be echoed\
+        back as the live output of another, and rates sent to Poisson\
+        sources are kept.
+    """
+
+    def __init__(self, database_dir, time_step_ms=1.0, run_time_ms=1000.0):
+        """
+        :param str database_dir: Where to write the database
+        :param float time_step_ms: The simulation time step
+        :param float run_time_ms: The time the simulation runs for
+        """
+        self.__database_path = os.path.join(database_dir, "input_output.db")
+        self.__time_step_ms = time_step_ms
+        self.__run_time_ms = run_time_ms
+        self.__populations = dict()
+        self.__by_placement = dict()
+        self.__echoes = dict()
+        self.__tag_target = None
+        self.__lock = Lock()
+        self.n_packets_received = 0
+        self.n_spikes_injected = dict()
+        self.rates = dict()
+        self.__start_time = time.perf_counter()
+        self.__board = UDPConnection(local_host=_LOCAL_HOST)
+        self.__running = True
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def add_population(self, label, n_neurons, live_output=False):
+        """ Add a population, on a core of its own.
+
+        :param str label: The label of the population
+        :param int n_neurons: The number of neurons
+        :param bool live_output:
+            Whether the spikes of the population are sent to the host
+        """
+        index = len(self.__populations)
+        population = _Population(
+            label, n_neurons, (index + 1) << 16,
+            (0, 0, _LPG_PLACEMENT[2] + index + 1), live_output)
+        self.__populations[label] = population
+        self.__by_placement[population.placement] = population
+        self.n_spikes_injected[label] = 0
+
+    def add_echo(self, send_label, receive_label):
+        """ Send spikes injected into a population back as the live output\
+            of another, from the same neurons.
+
+        :param str send_label: The population that spikes are injected into
+        :param str receive_label: The population the spikes are sent from
+        """
+        self.__echoes[send_label] = self.__populations[receive_label]
+
+    def keys(self, label):
+        """ Get the key of each neuron of a population.
+
+        :param str label: The label of the population
+        :rtype: ~numpy.ndarray
+        """
+        population = self.__populations[label]
+        return population.key_base + numpy.arange(population.n_neurons)
+
+    def write_database(self):
+        """ Write the database describing the populations, as the toolchain\
+            would.
+
+        :return: The path of the database
+        :rtype: str
+        """
+        if os.path.exists(self.__database_path):
+            os.remove(self.__database_path)
+        with open(os.path.join(
+                os.path.dirname(database.__file__), "db.sql"),
+                encoding="utf-8") as f:
+            schema = f.read()
+        with sqlite3.connect(self.__database_path) as db:
+            db.executescript(schema)
+            db.executemany(
+                "INSERT INTO configuration_parameters(parameter_id, value) "
+                "VALUES (?, ?)",
+                [("runtime", self.__run_time_ms),
+                 ("machine_time_step", self.__time_step_ms * 1000.0)])
+            db.execute(
+                "INSERT INTO Machine_layout("
+                "machine_id, x_dimension, y_dimension) VALUES (1, 1, 1)")
+            db.execute(
+                "INSERT INTO Machine_chip("
+                "no_processors, chip_x, chip_y, machine_id, ip_address, "
+                "nearest_ethernet_x, nearest_ethernet_y) "
+                "VALUES (18, 0, 0, 1, ?, 0, 0)", (_LOCAL_HOST,))
+            vertices = [(_LPG_LABEL, _LPG_PLACEMENT)] + [
+                (population.label, population.placement)
+                for population in self.__populations.values()]
+            for vertex_id, (label, (x, y, p)) in enumerate(vertices, 1):
+                db.execute(
+                    "INSERT INTO Application_vertices("
+                    "vertex_id, vertex_label) VALUES (?, ?)",
+                    (vertex_id, label))
+                db.execute(
+                    "INSERT INTO Machine_vertices(vertex_id, label) "
+                    "VALUES (?, ?)", (vertex_id, label))
+                db.execute(
+                    "INSERT INTO graph_mapper_vertex("
+                    "application_vertex_id, machine_vertex_id) "
+                    "VALUES (?, ?)", (vertex_id, vertex_id))
+                db.execute(
+                    "INSERT INTO Placements("
+                    "vertex_id, machine_id, chip_x, chip_y, chip_p) "
+                    "VALUES (?, 1, ?, ?, ?)", (vertex_id, x, y, p))
+            db.execute(
+                "INSERT INTO IP_tags("
+                "vertex_id, tag, board_address, ip_address, port, strip_sdp) "
+                "VALUES (1, ?, ?, ?, 17895, 1)",
+                (_TAG, _LOCAL_HOST, _LOCAL_HOST))
+            for vertex_id, population in enumerate(
+                    self.__populations.values(), 2):
+                if population.live_output:
+                    db.execute(
+                        "INSERT INTO m_vertex_to_lpg_vertex("
+                        "pre_vertex_id, partition_id, post_vertex_id) "
+                        "VALUES (?, 'SPIKE', 1)", (vertex_id,))
+                db.executemany(
+                    "INSERT INTO event_to_atom_mapping("
+                    "vertex_id, atom_id, event_id) VALUES (?, ?, ?)",
+                    ((vertex_id, atom_id, key) for atom_id, key in enumerate(
+                        self.keys(population.label).tolist())))
+        return self.__database_path
+
+    def notify_database(self, port, timeout=5.0):
+        """ Tell a connection where the database is, and wait for it to\
+            have been read.
+
+        :param int port: The port the connection listens on
+        :param float timeout: How long to wait for the connection
+        """
+        connection = EIEIOConnection(
+            local_host=_LOCAL_HOST, remote_host=_LOCAL_HOST, remote_port=port)
+        try:
+            connection.send_eieio_message(
+                NotificationProtocolDatabaseLocation(self.write_database()))
+            connection.receive_eieio_message(timeout)
+        finally:
+            connection.close()
+
+    def notify_start(self, port):
+        """ Tell a connection that the simulation has started.
+
+        :param int port: The port the connection listens on
+        """
+        self.__start_time = time.perf_counter()
+        self.__notify(port, NotificationProtocolStartResume())
+
+    def notify_stop(self, port):
+        """ Tell a connection that the simulation has stopped.
+
+        :param int port: The port the connection listens on
+        """
+        self.__notify(port, NotificationProtocolPauseStop())
+
+    @staticmethod
+    def __notify(port, message):
+        connection = EIEIOConnection(
+            local_host=_LOCAL_HOST, remote_host=_LOCAL_HOST, remote_port=port)
+        try:
+            connection.send_eieio_message(message)
+        finally:
+            connection.close()
+
+    @property
+    def port(self):
+        """ The port that the board listens on in place of the SCAMP port.
+
+        :rtype: int
+        """
+        return self.__board.local_port
+
+    @property
+    def tag_target(self):
+        """ Where live output is sent, once a connection has set the tag.
+
+        :rtype: tuple(str, int) or None
+        """
+        return self.__tag_target
+
+    def __run(self):
+        while self.__running:
+            if not self.__board.is_ready_to_receive(_POLL_TIMEOUT):
+                continue
+            try:
+                data, address = self.__board.receive_with_address()
+            except Exception:  # pylint: disable=broad-except
+                break
+            header = SDPHeader.from_bytestring(data, 2)
+            if header.destination_port == _SCP_PORT:
+                # The only SCP that connections send sets an IP tag to send
+                # to where it came from
+                self.__tag_target = address
+                self.__board.send_to(_SCP_OK, address)
+                continue
+            self.__receive_packet(
+                (header.destination_chip_x, header.destination_chip_y,
+                 header.destination_cpu), data[_EIEIO_OFFSET:])
+
+    def __receive_packet(self, placement, data):
+        population = self.__by_placement[placement]
+        header, keys, payloads = unpack_packet(data)
+        with self.__lock:
+            self.n_packets_received += 1
+        if payloads is not None:
+            rates = self.rates.setdefault(
+                population.label, numpy.zeros(population.n_neurons))
+            rates[keys - population.key_base] = \
+                DataType.S1615.decode_numpy_array(payloads)
+            return
+        atom_ids = keys
+        if header.eieio_type.key_bytes == 4:
+            atom_ids = keys - population.key_base
+        with self.__lock:
+            self.n_spikes_injected[population.label] += len(atom_ids)
+        if population.label in self.__echoes:
+            self.send_live_output(
+                self.__echoes[population.label].label, atom_ids)
+
+    @property
+    def time_step(self):
+        """ The current time step of the simulation.
+
+        :rtype: int
+        """
+        return int((time.perf_counter() - self.__start_time) * 1000.0 /
+                   self.__time_step_ms)
+
+    def send_live_output(self, label, atom_ids, time_step=None):
+        """ Send spikes of a population to the host, as the live packet\
+            gatherer would.
+
+        :param str label: The label of the population
+        :param ~numpy.ndarray atom_ids: The neurons that spiked
+        :param time_step: The time of the spikes, or None for the current
+            time step
+        :type time_step: int or None
+        """
+        if self.__tag_target is None:
+            return
+        if time_step is None:
+            time_step = self.time_step
+        keys = self.__populations[label].key_base + numpy.asarray(atom_ids)
+        max_elements = max_elements_per_packet(_LIVE_OUTPUT_TYPE)
+        for start in range(0, len(keys), max_elements):
+            elements = numpy.empty(
+                (len(keys[start:start + max_elements]), 2), dtype="<u4")
+            elements[:, 0] = keys[start:start + max_elements]
+            elements[:, 1] = time_step
+            self.__board.send_to(
+                EIEIODataHeader(
+                    _LIVE_OUTPUT_TYPE, is_time=True,
+                    count=len(elements)).bytestring + elements.tobytes(),
+                self.__tag_target)
+
+    def close(self):
+        """ Stop the board.
+        """
+        self.__running = False
+        self.__thread.join()
+        self.__board.close()
+
+
+class SPIFStandIn(object):
+    """ Stands in for SPIF, sending the spikes of a population to the host\
+        at a given rate once told to start, in packets of the size and at\
+        the times that it is configured with.
+    """
+
+    def __init__(self, keys, rate):
+        """
+        :param ~numpy.ndarray keys: The keys of the neurons that spike
+        :param float rate: The number of spikes to send each second
+        """
+        self.__keys = numpy.asarray(keys, dtype="<u4")
+        self.__rate = rate
+        self.__packet_size = 32
+        self.__target = None
+        self.__sent = Condition()
+        self.n_events_sent = 0
+        self.n_packets_sent = 0
+        self.__connection = UDPConnection(local_host=_LOCAL_HOST)
+        self.__running = True
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    @property
+    def port(self):
+        """ The port that SPIF listens on.
+
+        :rtype: int
+        """
+        return self.__connection.local_port
+
+    def __run(self):
+        rng = numpy.random.default_rng(0)
+        next_send = time.perf_counter()
+        while self.__running:
+            timeout = _POLL_TIMEOUT
+            if self.__target is not None:
+                timeout = max(next_send - time.perf_counter(), 0)
+            if self.__connection.is_ready_to_receive(timeout):
+                try:
+                    data, address = self.__connection.receive_with_address()
+                except Exception:  # pylint: disable=broad-except
+                    break
+                next_send = time.perf_counter()
+                self.__command(data, address)
+            elif self.__target is not None:
+                packet = self.__keys[rng.integers(
+                    0, len(self.__keys), self.__packet_size)]
+                self.__connection.send_to(packet.tobytes(), self.__target)
+                with self.__sent:
+                    self.n_events_sent += len(packet)
+                    self.n_packets_sent += 1
+                    self.__sent.notify_all()
+                next_send += self.__packet_size / self.__rate
+
+    def __command(self, data, address):
+        for offset in range(0, len(data), _SPIF_COMMAND.size):
+            command, = _SPIF_COMMAND.unpack_from(data, offset)
+            value = command & ~SPIF_OUTPUT_COMMAND_MASK
+            command &= SPIF_OUTPUT_COMMAND_MASK
+            if command == SPIF_OUTPUT_SET_LEN:
+                self.__packet_size = value // _SPIF_COMMAND.size
+            elif command == SPIF_OUTPUT_START:
+                self.__target = address
+            elif command == SPIF_OUTPUT_STOP:
+                with self.__sent:
+                    self.__target = None
+                    self.__sent.notify_all()
+
+    def wait_for_events_sent(self, n_events, timeout=5.0):
+        """ Wait until at least a number of events have been sent.
+
+        :param int n_events: The number of events to wait for
+        :param float timeout: How long to wait
+        :return: Whether the events were sent before the timeout
+        :rtype: bool
+        """
+        with self.__sent:
+            return self.__sent.wait_for(
+                lambda: self.n_events_sent >= n_events, timeout)
+
+    def wait_for_stop(self, timeout=5.0):
+        """ Wait until SPIF has been told to stop sending, after which no\
+            more events are sent.
+
+        :param float timeout: How long to wait
+        :return: Whether SPIF stopped before the timeout
+        :rtype: bool
+        """
+        with self.__sent:
+            return self.__sent.wait_for(
+                lambda: self.__target is None, timeout)
+
+    def close(self):
+        """ Stop SPIF.
+        """
+        self.__running = False
+        self.__thread.join()
+        self.__connection.close()
+
+
+class PushBotStandIn(object):
+    """ Stands in for the Wi-Fi interface of a PushBot, streaming retina\
+        events at 128 x 128 at a given rate to the first host that connects.
+    """
+
+    def __init__(self, rate, events_per_send=64):
+        """
+        :param float rate: The number of events to send each second
+        :param int events_per_send: The number of events in each send
+        """
+        self.__rate = rate
+        self.__events_per_send = events_per_send
+        self.__sent = Condition()
+        self.n_events_sent = 0
+        self.__server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__server.bind((_LOCAL_HOST, 0))
+        self.__server.listen(1)
+        self.__running = True
+        self.__streaming = False
+        self.__sending = False
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    @property
+    def port(self):
+        """ The port that the PushBot listens on.
+
+        :rtype: int
+        """
+        return self.__server.getsockname()[1]
+
+    def start_streaming(self):
+        """ Start sending retina events.
+        """
+        self.__streaming = True
+
+    def stop_streaming(self):
+        """ Stop sending retina events, waiting until the last have been\
+            sent.
+        """
+        with self.__sent:
+            self.__streaming = False
+            self.__sent.wait_for(lambda: not self.__sending, _STOP_TIMEOUT)
+
+    def wait_for_events_sent(self, n_events, timeout=5.0):
+        """ Wait until at least a number of events have been sent.
+
+        :param int n_events: The number of events to wait for
+        :param float timeout: How long to wait
+        :return: Whether the events were sent before the timeout
+        :rtype: bool
+        """
+        with self.__sent:
+            return self.__sent.wait_for(
+                lambda: self.n_events_sent >= n_events, timeout)
+
+    def __run(self):
+        self.__server.settimeout(_POLL_TIMEOUT)
+        client = None
+        while self.__running and client is None:
+            try:
+                client, _ = self.__server.accept()
+            except socket.timeout:
+                pass
+        rng = numpy.random.default_rng(0)
+        next_send = time.perf_counter()
+        while self.__running:
+            with self.__sent:
+                self.__sending = self.__streaming
+                self.__sent.notify_all()
+            if not self.__sending:
+                time.sleep(_POLL_TIMEOUT)
+                next_send = time.perf_counter()
+                continue
+            delay = next_send - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            events = numpy.empty((self.__events_per_send, 2), dtype="uint8")
+            events[:, 0] = 0x80 | rng.integers(
+                0, 128, self.__events_per_send)
+            events[:, 1] = rng.integers(0, 256, self.__events_per_send)
+            client.sendall(events.tobytes())
+            with self.__sent:
+                self.n_events_sent += self.__events_per_send
+                self.__sent.notify_all()
+            next_send += self.__events_per_send / self.__rate
+        if client is not None:
+            client.close()
+
+    def close(self):
+        """ Stop the PushBot.
+        """
+        self.__running = False
+        self.__thread.join()
+        self.__server.close()
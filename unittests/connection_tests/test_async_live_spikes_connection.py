@@ -0,0 +1,245 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import struct
+import numpy
+import pytest
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.eieio import EIEIOType, read_eieio_data_message
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
+from spinnman.messages.sdp import SDPHeader
+from spinn_front_end_common.interface.ds import DataType
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import (
+    AsyncLiveSpikesConnection, AsyncSPIFLiveSpikesConnection)
+from spynnaker.pyNN.connections import async_live_spikes_connection
+
+_RECEIVE_KEY_BASE = 0x1000
+_SEND_KEY_BASE = 0x2000
+_RATE_KEY_BASE = 0x3000
+_PLACEMENTS = {"input": (0, 1, 2), "poisson_control": (0, 1, 3)}
+
+
+class _DatabaseReader(object):
+    """ Describes populations on a board on the local host.
+    """
+
+    def get_job(self):
+        return None
+
+    def get_placements(self, label):
+        return [_PLACEMENTS[label]]
+
+    def get_ip_address(self, x, y):
+        return "127.0.0.1"
+
+    def get_atom_id_to_key_mapping(self, label):
+        base = _SEND_KEY_BASE if label == "input" else _RATE_KEY_BASE
+        return {atom_id: base + atom_id for atom_id in range(100)}
+
+    def get_live_output_details(self, label, receiver_label):
+        return ("127.0.0.1", 17896, True, "127.0.0.1", 1, 0, 0)
+
+    def get_key_to_atom_id_mapping(self, label):
+        return {_RECEIVE_KEY_BASE + atom_id: atom_id for atom_id in range(50)}
+
+
+def _answer_tag(board):
+    """ Answer the setting of the IP tag as the board would.
+    """
+    _, address = board.receive_with_address(timeout=5)
+    response = bytearray(18)
+    response[2] = 7
+    response[4] = 0xFF
+    board.send_to(bytes(response), address)
+    return address
+
+
+def _spike_packet(atom_ids, times):
+    header = EIEIODataHeader(
+        EIEIOType.KEY_PAYLOAD_32_BIT, is_time=True, count=len(atom_ids))
+    elements = numpy.zeros((len(atom_ids), 2), dtype="<u4")
+    elements[:, 0] = _RECEIVE_KEY_BASE + numpy.asarray(atom_ids)
+    elements[:, 1] = times
+    return header.bytestring + elements.tobytes()
+
+
+def _received(board, core):
+    data = board.receive(timeout=5)
+    header = SDPHeader.from_bytestring(data, 2)
+    assert (header.destination_chip_x, header.destination_chip_y,
+            header.destination_cpu) == core
+    message = read_eieio_data_message(data, 10)
+    elements = list()
+    while message.is_next_element:
+        element = message.next_element
+        elements.append(
+            (element.key, element.payload) if hasattr(element, "payload")
+            else element.key)
+    return elements
+
+
+async def _run_connection(board):
+    loop = asyncio.get_running_loop()
+    async with AsyncLiveSpikesConnection(
+            receive_labels=["pop"], send_labels=["input"],
+            poisson_labels=["poisson"], local_host="127.0.0.1",
+            local_port=None, queue_size=4) as connection:
+        # pylint: disable=protected-access
+        answer = loop.run_in_executor(None, _answer_tag, board)
+        await loop.run_in_executor(
+            None, connection._AsyncLiveSpikesConnection__read_database,
+            _DatabaseReader())
+        address = await answer
+        assert address == connection.local_address
+        assert connection.n_neurons("pop") == 50
+        assert connection.n_neurons("poisson") == 100
+        connection._AsyncLiveSpikesConnection__notify_start_resume()
+        await asyncio.wait_for(connection.wait_for_start(), 5)
+
+        # Spikes from the board are received in batches
+        spikes = connection.spikes("pop")
+        board.send_to(_spike_packet([3, 1, 4], [10, 10, 11]), address)
+        batch = await asyncio.wait_for(spikes.__anext__(), 5)
+        assert batch.ids.tolist() == [3, 1, 4]
+        assert batch.times.tolist() == [10, 10, 11]
+
+        # Spikes and rates are sent to the board
+        await connection.send_spikes(
+            "input", numpy.arange(100), send_full_keys=True)
+        assert _received(board, _PLACEMENTS["input"]) + _received(
+            board, _PLACEMENTS["input"]) == list(range(
+                _SEND_KEY_BASE, _SEND_KEY_BASE + 100))
+        await connection.send_spikes("input", [5, 6])
+        assert _received(board, _PLACEMENTS["input"]) == [5, 6]
+
+        # Neuron IDs that don't fit in 16 bits are not cut short
+        with pytest.raises(SpinnmanInvalidParameterException):
+            await connection.send_spikes("input", [5, 70000, 131073])
+
+        # ... and neuron IDs that are not those of a population are not
+        # wrapped
+        with pytest.raises(SpinnmanInvalidParameterException):
+            await connection.send_spikes("input", [-1], send_full_keys=True)
+        with pytest.raises(SpinnmanInvalidParameterException):
+            await connection.set_rates("poisson", [100], [1.0])
+        with pytest.raises(SpinnmanInvalidParameterException):
+            await connection.set_rates("poisson", [5, 6], [1.0])
+        await connection.set_rates("poisson", [7], [12.5])
+        assert _received(board, _PLACEMENTS["poisson_control"]) == [
+            (_RATE_KEY_BASE + 7, DataType.S1615.encode_as_int(12.5))]
+        assert connection.send_latency.n_samples == 3
+
+        # Sending waits while the transport's buffer is full
+        connection.pause_writing()
+        send = asyncio.ensure_future(connection.send_spikes("input", [8]))
+        await asyncio.sleep(0.05)
+        assert not send.done()
+        connection.resume_writing()
+        await asyncio.wait_for(send, 5)
+        assert _received(board, _PLACEMENTS["input"]) == [8]
+
+        # Sends to the same population that wait together each send their
+        # own spikes
+        connection.pause_writing()
+        sends = [asyncio.ensure_future(connection.send_spikes("input", [i]))
+                 for i in (1, 2)]
+        await asyncio.sleep(0.05)
+        assert not any(send.done() for send in sends)
+        connection.resume_writing()
+        await asyncio.wait_for(asyncio.gather(*sends), 5)
+        assert sorted([_received(board, _PLACEMENTS["input"]),
+                       _received(board, _PLACEMENTS["input"])]) == [[1], [2]]
+
+        # If spikes are not read quickly enough the oldest are dropped
+        for batch_time in range(6):
+            board.send_to(_spike_packet([batch_time], [batch_time]), address)
+        for _ in range(500):
+            if connection.n_dropped("pop") == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert connection.n_dropped("pop") == 2
+        for batch_time in range(2, 6):
+            batch = await asyncio.wait_for(spikes.__anext__(), 5)
+            assert batch.times.tolist() == [batch_time]
+        assert connection.receive_latency.n_samples == 5
+        statistics = connection.statistics
+        assert statistics.packets_received == 7
+        assert statistics.events_received == 9
+        assert statistics.events_delivered == 7
+        assert statistics.events_dropped == 2
+        assert statistics.queue_depth == 0
+        assert statistics.max_queue_depth == 4
+
+    # Closing ends the spikes
+    assert [batch async for batch in spikes] == []
+
+
+def test_async_live_spikes(monkeypatch):
+    unittest_setup()
+    board = UDPConnection(local_host="127.0.0.1")
+    monkeypatch.setattr(
+        async_live_spikes_connection, "SCP_SCAMP_PORT", board.local_port)
+    try:
+        asyncio.run(_run_connection(board))
+    finally:
+        board.close()
+
+
+async def _run_spif_connection(spif):
+    loop = asyncio.get_running_loop()
+    async with AsyncSPIFLiveSpikesConnection(
+            ["pop"], "127.0.0.1", spif.local_port, events_per_packet=16,
+            time_per_packet=100, local_host="127.0.0.1",
+            local_port=None) as connection:
+        # pylint: disable=protected-access
+        await loop.run_in_executor(
+            None, connection._AsyncLiveSpikesConnection__read_database,
+            _DatabaseReader())
+        assert connection.n_neurons("pop") == 50
+
+        # SPIF is configured and started when the simulation starts
+        connection._AsyncLiveSpikesConnection__notify_start_resume()
+        await asyncio.wait_for(connection.wait_for_start(), 5)
+        data, address = await loop.run_in_executor(
+            None, spif.receive_with_address, 5)
+        assert address == connection.local_address
+        assert struct.unpack("<3I", data) == (
+            0x5ec40000 + 64, 0x5ec20000 + 100, 0x5ec00000)
+
+        # Packets of keys are received in batches without times
+        spikes = connection.spikes("pop")
+        keys = _RECEIVE_KEY_BASE + numpy.array([3, 1, 4, 1, 5], dtype="<u4")
+        spif.send_to(keys.tobytes(), address)
+        batch = await asyncio.wait_for(spikes.__anext__(), 5)
+        assert batch.ids.tolist() == [3, 1, 4, 1, 5]
+        assert batch.times is None
+        assert connection.statistics.events_delivered == 5
+
+        # ... and stopped when the simulation stops
+        connection._AsyncLiveSpikesConnection__notify_stop_pause()
+        await asyncio.wait_for(connection.wait_for_stop(), 5)
+        data = await loop.run_in_executor(None, spif.receive, 5)
+        assert struct.unpack("<I", data) == (0x5ec10000, )
+
+
+def test_async_spif_live_spikes():
+    unittest_setup()
+    spif = UDPConnection(local_host="127.0.0.1")
+    try:
+        asyncio.run(_run_spif_connection(spif))
+    finally:
+        spif.close()
@@ -0,0 +1,159 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from queue import Queue
+from threading import Event
+import time
+import numpy
+from spinnman.utilities import utility_functions
+from spinn_front_end_common.utilities.connections import (
+    live_event_connection)
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import (
+    SPIFLiveSpikesConnection, SpynnakerLiveSpikesConnection,
+    SpynnakerPoissonControlConnection)
+from spynnaker.pyNN.external_devices_models.push_bot.ethernet import (
+    PushBotRetinaConnection, PushBotWIFIConnection)
+from .board_stand_in import BoardStandIn, PushBotStandIn, SPIFStandIn
+
+
+def _wait_until_steady(count, timeout=5.0):
+    """ Wait until a count stops changing.
+    """
+    end = time.monotonic() + timeout
+    last = -1
+    while count() != last and time.monotonic() < end:
+        last = count()
+        time.sleep(0.2)
+    return last
+
+
+def _board(monkeypatch, tmp_path):
+    """ Make a board that connections send to in place of the SCAMP port.
+    """
+    board = BoardStandIn(str(tmp_path))
+    monkeypatch.setattr(live_event_connection, "SCP_SCAMP_PORT", board.port)
+    monkeypatch.setattr(utility_functions, "SCP_SCAMP_PORT", board.port)
+    return board
+
+
+def test_live_spikes_echo(monkeypatch, tmp_path):
+    unittest_setup()
+    board = _board(monkeypatch, tmp_path)
+    board.add_population("input", 100)
+    board.add_population("output", 100, live_output=True)
+    board.add_echo("input", "output")
+    connection = SpynnakerLiveSpikesConnection(
+        receive_labels=["output"], send_labels=["input"],
+        local_host="127.0.0.1", local_port=None)
+    received = Queue()
+    connection.add_receive_callback(
+        "output", lambda label, time_step, atom_ids: received.put(atom_ids))
+    try:
+        board.notify_database(connection.local_port)
+        board.notify_start(connection.local_port)
+
+        # Each group of spikes is echoed back before the next is sent
+        rng = numpy.random.default_rng(0)
+        n_spikes = 0
+        for _ in range(200):
+            atom_ids = rng.integers(0, 100, 200)
+            connection.send_spikes("input", atom_ids, send_full_keys=True)
+            echoed = list()
+            while len(echoed) < len(atom_ids):
+                echoed.extend(received.get(timeout=5))
+            assert sorted(echoed) == sorted(atom_ids.tolist())
+            n_spikes += len(atom_ids)
+        assert board.n_spikes_injected["input"] == n_spikes
+        assert connection.statistics.events_delivered == n_spikes
+        board.notify_stop(connection.local_port)
+    finally:
+        connection.close()
+        board.close()
+
+
+def test_spif_stream(monkeypatch, tmp_path):
+    unittest_setup()
+    board = _board(monkeypatch, tmp_path)
+    board.add_population("pop", 1000, live_output=True)
+    spif = SPIFStandIn(board.keys("pop"), rate=500000)
+    connection = SPIFLiveSpikesConnection(
+        ["pop"], "127.0.0.1", spif.port, events_per_packet=64,
+        local_host="127.0.0.1", local_port=None)
+    connection.add_receive_callback("pop", lambda label, atom_ids: None)
+    try:
+        board.notify_database(connection.local_port)
+        board.notify_start(connection.local_port)
+        assert spif.wait_for_events_sent(100000)
+        board.notify_stop(connection.local_port)
+        assert spif.wait_for_stop()
+        n_received = _wait_until_steady(
+            lambda: connection.statistics.events_received)
+        assert 0 < n_received <= spif.n_events_sent
+        assert connection.statistics.unknown_keys == 0
+        assert spif.n_events_sent == spif.n_packets_sent * 64
+    finally:
+        connection.close()
+        spif.close()
+        board.close()
+
+
+def test_poisson_rates(monkeypatch, tmp_path):
+    unittest_setup()
+    board = _board(monkeypatch, tmp_path)
+    board.add_population("poisson_control", 100)
+    connection = SpynnakerPoissonControlConnection(
+        poisson_labels=["poisson"], local_host="127.0.0.1", local_port=None)
+    try:
+        board.notify_database(connection.local_port)
+        board.notify_start(connection.local_port)
+        rates = numpy.linspace(0.0, 99.0, 100)
+        connection.set_rate_arrays("poisson", numpy.arange(100), rates)
+        _wait_until_steady(lambda: board.n_packets_received)
+        assert board.n_packets_received == 4
+        assert numpy.allclose(board.rates["poisson_control"], rates)
+        board.notify_stop(connection.local_port)
+    finally:
+        connection.close()
+        board.close()
+
+
+def test_push_bot_retina(monkeypatch, tmp_path):
+    unittest_setup()
+    board = _board(monkeypatch, tmp_path)
+    board.add_population("retina", 128 * 128 * 2)
+    push_bot = PushBotStandIn(rate=200000)
+    wifi = PushBotWIFIConnection("127.0.0.1", push_bot.port)
+    connection = PushBotRetinaConnection(
+        "retina", wifi, local_host="127.0.0.1", local_port=None,
+        min_events_per_send=127)
+    started = Event()
+    connection.add_start_resume_callback(
+        "retina", lambda label, connection: started.set())
+    try:
+        board.notify_database(connection.local_port)
+        board.notify_start(connection.local_port)
+        assert started.wait(5)
+        push_bot.start_streaming()
+        assert push_bot.wait_for_events_sent(100000)
+        push_bot.stop_streaming()
+        board.notify_stop(connection.local_port)
+        n_injected = _wait_until_steady(
+            lambda: board.n_spikes_injected["retina"])
+        assert 0 < n_injected <= push_bot.n_events_sent
+    finally:
+        connection.close()
+        wifi.close()
+        push_bot.close()
+        board.close()
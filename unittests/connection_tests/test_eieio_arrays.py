@@ -0,0 +1,104 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy
+import pytest
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.eieio import EIEIOType, read_eieio_data_message
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+from spynnaker.pyNN.connections.eieio_arrays import (
+    check_atom_ids, max_elements_per_packet, message_prefix, pack_packets,
+    packed_messages, packet_buffer, packet_prefix, unpack_packet)
+
+
+@pytest.mark.parametrize("eieio_type", list(EIEIOType))
+def test_pack_and_unpack(eieio_type):
+    max_elements = max_elements_per_packet(eieio_type)
+    n_elements = max_elements * 2 + 5
+    rng = numpy.random.default_rng(0)
+    keys = rng.integers(0, eieio_type.max_value, n_elements)
+    payloads = None
+    if eieio_type.payload_bytes:
+        payloads = rng.integers(0, eieio_type.max_value, n_elements)
+    buffer = packet_buffer(n_elements, eieio_type)
+    sizes = pack_packets(
+        buffer, packet_prefix(1, 2, 3, eieio_type), eieio_type, keys,
+        payloads)
+    assert len(sizes) == 3
+    assert all(size - 2 <= 8 + 256 for size in sizes)
+
+    # What spinnman reads is what was packed, and is read the same here
+    read_keys = list()
+    read_payloads = list()
+    for packet, size in enumerate(sizes):
+        data = buffer[packet, :size].tobytes()
+        message = read_eieio_data_message(data, 10)
+        while message.is_next_element:
+            element = message.next_element
+            read_keys.append(element.key)
+            if payloads is not None:
+                read_payloads.append(element.payload)
+        _, unpacked_keys, unpacked_payloads = unpack_packet(data[10:])
+        assert unpacked_keys.tolist() == read_keys[-len(unpacked_keys):]
+        if payloads is not None:
+            assert unpacked_payloads.tolist() == read_payloads[
+                -len(unpacked_payloads):]
+    assert read_keys == keys.tolist()
+    if payloads is not None:
+        assert read_payloads == payloads.tolist()
+
+    # The messages are the packets without the padding and SDP header
+    messages = list(packed_messages(buffer, sizes))
+    assert [message.bytestring for message in messages] == [
+        buffer[packet, 10:size].tobytes()
+        for packet, size in enumerate(sizes)]
+    assert [message.eieio_header.count for message in messages] == [
+        max_elements, max_elements, 5]
+
+
+def test_unpack_prefixes():
+    message = EIEIODataMessage.create(
+        EIEIOType.KEY_16_BIT, key_prefix=0x1234, payload_prefix=99)
+    message.add_key(5)
+    message.add_key(6)
+    header, keys, payloads = unpack_packet(message.bytestring)
+    assert header.count == 2
+    assert keys.tolist() == [0x1234 | 5, 0x1234 | 6]
+    assert payloads.tolist() == [99, 99]
+
+
+def test_message_prefix():
+    keys = numpy.arange(10)
+    buffer = packet_buffer(len(keys), EIEIOType.KEY_32_BIT)
+    sizes = pack_packets(
+        buffer, packet_prefix(1, 2, 3, EIEIOType.KEY_32_BIT),
+        EIEIOType.KEY_32_BIT, keys)
+    with_header = [message.bytestring
+                   for message in packed_messages(buffer, sizes)]
+
+    # Messages packed without an SDP header are the same
+    sizes = pack_packets(
+        buffer, message_prefix(EIEIOType.KEY_32_BIT), EIEIOType.KEY_32_BIT,
+        keys)
+    assert [message.bytestring
+            for message in packed_messages(buffer, sizes)] == with_header
+
+
+def test_check_atom_ids():
+    check_atom_ids(numpy.array([0, 5, 9]), 10)
+    check_atom_ids(numpy.array([], dtype="int64"), 0)
+    for bad_ids in ([-1], [10], [3, 12]):
+        with pytest.raises(SpinnmanInvalidParameterException):
+            check_atom_ids(numpy.array(bad_ids), 10)
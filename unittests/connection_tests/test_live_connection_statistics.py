@@ -0,0 +1,196 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from threading import Event, Thread
+import time
+import numpy
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import (
+    EIEIODataHeader, EIEIODataMessage)
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import (
+    LiveConnectionStatistics, SpynnakerLiveSpikesConnection,
+    SPIFLiveSpikesConnection)
+
+# The keys of the population
+_KEYS = numpy.arange(0x1000, 0x1000 + 100)
+
+
+class _DatabaseReader(object):
+    """ Describes a population sending to SPIF.
+    """
+
+    def get_key_to_atom_id_mapping(self, label):
+        return {key: atom_id for atom_id, key in enumerate(_KEYS.tolist())}
+
+
+def test_counts():
+    statistics = LiveConnectionStatistics()
+    statistics.add_packet(10, 2)
+    statistics.add_packet(5)
+    statistics.add_delivered(8)
+    statistics.add_callback_time(0.001)
+    statistics.add_delivered(5)
+    statistics.add_dropped(3)
+    statistics.change_queue_depth(2)
+    statistics.change_queue_depth(-1)
+    assert statistics.packets_received == 2
+    assert statistics.events_received == 15
+    assert statistics.unknown_keys == 2
+    assert statistics.events_delivered == 13
+    assert statistics.events_dropped == 3
+    assert statistics.queue_depth == 1
+    assert statistics.max_queue_depth == 2
+    assert statistics.callback_time.n_samples == 1
+
+    snapshot = json.loads(statistics.to_json())
+    assert snapshot["packets_received"] == 2
+    assert snapshot["events_received"] == 15
+    assert snapshot["unknown_keys"] == 2
+    assert snapshot["events_delivered"] == 13
+    assert snapshot["events_dropped"] == 3
+    assert snapshot["max_queue_depth"] == 2
+    assert snapshot["callback_time"]["n_samples"] == 1
+    assert snapshot["callback_time"]["max"] == 0.001
+    assert sum(snapshot["callback_time"]["counts"]) == 1
+
+    statistics.reset()
+    assert statistics.packets_received == 0
+    assert statistics.events_received == 0
+    assert statistics.callback_time.n_samples == 0
+    assert statistics.queue_depth == 1
+    assert statistics.max_queue_depth == 1
+    assert not statistics.wait_until_queue_empty(timeout=0.01)
+
+    # Waiters are woken when the queue empties
+    thread = Thread(target=statistics.change_queue_depth, args=(-1, ))
+    thread.start()
+    assert statistics.wait_until_queue_empty(timeout=5)
+    thread.join()
+
+
+def test_live_spikes_counts():
+    unittest_setup()
+    connection = SpynnakerLiveSpikesConnection(
+        receive_labels=["pop"], local_host="127.0.0.1", local_port=None)
+    received = list()
+    try:
+        # As if the database had been read
+        # pylint: disable=protected-access
+        connection._LiveEventConnection__key_to_atom_id_and_label.update({
+            key: (atom_id, 0) for atom_id, key in enumerate(_KEYS.tolist())})
+        # Spikes with times come together, and others one at a time
+        connection.add_receive_callback(
+            "pop", lambda label, *args: received.append(args))
+        connection.add_receive_callback(
+            "pop", lambda label, *args: received.append(args),
+            translate_key=False)
+        receive_packet = connection._LiveEventConnection__do_receive_packet
+
+        # Two known spikes and one unknown, without times
+        message = EIEIODataMessage.create(EIEIOType.KEY_32_BIT)
+        for key in (0x1001, 0x9000, 0x1002):
+            message.add_key(key)
+        receive_packet(message.bytestring)
+
+        # Two spikes with a time
+        header = EIEIODataHeader(
+            EIEIOType.KEY_PAYLOAD_32_BIT, is_time=True, count=2)
+        elements = numpy.array([[0x1003, 7], [0x1004, 7]], dtype="<u4")
+        receive_packet(header.bytestring + elements.tobytes())
+
+        # Commands and SCP responses are not spikes
+        receive_packet(b"\x01\x40")
+        scp_response = bytearray(18)
+        scp_response[2] = 7
+        scp_response[4] = 0xFF
+        receive_packet(bytes(scp_response))
+
+        # Each spike passed on is counted once, whatever the callbacks
+        statistics = connection.statistics
+        assert statistics.events_delivered == 4
+        assert statistics.callback_time.n_samples == 6
+        assert sorted(received[:4]) == [(1, ), (2, ), (0x1001, ), (0x1002, )]
+        assert sorted(received[4:]) == [(7, [3, 4]), (7, [0x1003, 0x1004])]
+    finally:
+        connection.close()
+
+
+def test_spif_stress():
+    unittest_setup()
+    board = UDPConnection(local_host="127.0.0.1")
+    connection = SPIFLiveSpikesConnection(
+        ["pop"], "127.0.0.1", board.local_port, local_host="127.0.0.1",
+        local_port=None)
+    # As if the database had been read
+    # pylint: disable=protected-access
+    connection._SPIFLiveSpikesConnection__init_receivers(
+        _DatabaseReader(), dict())
+    address = ("127.0.0.1",
+               connection._SPIFLiveSpikesConnection__receiver_connection
+               .local_port)
+    # The last atom is only sent in the packets that mark the end
+    end_atom = len(_KEYS) - 1
+    ends = list()
+    ended = Event()
+
+    def callback(label, atoms):
+        # Slower than the packets arrive, so packets queue up
+        time.sleep(0.0002)
+        if atoms[0] == end_atom:
+            ends.append(len(atoms))
+            ended.set()
+
+    try:
+        connection.add_receive_callback("pop", callback)
+
+        # Packets of 64 events as fast as they can be sent, with an unknown
+        # key in each; some may be lost in the socket buffer
+        rng = numpy.random.default_rng(0)
+        packets = _KEYS[rng.integers(0, end_atom, (5000, 64))]
+        packets[:, 0] = 0x9000
+        packets = packets.astype("<u4")
+        for packet in packets:
+            board.send_to(packet.tobytes(), address)
+
+        # Mark the end until the mark is handled, so that everything sent
+        # before it has been read, and then wait for it to be handled
+        end = numpy.full(64, _KEYS[end_atom], dtype="<u4").tobytes()
+        for _ in range(100):
+            board.send_to(end, address)
+            if ended.wait(timeout=0.1):
+                break
+        assert ended.is_set()
+        statistics = connection.statistics
+        assert statistics.wait_until_queue_empty(timeout=30)
+        assert statistics.max_queue_depth >= 64
+
+        # Any end marks still arriving are handled before the close ends
+        connection.close()
+        snapshot = json.loads(statistics.to_json())
+        n_ends = len(ends)
+        n_received = snapshot["packets_received"] - n_ends
+        assert 0 < n_received <= len(packets)
+        assert snapshot["events_received"] == (n_received + n_ends) * 64
+        assert snapshot["unknown_keys"] == n_received
+        assert snapshot["events_delivered"] == (
+            n_received * 63 + n_ends * 64)
+        assert snapshot["callback_time"]["n_samples"] == (
+            n_received + n_ends)
+        assert snapshot["queue_depth"] == 0
+    finally:
+        connection.close()
+        board.close()
@@ -0,0 +1,148 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import numpy
+import pytest
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.eieio import read_eieio_data_message
+from spinnman.messages.sdp import SDPHeader
+from spinn_front_end_common.utilities.connections import (
+    live_event_connection)
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import SpynnakerLiveSpikesConnection
+
+# The keys of the population, which is on two cores
+_KEYS = numpy.concatenate((
+    numpy.arange(0x10000, 0x10000 + 100),
+    numpy.arange(0x20000, 0x20000 + 100)))
+
+
+class _DatabaseReader(object):
+    """ Describes a population on a board on the local host.
+    """
+
+    def get_job(self):
+        return None
+
+    def get_placements(self, label):
+        return [(1, 2, 3)]
+
+    def get_ip_address(self, x, y):
+        return "127.0.0.1"
+
+    def get_atom_id_to_key_mapping(self, label):
+        return {atom_id: key for atom_id, key in enumerate(_KEYS.tolist())}
+
+    def get_configuration_parameter_value(self, name):
+        return 1000.0
+
+
+def _connect(monkeypatch, board):
+    monkeypatch.setattr(
+        live_event_connection, "SCP_SCAMP_PORT", board.local_port)
+    connection = SpynnakerLiveSpikesConnection(
+        send_labels=["pop"], local_host="127.0.0.1", local_port=None)
+    # As if the toolchain had said where the database is
+    # pylint: disable=protected-access
+    for callback in connection._DatabaseConnection__database_callbacks:
+        callback(_DatabaseReader())
+    return connection
+
+
+def _received_keys(board, n_packets):
+    received = list()
+    for _ in range(n_packets):
+        data = board.receive(timeout=5)
+        header = SDPHeader.from_bytestring(data, 2)
+        assert (header.destination_chip_x, header.destination_chip_y,
+                header.destination_cpu) == (1, 2, 3)
+        message = read_eieio_data_message(data, 10)
+        while message.is_next_element:
+            received.append(message.next_element.key)
+    return received
+
+
+def test_send_spikes(monkeypatch):
+    unittest_setup()
+    board = UDPConnection(local_host="127.0.0.1")
+    connection = _connect(monkeypatch, board)
+    try:
+        # Neuron IDs are sent as they are, up to 127 in a packet
+        neuron_ids = numpy.arange(199, -1, -1)
+        connection.send_spikes("pop", neuron_ids)
+        assert _received_keys(board, 2) == neuron_ids.tolist()
+
+        # Full keys are looked up, up to 63 in a packet
+        connection.send_spikes("pop", neuron_ids, send_full_keys=True)
+        assert _received_keys(board, 4) == _KEYS[neuron_ids].tolist()
+
+        # A list sends the same
+        connection.send_spikes("pop", [150, 3], send_full_keys=True)
+        assert _received_keys(board, 1) == [0x20000 + 50, 0x10000 + 3]
+        connection.send_spike("pop", 7)
+        assert _received_keys(board, 1) == [7]
+
+        assert connection.n_spikes_sent == 403
+        assert connection.n_spike_packets_sent == 8
+        assert connection.n_spike_bytes_sent == (
+            8 * 12 + 200 * 2 + 200 * 4 + 2 * 4 + 2)
+
+        # Neuron IDs that don't fit in 16 bits are not cut short
+        with pytest.raises(SpinnmanInvalidParameterException):
+            connection.send_spikes("pop", [5, 70000, 131073])
+
+        # ... and neuron IDs that are not those of the population are not
+        # wrapped
+        for bad_ids in ([-1], [len(_KEYS)], [5, len(_KEYS)]):
+            with pytest.raises(SpinnmanInvalidParameterException):
+                connection.send_spikes("pop", bad_ids, send_full_keys=True)
+        assert connection.n_spikes_sent == 403
+    finally:
+        connection.close()
+        board.close()
+
+
+def test_send_spikes_spread(monkeypatch):
+    unittest_setup()
+    board = UDPConnection(local_host="127.0.0.1")
+    connection = _connect(monkeypatch, board)
+    try:
+        # Four packets, each sent a quarter of the time after the last
+        start = time.perf_counter()
+        connection.send_spikes(
+            "pop", numpy.arange(200), send_full_keys=True, spread_over=0.2)
+        assert time.perf_counter() - start >= 0.15
+        assert _received_keys(board, 4) == _KEYS.tolist()
+    finally:
+        connection.close()
+        board.close()
+
+
+def test_send_many_spikes(monkeypatch):
+    unittest_setup()
+    board = UDPConnection(local_host="127.0.0.1")
+    connection = _connect(monkeypatch, board)
+    rng = numpy.random.default_rng(0)
+    try:
+        for _ in range(100):
+            connection.send_spikes(
+                "pop", rng.integers(0, 200, 2000), send_full_keys=True)
+        assert connection.n_spikes_sent == 200000
+        assert connection.n_spike_packets_sent == 100 * 32
+        assert connection.spike_send_time > 0
+    finally:
+        connection.close()
+        board.close()
@@ -0,0 +1,106 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.eieio import read_eieio_data_message
+from spinnman.messages.sdp import SDPHeader
+from spinn_front_end_common.interface.ds import DataType
+from spinn_front_end_common.utilities.connections import (
+    live_event_connection)
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import SpynnakerPoissonControlConnection
+
+_KEY_BASE = 0x10000
+
+
+class _DatabaseReader(object):
+    """ Describes a Poisson source on a board on the local host.
+    """
+
+    def get_job(self):
+        return None
+
+    def get_placements(self, label):
+        return [(1, 2, 3)]
+
+    def get_ip_address(self, x, y):
+        return "127.0.0.1"
+
+    def get_atom_id_to_key_mapping(self, label):
+        return {i: _KEY_BASE + i for i in range(100)}
+
+    def get_configuration_parameter_value(self, name):
+        return 1000.0
+
+
+def _received_rates(board, n_packets):
+    received = list()
+    for _ in range(n_packets):
+        data = board.receive(timeout=5)
+        header = SDPHeader.from_bytestring(data, 2)
+        assert (header.destination_chip_x, header.destination_chip_y,
+                header.destination_cpu) == (1, 2, 3)
+        message = read_eieio_data_message(data, 10)
+        while message.is_next_element:
+            element = message.next_element
+            received.append((element.key, element.payload))
+    return received
+
+
+def test_set_rate_arrays(monkeypatch):
+    unittest_setup()
+    board = UDPConnection(local_host="127.0.0.1")
+    monkeypatch.setattr(
+        live_event_connection, "SCP_SCAMP_PORT", board.local_port)
+    connection = SpynnakerPoissonControlConnection(
+        poisson_labels=["pop"], local_host="127.0.0.1", local_port=None)
+    try:
+        # As if the toolchain had said where the database is
+        # pylint: disable=protected-access
+        for callback in connection._DatabaseConnection__database_callbacks:
+            callback(_DatabaseReader())
+
+        neuron_ids = numpy.arange(99, 29, -1)
+        rates = numpy.linspace(0.5, 200.0, len(neuron_ids))
+        connection.set_rate_arrays("pop", neuron_ids, rates)
+        expected = list(zip(
+            (_KEY_BASE + neuron_ids).tolist(),
+            DataType.S1615.encode_as_numpy_int_array(rates).tolist()))
+        assert _received_rates(board, 3) == expected
+        assert connection.n_rates_sent == 70
+        assert connection.n_rate_packets_sent == 3
+        assert connection.n_rate_bytes_sent == 2 * 260 + 12 + 8 * 8
+        assert connection.rates_per_second > 0
+
+        # The list of tuples form sends the same
+        connection.set_rates("pop", [(5, 10.0), (6, 20.0)])
+        assert _received_rates(board, 1) == [
+            (_KEY_BASE + 5, DataType.S1615.encode_as_int(10.0)),
+            (_KEY_BASE + 6, DataType.S1615.encode_as_int(20.0))]
+
+        # Neuron IDs that are not those of the source are not wrapped, and
+        # each must have a rate
+        for bad_ids in ([-1], [100], [5, 100]):
+            with pytest.raises(SpinnmanInvalidParameterException):
+                connection.set_rate_arrays(
+                    "pop", bad_ids, [1.0] * len(bad_ids))
+        with pytest.raises(SpinnmanInvalidParameterException):
+            connection.set_rate_arrays("pop", [5, 6], [1.0])
+        assert connection.n_rates_sent == 72
+    finally:
+        connection.close()
+        board.close()
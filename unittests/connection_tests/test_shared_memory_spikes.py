@@ -0,0 +1,145 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import json
+import subprocess
+import sys
+from threading import Thread
+import numpy
+from spynnaker.pyNN.connections import SpikeBatch
+from spynnaker.pyNN.connections.shared_memory_spikes import (
+    NO_TIME, SharedMemorySpikeReader, SharedMemorySpikeWriter)
+
+_READER = """
+import json, sys
+from spynnaker.pyNN.connections.shared_memory_spikes import (
+    SharedMemorySpikeReader)
+reader = SharedMemorySpikeReader(sys.argv[1])
+print("ready", flush=True)
+events = reader.wait(timeout=10)
+print(json.dumps([reader.labels, events.times.tolist(),
+                  events.atom_ids.tolist(), events.label_ids.tolist()]))
+reader.close()
+"""
+
+
+def test_write_and_read():
+    writer = SharedMemorySpikeWriter(None, ["a", "b"], capacity=8)
+    reader = SharedMemorySpikeReader(writer.name)
+    try:
+        assert reader.labels == ["a", "b"]
+        writer.write("a", 5, [1, 2, 3])
+        writer.receive_callback("b", 6, [4, 5, 6, 7])
+        events = reader.read()
+        assert events.times.tolist() == [5, 5, 5, 6, 6, 6, 6]
+        assert events.atom_ids.tolist() == [1, 2, 3, 4, 5, 6, 7]
+        assert events.label_ids.tolist() == [0, 0, 0, 1, 1, 1, 1]
+        assert len(reader.read().times) == 0
+
+        # More than fit; the oldest are lost, and the rest wrap around
+        writer.write("a", numpy.arange(10), numpy.arange(100, 110))
+        events = reader.read()
+        assert reader.n_lost == 2
+        assert events.atom_ids.tolist() == list(range(102, 110))
+        assert events.times.tolist() == list(range(2, 10))
+        assert writer.n_written == 17
+
+        # More than fit in one write
+        writer.write("b", 7, numpy.arange(20))
+        assert reader.wait(timeout=1).atom_ids.tolist() == list(range(12, 20))
+        assert reader.n_lost == 14
+        assert len(reader.wait(timeout=0.01).times) == 0
+    finally:
+        reader.close()
+        writer.close()
+
+
+def _race_times(atom_ids):
+    return (atom_ids * 2654435761) & 0xFFFFFFFF
+
+
+def test_race_writer_and_reader():
+    # Small batches in a small buffer, so that the writer often overwrites
+    # events while the reader is copying them
+    n_batches = 5000
+    batch_size = 13
+    writer = SharedMemorySpikeWriter(None, ["a", "b"], capacity=32)
+    reader = SharedMemorySpikeReader(writer.name)
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def write():
+        for batch in range(n_batches):
+            atom_ids = numpy.arange(
+                batch * batch_size, (batch + 1) * batch_size, dtype="int64")
+            writer.write(["a", "b"][batch % 2], _race_times(atom_ids),
+                         atom_ids)
+
+    try:
+        thread = Thread(target=write)
+        thread.start()
+        read = list()
+        while thread.is_alive():
+            read.append(reader.read())
+        thread.join()
+        read.append(reader.read())
+        atom_ids = numpy.concatenate([events.atom_ids for events in read])
+        times = numpy.concatenate([events.times for events in read])
+        label_ids = numpy.concatenate([events.label_ids for events in read])
+
+        # Every event is read whole, once and in order, or counted as lost
+        assert len(atom_ids)
+        assert numpy.all(numpy.diff(atom_ids.astype("int64")) > 0)
+        assert numpy.array_equal(times, _race_times(atom_ids))
+        assert numpy.array_equal(label_ids, (atom_ids // batch_size) % 2)
+        assert len(atom_ids) + reader.n_lost == n_batches * batch_size
+    finally:
+        sys.setswitchinterval(switch_interval)
+        reader.close()
+        writer.close()
+
+
+class _Connection(object):
+    async def spikes(self, label):
+        yield SpikeBatch(numpy.array([1, 2]), None)
+        yield SpikeBatch(numpy.array([3]), numpy.array([9]))
+
+
+def test_write_from_connection():
+    writer = SharedMemorySpikeWriter(None, ["a"], capacity=8)
+    reader = SharedMemorySpikeReader(writer.name)
+    try:
+        asyncio.run(writer.write_from(_Connection(), "a"))
+        events = reader.read()
+        assert events.atom_ids.tolist() == [1, 2, 3]
+        assert events.times.tolist() == [NO_TIME, NO_TIME, 9]
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_read_in_other_process():
+    writer = SharedMemorySpikeWriter(None, ["a", "b"])
+    try:
+        with subprocess.Popen(
+                [sys.executable, "-c", _READER, writer.name],
+                stdout=subprocess.PIPE, text=True) as process:
+            assert process.stdout.readline().strip() == "ready"
+            writer.write("b", 3, [7, 8])
+            output, _ = process.communicate(timeout=20)
+        assert json.loads(output) == [["a", "b"], [3, 3], [7, 8], [1, 1]]
+    finally:
+        writer.close()
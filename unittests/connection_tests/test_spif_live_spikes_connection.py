@@ -0,0 +1,122 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from queue import Queue
+import numpy
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import SPIFLiveSpikesConnection
+from spynnaker.pyNN.connections.key_to_atom_table import (
+    KeyToAtomTable, group_by_label)
+
+# The keys of the first population, which is on two cores
+_KEYS_A = numpy.concatenate((
+    numpy.arange(0x1000, 0x1000 + 50), numpy.arange(0x2000, 0x2000 + 50)))
+
+# The keys of the second population
+_KEYS_B = numpy.arange(0x3000, 0x3000 + 10)
+
+
+class _DatabaseReader(object):
+    """ Describes two populations sending to SPIF.
+    """
+
+    def get_key_to_atom_id_mapping(self, label):
+        keys = _KEYS_A if label == "a" else _KEYS_B
+        return {key: atom_id for atom_id, key in enumerate(keys.tolist())}
+
+
+def _connect(board, labels):
+    connection = SPIFLiveSpikesConnection(
+        labels, "127.0.0.1", board.local_port, local_host="127.0.0.1",
+        local_port=None)
+    # As if the database had been read
+    # pylint: disable=protected-access
+    connection._SPIFLiveSpikesConnection__init_receivers(
+        _DatabaseReader(), dict())
+    address = ("127.0.0.1",
+               connection._SPIFLiveSpikesConnection__receiver_connection
+               .local_port)
+    return connection, address
+
+
+def test_receive_atoms():
+    unittest_setup()
+    board = UDPConnection(local_host="127.0.0.1")
+    connection, address = _connect(board, ["a", "b"])
+    received = Queue()
+    try:
+        connection.add_receive_callback(
+            "a", lambda label, atoms: received.put((label, atoms)))
+        connection.add_receive_callback(
+            "b", lambda label, keys: received.put((label, keys)),
+            translate_key=False)
+
+        # Mixed labels and an unknown key
+        keys = numpy.array(
+            [0x1003, 0x3002, 0x2000, 0x4000, 0x1031, 0x3009], dtype="<u4")
+        board.send_to(keys.tobytes(), address)
+        events = dict(received.get(timeout=5) for _ in range(2))
+        assert events["a"].tolist() == [3, 50, 49]
+        assert events["b"].tolist() == [0x3002, 0x3009]
+        assert received.empty()
+    finally:
+        connection.close()
+        board.close()
+
+
+def test_receive_full_packets():
+    unittest_setup()
+    board = UDPConnection(local_host="127.0.0.1")
+    connection, address = _connect(board, ["a"])
+    counts = Queue()
+    try:
+        connection.add_receive_callback(
+            "a", lambda label, atoms: counts.put(
+                (len(atoms), int(atoms.sum()))))
+
+        # Packets as SPIF would send them, of 64 events each (the most that
+        # fit in what the connection reads), sent in bursts that fit in the
+        # socket buffer so that none are dropped
+        rng = numpy.random.default_rng(0)
+        packets = _KEYS_A[rng.integers(0, len(_KEYS_A), (200, 50, 64))]
+        packets = packets.astype("<u4")
+        n_events = 0
+        atom_sum = 0
+        for n_bursts, burst in enumerate(packets, start=1):
+            for packet in burst:
+                board.send_to(packet.tobytes(), address)
+            while n_events < n_bursts * burst.size:
+                n, total = counts.get(timeout=5)
+                n_events += n
+                atom_sum += total
+        atom_ids = numpy.searchsorted(
+            numpy.sort(_KEYS_A), packets.astype("int64"))
+        assert n_events == packets.size
+        assert atom_sum == int(atom_ids.sum())
+    finally:
+        connection.close()
+        board.close()
+
+
+def test_group_by_label():
+    keys = numpy.array([5, 6, 7, 8])
+    groups = [(label_id, values.tolist()) for label_id, values in
+              group_by_label(numpy.array([1, 0, 1, 0]), keys)]
+    assert groups == [(0, [6, 8]), (1, [5, 7])]
+
+    # A packet with no keys has no labels, even when there are several
+    table = KeyToAtomTable([{0x1000: 0}, {0x2000: 0}])
+    _, atom_ids, label_ids = table.translate(keys[:0])
+    assert list(group_by_label(label_ids, keys[:0], atom_ids)) == []
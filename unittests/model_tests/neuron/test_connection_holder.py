@@ -163,3 +163,66 @@ def test_connection_holder_matrix_multiple_items():
         [(0, 0, 1, 10), (0, 0, 2, 20), (0, 1, 3, 30)],
         AbstractSDRAMSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
     connection_holder.add_connections(connections)
+
+
+@pytest.mark.parametrize("multiple_synapses, expected", [
+    ("last", 2), ("first", 1), ("sum", 3), ("min", 1), ("max", 2)])
+def test_connection_holder_multiple_synapses(multiple_synapses, expected):
+    unittest_setup()
+    connections = numpy.array(
+        [(1, 0, 3, 30), (0, 0, 1, 10), (0, 0, 2, 20)],
+        AbstractSDRAMSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+    for data_format in ("array", "sparse"):
+        connection_holder = ConnectionHolder(
+            data_items_to_return=["weight"], as_list=False, n_pre_atoms=2,
+            n_post_atoms=2, data_format=data_format,
+            multiple_synapses=multiple_synapses)
+        connection_holder.add_connections(connections)
+        matrix = connection_holder[:, :]
+        if data_format == "sparse":
+            assert matrix.nnz == 2
+            matrix = matrix.toarray()
+        assert matrix[0, 0] == expected
+        assert matrix[1, 0] == 3
+
+
+def test_connection_holder_sparse_multiple_items():
+    unittest_setup()
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight", "delay", "test"], as_list=False,
+        n_pre_atoms=3, n_post_atoms=4, fixed_values=[("test", 100)],
+        data_format="sparse")
+    connection_holder.add_connections(numpy.array(
+        [(2, 3, 1, 10), (0, 1, 2, 20)],
+        AbstractSDRAMSynapseDynamics.NUMPY_CONNECTORS_DTYPE))
+    weights, delays, test = connection_holder
+    assert weights.shape == (3, 4)
+    assert weights[2, 3] == 1
+    assert delays[0, 1] == 20
+    assert test[0, 1] == 100
+    assert weights.nnz == delays.nnz == test.nnz == 2
+
+
+def test_connection_holder_structured():
+    unittest_setup()
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["source", "target", "weight"], as_list=False,
+        n_pre_atoms=2, n_post_atoms=2, data_format="structured")
+    connections = numpy.array(
+        [(1, 0, 3, 30), (0, 0, 1, 10), (0, 1, 2, 20)],
+        AbstractSDRAMSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+    connection_holder.add_connections(connections)
+    assert connection_holder.dtype.names == ("source", "target", "weight")
+    assert len(connection_holder) == 3
+    assert numpy.array_equal(
+        connection_holder["weight"], connections["weight"])
+
+
+def test_connection_holder_bad_format():
+    unittest_setup()
+    with pytest.raises(ValueError):
+        ConnectionHolder(
+            None, False, 2, 2, data_format="dense")
+    with pytest.raises(ValueError):
+        ConnectionHolder(
+            None, False, 2, 2, multiple_synapses="average")
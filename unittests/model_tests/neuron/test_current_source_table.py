@@ -0,0 +1,53 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy
+# pylint: disable=protected-access
+from spynnaker.pyNN.models.neuron.population_machine_neurons import (
+    _neurons_on_core, _neuron_current_source_table)
+
+
+def _reference_table(id_lists, cs_ids, cs_indices, lo_atom, hi_atom):
+    """ The table built one neuron at a time, as it used to be.
+    """
+    table = list()
+    for n in range(lo_atom, hi_atom + 1):
+        sources = [i for i, ids in enumerate(id_lists) if n in ids]
+        table.append(len(sources))
+        for i in sources:
+            table.extend([cs_ids[i], cs_indices[i]])
+    return table
+
+
+def test_neurons_on_core():
+    mask = _neurons_on_core([0, 3, 5, 5, 9, 12], 3, 9)
+    assert list(mask) == [True, False, True, False, False, False, True]
+    assert not numpy.any(_neurons_on_core([], 3, 9))
+
+
+def test_table_matches_reference():
+    rng = numpy.random.default_rng(3)
+    lo_atom, hi_atom = 100, 163
+    id_lists = [list(range(0, 1000))]
+    for _ in range(5):
+        id_lists.append(list(rng.choice(
+            200, size=int(rng.integers(1, 80)), replace=False)))
+    cs_ids = numpy.array([1, 2, 2, 3, 4, 4], dtype="uint32")
+    cs_indices = numpy.array([0, 0, 1, 0, 0, 1], dtype="uint32")
+    masks = numpy.array([
+        _neurons_on_core(ids, lo_atom, hi_atom) for ids in id_lists])
+    table = _neuron_current_source_table(masks, cs_ids, cs_indices)
+    assert list(table) == _reference_table(
+        id_lists, cs_ids, cs_indices, lo_atom, hi_atom)
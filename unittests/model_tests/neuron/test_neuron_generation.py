@@ -0,0 +1,48 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pyNN.spiNNaker as sim
+from pacman.model.graphs.common import Slice
+from spinnaker_testbase import BaseTestCase
+
+
+class TestNeuronGeneration(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_piecewise_values_generated(self):
+        sim.setup(1.0)
+        pop = sim.Population(100, sim.IF_curr_exp(), label="pop")
+        pop.set(tau_m=numpy.repeat([10.0, 15.0, 20.0, 25.0], 25))
+        pop.initialize(v=sim.RandomDistribution("uniform", (-70, -60)))
+        # pylint: disable=protected-access
+        vertex = pop._vertex
+        self.assertTrue(vertex.parameters["tau_m"].is_dense)
+        self.assertTrue(vertex.can_generate_on_machine())
+
+        # The generator data of a core has one range for each value
+        ranges = list(vertex.parameters["tau_m"].iter_ranges_by_ids(
+            Slice(20, 59).get_raster_ids()))
+        self.assertEqual(ranges, [
+            (20, 25, 10.0), (25, 50, 15.0), (50, 60, 20.0)])
+        sim.end()
+
+    def test_heterogeneous_values_written(self):
+        sim.setup(1.0)
+        pop = sim.Population(100, sim.IF_curr_exp(), label="pop")
+        pop.set(tau_m=numpy.linspace(10.0, 20.0, 100))
+        # pylint: disable=protected-access
+        self.assertFalse(pop._vertex.can_generate_on_machine())
+        sim.end()
@@ -0,0 +1,55 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.synapse_dynamics.\
+    synapse_dynamics_structural_common import _get_post_to_pre_table
+
+_EMPTY = 0xFFFFFFFF
+
+
+def _entry(pop, subpop, source):
+    return pop | (subpop << 8) | (source << 16)
+
+
+def test_post_to_pre_table():
+    unittest_setup()
+    pops = numpy.array([0, 1, 0, 1, 0])
+    subpops = numpy.array([2, 0, 1, 3, 0])
+    sources = numpy.array([5, 6, 7, 8, 300])
+    targets = numpy.array([2, 0, 2, 2, 0])
+    table = _get_post_to_pre_table(pops, subpops, sources, targets, 4, 3)
+    assert table.dtype == numpy.uint32
+    assert list(table.reshape(4, 3)[0]) == [
+        _EMPTY, _entry(1, 0, 6), _entry(0, 0, 300)]
+    assert list(table.reshape(4, 3)[1]) == [_EMPTY] * 3
+    assert list(table.reshape(4, 3)[2]) == [
+        _entry(0, 2, 5), _entry(0, 1, 7), _entry(1, 3, 8)]
+    assert list(table.reshape(4, 3)[3]) == [_EMPTY] * 3
+
+
+def test_post_to_pre_table_empty():
+    unittest_setup()
+    empty = numpy.zeros(0, dtype="uint32")
+    table = _get_post_to_pre_table(empty, empty, empty, empty, 3, 2)
+    assert list(table) == [_EMPTY] * 6
+
+
+def test_post_to_pre_table_too_many():
+    unittest_setup()
+    ones = numpy.ones(3, dtype="uint32")
+    with pytest.raises(ValueError):
+        _get_post_to_pre_table(ones, ones, ones, ones, 2, 2)
@@ -0,0 +1,45 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pyNN.spiNNaker as sim
+from spinnaker_testbase import BaseTestCase
+
+
+class TestRingBufferShifts(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_shifts_cached_until_projection_added(self):
+        sim.setup(1.0)
+        pre = sim.Population(100, sim.SpikeSourceArray(), label="pre")
+        post = sim.Population(10, sim.IF_curr_exp(), label="post")
+        sim.Projection(
+            pre, post, sim.AllToAllConnector(),
+            sim.StaticSynapse(weight=sim.RandomDistribution(
+                "uniform", low=0.5, high=1.5), delay=sim.RandomDistribution(
+                "uniform", low=1, high=10)))
+        # pylint: disable=protected-access
+        vertex = post._vertex
+        shifts = vertex.get_ring_buffer_shifts()
+        self.assertEqual(shifts, vertex.get_ring_buffer_shifts())
+        self.assertEqual(shifts[1], 0)
+
+        sim.Projection(
+            pre, post, sim.AllToAllConnector(),
+            sim.StaticSynapse(weight=2.0, delay=1),
+            receptor_type="inhibitory")
+        new_shifts = vertex.get_ring_buffer_shifts()
+        self.assertEqual(shifts[0], new_shifts[0])
+        self.assertGreater(new_shifts[1], 0)
+        sim.end()
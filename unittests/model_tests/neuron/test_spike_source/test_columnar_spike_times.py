@@ -0,0 +1,99 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from testfixtures import LogCapture
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.models.spike_source import (
+    ColumnarSpikeTimes, SpikeSourceArrayVertex)
+
+
+def _vertex(n_neurons, spike_times):
+    return SpikeSourceArrayVertex(
+        n_neurons=n_neurons, spike_times=spike_times, label="test",
+        max_atoms_per_core=None, model=None, splitter=None,
+        n_colour_bits=None)
+
+
+def _sent_keys(app_vertex, vertex_slice):
+    machine_vertex = app_vertex.create_machine_vertex(vertex_slice, None)
+    # pylint: disable=protected-access
+    machine_vertex._fill_send_buffer()
+    send_buffer = machine_vertex._send_buffer
+    if send_buffer is None:
+        return {}
+    return {timestamp: sorted(send_buffer._buffer[timestamp])
+            for timestamp in send_buffer.timestamps}
+
+
+def test_columns():
+    unittest_setup()
+    times = ColumnarSpikeTimes(
+        numpy.array([3, 0, 3, 1]), numpy.array([5.0, 2.0, 1.0, 7.0]))
+    assert len(times) == 4
+    assert times.n_spikes == 4
+    assert list(times[3]) == [1.0, 5.0]
+    assert list(times[2]) == []
+    assert list(times.counts) == [1, 1, 0, 2]
+    assert list(times.neuron_ids) == [0, 1, 3, 3]
+    selected = times[[3, 0]]
+    assert [list(t) for t in selected] == [[1.0, 5.0], [2.0]]
+    assert [list(t) for t in times[1:3]] == [[7.0], []]
+
+    structured = numpy.array(
+        [(1, 4.0), (0, 3.0)], dtype=[("id", "int32"), ("time", "float64")])
+    times = ColumnarSpikeTimes(structured).with_n_neurons(3)
+    assert [list(t) for t in times] == [[3.0], [4.0], []]
+    with pytest.raises(ValueError):
+        times.with_n_neurons(1)
+    with pytest.raises(ValueError):
+        ColumnarSpikeTimes(numpy.array([-1]), numpy.array([1.0]))
+
+
+def test_send_buffer_matches_lists():
+    unittest_setup()
+    writer = SpynnakerDataWriter.mock()
+    writer.increment_current_run_timesteps(40)
+    rng = numpy.random.default_rng(9)
+    n_neurons = 12
+    ids = rng.integers(0, 10, 300)
+    times = rng.integers(0, 50, 300).astype(float)
+    lists = [list(times[ids == i]) for i in range(n_neurons)]
+    columns = _vertex(n_neurons, ColumnarSpikeTimes(ids, times))
+    listed = _vertex(n_neurons, lists)
+
+    for vertex_slice in (Slice(0, 11), Slice(2, 8), Slice(10, 11)):
+        assert (_sent_keys(columns, vertex_slice) ==
+                _sent_keys(listed, vertex_slice))
+        assert (columns.get_sdram_used_by_atoms(vertex_slice) ==
+                listed.get_sdram_used_by_atoms(vertex_slice))
+    assert list(columns.get_parameter_values("spike_times")[4]) == sorted(
+        lists[4])
+
+    # Setting times for some neurons makes the times lists again
+    columns.set_parameter_values("spike_times", [1, 2], [0, 1])
+    values = columns.get_parameter_values("spike_times", [0, 1, 2])
+    assert [list(v) for v in values] == [[1, 2], [1, 2], sorted(lists[2])]
+
+
+def test_density():
+    unittest_setup()
+    with LogCapture() as lc:
+        _vertex(200, ColumnarSpikeTimes(numpy.arange(200), numpy.full(
+            200, 15.0)))
+        assert any("too many spikes" in str(record.msg) and
+                   "200" in str(record.msg) for record in lc.records)
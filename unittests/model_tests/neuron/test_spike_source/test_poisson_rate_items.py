@@ -0,0 +1,132 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from spinn_utilities.ranged import RangeDictionary, RangedList
+from spynnaker.pyNN.config_setup import unittest_setup
+# pylint: disable=protected-access
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_machine_vertex \
+    import _rate_items, _u3232_to_uint64, _values_of_ids
+
+
+def _reference_items(data, ids):
+    """ The items built one range at a time, as they used to be.
+    """
+    data_items = list()
+    n_items = 0
+    for (start, stop, item) in data.iter_ranges_by_ids(ids):
+        items = numpy.dstack(
+            (_u3232_to_uint64(item['rates']),
+             _u3232_to_uint64(item['starts']),
+             _u3232_to_uint64(item['durations'])))[0]
+        data_items.extend([[stop - start], [len(items)], [0],
+                           numpy.ravel(items).view("uint32")])
+        n_items += 1
+    return n_items, numpy.concatenate(data_items).astype("uint32")
+
+
+def _items(data, ids):
+    ids = numpy.asarray(ids)
+    return _rate_items(
+        _values_of_ids(data["rates"], ids),
+        _values_of_ids(data["starts"], ids),
+        _values_of_ids(data["durations"], ids), ids)
+
+
+def _schedules(rng, n_sources, max_n_rates):
+    rates = list()
+    starts = list()
+    durations = list()
+    for _ in range(n_sources):
+        n_rates = int(rng.integers(1, max_n_rates + 1))
+        rates.append(rng.integers(0, 3, n_rates).astype(float) * 2.5)
+        starts.append(numpy.arange(n_rates) * 10.0)
+        durations.append(numpy.full(n_rates, 10.0))
+    return rates, starts, durations
+
+
+def _data(n_sources, rates, starts, durations):
+    data = RangeDictionary(n_sources)
+    data["rates"] = RangedList(
+        n_sources, rates, use_list_as_value=not hasattr(rates[0], "__len__"))
+    data["starts"] = RangedList(
+        n_sources, starts,
+        use_list_as_value=not hasattr(starts[0], "__len__"))
+    data["durations"] = RangedList(
+        n_sources, durations,
+        use_list_as_value=not hasattr(durations[0], "__len__"))
+    return data
+
+
+def test_one_rate_for_all():
+    unittest_setup()
+    data = _data(20, numpy.array([5.0]), numpy.array([0.0]),
+                 numpy.array([100.0]))
+    n_items, items = _items(data, range(3, 17))
+    assert n_items == 1
+    assert list(items[:3]) == [14, 1, 0]
+    ref_n_items, ref_items = _reference_items(data, range(3, 17))
+    assert n_items == ref_n_items
+    assert numpy.array_equal(items, ref_items)
+
+
+def test_matches_reference():
+    unittest_setup()
+    rng = numpy.random.default_rng(11)
+    n_sources = 200
+    rates, starts, durations = _schedules(rng, n_sources, 3)
+    # Some runs of neighbours with the same schedule, and some with the
+    # same rates but different starts
+    for i in range(20, 30):
+        rates[i], starts[i], durations[i] = rates[19], starts[19], \
+            durations[19]
+    rates[31] = rates[30]
+    starts[31] = starts[30] + 1
+    durations[31] = durations[30]
+    data = _data(n_sources, rates, starts, durations)
+
+    # Ranges of the same values set across the sources
+    data["durations"].set_value_by_slice(
+        100, 150, numpy.array([5.0, 5.0, 5.0]), use_list_as_value=True)
+    data["rates"].set_value_by_slice(
+        100, 150, numpy.array([1.0, 2.0, 3.0]), use_list_as_value=True)
+    data["starts"].set_value_by_slice(
+        100, 150, numpy.array([0.0, 5.0, 10.0]), use_list_as_value=True)
+
+    for ids in (range(0, n_sources), range(15, 160),
+                [0, 1, 2, 20, 21, 22, 100, 101, 149, 150]):
+        n_items, items = _items(data, ids)
+        ref_n_items, ref_items = _reference_items(data, ids)
+        assert n_items == ref_n_items
+        assert numpy.array_equal(items, ref_items)
+
+
+def test_rate_items_many_sources():
+    """ Builds the items of many sources with 100-entry schedules that are
+        all different, as they would be built one range at a time.
+    """
+    unittest_setup()
+    rng = numpy.random.default_rng(5)
+    n_sources = 2000
+    n_rates = 100
+    rates = [rng.random(n_rates) * 100.0 for _ in range(n_sources)]
+    starts = [numpy.arange(n_rates) * 10.0] * n_sources
+    durations = [numpy.full(n_rates, 10.0)] * n_sources
+    data = _data(n_sources, rates, starts, durations)
+    ids = numpy.arange(n_sources)
+
+    ref_n_items, ref_items = _reference_items(data, ids)
+    n_items, items = _items(data, ids)
+    assert n_items == ref_n_items == n_sources
+    assert numpy.array_equal(items, ref_items)
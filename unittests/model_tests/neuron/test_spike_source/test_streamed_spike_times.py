@@ -0,0 +1,95 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.models.spike_source import (
+    ColumnarSpikeTimes, SpikeSourceArrayVertex, StreamedSpikeTimes)
+# pylint: disable=protected-access
+from spynnaker.pyNN.models.spike_source import streamed_spike_times
+
+
+def _vertex(n_neurons, spike_times):
+    return SpikeSourceArrayVertex(
+        n_neurons=n_neurons, spike_times=spike_times, label="test",
+        max_atoms_per_core=4, model=None, splitter=None, n_colour_bits=None)
+
+
+def _sent_keys(machine_vertex):
+    machine_vertex._fill_send_buffer()
+    send_buffer = machine_vertex._send_buffer
+    if send_buffer is None:
+        return {}
+    return {timestamp: sorted(send_buffer._buffer[timestamp])
+            for timestamp in send_buffer.timestamps}
+
+
+def _spikes(n_spikes, n_neurons, seed):
+    rng = numpy.random.default_rng(seed)
+    spikes = numpy.zeros(
+        n_spikes, dtype=[("id", "uint32"), ("time", "float64")])
+    spikes["id"] = rng.integers(0, n_neurons, n_spikes)
+    spikes["time"] = numpy.sort(rng.integers(0, 80, n_spikes)).astype(float)
+    return spikes
+
+
+def test_matches_columns(tmp_path, monkeypatch):
+    unittest_setup()
+    writer = SpynnakerDataWriter.mock()
+    # Scan the file in small chunks, to include the chunk boundaries
+    monkeypatch.setattr(streamed_spike_times, "_CHUNK_SPIKES", 50)
+    n_neurons = 10
+    spikes = _spikes(400, n_neurons, 4)
+    file_name = str(tmp_path / "spikes.npy")
+    numpy.save(file_name, spikes)
+    streamed = _vertex(n_neurons, StreamedSpikeTimes(file_name))
+    columns = _vertex(n_neurons, ColumnarSpikeTimes(spikes))
+
+    slices = [Slice(0, 3), Slice(4, 7), Slice(8, 9)]
+    for vertex_slice in slices:
+        assert (streamed.get_sdram_used_by_atoms(vertex_slice) ==
+                columns.get_sdram_used_by_atoms(vertex_slice))
+    streamed_vertices = [
+        streamed.create_machine_vertex(vertex_slice, None)
+        for vertex_slice in slices]
+    column_vertices = [
+        columns.create_machine_vertex(vertex_slice, None)
+        for vertex_slice in slices]
+
+    # Each run sends the spikes of its time steps
+    for n_steps in (30, 50):
+        writer.increment_current_run_timesteps(n_steps)
+        for streamed_vertex, column_vertex in zip(
+                streamed_vertices, column_vertices):
+            keys = _sent_keys(streamed_vertex)
+            assert keys == _sent_keys(column_vertex)
+            first = SpynnakerDataWriter.get_first_machine_time_step()
+            assert keys and all(
+                first <= tick < first + n_steps for tick in keys)
+
+    values = streamed.get_parameter_values("spike_times")
+    assert [list(v) for v in values] == [
+        sorted(spikes["time"][spikes["id"] == i]) for i in range(n_neurons)]
+
+
+def test_not_sorted():
+    unittest_setup()
+    SpynnakerDataWriter.mock()
+    spikes = _spikes(20, 4, 5)[::-1]
+    vertex = _vertex(4, StreamedSpikeTimes(spikes))
+    with pytest.raises(ValueError):
+        vertex.get_sdram_used_by_atoms(Slice(0, 3))
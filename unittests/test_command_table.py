@@ -0,0 +1,116 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spinn_front_end_common.utility_models import MultiCastCommand
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.external_devices_models.push_bot.parameters import (
+    PushBotLED, PushBotMotor)
+from spynnaker.pyNN.external_devices_models.push_bot.ethernet import (
+    PushBotEthernetLEDDevice, PushBotEthernetMotorDevice)
+from spynnaker.pyNN.protocols import (
+    CommandTable, MunichIoSpiNNakerLinkProtocol, MUNICH_MODES)
+from spynnaker.pyNN.protocols import command_table
+
+
+def _as_tuples(commands):
+    return [(command.key, command.payload, command.time, command.repeat,
+             command.delay_between_repeats) for command in commands]
+
+
+def test_arrays():
+    commands = [
+        MultiCastCommand(0x10), MultiCastCommand(0x20, payload=7, time=3),
+        MultiCastCommand(0x30, payload=0, repeat=5,
+                         delay_between_repeats=100)]
+    table = CommandTable(commands)
+    assert len(table) == 3
+    assert table.keys.tolist() == [0x10, 0x20, 0x30]
+    assert table.payloads.tolist() == [0, 7, 0]
+    assert table.has_payload.tolist() == [False, True, True]
+    assert table.repeats.tolist() == [0, 0, 5]
+    assert table.delays.tolist() == [0, 0, 100]
+    assert table.times.tolist() == [-1, 3, -1]
+    assert _as_tuples(table.commands) == _as_tuples(commands)
+    assert table == CommandTable(table.commands)
+    assert hash(table) == hash(CommandTable(table.commands))
+    assert table != CommandTable(commands[:2])
+
+
+def test_reuse():
+    CommandTable.clear_cache()
+    made = list()
+
+    def make_commands():
+        made.append(True)
+        return [MultiCastCommand(0x10)]
+
+    table = CommandTable.get(("test", 1), make_commands)
+    assert CommandTable.get(("test", 1), make_commands) is table
+    assert CommandTable.get(("test", 2), make_commands) is not table
+    assert len(made) == 2
+
+    # The list returned can be changed without changing the table
+    table.commands.append(MultiCastCommand(0x20))
+    assert len(table.commands) == 1
+
+    # ... but the commands in it are shared, so can't be
+    with pytest.raises(ConfigurationException):
+        table.commands[0].payload = 3
+    assert not table.commands[0].is_payload
+
+
+def test_cache_bounded(monkeypatch):
+    CommandTable.clear_cache()
+    monkeypatch.setattr(command_table, "_MAX_TABLES", 2)
+    first = CommandTable.get(1, lambda: [MultiCastCommand(0x10)])
+    CommandTable.get(2, lambda: [MultiCastCommand(0x20)])
+    assert CommandTable.get(1, list) is first
+
+    # Making another table forgets those made so far
+    CommandTable.get(3, lambda: [MultiCastCommand(0x30)])
+    assert len(CommandTable.get(1, list)) == 0
+    CommandTable.clear_cache()
+
+
+def test_push_bot_devices():
+    unittest_setup()
+    CommandTable.clear_cache()
+    protocol = MunichIoSpiNNakerLinkProtocol(MUNICH_MODES.PUSH_BOT)
+    protocol.set_mode()
+    motor = PushBotEthernetMotorDevice(
+        PushBotMotor.MOTOR_0_PERMANENT, protocol)
+    led = PushBotEthernetLEDDevice(
+        PushBotLED.LED_FRONT_ACTIVE_TIME, protocol, start_total_period=100,
+        start_frequency=20)
+    assert _as_tuples(motor.start_resume_commands) == _as_tuples(
+        [protocol.generic_motor_enable()])
+    assert _as_tuples(motor.pause_stop_commands) == _as_tuples(
+        [protocol.generic_motor_disable()])
+    assert _as_tuples(led.start_resume_commands) == _as_tuples([
+        protocol.push_bot_led_total_period(100),
+        protocol.push_bot_led_set_frequency(20)])
+
+    # Devices with the same configuration share tables
+    other_led = PushBotEthernetLEDDevice(
+        PushBotLED.LED_BACK_ACTIVE_TIME, protocol, start_total_period=100,
+        start_frequency=20)
+    assert other_led.start_resume_commands[0] is led.start_resume_commands[0]
+
+    # ... but not with a different protocol instance
+    other_protocol = MunichIoSpiNNakerLinkProtocol(MUNICH_MODES.PUSH_BOT)
+    other_led.set_command_protocol(other_protocol)
+    assert (other_led.start_resume_commands[0].key !=
+            led.start_resume_commands[0].key)
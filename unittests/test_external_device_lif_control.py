@@ -0,0 +1,234 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import numpy
+import pytest
+from spinn_front_end_common.interface.ds import DataType
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+import spynnaker
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.external_devices_models import (
+    ExternalDeviceLifControl, SendType)
+from spynnaker.pyNN.external_devices_models.push_bot.ethernet import (
+    PushBotEthernetMotorDevice)
+from spynnaker.pyNN.external_devices_models.push_bot.parameters import (
+    PushBotMotor)
+from spynnaker.pyNN.external_devices_models.\
+    threshold_type_multicast_device_control import (
+        ThresholdTypeMulticastDeviceControl)
+from spynnaker.pyNN.protocols import (
+    MunichIoSpiNNakerLinkProtocol, MUNICH_MODES)
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+
+# One in S1615
+_ONE = 1 << 15
+
+# The header of the binary that reads the data of the devices
+_HEADER = os.path.join(
+    os.path.dirname(os.path.dirname(spynnaker.__file__)), "neural_modelling",
+    "src", "neuron", "implementations", "neuron_impl_external_devices.h")
+
+# The data types of the C types of the fields of the devices
+_C_TYPES = {"uint32_t": DataType.UINT32, "accum": DataType.S1615,
+            "enum send_type": DataType.UINT32}
+
+
+def _payload(send_type, bits):
+    """ What _get_payload makes of a value, given as the bits of an accum.
+    """
+    if send_type in (SendType.SEND_TYPE_INT.value,
+                     SendType.SEND_TYPE_UINT.value):
+        value = abs(bits) // _ONE
+        value = -value if bits < 0 else value
+    elif send_type == SendType.SEND_TYPE_ACCUM.value:
+        value = bits
+    elif send_type == SendType.SEND_TYPE_UACCUM.value:
+        value = max(bits, 0) << 1
+    elif send_type == SendType.SEND_TYPE_FRACT.value:
+        value = min(max(bits << 16, -(1 << 31)), (1 << 31) - 1)
+    else:
+        value = min(max(bits << 17, 0), (1 << 32) - 1)
+    return value & 0xFFFFFFFF
+
+
+def _reference_sends(devices, values):
+    """ What the external device control binary sends.
+
+    :param ~numpy.ndarray devices:
+        The data of the devices as written by the threshold type
+    :param ~numpy.ndarray values:
+        The bits of the accum value of each device at each (sub-)step
+    :return: The step, key and payload of each packet sent
+    :rtype: list(tuple(int, int, int or None))
+    """
+    sends = list()
+    time_until_next_send = devices["ts_next_send"].astype("int64")
+    sums = numpy.zeros(len(devices), dtype="int64")
+    counts = numpy.zeros(len(devices), dtype="int64")
+    for step, step_values in enumerate(values):
+        for i, device in enumerate(devices):
+            value = min(max(int(step_values[i]), int(device["min"])),
+                        int(device["max"]))
+            if device["aggregate"]:
+                sums[i] += value
+                counts[i] += 1
+            if time_until_next_send[i] != 0:
+                time_until_next_send[i] -= 1
+                continue
+            time_until_next_send[i] = device["ts_inter_send"] - 1
+            if not device["scale"]:
+                sends.append((step, int(device["key"]), None))
+                continue
+            if device["aggregate"]:
+                # Rounded towards zero
+                value = int(abs(sums[i]) // counts[i])
+                value = -value if sums[i] < 0 else value
+                sums[i] = 0
+                counts[i] = 0
+            sends.append((step, int(device["key"]), _payload(
+                int(device["type"]), value * int(device["scale"]))))
+    return sends
+
+
+def _motors():
+    protocol = MunichIoSpiNNakerLinkProtocol(MUNICH_MODES.PUSH_BOT)
+    return [PushBotEthernetMotorDevice(motor, protocol)
+            for motor in (PushBotMotor.MOTOR_0_PERMANENT,
+                          PushBotMotor.MOTOR_1_PERMANENT)]
+
+
+def _device_data(threshold_type, n_devices):
+    values = SpynnakerRangeDictionary(n_devices)
+    threshold_type.add_parameters(values)
+    threshold_type.add_state_variables(values)
+    struct = threshold_type.structs[0]
+    data = struct.get_data(values, Slice(0, n_devices - 1))
+    assert len(data) == struct.get_size_in_whole_words(n_devices)
+    return data.view(struct.numpy_dtype)
+
+
+def _random_walk(n_steps, n_devices):
+    """ Membrane voltages that wander beyond the range of the motors.
+    """
+    rng = numpy.random.default_rng(0)
+    steps = rng.normal(0.0, 4.0, (n_steps, n_devices))
+    return (numpy.cumsum(steps, axis=0) * _ONE).astype("int64")
+
+
+def test_without_aggregation():
+    unittest_setup()
+    devices = _motors()
+    data = _device_data(ThresholdTypeMulticastDeviceControl(devices), 2)
+    assert data.itemsize == 32
+    assert data["aggregate"].tolist() == [0, 0]
+    assert data["ts_inter_send"].tolist() == [20, 20]
+
+    values = _random_walk(1000, 2)
+    sends = _reference_sends(data, values)
+    for step, key, payload in sends:
+        i = [d.device_control_key for d in devices].index(key)
+        value = int(numpy.clip(values[step, i], -100 * _ONE, 100 * _ONE))
+        assert payload == _payload(SendType.SEND_TYPE_INT.value, value)
+
+
+def test_aggregation():
+    unittest_setup()
+    devices = _motors()
+    data = _device_data(ThresholdTypeMulticastDeviceControl(devices, 50), 2)
+    assert data["aggregate"].tolist() == [1, 1]
+    assert data["ts_inter_send"].tolist() == [50, 50]
+
+    n_steps = 10000
+    values = _random_walk(n_steps, 2)
+    sends = _reference_sends(data, values)
+    unaggregated = _reference_sends(
+        _device_data(ThresholdTypeMulticastDeviceControl(devices), 2), values)
+    assert len(sends) * 2 <= len(unaggregated)
+
+    # Each payload is the mean of the clipped values since the last one
+    clipped = numpy.clip(values, -100 * _ONE, 100 * _ONE)
+    keys = data["key"].tolist()
+    first_step = [0, 0]
+    for step, key, payload in sends:
+        i = keys.index(key)
+        mean = numpy.mean(clipped[first_step[i]:step + 1, i]) / _ONE
+        first_step[i] = step + 1
+        assert payload == int(numpy.trunc(mean)) & 0xFFFFFFFF
+
+
+def test_aggregation_of_slow_devices():
+    unittest_setup()
+    devices = _motors()
+    assert all(d.device_control_timesteps_between_sending == 20
+               for d in devices)
+    data = _device_data(ThresholdTypeMulticastDeviceControl(devices, 5), 2)
+    assert data["aggregate"].tolist() == [1, 1]
+    assert data["ts_inter_send"].tolist() == [20, 20]
+
+    # The devices are sent no more often than without aggregation, and each
+    # payload is the mean of all the values since the last one
+    values = _random_walk(1000, 2)
+    sends = _reference_sends(data, values)
+    unaggregated = _reference_sends(
+        _device_data(ThresholdTypeMulticastDeviceControl(devices), 2), values)
+    assert [(step, key) for step, key, _ in sends] == [
+        (step, key) for step, key, _ in unaggregated]
+    clipped = numpy.clip(values, -100 * _ONE, 100 * _ONE)
+    keys = data["key"].tolist()
+    first_step = [0, 0]
+    for step, key, payload in sends:
+        i = keys.index(key)
+        mean = numpy.mean(clipped[first_step[i]:step + 1, i]) / _ONE
+        first_step[i] = step + 1
+        assert payload == int(numpy.trunc(mean)) & 0xFFFFFFFF
+
+
+def test_matches_binary():
+    if not os.path.exists(_HEADER):
+        pytest.skip("The C sources are not available")
+    with open(_HEADER, encoding="utf-8") as f:
+        header = f.read()
+    body = re.search(
+        r"typedef struct packet_firing_data_t \{(.*?)\} packet_firing_data_t;",
+        header, re.DOTALL).group(1)
+    body = re.sub(r"//.*", "", body)
+    c_types = [c_type.strip() for c_type, _ in re.findall(
+        r"([\w ]+?)\s+(\w+);", body)]
+    assert len(c_types) == 8
+    assert re.findall(r"(\w+);", body)[-1] == "aggregate"
+
+    struct = ThresholdTypeMulticastDeviceControl(_motors()).structs[0]
+    assert [data_type for data_type, _ in struct.fields] == [
+        _C_TYPES[c_type] for c_type in c_types]
+    assert struct.fields[-1][1] == "aggregate"
+    assert struct.numpy_dtype.itemsize == 32
+
+
+def test_bad_aggregation():
+    unittest_setup()
+    with pytest.raises(ConfigurationException):
+        ThresholdTypeMulticastDeviceControl(_motors(), 0)
+
+
+def test_model():
+    unittest_setup()
+    model = ExternalDeviceLifControl(_motors(), True, aggregate_timesteps=50)
+    values = SpynnakerRangeDictionary(2)
+    # pylint: disable=protected-access
+    model._model.add_parameters(values)
+    assert list(values["aggregate"]) == [1, 1]
+    assert list(values["ts_inter_send"]) == [50, 50]
@@ -0,0 +1,152 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from queue import Queue
+import time
+import numpy
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.external_devices_models.push_bot.ethernet import (
+    PushBotRetinaConnection, PushBotRetinaDecoder)
+from spynnaker.pyNN.external_devices_models.push_bot.parameters import (
+    PushBotRetinaResolution)
+
+
+def _stream(n_events, seed=0):
+    """ Make the bytes of events at random 128 x 128 pixels, with some\
+        bytes that are not events between them.
+    """
+    rng = numpy.random.default_rng(seed)
+    x = rng.integers(0, 128, n_events)
+    y = rng.integers(0, 128, n_events)
+    p = rng.integers(0, 2, n_events)
+    events = numpy.stack((0x80 | y, (p << 7) | x), axis=1)
+    data = []
+    for event in events:
+        if rng.random() < 0.1:
+            data.append(int(rng.integers(0, 0x80)))
+        data.extend(event.tolist())
+    return bytes(data)
+
+
+def _reference_decode(data, bits):
+    """ Decode events one byte at a time.
+    """
+    shift = 7 - bits
+    ids = []
+    i = 0
+    while i + 1 < len(data):
+        if data[i] >= 0x80:
+            y = (data[i] & 0x7F) >> shift
+            x = (data[i + 1] & 0x7F) >> shift
+            p = data[i + 1] >> 7
+            ids.append(x | (y << bits) | (p << (2 * bits)))
+            i += 2
+        else:
+            i += 1
+    return ids
+
+
+def _split(data, seed=1):
+    """ Split data into packets of random sizes, many of them odd.
+    """
+    rng = numpy.random.default_rng(seed)
+    packets = []
+    start = 0
+    while start < len(data):
+        end = start + int(rng.integers(1, 300))
+        packets.append(data[start:end])
+        start = end
+    return packets
+
+
+def test_decode_single_event():
+    decoder = PushBotRetinaDecoder()
+    # x = 3, y = 5, polarity 1
+    ids = decoder.decode(bytes([0x85, 0x83]))
+    assert ids.tolist() == [3 | (5 << 7) | (1 << 14)]
+    # x = 127, y = 0, polarity 0
+    ids = decoder.decode(bytes([0x80, 0x7F]))
+    assert ids.tolist() == [127]
+
+
+def test_decode_split_event():
+    decoder = PushBotRetinaDecoder()
+    assert decoder.decode(bytes([0x12, 0x85])).tolist() == []
+    assert decoder.decode(bytes([0x83])).tolist() == [
+        3 | (5 << 7) | (1 << 14)]
+    assert decoder.decode(bytes([0x85])).tolist() == []
+    decoder.reset()
+    assert decoder.decode(bytes([0x83, 0x01])).tolist() == [
+        1 | (3 << 7)]
+
+
+def test_decode_matches_reference():
+    data = _stream(20000)
+    for resolution in PushBotRetinaResolution:
+        bits = resolution.value.bits_per_coordinate
+        decoder = PushBotRetinaDecoder(resolution)
+        ids = numpy.concatenate(
+            [decoder.decode(packet) for packet in _split(data)])
+        assert ids.tolist() == _reference_decode(data, bits)
+
+
+def test_decode_many_packets():
+    data = _stream(100000)
+    packets = [data[start:start + 1024]
+               for start in range(0, len(data), 1024)]
+    decoder = PushBotRetinaDecoder()
+    n_events = sum(len(decoder.decode(packet)) for packet in packets)
+    assert n_events == 100000
+
+
+class _KeptSpikes(PushBotRetinaConnection):
+    """ Keeps the spikes that would be sent to SpiNNaker.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.sent = Queue()
+        super().__init__(*args, **kwargs)
+
+    def send_spikes(self, label, neuron_ids, *args, **kwargs):
+        self.sent.put((time.monotonic(), neuron_ids.tolist()))
+
+
+def test_send_after_delay():
+    unittest_setup()
+    wifi = UDPConnection(local_host="127.0.0.1")
+    connection = _KeptSpikes(
+        "retina", wifi, local_host="127.0.0.1", local_port=None,
+        min_events_per_send=100, max_send_delay=0.2)
+    try:
+        # pylint: disable=protected-access
+        connection._PushBotRetinaConnection__push_bot_start(
+            "retina", connection)
+        start = time.monotonic()
+        connection._receive_retina_data(bytes([0x80 | 3, 5]))
+        connection._receive_retina_data(bytes([0x80 | 4, 0x80 | 6]))
+
+        # Fewer events than min_events_per_send are sent after the delay
+        sent, neuron_ids = connection.sent.get(timeout=5)
+        assert sent - start >= 0.2
+        assert neuron_ids == [5 | 3 << 7, 6 | 4 << 7 | 1 << 14]
+
+        # ... and the delay starts again with the next events
+        connection._receive_retina_data(bytes([0x80 | 1, 2]))
+        _, neuron_ids = connection.sent.get(timeout=5)
+        assert neuron_ids == [2 | 1 << 7]
+        assert connection.sent.empty()
+    finally:
+        connection.close()
+        wifi.close()
@@ -0,0 +1,100 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.external_devices_models import SPIFRetinaDevice
+
+_BASE_KEY = 5
+
+
+def _events(width, height, n_events=100000):
+    rng = numpy.random.default_rng(0)
+    return rng.integers(0, width, n_events), rng.integers(0, height, n_events)
+
+
+def _coordinates(keys, x_bits, y_bits):
+    """ Get the device coordinates of keys from SPIF.
+    """
+    assert numpy.all(keys >> (x_bits + y_bits) == _BASE_KEY)
+    return keys & ((1 << x_bits) - 1), (keys >> x_bits) & ((1 << y_bits) - 1)
+
+
+def test_no_region_of_interest():
+    unittest_setup()
+    device = SPIFRetinaDevice(0, 128, 64, 32, 16, base_key=_BASE_KEY)
+    x, y = _events(128, 64)
+    out_x, out_y = _coordinates(device.map_events(x, y), 7, 6)
+    assert out_x.tolist() == x.tolist()
+    assert out_y.tolist() == y.tolist()
+
+
+def test_region_of_interest_and_pooling():
+    unittest_setup()
+    # A 128 x 128 region of a 640 x 480 camera, pooled 2 x 2
+    device = SPIFRetinaDevice(
+        0, 64, 64, 16, 16, base_key=_BASE_KEY, pooling=2,
+        roi_x=256, roi_y=128, input_width=640, input_height=480)
+    x, y = _events(640, 480)
+    out_x, out_y = _coordinates(device.map_events(x, y), 6, 6)
+
+    # What the events should be mapped to
+    in_roi = (x >= 256) & (x < 384) & (y >= 128) & (y < 256)
+    assert out_x.tolist() == ((x[in_roi] - 256) // 2).tolist()
+    assert out_y.tolist() == ((y[in_roi] - 128) // 2).tolist()
+
+
+def test_pooling_only():
+    unittest_setup()
+    device = SPIFRetinaDevice(
+        1, 32, 32, 8, 8, base_key=_BASE_KEY, pooling=4,
+        input_x_shift=0, input_y_shift=16)
+    x, y = _events(128, 128)
+    out_x, out_y = _coordinates(device.map_events(x, y), 5, 5)
+    assert out_x.tolist() == (x // 4).tolist()
+    assert out_y.tolist() == (y // 4).tolist()
+
+
+def test_bad_options():
+    unittest_setup()
+    with pytest.raises(ConfigurationException):
+        SPIFRetinaDevice(0, 64, 64, 16, 16, pooling=3)
+    with pytest.raises(ConfigurationException):
+        SPIFRetinaDevice(0, 64, 64, 16, 16, roi_x=32)
+    with pytest.raises(ConfigurationException):
+        SPIFRetinaDevice(
+            0, 64, 64, 16, 16, input_width=1 << 12, input_height=1 << 12)
+
+
+def test_region_above_input_size():
+    unittest_setup()
+    # Without the size of the input, events above the region can't be
+    # dropped, so a region that doesn't start at 0 needs it
+    with pytest.raises(ConfigurationException):
+        SPIFRetinaDevice(0, 64, 64, 16, 16, pooling=2, roi_x=256, roi_y=128)
+    with pytest.raises(ConfigurationException):
+        SPIFRetinaDevice(
+            0, 64, 64, 16, 16, pooling=2, roi_x=256, roi_y=128,
+            input_width=640)
+
+    # ... and with it they are dropped
+    device = SPIFRetinaDevice(
+        0, 64, 64, 16, 16, base_key=_BASE_KEY, pooling=2, roi_x=256,
+        roi_y=128, input_width=640, input_height=480)
+    out_x, out_y = _coordinates(
+        device.map_events([300, 300], [150, 406]), 6, 6)
+    assert out_x.tolist() == [(300 - 256) // 2]
+    assert out_y.tolist() == [(150 - 128) // 2]
@@ -0,0 +1,158 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+from threading import Lock
+from unittest import mock
+import numpy
+import pyNN.spiNNaker as sim
+from spinn_utilities.config_holder import set_config
+from spinnaker_testbase import BaseTestCase
+from spinnman.data import SpiNNManDataView
+from spinn_front_end_common.interface.interface_functions import (
+    load_application_data_specs)
+from spynnaker.pyNN.models.projection import Projection
+
+
+class _CpuInfo(object):
+    def __init__(self, user_0):
+        self.user = [user_0]
+
+
+class _MemoryTransceiver(object):
+    """ Holds the SDRAM of each chip, noting the threads that read it.
+    """
+
+    def __init__(self):
+        self.__memory = dict()
+        self.__user_0 = dict()
+        self.__lock = Lock()
+        self.n_reads = 0
+
+    def malloc_sdram(self, x, y, size, app_id, tag=None):
+        memory = self.__memory.setdefault((x, y), bytearray())
+        address = 0x60000000 + len(memory)
+        memory.extend(bytes(size))
+        return address
+
+    def write_user(self, x, y, p, user, value):
+        self.__user_0[x, y, p] = value
+
+    def get_cpu_information_from_core(self, x, y, p):
+        return _CpuInfo(self.__user_0[x, y, p])
+
+    def write_memory(self, x, y, base_address, data):
+        offset = base_address - 0x60000000
+        self.__memory[x, y][offset:offset + len(data)] = data
+
+    def read_memory(self, x, y, base_address, length, cpu=0):
+        with self.__lock:
+            self.n_reads += 1
+        offset = base_address - 0x60000000
+        return bytes(self.__memory[x, y][offset:offset + length])
+
+    def read_word(self, x, y, base_address, cpu=0):
+        return struct.unpack("<I", self.read_memory(x, y, base_address, 4))[0]
+
+
+def _read_connections(projection):
+    """ Get the connections of a projection from what has been read from the
+        machine.
+    """
+    # pylint: disable=protected-access
+    edge = projection._projection_edge
+    connections = edge.post_vertex.get_connections_from_machine(
+        edge, projection._synapse_information)
+    return sorted(zip(
+        connections["source"].tolist(), connections["target"].tolist(),
+        connections["weight"].tolist(), connections["delay"].tolist()))
+
+
+class TestGetProjectionData(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_get_projection_data(self):
+        sim.setup(1.0)
+        pop1 = sim.Population(5, sim.IF_curr_exp(), label="pop1")
+        pop2 = sim.Population(5, sim.IF_curr_exp(), label="pop2")
+        proj1 = sim.Projection(
+            pop1, pop2, sim.OneToOneConnector(),
+            synapse_type=sim.StaticSynapse(weight=2, delay=1))
+        proj2 = sim.Projection(
+            pop1, pop2, sim.AllToAllConnector(),
+            synapse_type=sim.StaticSynapse(weight=3, delay=2),
+            receptor_type="inhibitory")
+        proj3 = sim.Projection(
+            pop2, pop1, sim.OneToOneConnector(),
+            synapse_type=sim.StaticSynapse(weight=4, delay=3))
+        sim.run(0)
+        data = sim.get_projection_data(
+            [proj1, proj2, proj3], ["weight", "delay"], n_threads=2)
+        self.assertEqual(3, len(data))
+        for proj, proj_data in zip([proj1, proj2, proj3], data):
+            self.assertEqual(
+                list(proj.get(["weight", "delay"], "list")), list(proj_data))
+        weights = sim.get_projection_data([proj2], "weight", "array")[0]
+        self.assertTrue(numpy.array_equal(weights, numpy.full((5, 5), 3.0)))
+        sim.end()
+
+    def test_read_connections_in_threads(self):
+        sim.setup(1.0)
+        sim.set_number_of_neurons_per_core(sim.IF_curr_exp, 5)
+        pop1 = sim.Population(20, sim.IF_curr_exp(), label="pop1")
+        pop2 = sim.Population(20, sim.IF_curr_exp(), label="pop2")
+        conns1 = [(i, (i * 7) % 20, 1.0 + i, 1 + i % 3) for i in range(20)]
+        conns2 = [(i, (i * 3 + 1) % 20, 2.0, 5) for i in range(0, 20, 2)]
+        conns3 = [(i, 19 - i, 0.5 * i, 2) for i in range(20)]
+        projections = [
+            sim.Projection(pop1, pop2, sim.FromListConnector(conns1)),
+            sim.Projection(pop1, pop2, sim.FromListConnector(conns2),
+                           receptor_type="inhibitory"),
+            sim.Projection(pop2, pop1, sim.FromListConnector(conns3))]
+        sim.run(0)
+
+        # Load the data onto memory that stands in for the machine, and
+        # read it back from there
+        txrx = _MemoryTransceiver()
+        set_config("Machine", "virtual_board", "False")
+        set_config(
+            "Machine", "disable_advanced_monitor_usage_for_data_in", "True")
+        try:
+            with mock.patch.object(
+                    SpiNNManDataView, "get_transceiver", return_value=txrx), \
+                    mock.patch.object(
+                        SpiNNManDataView, "read_memory", txrx.read_memory):
+                load_application_data_specs()
+                read = list()
+                for n_threads in (1, 4):
+                    for projection in projections:
+                        projection._clear_cache()
+                    n_reads = txrx.n_reads
+                    Projection._read_connections_from_machine(
+                        projections, n_threads)
+                    self.assertGreater(txrx.n_reads, n_reads)
+                    # The reads are cached, so no more are done here
+                    n_reads = txrx.n_reads
+                    read.append([
+                        _read_connections(projection)
+                        for projection in projections])
+                    self.assertEqual(n_reads, txrx.n_reads)
+        finally:
+            set_config("Machine", "virtual_board", "True")
+        serial, threaded = read
+        self.assertEqual(serial, threaded)
+        for conns, connections in zip([conns1, conns2, conns3], serial):
+            self.assertEqual(sorted(conns), connections)
+        sim.end()
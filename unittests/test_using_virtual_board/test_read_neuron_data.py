@@ -0,0 +1,133 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from threading import Lock
+import time
+from unittest import mock
+import numpy
+import pyNN.spiNNaker as sim
+from spinnaker_testbase import BaseTestCase
+from spinnman.data import SpiNNManDataView
+from spinn_front_end_common.utilities.helpful_functions import (
+    get_region_base_address_offset)
+from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.models.neuron.population_machine_neurons import (
+    PopulationMachineNeurons)
+from spynnaker.pyNN.utilities.struct import StructRepeat
+
+
+class _CpuInfo(object):
+    def __init__(self, user_0):
+        self.user = [user_0]
+
+
+class _LatencyTransceiver(object):
+    """ Holds the neuron data of each core, taking some time to read it and
+        noting how many reads are done at the same time.
+    """
+
+    def __init__(self, latency):
+        self.__latency = latency
+        self.__words = dict()
+        self.__memory = dict()
+        self.__lock = Lock()
+        self.__n_reading = 0
+        self.max_reading = 0
+
+    def add_core(self, placement, regions, data):
+        base_address = 0x60000000 + (placement.p << 20)
+        data_address = base_address + 0x10000
+        for region in regions:
+            self.__words[placement.x, placement.y,
+                         get_region_base_address_offset(
+                             base_address, region)] = data_address
+        self.__memory[placement.x, placement.y, data_address] = data
+
+    def get_cpu_information_from_core(self, x, y, p):
+        return _CpuInfo(0x60000000 + (p << 20))
+
+    def read_word(self, x, y, address):
+        return self.__words[x, y, address]
+
+    def read_memory(self, x, y, address, n_bytes, cpu=0):
+        with self.__lock:
+            self.__n_reading += 1
+            self.max_reading = max(self.max_reading, self.__n_reading)
+        time.sleep(self.__latency)
+        with self.__lock:
+            self.__n_reading -= 1
+        return self.__memory[x, y, address][:n_bytes]
+
+
+class TestReadNeuronData(BaseTestCase):
+
+    # NO unittest_setup() as sim.setup is called
+
+    def test_read_concurrently(self):
+        n_neurons = 300
+        sim.setup(1.0)
+        sim.set_number_of_neurons_per_core(sim.IF_curr_exp, 50)
+        pop = sim.Population(n_neurons, sim.IF_curr_exp(), label="pop")
+        on_machine_v = numpy.linspace(-70.0, -60.0, n_neurons)
+        pop.initialize(v=on_machine_v)
+        sim.run(0)
+
+        # pylint: disable=protected-access
+        vertex = pop._vertex
+        values = {key: vertex.parameters[key]
+                  for key in vertex.parameters.keys()}
+        values.update({key: vertex.state_variables[key]
+                       for key in vertex.state_variables.keys()})
+        txrx = _LatencyTransceiver(0.02)
+        placements = list()
+        for m_vertex in vertex.machine_vertices:
+            placement = SpynnakerDataView.get_placement_of_vertex(m_vertex)
+            vertex_slice = m_vertex.vertex_slice
+            data = numpy.concatenate([
+                struct.get_data(values)
+                if struct.repeat_type == StructRepeat.GLOBAL
+                else struct.get_data(values, vertex_slice)
+                for struct in vertex.neuron_impl.structs])
+            regions = m_vertex._neuron_regions
+            txrx.add_core(placement, (
+                regions.neuron_params, regions.initial_values),
+                data.tobytes())
+            placements.append(placement)
+        self.assertEqual(6, len(placements))
+
+        # Forget the values and read them back
+        vertex.state_variables["v"].set_value(-65.0)
+        vertex.initial_state_variables["v"].set_value(-65.0)
+        with mock.patch.object(
+                SpiNNManDataView, "get_transceiver", return_value=txrx), \
+                mock.patch.object(
+                    SpiNNManDataView, "read_memory", txrx.read_memory):
+            PopulationMachineNeurons.read_parameters_from_machines(
+                placements, n_threads=3)
+            self.assertTrue(numpy.allclose(
+                vertex.state_variables["v"].get_values(), on_machine_v,
+                atol=0.001))
+            self.assertTrue(vertex.state_variables["v"].is_dense)
+            self.assertEqual(
+                [-65.0] * n_neurons,
+                vertex.initial_state_variables["v"].get_values())
+            self.assertGreater(txrx.max_reading, 1)
+            self.assertLessEqual(txrx.max_reading, 3)
+
+            PopulationMachineNeurons.read_parameters_from_machines(
+                placements, initial=True)
+        self.assertTrue(numpy.allclose(
+            vertex.initial_state_variables["v"].get_values(), on_machine_v,
+            atol=0.001))
+        sim.end()
@@ -0,0 +1,132 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from pyNN.random import RandomDistribution
+from spinn_utilities.ranged import MultipleValuesException, RangedList
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.ranged import (
+    DenseRangedList, SpynnakerRangeDictionary)
+
+
+def test_ranges_until_heterogeneous():
+    unittest_setup()
+    values = DenseRangedList(10, 1.0, "v")
+    values.set_value_by_slice(2, 5, 3.0)
+    assert not values.is_dense
+    assert list(values.iter_ranges()) == [
+        (0, 2, 1.0), (2, 5, 3.0), (5, 10, 1.0)]
+
+    values.set_value_by_slice(6, 9, [4.0, 5.0, 6.0])
+    assert values.is_dense
+    assert values.get_values() == [
+        1.0, 1.0, 3.0, 3.0, 3.0, 1.0, 4.0, 5.0, 6.0, 1.0]
+    assert list(values.iter_ranges()) == [
+        (0, 2, 1.0), (2, 5, 3.0), (5, 6, 1.0), (6, 7, 4.0), (7, 8, 5.0),
+        (8, 9, 6.0), (9, 10, 1.0)]
+    assert list(values.iter_ranges_by_slice(3, 7)) == [
+        (3, 5, 3.0), (5, 6, 1.0), (6, 7, 4.0)]
+    assert list(values.iter_ranges_by_ids([0, 1, 3, 4, 8])) == [
+        (0, 2, 1.0), (3, 5, 3.0), (8, 9, 6.0)]
+    assert values.get_values([8, 2]) == [6.0, 3.0]
+    assert values.get_single_value_by_slice(2, 5) == 3.0
+    with pytest.raises(MultipleValuesException):
+        values.get_single_value_by_slice(4, 7)
+
+    # Setting single values keeps the values dense
+    values.set_value_by_slice(0, 3, 2)
+    values.set_value_by_id(9, 7.5)
+    values.set_value_by_ids([1, 4], [8, 9])
+    assert values.is_dense
+    assert numpy.array_equal(
+        values.get_dense_values(slice(None)),
+        [2.0, 8.0, 2.0, 3.0, 9.0, 1.0, 4.0, 5.0, 6.0, 7.5])
+
+    # Setting the whole list to one value goes back to ranges
+    values.set_value(0.5)
+    assert not values.is_dense
+    assert list(values.iter_ranges()) == [(0, 10, 0.5)]
+
+
+def test_integers_widened():
+    unittest_setup()
+    values = DenseRangedList(4, 0, "i")
+    values.set_value([1, 2, 3, 4])
+    assert values.is_dense
+    values.set_value_by_id(0, 0.5)
+    assert values.get_values() == [0.5, 2, 3, 4]
+
+
+def test_not_numbers():
+    unittest_setup()
+    values = DenseRangedList(4, 0.0, "r")
+    distribution = RandomDistribution("uniform", (0, 1))
+    values.set_value_by_slice(0, 2, distribution)
+    assert not values.is_dense
+    values.set_value_by_slice(2, 4, [1.0, 2.0])
+    assert not values.is_dense
+    assert values.get_values() == [distribution, distribution, 1.0, 2.0]
+
+    values = DenseRangedList(4, 0.0, "r")
+    values.set_value([1.0, 2.0, 3.0, 4.0])
+    values.set_value_by_id(1, distribution)
+    assert not values.is_dense
+    assert values.get_values() == [1.0, distribution, 3.0, 4.0]
+    with pytest.raises(ValueError):
+        values.get_dense_values([0])
+
+
+def test_copy():
+    unittest_setup()
+    values = SpynnakerRangeDictionary(5)
+    values["a"] = 1.0
+    values["b"] = numpy.arange(5.0)
+    copy = values.copy()
+    assert isinstance(copy, SpynnakerRangeDictionary)
+    assert isinstance(copy["a"], DenseRangedList)
+    assert copy["b"].is_dense
+    copy["b"].set_value_by_id(0, 10.0)
+    assert values["b"].get_values() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    other = SpynnakerRangeDictionary(5)
+    other["a"] = numpy.ones(5)
+    other["b"] = 2.0
+    other.copy_into(values)
+    assert other["a"].get_values() == [1.0] * 5
+    assert not other["a"].is_dense
+    assert other["b"].get_values() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_matches_ranged_list():
+    """ Random writes give the same values as a normal RangedList.
+    """
+    unittest_setup()
+    rng = numpy.random.default_rng(7)
+    dense = DenseRangedList(50, 0.0, "d")
+    ranged = RangedList(50, 0.0, "d")
+    for _ in range(100):
+        start = int(rng.integers(0, 49))
+        stop = int(rng.integers(start + 1, 51))
+        if rng.random() < 0.5:
+            value = float(rng.integers(0, 3))
+        else:
+            value = list(rng.integers(0, 3, stop - start).astype(float))
+        dense.set_value_by_slice(start, stop, value)
+        ranged.set_value_by_slice(start, stop, value)
+    assert dense.get_values() == ranged.get_values()
+    assert list(dense.iter_ranges()) == list(ranged.iter_ranges())
+    ids = [1, 2, 3, 10, 11, 30]
+    assert (list(dense.iter_ranges_by_ids(ids)) ==
+            list(ranged.iter_ranges_by_ids(ids)))
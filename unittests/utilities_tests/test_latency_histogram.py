@@ -0,0 +1,36 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from spynnaker.pyNN.utilities.latency_histogram import LatencyHistogram
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.n_samples == 0
+    assert histogram.percentile(99) == 0.0
+    for latency in [0.5e-6, 1.5e-6, 3e-6, 3.5e-6, 1e4]:
+        histogram.add(latency)
+    counts = histogram.counts
+    assert counts[0] == 1
+    assert counts[1] == 1
+    assert counts[2] == 2
+    assert counts[-1] == 1
+    assert histogram.n_samples == 5
+    assert histogram.max == 1e4
+    assert histogram.mean == sum([0.5e-6, 1.5e-6, 3e-6, 3.5e-6, 1e4]) / 5
+    assert histogram.percentile(50) == histogram.bucket_edges[2]
+    assert histogram.percentile(100) == 1e4
+    histogram.reset()
+    assert histogram.n_samples == 0
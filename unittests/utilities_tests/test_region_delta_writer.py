@@ -0,0 +1,125 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from pacman.model.placements import Placement
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.utilities.region_delta_writer import RegionDeltaWriter
+
+_BASE = 0x60000000
+_REGION = 3
+_REGION_ADDRESS = 0x70000000
+
+
+class _CpuInfo(object):
+    def __init__(self, user_0):
+        self.user = [user_0]
+
+
+class _MockTransceiver(object):
+    def __init__(self):
+        self.writes = list()
+
+    def get_cpu_information_from_core(self, x, y, p):
+        return _CpuInfo(_BASE)
+
+    def read_word(self, x, y, address):
+        return _REGION_ADDRESS
+
+    def write_memory(self, x, y, address, data):
+        self.writes.append((address, bytes(data)))
+
+
+class _MockSpec(object):
+    def __init__(self):
+        self.region = None
+        self.written = dict()
+
+    def switch_write_focus(self, region):
+        self.region = region
+
+    def write_array(self, data):
+        self.written[self.region] = numpy.array(data, dtype="uint32")
+
+
+def test_unknown_then_delta():
+    unittest_setup()
+    placement = Placement(None, 0, 0, 1)
+    writer = RegionDeltaWriter()
+    txrx = _MockTransceiver()
+    data = numpy.arange(100, dtype="uint32")
+
+    # Nothing is known, so the whole region is written with the spec
+    spec = _MockSpec()
+    assert writer.write_region(
+        spec, placement, _REGION, data, transceiver=txrx) == 400
+    assert numpy.array_equal(spec.written[_REGION], data)
+    assert not txrx.writes
+
+    # The same data again writes nothing
+    spec = _MockSpec()
+    assert writer.write_region(
+        spec, placement, _REGION, data, transceiver=txrx) == 0
+    assert not spec.written
+    assert not txrx.writes
+
+    # Changes close together are written together; others separately
+    data = data.copy()
+    data[[10, 12, 90]] = 1000
+    assert writer.write_region(
+        spec, placement, _REGION, data, transceiver=txrx) == 16
+    assert not spec.written
+    assert txrx.writes == [
+        (_REGION_ADDRESS + 40, data[10:13].tobytes()),
+        (_REGION_ADDRESS + 360, data[90:91].tobytes())]
+    assert writer.get_bytes_written(
+        SpynnakerDataWriter.get_run_number()) == {_REGION: (16, 400)}
+
+
+def test_changes_on_run():
+    unittest_setup()
+    writer = SpynnakerDataWriter.setup()
+    placement = Placement(None, 0, 0, 1)
+    region_writer = RegionDeltaWriter()
+    txrx = _MockTransceiver()
+    data = numpy.arange(10, dtype="uint32")
+    region_writer.note_data(_REGION, data.tobytes(), changes_on_run=True)
+
+    # Known before the run, so only the change is written
+    new_data = data.copy()
+    new_data[5] = 0
+    spec = _MockSpec()
+    assert region_writer.write_region(
+        spec, placement, _REGION, new_data, changes_on_run=True,
+        transceiver=txrx) == 4
+
+    # After the run the data is no longer known, so it is all written
+    writer.start_run()
+    writer.finish_run()
+    assert region_writer.write_region(
+        spec, placement, _REGION, new_data, changes_on_run=True,
+        transceiver=txrx) == 40
+    assert numpy.array_equal(spec.written[_REGION], new_data)
+    assert len(txrx.writes) == 1
+
+
+def test_dirty():
+    unittest_setup()
+    writer = RegionDeltaWriter()
+    writer.set_dirty(1, 2)
+    assert writer.is_dirty(1)
+    assert not writer.is_dirty(3)
+    writer.clear_dirty()
+    assert not writer.is_dirty(1)
@@ -0,0 +1,87 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.sdram_read_planner import SDRAMReadPlanner
+
+
+class _CountingTransceiver(object):
+    """ Memory where each byte is the low byte of its address, counting the
+        reads made.
+    """
+
+    def __init__(self):
+        self.reads = list()
+
+    def read_memory(self, x, y, address, n_bytes):
+        self.reads.append((x, y, address, n_bytes))
+        return bytes((address + i) & 0xFF for i in range(n_bytes))
+
+    @property
+    def n_bytes_read(self):
+        return sum(read[3] for read in self.reads)
+
+
+def test_adjacent_reads_merged():
+    unittest_setup()
+    txrx = _CountingTransceiver()
+    planner = SDRAMReadPlanner(read_memory=txrx.read_memory)
+    planner.add_read(0, 0, 0x1000, 16)
+    planner.add_read(0, 0, 0x1010, 32)
+    planner.add_read(0, 0, 0x1008, 8)
+    planner.add_read(0, 0, 0x2000, 4)
+    planner.add_read(1, 0, 0x1030, 4)
+    planner.add_read(1, 0, 0x1000, 0)
+    planner.read()
+    assert txrx.reads == [
+        (0, 0, 0x1000, 48), (0, 0, 0x2000, 4), (1, 0, 0x1030, 4)]
+    assert txrx.n_bytes_read == 56
+    assert bytes(planner.get_data(0, 0, 0x1010, 4)) == bytes(
+        [0x10, 0x11, 0x12, 0x13])
+    assert bytes(planner.get_data(0, 0, 0x2000, 4)) == bytes(
+        [0x00, 0x01, 0x02, 0x03])
+    assert bytes(planner.get_data(1, 0, 0x1032, 2)) == bytes([0x32, 0x33])
+    assert len(planner.get_data(1, 0, 0x1000, 0)) == 0
+
+
+def test_max_gap():
+    unittest_setup()
+    txrx = _CountingTransceiver()
+    planner = SDRAMReadPlanner(max_gap=16, read_memory=txrx.read_memory)
+    planner.add_read(0, 0, 0x1000, 16)
+    planner.add_read(0, 0, 0x1020, 16)
+    planner.add_read(0, 0, 0x1100, 16)
+    assert planner.plan() == [(0, 0, 0x1000, 0x30), (0, 0, 0x1100, 16)]
+    planner.read()
+    assert len(txrx.reads) == 2
+    assert bytes(planner.get_data(0, 0, 0x1020, 1)) == bytes([0x20])
+
+
+def test_errors():
+    unittest_setup()
+    txrx = _CountingTransceiver()
+    planner = SDRAMReadPlanner(read_memory=txrx.read_memory)
+    planner.add_read(0, 0, 0x1000, 16)
+    with pytest.raises(ValueError):
+        planner.get_data(0, 0, 0x1000, 16)
+    planner.read()
+    with pytest.raises(ValueError):
+        planner.add_read(0, 0, 0x2000, 16)
+    with pytest.raises(KeyError):
+        planner.get_data(0, 0, 0x1008, 16)
+    with pytest.raises(KeyError):
+        planner.get_data(0, 0, 0x0FF0, 4)
+    with pytest.raises(KeyError):
+        planner.get_data(0, 1, 0x1000, 4)
@@ -0,0 +1,96 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from pyNN.random import RandomDistribution
+from spinn_utilities.ranged import RangeDictionary
+from spinn_front_end_common.interface.ds import DataType
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.struct import Struct
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_to, convert_array_to)
+
+
+def _values(n_atoms, data_type):
+    values = RangeDictionary(n_atoms)
+    high = min(float(data_type.max), 100) * 0.99
+    values["a"] = high / 2
+    values["a"][n_atoms // 4:n_atoms // 2] = numpy.linspace(
+        0, high, n_atoms // 2 - n_atoms // 4)
+    values["a"][n_atoms // 2:] = RandomDistribution("uniform", (0, high))
+    return values
+
+
+def test_get_data_all_types():
+    unittest_setup()
+    n_atoms = 64
+    vertex_slice = Slice(8, 55)
+    for data_type in DataType:
+        struct = Struct([(data_type, "a"), (DataType.UINT32, "b")],
+                        default_values={"b": 7})
+        values = _values(n_atoms, data_type)
+        data = struct.get_data(values, vertex_slice)
+        read = numpy.frombuffer(
+            data.tobytes(), dtype=struct.numpy_dtype,
+            count=vertex_slice.n_atoms)
+        assert numpy.all(read["b"] == 7)
+
+        # The random values are not repeatable, so check only the fixed
+        # ones against converting one at a time
+        expected = [convert_to(values["a"][i], data_type)
+                    for i in range(vertex_slice.lo_atom, n_atoms // 2)]
+        assert read["a"][:len(expected)].tolist() == expected, data_type
+
+
+def test_get_data_64_bit_integers():
+    unittest_setup()
+    struct = Struct([(DataType.UINT64, "a")])
+    values = RangeDictionary(10)
+    values["a"] = 2 ** 53 + 1
+    values["a"][5:] = RandomDistribution("uniform", (0, 100))
+    data = struct.get_data(values, Slice(0, 9))
+    read = numpy.frombuffer(data.tobytes(), dtype=struct.numpy_dtype)
+    assert read["a"][:5].tolist() == [2 ** 53 + 1] * 5
+
+
+def test_get_generator_data():
+    unittest_setup()
+    struct = Struct([(DataType.S1615, "a")])
+    values = RangeDictionary(10)
+    values["a"] = -1.5
+    values["a"][5:] = 2.25
+    values["a"][7:9] = RandomDistribution("uniform", (0, 1))
+    data = struct.get_generator_data(values, Slice(0, 9))
+
+    # Header, then (n_items, per-range (count, generator)), then params
+    assert list(data[:6]) == [4, 10, 4 * 14, 1, 0, 4]
+    assert list(data[6:14]) == [5, 0, 2, 0, 2, 1, 1, 0]
+    params = data[14:].view("int32")
+    assert list(params) == [
+        -3 << 14, 9 << 13, 0, 1 << 15, 9 << 13]
+
+
+def test_convert_array_to_many():
+    """ Converts a slice of values of each field type as an array, as they
+        would be converted one at a time.
+    """
+    unittest_setup()
+    n_values = 1000
+    for data_type in DataType:
+        values = numpy.linspace(
+            0, min(float(data_type.max), 100) * 0.99, n_values)
+        single = [convert_to(value, data_type) for value in values]
+        array = convert_array_to(values, data_type)
+        assert array.tolist() == single, data_type
@@ -15,7 +15,9 @@
 import os
 import shutil
 import unittest
+import numpy
 from pyNN.random import RandomDistribution
+from spinn_front_end_common.interface.ds import DataType
 from spynnaker.pyNN.config_setup import unittest_setup
 from spynnaker.pyNN.utilities import utility_calls
 
@@ -56,6 +58,49 @@ class TestUtilityCalls(unittest.TestCase):
         self.assertTrue(hasattr(multi_value, "__iter__"))
         self.assertEqual(len(multi_value), 10)
 
+    def test_convert_array_to(self):
+        rng = numpy.random.default_rng(42)
+        for data_type in DataType:
+            low = max(float(data_type.min), -1e6)
+            high = min(float(data_type.max), 1e6)
+            if high > data_type.max:
+                high = numpy.nextafter(high, low)
+            scale = float(data_type.scale)
+            values = numpy.concatenate((
+                [0, low, high], rng.uniform(low, high, 1000),
+                # Values with few decimal places ...
+                numpy.round(rng.uniform(low, high, 1000), 3),
+                # ... and exactly half way between two fixed-point values
+                (numpy.floor(rng.uniform(low, high, 1000) * scale) + 0.5) /
+                scale))
+            values = values[(values >= low) & (values <= high)]
+            if data_type.scale == 1:
+                values = numpy.trunc(values)
+            converted = utility_calls.convert_array_to(values, data_type)
+            expected = [
+                utility_calls.convert_to(value, data_type)
+                for value in values]
+            self.assertEqual(
+                converted.dtype, numpy.dtype(data_type.struct_encoding))
+            self.assertEqual(converted.tolist(), expected, data_type)
+
+    def test_convert_array_to_64_bit_integers(self):
+        values = [2 ** 64 - 1, 2 ** 53 + 1, 0]
+        self.assertEqual(utility_calls.convert_array_to(
+            numpy.array(values, dtype="uint64"), DataType.UINT64).tolist(),
+            values)
+        self.assertEqual(utility_calls.convert_array_to(
+            numpy.array([2 ** 53 + 1, 1.5], dtype=object),
+            DataType.INT64).tolist(), [2 ** 53 + 1, 1])
+
+    def test_convert_array_to_out_of_range(self):
+        with self.assertRaises(ValueError):
+            utility_calls.convert_array_to([0.5, 65536.0], DataType.S1615)
+        with self.assertRaises(ValueError):
+            utility_calls.convert_array_to([numpy.nan], DataType.U032)
+        self.assertEqual(
+            len(utility_calls.convert_array_to([], DataType.S1615)), 0)
+
 
 if __name__ == '__main__':
     unittest.main()